@@ -0,0 +1,310 @@
+"""
+API 수집 동시 실행 제한 (admission control) 모듈
+
+큰 카테고리 다운로드가 몰려도 네이버 요청량과 메모리가 한없이 늘지 않도록,
+새로 수집해야 하는 요청만 제한된 실행 자리를 얻은 뒤 수집합니다 (캐시 적중과
+같은 카테고리의 진행 중인 수집을 함께 기다리는 요청은 자리를 쓰지 않음).
+
+- 수집(crawl) 자리는 ADMISSION_MAX_CRAWLS개, 나머지는 대기열(최대 ADMISSION_QUEUE_SIZE)에서 순서대로 기다림
+- 클라이언트 하나가 동시에 실행/대기할 수 있는 수집은 ADMISSION_PER_CLIENT개
+- 가벼운 요청(카테고리 목록)은 우선(priority) 대기열을 쓰며, 전용 자리 ADMISSION_PRIORITY_SLOTS개와
+  비어 있는 수집 자리를 먼저 받음
+- 대기열이 꽉 찼거나, 클라이언트 한도를 넘었거나, ADMISSION_QUEUE_TIMEOUT 동안 자리를 얻지 못하면
+  AdmissionRejected (API는 429 + Retry-After + 대기 순번)
+
+상태는 이벤트 루프 스레드에서만 바꾸는 것을 전제로 잠금 없이 처리합니다.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional
+
+from .config import (
+    ADMISSION_ENABLED,
+    ADMISSION_MAX_CRAWLS,
+    ADMISSION_QUEUE_SIZE,
+    ADMISSION_PER_CLIENT,
+    ADMISSION_QUEUE_TIMEOUT,
+    ADMISSION_PRIORITY_SLOTS,
+    ADMISSION_DEFAULT_CRAWL_SEC,
+)
+from .metrics import ADMISSION_QUEUE_DEPTH, ADMISSION_RUNNING, ADMISSION_REJECTIONS, ADMISSION_WAIT
+
+PRIORITY = "priority"
+CRAWL = "crawl"
+LANES = (PRIORITY, CRAWL)
+# 요청한 클라이언트가 없는 서버 내부 작업 (일괄 수집 등)
+INTERNAL_CLIENT = "internal"
+
+# 수집 시간 이동 평균 가중치 (Retry-After 추정용)
+_CRAWL_SEC_ALPHA = 0.2
+
+
+class AdmissionRejected(Exception):
+    """
+    실행 자리를 얻지 못해 요청을 거절함
+
+    Attributes:
+        reason: 거절 이유 (queue_full, client_quota, timeout)
+        retry_after: 다시 시도하기까지 권장 시간 (초)
+        position: 거절 시점의 대기 순번 (1부터, 대기열과 관계없는 거절이면 None)
+    """
+
+    MESSAGES = {
+        'queue_full': "수집 대기열이 가득 찼습니다",
+        'client_quota': "동시에 요청할 수 있는 수집 수를 넘었습니다",
+        'timeout': "수집 대기 시간이 초과되었습니다",
+    }
+
+    def __init__(self, reason: str, retry_after: float, position: Optional[int] = None):
+        message = self.MESSAGES[reason]
+        if position is not None:
+            message += f" (대기 순번 {position})"
+        super().__init__(f"{message}. {math.ceil(retry_after)}초 후 다시 시도하세요.")
+        self.reason = reason
+        self.retry_after = retry_after
+        self.position = position
+
+
+class AdmissionTicket:
+    """얻은 실행 자리 (release로 한 번만 반납)"""
+
+    __slots__ = ('lane', 'client', 'admitted_at', 'waited', 'counted', 'released')
+
+    def __init__(self, lane: str, client: str, waited: float, counted: bool):
+        self.lane = lane
+        self.client = client
+        self.admitted_at = time.monotonic()
+        self.waited = waited  # 대기열에서 기다린 시간 (초)
+        self.counted = counted  # 클라이언트 한도에 포함했는지
+        self.released = False
+
+
+class _Waiter:
+    __slots__ = ('lane', 'client', 'future', 'enqueued_at')
+
+    def __init__(self, lane: str, client: str):
+        self.lane = lane
+        self.client = client
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.enqueued_at = time.monotonic()
+
+
+class AdmissionController:
+    """
+    수집 실행 자리 / 대기열 / 클라이언트별 한도 관리
+
+    Args:
+        max_crawls: 동시에 실행할 수집 수
+        queue_size: 대기열 최대 길이 (두 대기열 합산)
+        per_client: 클라이언트 하나의 최대 실행 + 대기 수집 수 (수집 대기열만 해당)
+        queue_timeout: 대기열에서 기다리는 최대 시간 (초)
+        priority_slots: 우선 요청 전용 실행 자리 수
+        enabled: False면 제한 없이 바로 실행 (실행 수만 기록)
+    """
+
+    def __init__(
+        self,
+        max_crawls: int = ADMISSION_MAX_CRAWLS,
+        queue_size: int = ADMISSION_QUEUE_SIZE,
+        per_client: int = ADMISSION_PER_CLIENT,
+        queue_timeout: float = ADMISSION_QUEUE_TIMEOUT,
+        priority_slots: int = ADMISSION_PRIORITY_SLOTS,
+        enabled: bool = ADMISSION_ENABLED,
+    ):
+        self.max_crawls = max(1, max_crawls)
+        self.queue_size = queue_size
+        self.per_client = per_client
+        self.queue_timeout = queue_timeout
+        self.priority_slots = priority_slots
+        self.enabled = enabled
+        self.running: Dict[str, int] = {lane: 0 for lane in LANES}
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {reason: 0 for reason in AdmissionRejected.MESSAGES}
+        self._waiting: Dict[str, Deque[_Waiter]] = {lane: deque() for lane in LANES}
+        self._clients: Dict[str, int] = {}  # 클라이언트별 실행 + 대기 수집 수
+        self._crawl_sec: Optional[float] = None  # 수집 자리 사용 시간 이동 평균
+
+    # ---- 자리 계산 ----
+
+    def _borrowed(self) -> int:
+        """우선 요청이 빌려 쓰는 수집 자리 수"""
+        return max(0, self.running[PRIORITY] - self.priority_slots)
+
+    def _has_slot(self, lane: str) -> bool:
+        crawl_free = self.running[CRAWL] + self._borrowed() < self.max_crawls
+        if lane == PRIORITY:
+            return self.running[PRIORITY] < self.priority_slots or crawl_free
+        return crawl_free
+
+    def _position(self, lane: str, index: int) -> int:
+        """대기 순번 (우선 대기열이 항상 먼저)"""
+        return index + 1 + (len(self._waiting[PRIORITY]) if lane == CRAWL else 0)
+
+    @property
+    def queued(self) -> int:
+        return sum(len(waiting) for waiting in self._waiting.values())
+
+    def retry_after(self, position: int = 1) -> float:
+        """
+        대기 순번 기준 예상 대기 시간 (초, 최소 1초)
+
+        지금까지의 평균 수집 시간 x (앞선 요청 수 / 수집 자리 수)로 계산합니다.
+        """
+        crawl_sec = self._crawl_sec if self._crawl_sec is not None else ADMISSION_DEFAULT_CRAWL_SEC
+        return max(1.0, crawl_sec * math.ceil(position / self.max_crawls))
+
+    def _update_gauges(self) -> None:
+        for lane in LANES:
+            ADMISSION_QUEUE_DEPTH.labels(lane).set(len(self._waiting[lane]))
+            ADMISSION_RUNNING.labels(lane).set(self.running[lane])
+
+    def _reject(self, reason: str, retry_after: float, position: Optional[int] = None) -> AdmissionRejected:
+        self.rejected[reason] += 1
+        ADMISSION_REJECTIONS.labels(reason).inc()
+        return AdmissionRejected(reason, retry_after, position)
+
+    def _grant(self, lane: str, client: str, waited: float) -> AdmissionTicket:
+        self.running[lane] += 1
+        self.admitted += 1
+        ADMISSION_WAIT.labels(lane).observe(waited)
+        return AdmissionTicket(lane, client, waited, counted=self.enabled and lane == CRAWL)
+
+    def _join(self, lane: str, client: str) -> None:
+        """클라이언트 한도 계산에 요청 하나 추가 (수집 대기열만)"""
+        if lane == CRAWL:
+            self._clients[client] = self._clients.get(client, 0) + 1
+
+    def _leave(self, lane: str, client: str) -> None:
+        """클라이언트 한도 계산에서 요청 하나 제외"""
+        if lane != CRAWL:
+            return
+        count = self._clients.get(client, 0) - 1
+        if count > 0:
+            self._clients[client] = count
+        else:
+            self._clients.pop(client, None)
+
+    def _dispatch(self) -> None:
+        """빈 자리를 대기 중인 요청에 순서대로 배정 (우선 대기열 먼저)"""
+        for lane in LANES:
+            waiting = self._waiting[lane]
+            while waiting and self._has_slot(lane):
+                waiter = waiting.popleft()
+                if waiter.future.done():
+                    continue
+                waiter.future.set_result(self._grant(lane, waiter.client, time.monotonic() - waiter.enqueued_at))
+            if waiting:
+                # 우선 요청이 기다리는 동안 수집 요청이 자리를 먼저 가져가지 않도록
+                break
+        self._update_gauges()
+
+    # ---- 자리 얻기 / 반납 ----
+
+    async def acquire(self, client: str, lane: str = CRAWL) -> AdmissionTicket:
+        """
+        실행 자리 얻기 (없으면 대기열에서 기다림)
+
+        Args:
+            client: 클라이언트 식별자 (IP 등)
+            lane: PRIORITY(가벼운 요청) 또는 CRAWL(키워드 수집)
+
+        Returns:
+            AdmissionTicket (끝나면 release로 반납)
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 참 / 클라이언트 한도 초과 / 대기 시간 초과
+        """
+        if not self.enabled:
+            ticket = self._grant(lane, client, 0.0)
+            self._update_gauges()
+            return ticket
+
+        if lane == CRAWL and self._clients.get(client, 0) >= self.per_client:
+            raise self._reject('client_quota', self.retry_after())
+
+        ahead = len(self._waiting[PRIORITY]) if lane == PRIORITY else self.queued
+        if not ahead and self._has_slot(lane):
+            self._join(lane, client)
+            ticket = self._grant(lane, client, 0.0)
+            self._update_gauges()
+            return ticket
+
+        if self.queued >= self.queue_size:
+            position = self._position(lane, len(self._waiting[lane]))
+            raise self._reject('queue_full', self.retry_after(position), position)
+
+        waiter = _Waiter(lane, client)
+        self._waiting[lane].append(waiter)
+        self._join(lane, client)
+        self._update_gauges()
+        try:
+            return await asyncio.wait_for(waiter.future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            position = self._position(lane, self._remove(waiter))
+            self._leave(lane, client)
+            raise self._reject('timeout', self.retry_after(position), position)
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 자리를 받은 직후 취소됨 - 바로 반납
+                self.release(waiter.future.result())
+            else:
+                self._remove(waiter)
+                self._leave(lane, client)
+            raise
+
+    def _remove(self, waiter: _Waiter) -> int:
+        """대기열에서 제거하고 제거 전 위치 반환"""
+        waiting = self._waiting[waiter.lane]
+        index = 0
+        for index, other in enumerate(waiting):
+            if other is waiter:
+                del waiting[index]
+                break
+        self._dispatch()
+        return index
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """실행 자리 반납 (여러 번 호출해도 한 번만 반영)"""
+        if ticket.released:
+            return
+        ticket.released = True
+        self.running[ticket.lane] -= 1
+        if ticket.counted:
+            self._leave(ticket.lane, ticket.client)
+        if ticket.lane == CRAWL:
+            held = time.monotonic() - ticket.admitted_at
+            if self._crawl_sec is None:
+                self._crawl_sec = held
+            else:
+                self._crawl_sec += _CRAWL_SEC_ALPHA * (held - self._crawl_sec)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, client: str, lane: str = CRAWL) -> AsyncIterator[AdmissionTicket]:
+        """acquire / release를 묶은 컨텍스트 관리자"""
+        ticket = await self.acquire(client, lane)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def snapshot(self) -> Dict:
+        """현재 상태 (지표 노출용)"""
+        return {
+            'enabled': self.enabled,
+            'maxCrawls': self.max_crawls,
+            'prioritySlots': self.priority_slots,
+            'queueSize': self.queue_size,
+            'perClient': self.per_client,
+            'queueTimeoutSec': self.queue_timeout,
+            'running': dict(self.running),
+            'queued': {lane: len(waiting) for lane, waiting in self._waiting.items()},
+            'clients': len(self._clients),
+            'admitted': self.admitted,
+            'rejected': dict(self.rejected),
+            'avgCrawlSec': round(self._crawl_sec, 3) if self._crawl_sec is not None else None,
+        }
@@ -4,21 +4,236 @@ FastAPI 애플리케이션
 네이버 인플루언서 키워드 수집 REST API를 제공합니다.
 """
 
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import PlainTextResponse, FileResponse
+from fastapi.responses import PlainTextResponse, FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from typing import Literal
+from starlette.background import BackgroundTask
+from starlette.concurrency import iterate_in_threadpool
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Literal, Optional, Set
+import asyncio
+import json
+import logging
+import math
 import os
+import time
+
+from .scraper import (
+    fetch_categories_async,
+    fetch_all_keywords_async,
+    get_all_keywords_async,
+    gather_keywords_async,
+    try_fetch_recommend_keywords_async,
+    iter_keyword_pages_async,
+    keywords_result,
+    keywords_ttl,
+)
+from .http_client import open_client, close_client
+from .cache import AsyncTTLCache, CacheEntry, compute_etag
+from .harvest import HarvestJob, harvest_all_async
+from .pacing import AdaptivePacer
+from .checkpoint import get_default_journal
+from .keyword_store import get_default_store
+from .shared_store import get_default_shared_store, keywords_key, CATEGORIES_KEY, JSON_CODEC, KEYWORDS_CODEC
+from .delta import delta_sync_async
+from .search_index import get_default_search_index
+from .export import ExportUnavailable, ZipExporter, parse_formats
+from .trends import TrendsUnavailable, get_default_trend_store, record_snapshot
+from .prewarm import PrewarmScheduler, PrewarmStore
+from .jobs import JobManager, JobQueueFull
+from .resilience import CircuitBreaker, CircuitOpenError, get_default_breaker, get_default_hedger
+from .admission import AdmissionController, AdmissionRejected, INTERNAL_CLIENT, PRIORITY
+from .batch import KeywordBatch, encode_json, select_keywords
+from .utils import KeywordWriter
+from .metrics import REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE, PACER_DELAY, MetricsMiddleware, phase
+from .config import (
+    MIN_SLEEP_SEC,
+    MAX_SLEEP_SEC,
+    DEFAULT_SLEEP_SEC_API,
+    CATEGORY_CACHE_TTL,
+    CACHE_STALE_TTL,
+    KEYWORD_CACHE_MAXSIZE,
+    PREVIEW_CACHE_MAXSIZE,
+    KEYWORD_QUERY_MAX_LIMIT,
+    HARVEST_CONCURRENCY,
+    HARVEST_RATE_PER_SEC,
+    HARVEST_OUTPUT_DIR,
+    SEARCH_DEFAULT_LIMIT,
+    SEARCH_MAX_LIMIT,
+    TRENDS_DEFAULT_WINDOW,
+    TRENDS_MAX_WINDOW,
+    TRENDS_DEFAULT_K,
+    TRENDS_MAX_K,
+    PREWARM_ENABLED,
+    ADMISSION_CLIENT_HEADER,
+)
+
+logger = logging.getLogger(__name__)
+
+# 스트리밍 응답 포맷별 Content-Type
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson; charset=utf-8",
+    "txt": "text/plain; charset=utf-8",
+    "tsv": "text/tab-separated-values; charset=utf-8",
+    "csv": "text/csv; charset=utf-8",
+}
+# 캐시된 결과를 스트리밍할 때 한 번에 보낼 바이트 수
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# 결과 캐시 (카테고리 목록 / 카테고리별 키워드)
+categories_cache = AsyncTTLCache("categories", CATEGORY_CACHE_TTL, CACHE_STALE_TTL, maxsize=1)
+# 추천 키워드 없이 반환한 결과는 DEGRADED_CACHE_TTL 동안만 신선 (이후 요청에서 다시 시도)
+keywords_cache = AsyncTTLCache("keywords", keywords_ttl, CACHE_STALE_TTL, KEYWORD_CACHE_MAXSIZE)
+# 전체 목록이 캐시에 없을 때 limit 조회로 앞부분만 수집한 결과
+previews_cache = AsyncTTLCache("previews", keywords_ttl, CACHE_STALE_TTL, PREVIEW_CACHE_MAXSIZE)
+
+# API 수집 공용 간격 조절기 (스로틀링 감지 결과를 모든 수집이 공유)
+api_pacer = AdaptivePacer(initial_delay=DEFAULT_SLEEP_SEC_API)
+PACER_DELAY.set_function(lambda: api_pacer.delay)
+
+# 새로 수집하는 요청의 동시 실행 / 대기열 / 클라이언트별 한도 (캐시 적중은 제한하지 않음)
+admission = AdmissionController()
+
+# 일괄 수집 작업 목록 (작업 ID -> 상태)
+harvest_jobs: Dict[str, HarvestJob] = {}
+_harvest_tasks: Dict[str, asyncio.Task] = {}
+
+
+# 검색 색인 / 참여자수 추이 갱신 태스크 (응답을 기다리게 하지 않도록 스레드에서 실행)
+_index_tasks: Set[asyncio.Task] = set()
+
+
+def _category_name(category_id: str) -> Optional[str]:
+    """캐시된 카테고리 목록에서 이름 조회 (목록이 없으면 None)"""
+    entry = categories_cache.peek('categories')
+    if entry is None:
+        return None
+    for category in entry.value:
+        if str(category['id']) == category_id:
+            return category['name']
+    return None
+
+
+def _on_indexed(task: asyncio.Task) -> None:
+    _index_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("검색 색인 / 참여자수 추이 갱신 실패: %s", task.exception())
+
+
+def _update_indexes(category_id: str, normal: Any, name: Optional[str]) -> None:
+    get_default_search_index().update(category_id, normal, name)
+    record_snapshot(category_id, normal)
+
+
+def _index_keywords(category_id: str, keywords: Dict) -> None:
+    """
+    끝까지 수집한 일반 키워드를 검색 색인과 참여자수 추이에 반영
+    (백그라운드, 색인은 내용이 같으면, 추이는 마지막 스냅샷이 TRENDS_MIN_INTERVAL 안이면 건너뜀)
+    """
+    task = asyncio.get_running_loop().create_task(asyncio.to_thread(
+        _update_indexes, category_id, keywords['normal'], _category_name(category_id)
+    ))
+    _index_tasks.add(task)
+    task.add_done_callback(_on_indexed)
+
+
+async def _share_keywords(category_id: str, keywords: Dict) -> None:
+    """수집을 끝까지 마친 결과를 공유 저장소(다른 워커/CLI용)와 검색 색인에 저장 (인코딩과 저장은 스레드에서)"""
+    await asyncio.to_thread(
+        get_default_shared_store().put_value, keywords_key(category_id), keywords, keywords_ttl, KEYWORDS_CODEC,
+    )
+    _index_keywords(category_id, keywords)
+
+
+def _on_shared(task: asyncio.Task) -> None:
+    _index_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("공유 저장소 저장 실패: %s", task.exception())
+
+
+def _remember_keywords(category_id: str, keywords: Dict) -> None:
+    """수집을 끝까지 마친 결과를 키워드 캐시에 저장하고, 공유 저장소와 검색 색인에는 백그라운드로 저장"""
+    keywords_cache.set(category_id, keywords)
+    task = asyncio.get_running_loop().create_task(_share_keywords(category_id, keywords))
+    _index_tasks.add(task)
+    task.add_done_callback(_on_shared)
+
+
+# 카테고리 수집 작업 (워커 풀, 끝난 결과는 키워드 캐시에도 채워 둠)
+job_manager = JobManager(
+    pacer=api_pacer,
+    on_done=lambda job, keywords: _remember_keywords(job.category_id, keywords),
+)
+
+async def _prewarm_keywords(category_id: str) -> Dict:
+    """
+    인기 카테고리 미리 갱신 - 공유 저장소 결과가 아직 신선해도 새로 수집해 캐시와 공유 저장소를 교체
+    
+    수집하는 동안 들어온 요청은 기존 결과를 그대로 받습니다.
+    """
+    async def load() -> Dict:
+        keywords = await get_all_keywords_async(
+            category_id, DEFAULT_SLEEP_SEC_API, pacer=api_pacer, journal=get_default_journal(),
+        )
+        await _share_keywords(category_id, keywords)
+        return keywords
+
+    entry = await keywords_cache.refresh(category_id, load)
+    return entry.value
+
+
+async def _prewarm_categories() -> list:
+    """카테고리 목록을 새로 받아 캐시와 공유 저장소를 교체 (keywordCount 변화 확인용)"""
+    categories = await fetch_categories_async()
+    categories_cache.set('categories', categories)
+    await asyncio.to_thread(get_default_shared_store().put_value, CATEGORIES_KEY, categories, CATEGORY_CACHE_TTL)
+    return categories
+
+
+# 인기 카테고리 미리 갱신 (요청 빈도는 모든 워커가 기록하고, 수집은 임대를 가진 하나만 수행)
+prewarm = PrewarmScheduler(
+    _prewarm_keywords,
+    _prewarm_categories,
+    PrewarmStore(),
+    get_default_shared_store(),
+    enabled=PREWARM_ENABLED,
+)
+
+# 카테고리별 증분 동기화 잠금 (같은 카테고리 동기화가 겹치지 않도록)
+_sync_locks: Dict[str, asyncio.Lock] = {}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명 주기 - 시작 시 공유 HTTP 커넥션 풀과 작업 워커를 열고 종료 시 정리"""
+    await open_client()
+    await job_manager.start()
+    # 저장된 검색 색인을 미리 읽어 둠 (첫 검색이 디스크 읽기를 기다리지 않도록)
+    await asyncio.to_thread(get_default_search_index().refresh, True)
+    prewarm.start()
+    yield
+    await prewarm.stop()
+    await job_manager.stop()
+    if _index_tasks:
+        await asyncio.gather(*_index_tasks, return_exceptions=True)
+    await close_client()
+
+
+class FastJSONResponse(JSONResponse):
+    """encode_json(orjson이 있으면 orjson)으로 인코딩하는 JSON 응답 (키워드 묶음도 직접 인코딩)"""
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
 
-from .scraper import fetch_categories, get_all_keywords
-from .utils import format_keywords_txt, format_keywords_tsv, format_keywords_csv
-from .config import MIN_SLEEP_SEC, MAX_SLEEP_SEC, DEFAULT_SLEEP_SEC_API
 
 app = FastAPI(
     title="Naver Influencer Keyword API",
     description="네이버 인플루언서 키워드 수집 API (개인용 로컬 실행)",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # CORS 설정 (로컬 프론트엔드 호출 가능)
@@ -28,8 +243,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+# API 지연 시간 지표 + Server-Timing 헤더 (fetch / parse / sleep / format)
+app.add_middleware(MetricsMiddleware)
+
 # 정적 파일 서빙 (HTML 프론트엔드)
 static_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
 if os.path.exists(static_path):
@@ -49,23 +268,235 @@ async def root():
             "version": "1.0.0",
             "endpoints": {
                 "categories": "/api/categories",
-                "keywords_json": "/api/keywords?categoryId={id}&sleepSec={sec}",
-                "keywords_text": "/api/keywords.txt?categoryId={id}&format={txt|tsv|csv}&includeRecomm={0|1}"
+                "keywords_json": "/api/keywords?categoryId={id}&sleepSec={sec}&limit={n}&offset={n}&minParticipants={n}&sort={api|participants}",
+                "pacing": "/api/pacing",
+                "upstream": "/api/upstream",
+                "admission": "/api/admission",
+                "keywords_text": "/api/keywords.txt?categoryId={id}&format={txt|tsv|csv}&includeRecomm={0|1}",
+                "keywords_stream": "/api/keywords/stream?categoryId={id}&format={ndjson|txt|tsv|csv}&includeRecomm={0|1}",
+                "export": "/api/export?categoryId={id,...}&format={txt,tsv,csv,ndjson,parquet,arrow}&includeRecomm={0|1}&cachedOnly={0|1}",
+                "search": "/api/search?q={query}&category={id,...}&sort={participants|name}&limit={n}",
+                "trends": "/api/trends?categoryId={id}&window={n}&k={n}&by={change|rate}",
+                "prewarm": "/api/prewarm",
+                "cache_stats": "/api/cache/stats",
+                "metrics": "/metrics",
+                "harvest": "POST /api/harvest, GET /api/harvest/{jobId}",
+                "jobs": "POST /api/jobs?categoryId={id}, GET|DELETE /api/jobs/{jobId}, GET /api/jobs/{jobId}/result?format={txt|tsv|csv}&includeRecomm={0|1}"
             }
         }
 
 
+def _cache_headers(entry: CacheEntry, etag: Optional[str] = None) -> Dict[str, str]:
+    """캐시 항목 기준 Cache-Control / ETag / Age 헤더 생성 (만료된 결과면 Warning: 110 추가)"""
+    headers = {
+        'ETag': etag or entry.etag,
+        'Cache-Control': f'public, max-age={entry.max_age}, stale-while-revalidate={CACHE_STALE_TTL}',
+        'Age': str(int(entry.age)),
+    }
+    if not entry.is_fresh(time.time()):
+        headers['Warning'] = '110 - "Response is Stale"'
+    return headers
+
+
+def _unavailable(e: CircuitOpenError) -> HTTPException:
+    """회로 차단 중이고 돌려줄 이전 결과도 없을 때의 응답 (네이버에 요청하지 않고 바로 503)"""
+    return HTTPException(status_code=503, detail=str(e), headers={'Retry-After': str(math.ceil(e.retry_after))})
+
+
+def _rejected(e: AdmissionRejected) -> HTTPException:
+    """실행 자리를 얻지 못한 요청의 응답 (429 + Retry-After, 대기열에 있었으면 X-Queue-Position)"""
+    headers = {'Retry-After': str(math.ceil(e.retry_after))}
+    if e.position is not None:
+        headers['X-Queue-Position'] = str(e.position)
+    return HTTPException(status_code=429, detail=str(e), headers=headers)
+
+
+def _client_key(request: Request) -> str:
+    """클라이언트별 한도에 쓰는 식별자 (ADMISSION_CLIENT_HEADER 헤더의 첫 값, 없으면 접속 IP)"""
+    if ADMISSION_CLIENT_HEADER:
+        value = request.headers.get(ADMISSION_CLIENT_HEADER, "").split(",")[0].strip()
+        if value:
+            return value
+    return request.client.host if request.client else INTERNAL_CLIENT
+
+
+async def _last_known(cache: AsyncTTLCache, key: str, shared_key: str, decode) -> Optional[CacheEntry]:
+    """
+    만료 여부와 관계없이 마지막으로 받은 결과 (메모리 캐시, 없으면 공유 저장소)
+    
+    회로 차단 중에 새로 수집하지 못할 때 stale 표시와 함께 돌려줄 항목입니다.
+    """
+    entry = cache.peek(key)
+    if entry is not None:
+        return entry
+    # 공유 저장소 조회와 디코딩은 이벤트 루프를 막지 않도록 스레드에서
+    return await asyncio.to_thread(_shared_entry, shared_key, decode)
+
+
+def _shared_entry(shared_key: str, decode) -> Optional[CacheEntry]:
+    shared = get_default_shared_store().get(shared_key)
+    if shared is None:
+        return None
+    value = decode(shared.payload)
+    return CacheEntry(
+        value=value,
+        etag=compute_etag(encode_json(value)),
+        created_at=shared.created_at,
+        expires_at=shared.expires_at,
+        stale_until=shared.expires_at,
+    )
+
+
+def _degraded_headers(keywords: Dict) -> Dict[str, str]:
+    """일부가 빠진 결과이면 X-Degraded 헤더 (빠진 부분 이름)"""
+    return {'X-Degraded': 'recomm'} if 'recommError' in keywords else {}
+
+
+def _json_response(entry: CacheEntry, headers: Dict[str, str]) -> Response:
+    """캐시 항목 값 전체를 JSON으로 응답 (ETag 계산 때 인코딩해 둔 본문을 그대로 씀)"""
+    with phase('format'):
+        content = entry.body('json', encode_json)
+    return Response(content, media_type="application/json", headers=headers)
+
+
+def _encode_keywords(keywords: Dict, format: str, include_recomm: bool) -> bytes:
+    """
+    키워드 결과 전체를 텍스트 포맷으로 인코딩
+    
+    추천 키워드를 포함하면 맨 위에 두고, txt는 빈 줄로 일반 키워드와 구분합니다.
+    /api/keywords.txt 와 캐시 적중 시의 /api/keywords/stream 이 같은 본문을 씁니다.
+    """
+    writer = KeywordWriter(format)
+    parts = [writer.begin()]
+    if include_recomm and keywords['recomm']:
+        parts.append(writer.write(keywords['recomm']))
+        parts.append(writer.section_break())
+    parts.append(writer.write(keywords['normal']))
+    parts.append(writer.end())
+    return "".join(parts).encode('utf-8')
+
+
+def _keywords_body(entry: CacheEntry, format: str, include_recomm: bool) -> bytes:
+    """캐시 항목의 포맷별 본문 (처음 요청할 때 한 번만 인코딩해 항목에 보관)"""
+    with phase('format'):
+        return entry.body((format, include_recomm), lambda keywords: _encode_keywords(keywords, format, include_recomm))
+
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인"""
+    if_none_match = request.headers.get('if-none-match')
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+
+
+async def _load_categories(client: str = INTERNAL_CLIENT) -> CacheEntry:
+    """
+    캐시를 거쳐 카테고리 목록 조회 (캐시에 없으면 공유 저장소, 그다음 네이버)
+    
+    새로 받을 때는 우선 대기열에서 실행 자리를 얻으므로 키워드 수집이 몰려도 기다리지 않습니다.
+    회로 차단 중이면 마지막으로 받은 목록을 만료 여부와 관계없이 반환합니다.
+    """
+    async def load() -> list:
+        async with admission.slot(client, PRIORITY):
+            return await fetch_categories_async(store=get_default_shared_store())
+
+    try:
+        return await categories_cache.get_or_load('categories', load)
+    except CircuitOpenError:
+        entry = await _last_known(categories_cache, 'categories', CATEGORIES_KEY, JSON_CODEC.decode)
+        if entry is None:
+            raise
+        return entry
+
+
+async def _load_keywords(
+    category_id: str,
+    sleep_sec: Optional[float] = None,
+    client: str = INTERNAL_CLIENT,
+) -> CacheEntry:
+    """
+    캐시를 거쳐 카테고리 키워드 조회 (동시 요청은 수집 하나를 공유)
+    
+    sleep_sec를 지정하지 않으면 공용 간격 조절기(api_pacer)를 사용하고,
+    지정하면 그 값으로 시작하는 별도의 간격 조절기를 사용합니다.
+    메모리 캐시에 없으면 공유 저장소를 확인하며, 다른 워커가 같은 카테고리를 수집 중이면
+    새로 수집하지 않고 그 결과를 기다립니다.
+    새로 수집할 때만 client 이름으로 실행 자리를 얻습니다 (없으면 AdmissionRejected).
+    회로 차단 중이면 마지막으로 받은 결과를 만료 여부와 관계없이 반환합니다 (없으면 CircuitOpenError).
+    """
+    pacer = api_pacer if sleep_sec is None else None
+
+    async def load() -> Dict:
+        async with admission.slot(client):
+            keywords = await get_all_keywords_async(
+                category_id,
+                DEFAULT_SLEEP_SEC_API if sleep_sec is None else sleep_sec,
+                pacer=pacer,
+                journal=get_default_journal(),
+                store=get_default_shared_store(),
+            )
+        _index_keywords(category_id, keywords)
+        return keywords
+
+    try:
+        return await keywords_cache.get_or_load(category_id, load)
+    except CircuitOpenError:
+        entry = await _last_known(keywords_cache, category_id, keywords_key(category_id), KEYWORDS_CODEC.decode)
+        if entry is None:
+            raise
+        return entry
+
+
+async def _load_keywords_page(
+    category_id: str,
+    limit: int,
+    offset: int,
+    min_participants: Optional[int],
+    client: str = INTERNAL_CLIENT,
+) -> CacheEntry:
+    """
+    카테고리 키워드 앞부분만 수집 (조건에 맞는 키워드가 limit개 모이면 중단)
+    
+    같은 조건의 동시 요청은 수집 하나를 공유하며 결과는 previews_cache에 보관합니다.
+    """
+    async def load() -> Dict:
+        async with admission.slot(client):
+            return await gather_keywords_async(
+                category_id,
+                fetch_all_keywords_async(
+                    category_id,
+                    DEFAULT_SLEEP_SEC_API,
+                    pacer=api_pacer,
+                    journal=get_default_journal(),
+                    limit=limit,
+                    offset=offset,
+                    min_participants=min_participants,
+                ),
+            )
+    
+    return await previews_cache.get_or_load((category_id, limit, offset, min_participants), load)
+
+
 @app.get("/api/categories")
-async def get_categories():
+async def get_categories(request: Request):
     """
-    카테고리 목록 조회
+    카테고리 목록 조회 (캐시 사용)
     
     Returns:
         [{'id': ..., 'name': ..., 'keywordCount': ...}, ...]
     """
     try:
-        categories = fetch_categories()
-        return categories
+        entry = await _load_categories(_client_key(request))
+        headers = _cache_headers(entry)
+        if _is_not_modified(request, entry.etag):
+            return Response(status_code=304, headers=headers)
+        return _json_response(entry, headers)
+    except CircuitOpenError as e:
+        raise _unavailable(e)
+    except AdmissionRejected as e:
+        raise _rejected(e)
     except ValueError as e:
         # 파싱 오류 등 (네이버 응답 구조 변경)
         raise HTTPException(status_code=502, detail=f"네이버 응답 처리 실패: {str(e)}")
@@ -76,27 +507,93 @@ async def get_categories():
 
 @app.get("/api/keywords")
 async def get_keywords(
+    request: Request,
     categoryId: str = Query(..., description="카테고리 ID"),
-    sleepSec: float = Query(
-        DEFAULT_SLEEP_SEC_API, 
+    sleepSec: Optional[float] = Query(
+        None, 
         ge=MIN_SLEEP_SEC, 
         le=MAX_SLEEP_SEC, 
-        description="요청 간 대기 시간 (초)"
-    )
+        description="시작 요청 간 대기 시간 (초, 미지정 시 공용 적응형 간격 사용)"
+    ),
+    limit: Optional[int] = Query(None, ge=1, le=KEYWORD_QUERY_MAX_LIMIT, description="일반 키워드 최대 개수"),
+    offset: int = Query(0, ge=0, description="건너뛸 일반 키워드 수 (minParticipants 적용 후 기준)"),
+    minParticipants: Optional[int] = Query(None, ge=0, description="최소 참여자수"),
+    sort: Literal["api", "participants"] = Query("api", description="정렬 (api=수집 순서, participants=참여자수 내림차순)")
 ):
     """
-    키워드 조회 (JSON 응답)
+    키워드 조회 (JSON 응답, 캐시 사용)
+    
+    limit/offset/minParticipants/sort 를 지정하면 일반 키워드 중 해당 구간만 반환합니다.
+    
+    - 전체 목록이 캐시에 있으면 캐시에서 바로 선택 (sort=participants 는 힙 기반 상위 K개)
+    - 캐시에 없고 sort=api 이며 limit 이 있으면, 조건에 맞는 키워드가 모이는 즉시
+      페이지네이션을 멈추므로 미리보기는 보통 첫 페이지 하나로 끝남
+    - 그 밖의 경우(참여자수 정렬, limit 없는 필터)는 전체를 수집해 캐시에 저장한 뒤 선택
     
     Args:
         categoryId: 카테고리 ID
-        sleepSec: 요청 간 대기 시간 (0~10초)
+        sleepSec: 시작 요청 간 대기 시간 (0~10초, 새로 수집할 때만 적용)
+        limit: 일반 키워드 최대 개수
+        offset: 건너뛸 일반 키워드 수
+        minParticipants: 최소 참여자수
+        sort: 정렬 기준
         
     Returns:
         {'recomm': [{'name': ..., 'participantCount': ...}], 'normal': [...]}
+        (구간 조회 시 'offset', 'limit', 'source': 'cache' | 'live' 추가)
+        추천 키워드 조회가 실패/시간 초과하면 recomm은 비어 있고 'recommError'와
+        X-Degraded: recomm 헤더가 추가됩니다 (일반 키워드는 정상 반환).
     """
+    prewarm.record(categoryId)
+    bounded = limit is not None or offset > 0 or minParticipants is not None or sort != "api"
     try:
-        keywords = get_all_keywords(categoryId, sleepSec)
-        return keywords
+        if not bounded:
+            entry = await _load_keywords(categoryId, sleepSec, _client_key(request))
+            headers = {**_cache_headers(entry), **_degraded_headers(entry.value)}
+            if _is_not_modified(request, entry.etag):
+                return Response(status_code=304, headers=headers)
+            return _json_response(entry, headers)
+        
+        cached = keywords_cache.peek(categoryId)
+        if (
+            limit is not None and sort == "api" and (cached is None or not cached.is_usable(time.time()))
+            and get_default_breaker().state != CircuitBreaker.OPEN
+        ):
+            # 전체 목록이 없으면 필요한 만큼만 수집 (차단 중이면 마지막 전체 목록에서 선택)
+            entry = await _load_keywords_page(categoryId, limit, offset, minParticipants, _client_key(request))
+            headers = {**_cache_headers(entry), **_degraded_headers(entry.value)}
+            if _is_not_modified(request, entry.etag):
+                return Response(status_code=304, headers=headers)
+            # 미리보기 캐시 키에 limit/offset/minParticipants가 들어 있으므로 본문도 항목에 보관
+            with phase('format'):
+                content = entry.body('live', lambda keywords: encode_json(
+                    {**keywords, 'offset': offset, 'limit': limit, 'source': 'live'}
+                ))
+            return Response(content, media_type="application/json", headers=headers)
+        
+        entry = await _load_keywords(categoryId, sleepSec, _client_key(request))
+        # 조건별로 본문이 다르므로 ETag에 반영
+        etag = f'{entry.etag[:-1]}-{limit}-{offset}-{minParticipants}-{sort}"'
+        headers = {**_cache_headers(entry, etag=etag), **_degraded_headers(entry.value)}
+        if _is_not_modified(request, etag):
+            return Response(status_code=304, headers=headers)
+        with phase('format'):
+            body = {
+                **keywords_result(
+                    entry.value['recomm'],
+                    select_keywords(entry.value['normal'], limit, offset, minParticipants, sort),
+                    entry.value.get('recommError'),
+                ),
+                'offset': offset,
+                'limit': limit,
+                'source': 'cache',
+            }
+            content = encode_json(body)
+        return Response(content, media_type="application/json", headers=headers)
+    except CircuitOpenError as e:
+        raise _unavailable(e)
+    except AdmissionRejected as e:
+        raise _rejected(e)
     except ValueError as e:
         # GraphQL 오류 (errors 키 존재 또는 data 없음)
         raise HTTPException(status_code=502, detail=f"네이버 응답 오류: {str(e)}")
@@ -107,12 +604,16 @@ async def get_keywords(
 
 @app.get("/api/keywords.txt", response_class=PlainTextResponse)
 async def get_keywords_text(
+    request: Request,
     categoryId: str = Query(..., description="카테고리 ID"),
     format: Literal["txt", "tsv", "csv"] = Query("txt", description="출력 포맷"),
     includeRecomm: int = Query(0, ge=0, le=1, description="추천 키워드 포함 여부 (0=미포함, 1=포함)")
 ):
     """
-    키워드 조회 (텍스트 응답)
+    키워드 조회 (텍스트 응답, 캐시 사용)
+    
+    /api/keywords 와 같은 캐시 항목을 사용하므로 미리보기 후 다운로드해도
+    다시 수집하지 않습니다.
     
     Args:
         categoryId: 카테고리 ID
@@ -122,34 +623,654 @@ async def get_keywords_text(
     Returns:
         텍스트 형식의 키워드 데이터
     """
+    prewarm.record(categoryId)
     try:
-        keywords = get_all_keywords(categoryId, DEFAULT_SLEEP_SEC_API)
+        entry = await _load_keywords(categoryId, client=_client_key(request))
+        keywords = entry.value
         
-        # 데이터 병합
-        data = keywords['normal'].copy()
-        
-        if includeRecomm == 1 and keywords['recomm']:
-            # 추천 키워드를 맨 위에 추가하고 빈 줄로 구분
-            if format == "txt":
-                # txt 포맷: 추천 키워드 + 빈 줄 + 일반 키워드
-                recomm_text = format_keywords_txt(keywords['recomm'])
-                normal_text = format_keywords_txt(keywords['normal'])
-                return f"{recomm_text}\n\n{normal_text}"
-            else:
-                # tsv/csv 포맷: 추천을 맨 위에 추가 (빈 줄 없이)
-                data = keywords['recomm'] + keywords['normal']
+        # 포맷/옵션별로 본문이 다르므로 ETag에 반영
+        headers = {
+            **_cache_headers(entry, etag=f'{entry.etag[:-1]}-{format}-{includeRecomm}"'),
+            **_degraded_headers(keywords),
+        }
+        if _is_not_modified(request, headers['ETag']):
+            return Response(status_code=304, headers=headers)
         
-        # 포맷 변환
-        if format == "txt":
-            return format_keywords_txt(data)
-        elif format == "tsv":
-            return format_keywords_tsv(data)
-        else:  # csv
-            return format_keywords_csv(data)
+        # 추천 키워드는 맨 위에 추가 (txt는 빈 줄로 구분), 포맷별 본문은 캐시 항목에 보관
+        return PlainTextResponse(_keywords_body(entry, format, includeRecomm == 1), headers=headers)
             
+    except CircuitOpenError as e:
+        raise _unavailable(e)
+    except AdmissionRejected as e:
+        raise _rejected(e)
     except ValueError as e:
         # GraphQL 오류
         raise HTTPException(status_code=502, detail=f"네이버 응답 오류: {str(e)}")
     except Exception as e:
         # 네트워크 오류 등
         raise HTTPException(status_code=502, detail=f"키워드 조회 실패: {str(e)}")
+
+
+def _chunks(body: bytes, size: int = STREAM_CHUNK_BYTES):
+    """본문을 size 바이트씩 나눔"""
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+def _stream_cached(entry: CacheEntry, format: str, include_recomm: bool, cache_status: str) -> StreamingResponse:
+    """캐시 항목의 포맷별 본문을 STREAM_CHUNK_BYTES씩 스트리밍 (X-Cache: HIT | STALE)"""
+    keywords = entry.value
+    body = _keywords_body(entry, format, include_recomm)
+    
+    async def cached_body() -> AsyncIterator[bytes]:
+        for chunk in _chunks(body):
+            yield chunk
+    
+    headers = {'X-Total-Count': str(len(keywords['normal'])), 'X-Cache': cache_status, **_degraded_headers(keywords)}
+    if not entry.is_fresh(time.time()):
+        headers['Warning'] = '110 - "Response is Stale"'
+    return StreamingResponse(cached_body(), media_type=STREAM_MEDIA_TYPES[format], headers=headers)
+
+
+@app.get("/api/keywords/stream")
+async def stream_keywords(
+    request: Request,
+    categoryId: str = Query(..., description="카테고리 ID"),
+    format: Literal["ndjson", "txt", "tsv", "csv"] = Query("ndjson", description="출력 포맷"),
+    includeRecomm: int = Query(0, ge=0, le=1, description="추천 키워드 포함 여부 (0=미포함, 1=포함)")
+):
+    """
+    키워드 스트리밍 조회
+    
+    GraphQL 페이지가 도착할 때마다 해당 행을 바로 전송하므로 큰 카테고리도
+    첫 바이트가 곧바로 도착합니다. 캐시된 결과가 있으면 캐시에서 스트리밍하고,
+    새로 수집한 경우 수집이 끝나면 캐시에 저장합니다.
+    
+    응답 헤더 X-Total-Count 에 전체 키워드 수(알 수 있는 경우)가 포함됩니다.
+    추천 키워드 조회가 실패/시간 초과하면 추천 없이 스트리밍하고 X-Degraded: recomm 헤더를 붙입니다.
+    수집 도중 오류가 나면 ndjson은 {"error": ...} 행을 보내고 종료하며,
+    다른 포맷은 연결을 끊습니다. 회로 차단 중이면 마지막으로 받은 결과를 X-Cache: STALE로 보냅니다.
+    새로 수집하는 동안에는 응답이 끝날 때까지 실행 자리 하나를 사용합니다 (얻지 못하면 429).
+    
+    Args:
+        categoryId: 카테고리 ID
+        format: 출력 포맷 (ndjson, txt, tsv, csv)
+        includeRecomm: 추천 키워드 포함 여부
+    """
+    prewarm.record(categoryId)
+    writer = KeywordWriter(format)
+    media_type = STREAM_MEDIA_TYPES[format]
+    
+    entry = keywords_cache.peek(categoryId)
+    if entry is None or not entry.is_usable(time.time()):
+        # 다른 워커/CLI가 받아 둔 결과가 있으면 다시 수집하지 않음
+        shared = await asyncio.to_thread(get_default_shared_store().get_fresh, keywords_key(categoryId), KEYWORDS_CODEC)
+        if shared is not None:
+            entry = keywords_cache.set(categoryId, shared)
+    if entry is not None and entry.is_usable(time.time()):
+        # 캐시 적중: stale 이면 get_or_load가 백그라운드 갱신을 시작
+        try:
+            entry = await _load_keywords(categoryId, client=_client_key(request))
+        except AdmissionRejected as e:
+            raise _rejected(e)
+        return _stream_cached(entry, format, includeRecomm == 1, 'HIT')
+    
+    try:
+        ticket = await admission.acquire(_client_key(request))
+    except AdmissionRejected as e:
+        raise _rejected(e)
+    
+    # 첫 페이지까지는 응답 시작 전에 받아 두어 오류를 502로 돌려줄 수 있게 함
+    # (추천 키워드는 첫 페이지와 동시에 요청하고, 실패하면 추천 없이 진행)
+    recomm_task = asyncio.ensure_future(try_fetch_recommend_keywords_async(categoryId))
+    try:
+        pages = iter_keyword_pages_async(
+            categoryId, DEFAULT_SLEEP_SEC_API, pacer=api_pacer, journal=get_default_journal()
+        )
+        first = await pages.__anext__()
+    except CircuitOpenError as e:
+        # 차단 중이면 마지막으로 받은 결과를 stale 표시와 함께 스트리밍 (없으면 바로 503)
+        recomm_task.cancel()
+        admission.release(ticket)
+        entry = await _last_known(keywords_cache, categoryId, keywords_key(categoryId), KEYWORDS_CODEC.decode)
+        if entry is None:
+            raise _unavailable(e)
+        return _stream_cached(entry, format, includeRecomm == 1, 'STALE')
+    except ValueError as e:
+        recomm_task.cancel()
+        admission.release(ticket)
+        raise HTTPException(status_code=502, detail=f"네이버 응답 오류: {str(e)}")
+    except Exception as e:
+        recomm_task.cancel()
+        admission.release(ticket)
+        raise HTTPException(status_code=502, detail=f"키워드 조회 실패: {str(e)}")
+    except BaseException:
+        # 요청 취소
+        recomm_task.cancel()
+        admission.release(ticket)
+        raise
+    recomm, recomm_error = await recomm_task
+    
+    async def live_body() -> AsyncIterator[str]:
+        collected = KeywordBatch(first.keywords)
+        try:
+            yield writer.begin()
+            if includeRecomm == 1 and recomm:
+                yield writer.write(recomm)
+                yield writer.section_break()
+            yield writer.write(first.keywords)
+            
+            async for page in pages:
+                collected.extend(page.keywords)
+                yield writer.write(page.keywords)
+        except Exception as e:
+            logger.warning("키워드 스트리밍 중단 (%s): %s", categoryId, e)
+            if format == "ndjson":
+                yield json.dumps({'error': str(e)}, ensure_ascii=False) + "\n"
+                return
+            raise
+        finally:
+            await pages.aclose()
+            admission.release(ticket)
+        
+        yield writer.end()
+        # 끝까지 받은 결과는 캐시에 저장 (이후 요청은 캐시에서 응답)
+        _remember_keywords(categoryId, keywords_result(recomm, collected, recomm_error))
+    
+    headers = {'X-Cache': 'MISS'}
+    if recomm_error is not None:
+        headers['X-Degraded'] = 'recomm'
+    if first.total is not None:
+        headers['X-Total-Count'] = str(first.total)
+    # 본문을 보내기 전에 연결이 끊겨도 실행 자리는 반납 (release는 한 번만 반영)
+    return StreamingResponse(
+        live_body(), media_type=media_type, headers=headers, background=BackgroundTask(admission.release, ticket),
+    )
+
+
+def _parse_since(value: str) -> float:
+    """since 파라미터 파싱 (epoch 초 또는 ISO 8601, 시간대 없으면 로컬 시간)"""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="since는 epoch 초 또는 ISO 8601 형식이어야 합니다.")
+
+
+@app.get("/api/export")
+async def export_keywords(
+    request: Request,
+    categoryId: Optional[str] = Query(None, description="내보낼 카테고리 ID (쉼표로 여러 개, 미지정 시 전체)"),
+    format: str = Query("txt,tsv,csv", description="포맷 (쉼표로 여러 개: txt, tsv, csv, ndjson, parquet, arrow)"),
+    includeRecomm: int = Query(0, ge=0, le=1, description="추천 키워드 포함 여부 (0=미포함, 1=포함)"),
+    cachedOnly: int = Query(0, ge=0, le=1, description="받아 둔 결과만 내보내기 (1이면 새로 수집하지 않고 건너뜀)"),
+):
+    """
+    여러 카테고리 키워드를 zip 하나로 내보내기 (스트리밍)
+    
+    카테고리를 차례로 조회하며(캐시 / 공유 저장소, 없으면 수집) 끝나는 대로 zip 항목을 보내므로
+    zip 전체를 메모리에 모으지 않습니다. 텍스트 포맷은 {포맷}/{카테고리명}.{포맷} 항목으로,
+    parquet / arrow 는 모든 카테고리를 담은 keywords.{포맷} 항목 하나로 마지막에 추가됩니다.
+    조회에 실패한(또는 cachedOnly=1에서 받아 둔 결과가 없는) 카테고리는 건너뛰고 manifest.json에 기록합니다.
+    
+    Args:
+        categoryId: 카테고리 ID 목록 (쉼표 구분)
+        format: 포맷 목록 (쉼표 구분)
+        includeRecomm: 추천 키워드 포함 여부
+        cachedOnly: 받아 둔 결과만 내보낼지 여부
+    """
+    try:
+        exporter = ZipExporter(parse_formats(format), includeRecomm == 1)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExportUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    
+    client = _client_key(request)
+    try:
+        categories = (await _load_categories(client)).value
+    except CircuitOpenError as e:
+        exporter.close()
+        raise _unavailable(e)
+    except AdmissionRejected as e:
+        exporter.close()
+        raise _rejected(e)
+    except Exception as e:
+        exporter.close()
+        raise HTTPException(status_code=502, detail=f"카테고리 조회 실패: {str(e)}")
+    
+    names = {str(c['id']): c['name'] for c in categories}
+    selected = list(names) if categoryId is None else [c.strip() for c in categoryId.split(',') if c.strip()]
+    unknown = [c for c in selected if c not in names]
+    if unknown or not selected:
+        exporter.close()
+        raise HTTPException(status_code=404, detail=f"카테고리를 찾을 수 없습니다: {', '.join(unknown)}")
+    
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            for category_id in selected:
+                if cachedOnly == 1:
+                    entry = await _last_known(keywords_cache, category_id, keywords_key(category_id), KEYWORDS_CODEC.decode)
+                    if entry is None:
+                        exporter.skip(category_id, names[category_id], "not_cached")
+                        continue
+                else:
+                    try:
+                        entry = await _load_keywords(category_id, client=client)
+                    except Exception as e:
+                        exporter.skip(category_id, names[category_id], str(e))
+                        continue
+                # zip 압축은 이벤트 루프를 막지 않도록 스레드에서
+                async for chunk in iterate_in_threadpool(exporter.add_category(category_id, names[category_id], entry.value)):
+                    yield chunk
+            async for chunk in iterate_in_threadpool(exporter.finish()):
+                yield chunk
+        finally:
+            exporter.close()
+    
+    filename = f"naver-keywords-{datetime.now():%Y%m%d-%H%M%S}.zip"
+    return StreamingResponse(
+        body(),
+        media_type="application/zip",
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+    )
+
+
+@app.post("/api/keywords/sync")
+async def sync_keywords(
+    request: Request,
+    categoryId: str = Query(..., description="카테고리 ID"),
+    full: int = Query(0, ge=0, le=1, description="조기 중단 없이 끝까지 수집 (0=자동, 1=전체)")
+):
+    """
+    카테고리 증분 동기화 실행
+    
+    키워드 저장소와 비교해 추가/삭제/변경된 키워드만 반환합니다.
+    이전에 끝까지 수집한 적이 있으면 연속으로 변경 없는 페이지가 이어질 때 일찍 멈춥니다.
+    키워드 수집과 같은 실행 자리를 사용합니다 (얻지 못하면 429).
+    
+    Args:
+        categoryId: 카테고리 ID
+        full: 1이면 끝까지 수집 (삭제된 키워드까지 반영)
+        
+    Returns:
+        {'categoryId': ..., 'pages': ..., 'complete': ..., 'earlyStopped': ...,
+         'added': [...], 'removed': [...], 'changed': [...]}
+    """
+    lock = _sync_locks.setdefault(categoryId, asyncio.Lock())
+    try:
+        async with lock, admission.slot(_client_key(request)):
+            options = {'early_stop_pages': 0} if full == 1 else {}
+            result = await delta_sync_async(categoryId, pacer=api_pacer, **options)
+    except CircuitOpenError as e:
+        raise _unavailable(e)
+    except AdmissionRejected as e:
+        raise _rejected(e)
+    except ValueError as e:
+        raise HTTPException(status_code=502, detail=f"네이버 응답 오류: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"키워드 동기화 실패: {str(e)}")
+
+    # 바뀐 내용이 있으면 캐시된 전체 목록은 더 이상 최신이 아님
+    if result.added or result.removed or result.changed:
+        keywords_cache.invalidate(categoryId)
+        await asyncio.to_thread(get_default_shared_store().invalidate, keywords_key(categoryId))
+    return result.as_dict()
+
+
+@app.get("/api/keywords/delta")
+async def get_keywords_delta(
+    categoryId: str = Query(..., description="카테고리 ID"),
+    since: Optional[str] = Query(None, description="기준 시각 (epoch 초 또는 ISO 8601, 미지정 시 마지막 동기화의 변경분)")
+):
+    """
+    since 이후 저장소에 기록된 키워드 변경분 조회 (네이버 요청 없음)
+    
+    같은 키워드가 여러 번 바뀌었으면 순변경 하나로 합칩니다.
+    
+    Args:
+        categoryId: 카테고리 ID
+        since: 기준 시각
+        
+    Returns:
+        {'categoryId': ..., 'since': ..., 'lastSyncAt': ..., 'added': [...], 'removed': [...], 'changed': [...]}
+    """
+    store = get_default_store()
+    last_run = await asyncio.to_thread(store.last_run, categoryId)
+    if last_run is None:
+        raise HTTPException(status_code=404, detail="동기화 기록이 없습니다. 먼저 POST /api/keywords/sync 를 실행하세요.")
+
+    since_ts = _parse_since(since) if since is not None else last_run.started_at
+    changes = await asyncio.to_thread(store.changes_since, categoryId, since_ts)
+    return {
+        'categoryId': categoryId,
+        'since': since_ts,
+        'lastSyncAt': last_run.finished_at,
+        'lastSyncComplete': last_run.complete,
+        **changes,
+    }
+
+
+@app.get("/api/search")
+async def search_keywords(
+    q: str = Query(..., min_length=1, description="검색어 (초성만 입력하면 초성 검색)"),
+    category: Optional[str] = Query(None, description="검색할 카테고리 ID (쉼표로 여러 개, 미지정 시 전체)"),
+    sort: Literal["participants", "name"] = Query("participants", description="정렬 (participants=참여자수 내림차순, name=키워드명 순)"),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=SEARCH_MAX_LIMIT, description="최대 결과 수"),
+):
+    """
+    수집해 둔 키워드 검색 (로컬 색인, 네이버에 요청하지 않음)
+    
+    키워드 목록을 끝까지 수집한 카테고리만 검색됩니다 (수집이 끝나는 대로 색인에 반영).
+    
+    Args:
+        q: 검색어 (공백/대소문자 무시)
+        category: 카테고리 ID 목록 (쉼표 구분)
+        sort: 정렬 기준
+        limit: 최대 결과 수
+        
+    Returns:
+        {'query': ..., 'initials': ..., 'total': ..., 'tookMs': ...,
+         'categories': [{'categoryId': ..., 'name': ..., 'matches': ...}],
+         'items': [{'categoryId': ..., 'name': ..., 'participantCount': ...}]}
+    """
+    categories = None if category is None else [c.strip() for c in category.split(',') if c.strip()]
+    try:
+        result = await asyncio.to_thread(get_default_search_index().search, q, categories, sort, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    body = result.as_dict()
+    for item in body['categories']:
+        if item['name'] is None:
+            item['name'] = _category_name(item['categoryId'])
+    return body
+
+
+@app.get("/api/trends")
+async def get_trends(
+    categoryId: str = Query(..., description="카테고리 ID"),
+    window: int = Query(TRENDS_DEFAULT_WINDOW, ge=2, le=TRENDS_MAX_WINDOW, description="비교할 최근 스냅샷 수"),
+    k: int = Query(TRENDS_DEFAULT_K, ge=1, le=TRENDS_MAX_K, description="늘어난 / 줄어든 키워드 각각 최대 개수"),
+    by: Literal["change", "rate"] = Query("change", description="순위 기준 (change=참여자수 변화량, rate=증가율)"),
+):
+    """
+    카테고리 참여자수 추이 (로컬에 쌓인 수집 스냅샷, 네이버에 요청하지 않음)
+    
+    키워드 목록을 끝까지 수집할 때마다 스냅샷이 쌓이며, 최근 window개 스냅샷에서
+    처음 확인된 참여자수와 마지막 참여자수를 비교합니다.
+    
+    Args:
+        categoryId: 카테고리 ID
+        window: 비교할 최근 스냅샷 수
+        k: 늘어난 / 줄어든 키워드 각각 최대 개수
+        by: 순위 기준
+        
+    Returns:
+        {'categoryId': ..., 'window': ..., 'snapshots': ..., 'keywords': ..., 'new': ..., 'removed': ...,
+         'takenAt': [...], 'totals': [...],
+         'gainers': [{'name', 'participantCount', 'previous', 'change', 'growthRate', 'perDay', 'movingAverage', 'series'}],
+         'losers': [...]}
+    """
+    try:
+        result = await asyncio.to_thread(get_default_trend_store().trends, categoryId, window, k, by)
+    except TrendsUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"카테고리 {categoryId}의 스냅샷이 2개 미만입니다 (수집을 마칠 때마다 쌓입니다)")
+    return result
+
+
+@app.get("/api/pacing")
+async def get_pacing():
+    """
+    공용 적응형 간격 조절기 상태 조회
+    
+    Returns:
+        {'delaySec': ..., 'ratePerSec': ..., 'throttles': ..., ...}
+    """
+    return api_pacer.snapshot()
+
+
+@app.get("/api/upstream")
+async def get_upstream():
+    """
+    upstream 장애 대응 상태 조회
+    
+    Returns:
+        {'breaker': {'state': 'closed' | 'open' | 'half_open', 'failures': ..., 'retryAfterSec': ..., ...},
+         'hedge': {'delaySec': ..., 'calls': ..., 'hedges': ..., 'hedgeWins': ..., ...}}
+    """
+    return {'breaker': get_default_breaker().snapshot(), 'hedge': get_default_hedger().snapshot()}
+
+
+@app.get("/api/admission")
+async def get_admission():
+    """
+    수집 실행 자리 / 대기열 상태 조회
+    
+    Returns:
+        {'maxCrawls': ..., 'running': {'priority': ..., 'crawl': ...}, 'queued': {...},
+         'admitted': ..., 'rejected': {'queue_full': ..., 'client_quota': ..., 'timeout': ...}, ...}
+    """
+    return admission.snapshot()
+
+
+@app.get("/api/prewarm")
+async def get_prewarm():
+    """
+    인기 카테고리 미리 갱신 일정 조회
+    
+    Returns:
+        {'enabled': ..., 'leader': ..., 'quiet': ..., 'budget': {'limit', 'used', 'remaining', ...},
+         'items': [{'categoryId', 'score', 'expiresAt', 'refreshAt', 'due', 'lastRefresh', ...}], ...}
+        (인기 순, leader: 이 워커가 수집을 맡고 있는지)
+    """
+    return await asyncio.to_thread(prewarm.schedule)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """
+    Prometheus 지표 (텍스트 형식)
+    
+    upstream 요청 지연 시간/오류, 카테고리별 페이지·키워드 수, 단계별(fetch/parse/sleep/format) 시간,
+    진행 중인 수집 수, 라우트별 API 지연 시간
+    """
+    return Response(REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """
+    캐시 히트/미스 통계 조회
+    
+    Returns:
+        {'categories': {...}, 'keywords': {...}, 'previews': {...}, 'shared': {...}, 'search': {...}}
+        (shared: 이 워커의 공유 저장소 사용 통계 - hits, loads, waits, lease_takeovers,
+         search: 검색 색인 크기와 사용 통계 - categories, keywords, grams, searches, updates, ...)
+    """
+    stats = {
+        cache.name: {**cache.stats.as_dict(), 'size': len(cache)}
+        for cache in (categories_cache, keywords_cache, previews_cache)
+    }
+    stats['shared'] = get_default_shared_store().stats.as_dict()
+    search_index = get_default_search_index()
+    stats['search'] = {**search_index.summary(), **search_index.stats.as_dict()}
+    return stats
+
+
+async def _run_harvest(job: HarvestJob, **options) -> None:
+    """일괄 수집 작업 실행 (백그라운드 태스크)"""
+    try:
+        entry = await _load_categories()
+        categories = entry.value
+        job.total = len(categories)
+        job.status = "running"
+
+        def on_result(result, keywords) -> None:
+            job.completed.append(result)
+            # 수집이 끝난 카테고리는 키워드 캐시에도 채워 둠
+            if not result.error:
+                _remember_keywords(result.category_id, keywords)
+
+        job.report = await harvest_all_async(categories, on_result=on_result, **options)
+        job.status = "done"
+    except Exception as e:
+        job.status = "failed"
+        job.error = str(e)
+    finally:
+        job.finished_at = time.time()
+        _harvest_tasks.pop(job.id, None)
+
+
+@app.post("/api/harvest", status_code=202)
+async def start_harvest(
+    concurrency: int = Query(HARVEST_CONCURRENCY, ge=1, le=16, description="동시에 수집할 카테고리 수"),
+    rate: float = Query(HARVEST_RATE_PER_SEC, gt=0, le=20, description="전체 요청 속도 상한 (초당 요청 수)"),
+    format: Literal["txt", "tsv", "csv"] = Query("txt", description="저장 포맷"),
+    includeRecomm: int = Query(0, ge=0, le=1, description="추천 키워드 포함 여부 (0=미포함, 1=포함)")
+):
+    """
+    전체 카테고리 일괄 수집 작업 시작
+    
+    이미 실행 중인 작업이 있으면 새로 시작하지 않고 해당 작업을 반환합니다.
+    카테고리별 결과 파일은 HARVEST_OUTPUT_DIR에 끝나는 대로 저장됩니다.
+    
+    Returns:
+        작업 상태 {'id': ..., 'status': ..., ...}
+    """
+    running_id = next(iter(_harvest_tasks), None)
+    if running_id is not None:
+        return harvest_jobs[running_id].as_dict()
+    
+    job = HarvestJob()
+    harvest_jobs[job.id] = job
+    _harvest_tasks[job.id] = asyncio.create_task(_run_harvest(
+        job,
+        concurrency=concurrency,
+        rate=rate,
+        format=format,
+        include_recomm=includeRecomm == 1,
+        output_dir=HARVEST_OUTPUT_DIR,
+    ))
+    return job.as_dict()
+
+
+@app.get("/api/harvest/{job_id}")
+async def get_harvest(job_id: str):
+    """
+    일괄 수집 작업 상태 조회
+    
+    Args:
+        job_id: 작업 ID
+        
+    Returns:
+        작업 상태 및 완료 시 처리량 보고서 (pagesPerSec, keywordsPerSec)
+    """
+    job = harvest_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job.as_dict()
+
+
+def _get_job(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
+@app.post("/api/jobs", status_code=202)
+async def create_job(
+    categoryId: str = Query(..., description="카테고리 ID")
+):
+    """
+    카테고리 수집 작업 시작
+    
+    같은 카테고리 작업이 대기/실행 중이거나 아직 만료되지 않은 결과가 있으면
+    새로 수집하지 않고 해당 작업을 반환합니다.
+    회로 차단 중에는 실패할 작업을 대기열에 넣지 않고 바로 503으로 응답합니다.
+    
+    Args:
+        categoryId: 카테고리 ID
+        
+    Returns:
+        작업 상태 {'id': ..., 'status': 'queued' | 'running' | 'done', ...}
+    """
+    prewarm.record(categoryId)
+    breaker = get_default_breaker()
+    if breaker.state == CircuitBreaker.OPEN and job_manager.find(categoryId) is None:
+        raise _unavailable(CircuitOpenError(breaker.name, breaker.retry_after))
+    try:
+        job = job_manager.submit(categoryId)
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return job.as_dict()
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    수집 작업 상태 조회
+    
+    Args:
+        job_id: 작업 ID
+        
+    Returns:
+        {'id': ..., 'status': ..., 'pages': ..., 'keywords': ..., 'total': ...,
+         'etaSec': ..., 'pacing': {...}, ...}
+    """
+    job = _get_job(job_id)
+    return {**job.as_dict(), 'pacing': api_pacer.snapshot()}
+
+
+@app.get("/api/jobs/{job_id}/result")
+async def get_job_result(
+    job_id: str,
+    format: Literal["txt", "tsv", "csv"] = Query("txt", description="출력 포맷"),
+    includeRecomm: int = Query(0, ge=0, le=1, description="추천 키워드 포함 여부 (0=미포함, 1=포함)")
+):
+    """
+    완료된 수집 작업 결과 다운로드
+    
+    포맷별 파일은 처음 요청할 때 만들어 두고 결과가 만료될 때까지 재사용합니다.
+    
+    Args:
+        job_id: 작업 ID
+        format: 출력 포맷 (txt=키워드만, tsv/csv=키워드+참여자수)
+        includeRecomm: 추천 키워드 포함 여부
+    """
+    job = _get_job(job_id)
+    if job.status != "done":
+        raise HTTPException(status_code=409, detail=f"작업이 완료되지 않았습니다 (상태: {job.status}).")
+    path = await job_manager.export_result(job, format, includeRecomm == 1)
+    return FileResponse(
+        path,
+        media_type=STREAM_MEDIA_TYPES[format],
+        filename=f"{job.category_id}.{format}",
+    )
+
+
+@app.delete("/api/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """
+    수집 작업 취소
+    
+    대기 중인 작업은 바로 취소되고, 실행 중인 작업은 받고 있는 페이지까지만 받은 뒤 멈춥니다
+    (받은 페이지는 체크포인트에 남아 다음 수집이 이어받음). 완료된 작업은 결과를 삭제합니다.
+    
+    Args:
+        job_id: 작업 ID
+        
+    Returns:
+        작업 상태
+    """
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job.as_dict()
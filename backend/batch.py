@@ -0,0 +1,357 @@
+"""
+컬럼형 키워드 묶음 모듈
+
+키워드마다 {'name': ..., 'participantCount': ...} 딕셔너리를 만드는 대신
+키워드명 리스트와 참여자수 array 두 컬럼으로 보관합니다.
+행마다 딕셔너리/정수 객체를 만들지 않으므로 일괄 수집처럼 키워드가 많을 때 메모리를 크게 줄입니다.
+
+- KeywordBatch: 키워드 묶음 (추가 가능)
+- KeywordView: 하나 이상의 묶음 구간을 복사 없이 이어 붙인 읽기 전용 뷰
+  (추천 + 일반 키워드 병합, 스트리밍용 분할 등)
+
+두 타입 모두 기존 리스트처럼 len(), 반복(딕셔너리), 인덱싱을 지원하므로
+리스트를 기대하는 코드도 그대로 동작합니다. 포맷 변환기와 JSON 인코더는
+rows()로 (키워드명, 참여자수) 튜플을 직접 읽습니다.
+"""
+
+import heapq
+import json
+from json.encoder import encode_basestring
+from array import array
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# orjson이 설치되어 있으면 응답 본문 인코딩에 사용 (선택 의존성, 없으면 dumps_json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# participantCount가 없는(null) 행의 저장값 (참여자수는 음수가 될 수 없음)
+MISSING_COUNT = -1
+
+
+def _to_count(value: Optional[int]) -> int:
+    return MISSING_COUNT if value is None else value
+
+
+def _from_count(value: int) -> Optional[int]:
+    return None if value == MISSING_COUNT else value
+
+
+def _zip_rows(names: Iterable[str], counts: array) -> Iterator[Tuple[str, Optional[int]]]:
+    # null 참여자수가 없으면(대부분) 행마다 변환 함수를 거치지 않음
+    if MISSING_COUNT in counts:
+        return zip(names, map(_from_count, counts))
+    return zip(names, counts)
+
+
+class KeywordBatch:
+    """
+    컬럼형 키워드 묶음
+
+    Args:
+        keywords: 초기 키워드 ([{'name': ..., 'participantCount': ...}] 또는 다른 묶음/뷰)
+    """
+
+    __slots__ = ('names', 'counts')
+
+    def __init__(self, keywords: Optional[Iterable] = None):
+        self.names: List[str] = []
+        self.counts = array('l')
+        if keywords is not None:
+            self.extend(keywords)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, Optional[int]]]) -> "KeywordBatch":
+        """(키워드명, 참여자수) 튜플로 묶음 생성"""
+        batch = cls()
+        for name, count in rows:
+            batch.append(name, count)
+        return batch
+
+    @classmethod
+    def from_columns(cls, names: List[str], counts: Iterable[int]) -> "KeywordBatch":
+        """키워드명 리스트와 참여자수 저장값(null은 MISSING_COUNT)으로 묶음 생성 (복사 최소화)"""
+        batch = cls()
+        batch.names = names
+        batch.counts = array('l', counts)
+        return batch
+
+    def append(self, name: str, participant_count: Optional[int]) -> None:
+        """키워드 하나 추가"""
+        self.names.append(name)
+        self.counts.append(_to_count(participant_count))
+
+    def extend(self, keywords: Iterable) -> None:
+        """
+        키워드 여러 개 추가
+
+        Args:
+            keywords: [{'name': ..., 'participantCount': ...}] 또는 KeywordBatch / KeywordView
+        """
+        if isinstance(keywords, KeywordBatch):
+            self.names.extend(keywords.names)
+            self.counts.extend(keywords.counts)
+            return
+        if isinstance(keywords, KeywordView):
+            for batch, start, stop in keywords.segments:
+                self.names.extend(islice(batch.names, start, stop))
+                self.counts.extend(batch.counts[start:stop])
+            return
+        for k in keywords:
+            self.append(k['name'], k['participantCount'])
+
+    def rows(self) -> Iterator[Tuple[str, Optional[int]]]:
+        """(키워드명, 참여자수) 튜플 반복"""
+        return _zip_rows(self.names, self.counts)
+
+    def view(self, start: int = 0, stop: Optional[int] = None) -> "KeywordView":
+        """복사 없이 [start:stop] 구간을 가리키는 뷰"""
+        start, stop, _ = slice(start, stop).indices(len(self.names))
+        return KeywordView([(self, start, max(start, stop))])
+
+    def to_list(self) -> List[Dict]:
+        """딕셔너리 리스트로 변환 (호환용)"""
+        return [{'name': name, 'participantCount': count} for name, count in self.rows()]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for name, count in self.rows():
+            yield {'name': name, 'participantCount': count}
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict, "KeywordView"]:
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError("step이 있는 슬라이스는 지원하지 않습니다.")
+            return self.view(index.start or 0, index.stop)
+        return {'name': self.names[index], 'participantCount': _from_count(self.counts[index])}
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (KeywordBatch, KeywordView, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"KeywordBatch({len(self)} keywords)"
+
+
+class KeywordView:
+    """
+    하나 이상의 KeywordBatch 구간을 이어 붙인 읽기 전용 뷰 (복사 없음)
+
+    Args:
+        segments: [(batch, start, stop), ...]
+    """
+
+    __slots__ = ('segments',)
+
+    def __init__(self, segments: Sequence[Tuple[KeywordBatch, int, int]]):
+        self.segments = [s for s in segments if s[2] > s[1]]
+
+    def rows(self) -> Iterator[Tuple[str, Optional[int]]]:
+        """(키워드명, 참여자수) 튜플 반복"""
+        return chain.from_iterable(
+            _zip_rows(islice(batch.names, start, stop), batch.counts[start:stop])
+            for batch, start, stop in self.segments
+        )
+
+    def to_list(self) -> List[Dict]:
+        """딕셔너리 리스트로 변환 (호환용)"""
+        return [{'name': name, 'participantCount': count} for name, count in self.rows()]
+
+    def __len__(self) -> int:
+        return sum(stop - start for _, start, stop in self.segments)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for name, count in self.rows():
+            yield {'name': name, 'participantCount': count}
+
+    def __getitem__(self, index: int) -> Dict:
+        if index < 0:
+            index += len(self)
+        for batch, start, stop in self.segments:
+            if index < stop - start:
+                return batch[start + index]
+            index -= stop - start
+        raise IndexError("KeywordView index out of range")
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (KeywordBatch, KeywordView, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"KeywordView({len(self)} keywords, {len(self.segments)} segments)"
+
+
+Keywords = Union[KeywordBatch, KeywordView, List[Dict]]
+
+
+def concat_keywords(*parts: Keywords) -> KeywordView:
+    """
+    키워드 묶음 이어 붙이기 (추천 + 일반 등)
+
+    묶음/뷰는 복사 없이 뷰로 연결하고, 딕셔너리 리스트만 묶음으로 변환합니다.
+
+    Args:
+        *parts: KeywordBatch / KeywordView / 딕셔너리 리스트
+
+    Returns:
+        이어 붙인 KeywordView
+    """
+    segments = []
+    for part in parts:
+        if isinstance(part, KeywordView):
+            segments.extend(part.segments)
+        else:
+            batch = part if isinstance(part, KeywordBatch) else KeywordBatch(part)
+            segments.append((batch, 0, len(batch)))
+    return KeywordView(segments)
+
+
+def iter_rows(keywords: Keywords) -> Iterator[Tuple[str, Optional[int]]]:
+    """
+    어떤 키워드 표현이든 (키워드명, 참여자수) 튜플로 반복
+
+    Args:
+        keywords: KeywordBatch / KeywordView / [{'name': ..., 'participantCount': ...}]
+    """
+    if isinstance(keywords, (KeywordBatch, KeywordView)):
+        return keywords.rows()
+    return ((k['name'], k['participantCount']) for k in keywords)
+
+
+def iter_chunks(keywords: Keywords, size: int) -> Iterator[KeywordView]:
+    """
+    키워드를 size개씩 나눈 뷰로 반복 (묶음/뷰는 복사 없음, 딕셔너리 리스트는 한 번만 묶음으로 변환)
+
+    Args:
+        keywords: KeywordBatch / KeywordView / [{'name': ..., 'participantCount': ...}]
+        size: 뷰 하나의 최대 행 수
+    """
+    pending: List[Tuple[KeywordBatch, int, int]] = []
+    filled = 0
+    for batch, start, stop in concat_keywords(keywords).segments:
+        while start < stop:
+            end = min(stop, start + size - filled)
+            pending.append((batch, start, end))
+            filled += end - start
+            start = end
+            if filled == size:
+                yield KeywordView(pending)
+                pending, filled = [], 0
+    if pending:
+        yield KeywordView(pending)
+
+
+def _sort_key(row: Tuple[str, Optional[int]]) -> int:
+    return MISSING_COUNT if row[1] is None else row[1]
+
+
+def select_keywords(
+    keywords: Keywords,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    min_participants: Optional[int] = None,
+    sort: str = "api",
+) -> KeywordBatch:
+    """
+    키워드 묶음에서 조건에 맞는 구간 선택
+
+    Args:
+        keywords: KeywordBatch / KeywordView / 딕셔너리 리스트
+        limit: 최대 개수 (None이면 전부)
+        offset: 건너뛸 개수 (필터 적용 후 기준)
+        min_participants: 최소 참여자수 (미만이거나 참여자수가 없으면 제외)
+        sort: 'api' (수집 순서 유지) | 'participants' (참여자수 내림차순, 동률은 수집 순서)
+
+    Returns:
+        선택한 KeywordBatch
+    """
+    rows = iter_rows(keywords)
+    if min_participants is not None:
+        rows = (row for row in rows if row[1] is not None and row[1] >= min_participants)
+
+    if sort == "participants":
+        if limit is None:
+            ranked = sorted(rows, key=_sort_key, reverse=True)
+        else:
+            # 상위 offset + limit 개만 힙으로 유지 (전체 정렬 없음)
+            ranked = heapq.nlargest(offset + limit, rows, key=_sort_key)
+        return KeywordBatch.from_rows(ranked[offset:])
+
+    stop = None if limit is None else offset + limit
+    return KeywordBatch.from_rows(islice(rows, offset, stop))
+
+
+def encode_keywords_json(keywords: Keywords) -> str:
+    """
+    키워드 묶음을 JSON 배열로 직렬화 (행마다 딕셔너리를 만들지 않음)
+
+    Args:
+        keywords: KeywordBatch / KeywordView / 딕셔너리 리스트
+
+    Returns:
+        '[{"name":...,"participantCount":...},...]'
+    """
+    return "[" + ",".join(
+        '{"name":' + encode_basestring(name)
+        + ',"participantCount":' + ("null" if count is None else str(count)) + "}"
+        for name, count in iter_rows(keywords)
+    ) + "]"
+
+
+def dumps_json(value: Any) -> str:
+    """
+    키워드 묶음이 포함된 값을 JSON으로 직렬화
+
+    json.dumps(value, ensure_ascii=False, separators=(',', ':'))와 같은 결과를 내되,
+    KeywordBatch / KeywordView 는 encode_keywords_json으로 직접 인코딩합니다.
+
+    Args:
+        value: dict / list / KeywordBatch / KeywordView / JSON 기본 타입
+
+    Returns:
+        JSON 문자열
+    """
+    if isinstance(value, (KeywordBatch, KeywordView)):
+        return encode_keywords_json(value)
+    if isinstance(value, dict):
+        return "{" + ",".join(
+            json.dumps(str(key), ensure_ascii=False) + ":" + dumps_json(item)
+            for key, item in value.items()
+        ) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(dumps_json(item) for item in value) + "]"
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, (KeywordBatch, KeywordView)):
+        return [{'name': name, 'participantCount': count} for name, count in value.rows()]
+    raise TypeError
+
+
+def encode_json(value: Any) -> bytes:
+    """
+    값을 JSON 바이트로 인코딩 (응답 본문 / ETag용)
+
+    orjson이 있으면 orjson으로 한 번에 인코딩하고(표준 json 경로의 약 2.5배 속도), 없거나 orjson이
+    처리하지 못하는 값(str 변환이 필요한 값 등)은 dumps_json(value).encode('utf-8')을 사용합니다.
+    키워드/카테고리 응답은 두 경로의 결과 바이트가 같습니다 (실수의 지수 표기만 다를 수 있음).
+
+    Args:
+        value: dict / list / KeywordBatch / KeywordView / JSON 기본 타입
+
+    Returns:
+        UTF-8 JSON 바이트
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=_orjson_default)
+        except TypeError:
+            pass
+    return dumps_json(value).encode('utf-8')
@@ -0,0 +1,271 @@
+"""
+결과 캐시 모듈
+
+카테고리 목록과 카테고리별 키워드 수집 결과를 메모리에 캐시합니다.
+
+- 키별 TTL: 만료 전까지는 캐시된 값을 그대로 반환
+- stale-while-revalidate: 만료 후 일정 시간 동안은 이전 값을 즉시 반환하고
+  백그라운드에서 새로 수집
+- 요청 병합: 같은 키를 동시에 요청하면 진행 중인 수집 하나를 공유
+- LRU: 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+- 인코딩한 응답 본문 보관: 값은 저장 후 바뀌지 않으므로 JSON(ETag 계산 때 인코딩)과
+  텍스트 포맷별 본문을 항목에 바이트로 남겨, 같은 요청은 다시 인코딩하지 않고 그대로 씀
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Union
+
+from .batch import encode_json
+from .config import RESPONSE_BODY_CACHE
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목"""
+    value: Any
+    etag: str
+    created_at: float
+    expires_at: float
+    stale_until: float
+    # 인코딩한 응답 본문 (본문 종류 -> 바이트, 'json'은 값 전체 JSON)
+    bodies: Dict[Hashable, bytes] = field(default_factory=dict, repr=False)
+
+    @property
+    def age(self) -> float:
+        """생성 후 경과 시간 (초)"""
+        return max(0.0, time.time() - self.created_at)
+
+    @property
+    def max_age(self) -> int:
+        """남은 신선 유지 시간 (Cache-Control max-age용, 초)"""
+        return max(0, int(self.expires_at - time.time()))
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def is_usable(self, now: float) -> bool:
+        return now < self.stale_until
+
+    def body(self, kind: Hashable, encode: Callable[[Any], bytes]) -> bytes:
+        """
+        값을 인코딩한 응답 본문 (종류별로 처음 한 번만 인코딩해 보관)
+
+        Args:
+            kind: 본문 종류 (예: 'json', ('tsv', True)) - 같은 종류는 항상 같은 encode를 써야 함
+            encode: 값 -> 바이트
+
+        Returns:
+            응답 본문 바이트
+        """
+        body = self.bodies.get(kind)
+        if body is None:
+            body = encode(self.value)
+            if RESPONSE_BODY_CACHE:
+                self.bodies[kind] = body
+        return body
+
+
+@dataclass
+class CacheStats:
+    """캐시 히트/미스 카운터"""
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    evictions: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(self.__dict__)
+
+
+def compute_etag(payload: bytes) -> str:
+    """
+    JSON 본문의 ETag 계산
+
+    Args:
+        payload: 값을 encode_json으로 인코딩한 바이트
+
+    Returns:
+        따옴표로 감싼 ETag 문자열
+    """
+    return '"' + hashlib.sha1(payload).hexdigest() + '"'
+
+
+class AsyncTTLCache:
+    """
+    TTL + stale-while-revalidate + 요청 병합을 지원하는 비동기 LRU 캐시
+
+    Args:
+        name: 캐시 이름 (통계 표시용)
+        ttl: 기본 신선 유지 시간 (초, 값에 따라 정하려면 값을 받아 시간을 돌려주는 함수)
+        stale_ttl: 만료 후 이전 값을 계속 제공할 시간 (초)
+        maxsize: 최대 항목 수
+    """
+
+    def __init__(self, name: str, ttl: Union[float, Callable[[Any], float]], stale_ttl: float, maxsize: int):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """통계/LRU 순서에 영향을 주지 않고 항목 조회 (만료 여부 무관)"""
+        return self._entries.get(key)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[Union[float, Callable[[Any], float]]] = None) -> CacheEntry:
+        """
+        값을 캐시에 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 이 키의 신선 유지 시간 (None이면 기본값)
+
+        Returns:
+            저장된 CacheEntry
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if callable(ttl):
+            ttl = ttl(value)
+        now = time.time()
+        payload = encode_json(value)
+        entry = CacheEntry(
+            value=value,
+            etag=compute_etag(payload),
+            created_at=now,
+            expires_at=now + ttl,
+            stale_until=now + ttl + self.stale_ttl,
+        )
+        if RESPONSE_BODY_CACHE:
+            entry.bodies['json'] = payload
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+        return entry
+
+    def invalidate(self, key: Hashable) -> None:
+        """키 삭제"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._entries.clear()
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> CacheEntry:
+        """
+        캐시 조회, 없으면 loader로 수집
+
+        Args:
+            key: 캐시 키
+            loader: 값을 수집하는 코루틴 함수 (인자 없음)
+            ttl: 이 키의 신선 유지 시간 (None이면 기본값)
+
+        Returns:
+            CacheEntry (값, ETag, 만료 정보 포함)
+
+        Raises:
+            loader가 발생시킨 예외 (캐시된 값이 없을 때만)
+        """
+        now = time.time()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            if entry.is_fresh(now):
+                self.stats.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+
+            if entry.is_usable(now):
+                # 이전 값을 즉시 반환하고 백그라운드에서 갱신
+                self.stats.stale_hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._inflight:
+                    self.stats.refreshes += 1
+                    self._start_load(key, loader, ttl, background=True)
+                return entry
+
+        if key in self._inflight:
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+            self._start_load(key, loader, ttl, background=False)
+
+        # 요청이 취소되어도 공유 수집 작업은 계속 진행
+        return await asyncio.shield(self._inflight[key])
+
+    async def refresh(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> CacheEntry:
+        """
+        신선 여부와 관계없이 loader로 다시 수집해 저장 (미리 갱신용)
+
+        같은 키를 이미 수집 중이면 새로 시작하지 않고 그 결과를 기다리며,
+        수집하는 동안 들어온 요청은 기존 항목을 그대로 받습니다.
+
+        Args:
+            key: 캐시 키
+            loader: 값을 수집하는 코루틴 함수 (인자 없음)
+            ttl: 이 키의 신선 유지 시간 (None이면 기본값)
+
+        Returns:
+            새로 저장된 CacheEntry
+
+        Raises:
+            loader가 발생시킨 예외 (기존 항목은 그대로 유지)
+        """
+        if key not in self._inflight:
+            self.stats.refreshes += 1
+            self._start_load(key, loader, ttl, background=False)
+        return await asyncio.shield(self._inflight[key])
+
+    def _start_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float],
+        background: bool,
+    ) -> asyncio.Task:
+        async def run() -> CacheEntry:
+            try:
+                value = await loader()
+                return self.set(key, value, ttl)
+            except Exception:
+                if background:
+                    self.stats.refresh_errors += 1
+                    logger.exception("[%s] 백그라운드 갱신 실패: %s", self.name, key)
+                raise
+            finally:
+                self._inflight.pop(key, None)
+
+        task = asyncio.ensure_future(run())
+        # 기다리는 요청이 모두 취소된 경우에도 "never retrieved" 경고가 나지 않도록 예외를 소비
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._inflight[key] = task
+        return task
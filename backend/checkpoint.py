@@ -0,0 +1,203 @@
+"""
+수집 체크포인트 모듈
+
+긴 페이지네이션 도중 타임아웃이나 GraphQL 오류로 실패해도 처음부터 다시 받지 않도록,
+페이지를 받을 때마다 다음 커서와 지금까지 받은 키워드를 SQLite 저널에 기록합니다.
+같은 카테고리를 다시 수집하면 마지막으로 성공한 커서부터 이어서 받습니다.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from .config import CHECKPOINT_DB_PATH, CHECKPOINT_MAX_AGE
+
+
+@dataclass
+class Checkpoint:
+    """카테고리 하나의 중단 지점"""
+    category_id: str
+    next_cursor: Optional[str]
+    total: Optional[int]
+    pages: int
+    keywords: List[Dict]
+    updated_at: float
+
+    @property
+    def has_ids(self) -> bool:
+        """모든 행에 키워드 id가 기록되어 있는지 여부 (이전 버전 체크포인트는 id 없음)"""
+        return all(k.get('id') is not None for k in self.keywords)
+
+
+class CrawlJournal:
+    """
+    카테고리별 수집 진행 상황 저널 (SQLite)
+
+    한 카테고리는 프로세스 안에서 동시에 하나의 수집만 저널을 사용할 수 있습니다.
+    (claim/release로 관리하며, 이미 사용 중이면 저널 없이 수집)
+
+    Args:
+        path: SQLite 파일 경로
+        max_age: 이 시간(초)보다 오래된 체크포인트는 버리고 처음부터 수집
+    """
+
+    def __init__(self, path: str = CHECKPOINT_DB_PATH, max_age: float = CHECKPOINT_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self._active: Set[str] = set()
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS crawl_checkpoints (
+                    category_id TEXT PRIMARY KEY,
+                    next_cursor TEXT,
+                    total INTEGER,
+                    pages INTEGER NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS crawl_checkpoint_rows (
+                    category_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    participant_count INTEGER,
+                    keyword_id TEXT,
+                    PRIMARY KEY (category_id, seq)
+                );
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(crawl_checkpoint_rows)")}
+            if 'keyword_id' not in columns:
+                conn.execute("ALTER TABLE crawl_checkpoint_rows ADD COLUMN keyword_id TEXT")
+            self._initialized = True
+        return conn
+
+    def claim(self, category_id: str) -> bool:
+        """카테고리 저널 사용 시작 (이미 다른 수집이 사용 중이면 False)"""
+        with self._lock:
+            if category_id in self._active:
+                return False
+            self._active.add(category_id)
+            return True
+
+    def release(self, category_id: str) -> None:
+        """카테고리 저널 사용 종료"""
+        with self._lock:
+            self._active.discard(category_id)
+
+    def load(self, category_id: str) -> Optional[Checkpoint]:
+        """
+        체크포인트 조회
+
+        Args:
+            category_id: 카테고리 ID
+
+        Returns:
+            Checkpoint (없거나 max_age보다 오래되었으면 None, 오래된 것은 삭제)
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT next_cursor, total, pages, updated_at FROM crawl_checkpoints WHERE category_id = ?",
+                (category_id,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            next_cursor, total, pages, updated_at = row
+            if time.time() - updated_at > self.max_age:
+                self._delete(conn, category_id)
+                conn.commit()
+                return None
+
+            keywords = [
+                {'id': keyword_id, 'name': name, 'participantCount': count}
+                for keyword_id, name, count in conn.execute(
+                    "SELECT keyword_id, name, participant_count FROM crawl_checkpoint_rows "
+                    "WHERE category_id = ? ORDER BY seq",
+                    (category_id,),
+                )
+            ]
+            return Checkpoint(category_id, next_cursor, total, pages, keywords, updated_at)
+        finally:
+            conn.close()
+
+    def append_page(
+        self,
+        category_id: str,
+        keywords: List[Dict],
+        next_cursor: Optional[str],
+        total: Optional[int],
+    ) -> None:
+        """
+        받은 페이지를 저널에 추가 (행 추가와 커서 갱신을 한 트랜잭션으로 처리)
+
+        Args:
+            category_id: 카테고리 ID
+            keywords: 이번 페이지 키워드
+            next_cursor: 다음 페이지 커서
+            total: 전체 키워드 수 (paging.total)
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute(
+                    "SELECT COALESCE(MAX(seq) + 1, 0) FROM crawl_checkpoint_rows WHERE category_id = ?",
+                    (category_id,),
+                ).fetchone()
+                seq = row[0]
+                conn.executemany(
+                    "INSERT INTO crawl_checkpoint_rows (category_id, seq, name, participant_count, keyword_id) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (category_id, seq + i, k['name'], k['participantCount'], k.get('id'))
+                        for i, k in enumerate(keywords)
+                    ],
+                )
+                conn.execute(
+                    "INSERT INTO crawl_checkpoints (category_id, next_cursor, total, pages, updated_at) "
+                    "VALUES (?, ?, ?, 1, ?) "
+                    "ON CONFLICT(category_id) DO UPDATE SET "
+                    "next_cursor = excluded.next_cursor, total = excluded.total, "
+                    "pages = pages + 1, updated_at = excluded.updated_at",
+                    (category_id, next_cursor, total, time.time()),
+                )
+        finally:
+            conn.close()
+
+    def clear(self, category_id: str) -> None:
+        """체크포인트 삭제 (수집 완료 시)"""
+        conn = self._connect()
+        try:
+            with conn:
+                self._delete(conn, category_id)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, category_id: str) -> None:
+        conn.execute("DELETE FROM crawl_checkpoint_rows WHERE category_id = ?", (category_id,))
+        conn.execute("DELETE FROM crawl_checkpoints WHERE category_id = ?", (category_id,))
+
+
+_default_journal: Optional[CrawlJournal] = None
+
+
+def get_default_journal() -> CrawlJournal:
+    """설정 경로(CHECKPOINT_DB_PATH)를 사용하는 공용 저널 반환"""
+    global _default_journal
+
+    if _default_journal is None:
+        _default_journal = CrawlJournal()
+    return _default_journal
@@ -4,9 +4,12 @@
 네이버 인플루언서 키워드 수집에 사용되는 모든 설정값을 정의합니다.
 """
 
-# API 엔드포인트
-NAVER_INFLUENCER_URL = "https://in.naver.com/keywords"
-GRAPHQL_URL = "https://in.naver.com/graphql"
+import os
+
+# API 엔드포인트 (NAVER_INFL_BASE_URL 로 로컬 가짜 서버 등 다른 주소를 지정할 수 있음)
+NAVER_BASE_URL = os.environ.get("NAVER_INFL_BASE_URL", "https://in.naver.com").rstrip("/")
+NAVER_INFLUENCER_URL = f"{NAVER_BASE_URL}/keywords"
+GRAPHQL_URL = f"{NAVER_BASE_URL}/graphql"
 
 # 스크래핑 설정
 DEFAULT_SLEEP_SEC_CLI = 3  # CLI 기본값 (기존 유지)
@@ -16,9 +19,151 @@ MAX_SLEEP_SEC = 10
 DEFAULT_LIMIT = 20
 RECOMMEND_LIMIT = 3
 
+# 적응형 간격 조절 (AIMD) 설정 - 대기 시간은 항상 MIN_SLEEP_SEC ~ MAX_SLEEP_SEC 범위
+PACER_MIN_DELAY = 0.5  # 응답이 좋을 때 줄일 수 있는 최소 대기 시간 (초)
+PACER_DECREASE_STEP = 0.1  # 정상 응답마다 줄이는 대기 시간 (초)
+PACER_BACKOFF_FACTOR = 2.0  # 스로틀링 시 대기 시간 배수
+PACER_BACKOFF_BASE = 0.5  # 대기 시간이 0일 때 백오프 기준값 (초)
+PACER_JITTER = 0.2  # 백오프 jitter 비율 (±20%)
+PACER_LATENCY_FACTOR = 2.0  # 평균 대비 이 배수 이상 느린 응답을 지연 시간 급증 표본으로 봄
+PACER_LATENCY_MIN_SEC = 0.25  # 이보다 빠른 응답은 평균 대비 느려도 급증으로 보지 않음 (초)
+PACER_LATENCY_SAMPLES = 3  # 급증 표본이 이만큼 연속될 때만 대기 시간을 늘림
+PACER_LATENCY_STEP = 0.1  # 지연 시간 급증이 이어질 때마다 늘리는 대기 시간 (초, 가산적 증가)
+PACER_ADAPTIVE = os.environ.get("NAVER_INFL_ADAPTIVE_PACING", "1") != "0"  # 0이면 sleepSec을 지정한 수집은 고정 간격 (Retry-After만 지킴)
+PAGE_MAX_RETRIES = 5  # 페이지 요청 실패(429/5xx, 타임아웃, GraphQL errors) 시 재시도 횟수
+RETRY_BASE_DELAY = 0.2  # 페이지 재시도 추가 대기 기준값 (초, 0 ~ 기준값 x 2^시도 사이 임의 - full jitter)
+RETRY_MAX_DELAY = 5.0  # 페이지 재시도 추가 대기 최대값 (초)
+
+# hedged request 설정 - 페이지 응답이 최근 지연 시간 백분위수보다 늦으면 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+HEDGE_ENABLED = os.environ.get("NAVER_INFL_HEDGE", "1") != "0"
+HEDGE_PERCENTILE = 95  # 이 백분위수 지연 시간이 지나면 두 번째 요청 전송
+HEDGE_MIN_DELAY = 0.05  # 두 번째 요청까지 최소 대기 시간 (초)
+HEDGE_MIN_SAMPLES = 20  # 백분위수 계산에 필요한 최소 응답 수 (그 전에는 보내지 않음)
+HEDGE_WINDOW = 200  # 백분위수 계산에 쓰는 최근 응답 수
+HEDGE_MAX_RATIO = 0.1  # 전체 페이지 요청 대비 두 번째 요청 최대 비율 (upstream 부하 상한)
+
+# 회로 차단기 설정 - upstream 연속 실패(429/5xx, 타임아웃)가 쌓이면 일정 시간 요청을 보내지 않고 바로 실패
+BREAKER_ENABLED = os.environ.get("NAVER_INFL_BREAKER", "1") != "0"
+BREAKER_FAILURE_THRESHOLD = 5  # 차단까지 연속 실패 수
+BREAKER_RESET_TIMEOUT = 30  # 차단 후 시험 요청(half-open)까지 시간 (초)
+
+# API 수집 동시 실행 제한 (API 프로세스 하나 기준, 캐시 적중은 제한하지 않음)
+ADMISSION_ENABLED = os.environ.get("NAVER_INFL_ADMISSION", "1") != "0"
+ADMISSION_MAX_CRAWLS = int(os.environ.get("NAVER_INFL_MAX_CRAWLS", "4"))  # 동시에 실행할 키워드 수집 수
+ADMISSION_QUEUE_SIZE = 16  # 실행을 기다릴 수 있는 최대 요청 수 (넘으면 429)
+ADMISSION_PER_CLIENT = 2  # 클라이언트(IP) 하나가 동시에 실행/대기할 수 있는 수집 수 (넘으면 429)
+ADMISSION_QUEUE_TIMEOUT = 60  # 대기열에서 기다리는 최대 시간 (초, 넘으면 429)
+ADMISSION_PRIORITY_SLOTS = 2  # 가벼운 요청(카테고리 목록) 전용 실행 자리 (수집이 꽉 차도 바로 실행)
+ADMISSION_CLIENT_HEADER = os.environ.get("NAVER_INFL_CLIENT_HEADER", "")  # 클라이언트 식별 헤더 (프록시 뒤라면 X-Forwarded-For 등, 빈 값이면 접속 IP)
+ADMISSION_DEFAULT_CRAWL_SEC = 10.0  # 완료된 수집이 없을 때 Retry-After 계산에 쓰는 수집 시간 (초)
+
+# HTTP 커넥션 풀 설정
+HTTP_MAX_CONNECTIONS = 20  # 풀 전체 최대 연결 수
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10  # 유지할 keep-alive 연결 수
+HTTP_MAX_CONNECTIONS_PER_HOST = 6  # 호스트별 최대 동시 연결 수
+HTTP_KEEPALIVE_EXPIRY = 30  # 유휴 연결 유지 시간 (초)
+HTTP_CONNECT_TIMEOUT = 5  # 연결 타임아웃 (초)
+HTTP_READ_TIMEOUT = 10  # 읽기 타임아웃 (초)
+
+# 캐시 설정
+CATEGORY_CACHE_TTL = 3600  # 카테고리 목록 신선 유지 시간 (초)
+KEYWORD_CACHE_TTL = 1800  # 카테고리별 키워드 신선 유지 시간 (초)
+CACHE_STALE_TTL = 3600  # 만료 후 이전 값을 제공하며 백그라운드 갱신하는 시간 (초)
+KEYWORD_CACHE_MAXSIZE = 32  # 메모리에 보관할 카테고리 수 (LRU)
+PREVIEW_CACHE_MAXSIZE = 128  # 일부 조회(limit 지정) 결과 캐시 항목 수 (LRU)
+KEYWORD_QUERY_MAX_LIMIT = 10000  # /api/keywords limit 최대값
+# 캐시 항목에 인코딩한 응답 본문(JSON, 텍스트 포맷별)을 바이트로 보관 (0이면 요청마다 인코딩, 메모리 절약)
+RESPONSE_BODY_CACHE = os.environ.get("NAVER_INFL_RESPONSE_BODY_CACHE", "1") != "0"
+
+# 추천 + 일반 키워드 동시 조회 설정
+RECOMMEND_TIMEOUT = 10.0  # 추천 키워드 제한 시간 (초, 넘거나 실패하면 추천 없이 일반 키워드만 반환)
+NORMAL_KEYWORDS_TIMEOUT = None  # 일반 키워드 전체 수집 제한 시간 (초, None이면 제한 없음)
+DEGRADED_CACHE_TTL = 60  # 추천 키워드 없이 반환한 결과의 캐시 유지 시간 (초, 이후 요청에서 다시 시도)
+
+# 일괄 수집(harvest) 설정
+HARVEST_CONCURRENCY = 4  # 동시에 수집할 카테고리 수
+HARVEST_RATE_PER_SEC = 2.0  # 전체 요청 속도 상한 (초당 요청 수, 모든 카테고리 합산)
+HARVEST_BURST = 2  # 토큰 버킷 최대 버스트
+HARVEST_OUTPUT_DIR = "./harvest"  # 카테고리별 결과 저장 디렉토리
+
+# 분할 수집(partition) 설정 - 큰 카테고리 하나를 검색어(키워드명 첫 글자)별로 나눠 동시에 수집
+PARTITION_CONCURRENCY = 4  # 전체 목록 수집과 함께 동시에 진행할 검색어 수
+PARTITION_RATE_PER_SEC = 4.0  # 분할 수집 전체 요청 속도 상한 (초당 요청 수, 모든 검색어 합산)
+PARTITION_BURST = 2  # 토큰 버킷 최대 버스트
+PARTITION_MAX_TERMS = 64  # 최대 검색어(분할) 수 (나머지는 전체 목록 수집이 담당)
+PARTITION_DISCOVERY_PAGES = 5  # 전체 목록에서 이 페이지 수만큼 새 검색어가 없으면 검색어 수집이 끝날 때까지 멈춤
+
+# 로컬 데이터 저장 위치 (체크포인트 등)
+DATA_DIR = os.environ.get("NAVER_INFL_DATA_DIR", "./data")
+
+# 수집 체크포인트 설정
+CHECKPOINT_DB_PATH = os.path.join(DATA_DIR, "checkpoints.sqlite3")
+CHECKPOINT_MAX_AGE = 6 * 3600  # 이보다 오래된 중단 지점은 버리고 처음부터 수집 (초)
+
+# 키워드 저장소 / 증분 동기화(delta sync) 설정
+KEYWORD_STORE_DB_PATH = os.path.join(DATA_DIR, "keywords.sqlite3")
+DELTA_EARLY_STOP_PAGES = 3  # 연속으로 이 페이지 수만큼 변경이 없으면 나머지는 그대로라고 보고 중단
+
+# 키워드 검색 색인 설정 (수집을 마친 카테고리를 로컬에서 검색)
+SEARCH_INDEX_DB_PATH = os.path.join(DATA_DIR, "search.sqlite3")
+SEARCH_REFRESH_INTERVAL = 1.0  # 다른 프로세스(워커/CLI)가 갱신한 카테고리를 확인하는 최소 간격 (초)
+SEARCH_DEFAULT_LIMIT = 50  # /api/search 기본 결과 수
+SEARCH_MAX_LIMIT = 1000  # /api/search limit 최대값
+
+# 참여자수 추이 설정 (수집을 마칠 때마다 스냅샷을 쌓아 /api/trends 계산, 계산에는 numpy 필요)
+TRENDS_ENABLED = os.environ.get("NAVER_INFL_TRENDS", "1") != "0"  # 0이면 스냅샷을 기록하지 않음
+TRENDS_DIR = os.path.join(DATA_DIR, "trends")  # 카테고리별 키워드명 / 참여자수 컬럼 파일
+TRENDS_MIN_INTERVAL = 600  # 같은 카테고리 스냅샷 최소 간격 (초, 더 자주 수집해도 기록하지 않음)
+TRENDS_DEFAULT_WINDOW = 7  # /api/trends 기본 비교 구간 (최근 스냅샷 수)
+TRENDS_MAX_WINDOW = 365  # window 최대값
+TRENDS_DEFAULT_K = 20  # 늘어난 / 줄어든 키워드 기본 개수
+TRENDS_MAX_K = 500  # k 최대값
+TRENDS_MIN_BASE = 10  # 증가율(by=rate) 순위에 넣을 최소 기준 참여자수 (작은 값에서 튀는 비율 제외)
+
+# 인기 카테고리 미리 갱신(prewarm) 설정 - 자주 요청되는 카테고리를 결과가 만료되기 전에 백그라운드에서 다시 수집
+PREWARM_ENABLED = os.environ.get("NAVER_INFL_PREWARM", "1") != "0"  # 0이면 API 서버는 요청 빈도만 기록 (수집은 별도 프로세스가 담당)
+PREWARM_DB_PATH = os.path.join(DATA_DIR, "prewarm.sqlite3")
+PREWARM_INTERVAL = 30  # 일정 확인 간격 (초)
+PREWARM_LEAD = 300  # 만료 이 시간 전부터 다시 수집 (초, 같은 카테고리는 이 간격보다 자주 수집하지 않음)
+PREWARM_TOP_K = 10  # 미리 갱신할 최대 카테고리 수 (인기 순)
+PREWARM_MIN_SCORE = 3.0  # 인기 점수(반감기 적용 요청 수)가 이 값 이상인 카테고리만 미리 갱신
+PREWARM_HALF_LIFE = 6 * 3600  # 요청 빈도 반감기 (초)
+PREWARM_BUDGET = 1000  # PREWARM_BUDGET_WINDOW 동안 미리 갱신에 쓸 수 있는 최대 upstream 요청 수 (모든 프로세스 합산)
+PREWARM_BUDGET_WINDOW = 3600  # 요청 예산 기간 (초)
+PREWARM_QUIET_HOURS = os.environ.get("NAVER_INFL_PREWARM_QUIET_HOURS", "01-06")  # 미리 갱신을 쉬는 시간대 (로컬 시각 HH-HH, 빈 값이면 없음)
+PREWARM_CATEGORIES_INTERVAL = 3600  # 카테고리 목록(새 카테고리, keywordCount 변화)을 다시 받는 간격 (초)
+
+# 프로세스 간 공유 결과 저장소 설정 (uvicorn --workers, 여러 인스턴스, CLI가 함께 사용)
+SHARED_STORE_DB_PATH = os.path.join(DATA_DIR, "shared.sqlite3")
+SHARED_LEASE_TTL = 30  # 수집 임대 유지 시간 (초, 수집 중에는 계속 연장, 프로세스가 죽으면 이후 다른 프로세스가 이어받음)
+SHARED_POLL_INTERVAL = 0.25  # 다른 프로세스의 수집 완료를 확인하는 간격 (초)
+
+# 백그라운드 수집 작업(job) 설정
+JOB_WORKERS = 2  # 동시에 실행할 작업 수
+JOB_QUEUE_MAXSIZE = 100  # 대기 중인 작업 최대 수
+JOB_RESULT_DIR = os.path.join(DATA_DIR, "jobs")  # 작업 결과 저장 디렉토리
+JOB_RESULT_TTL = 24 * 3600  # 완료된 작업 결과 보관 시간 (초)
+
+# 지표(/metrics, Server-Timing) 설정
+METRICS_ENABLED = os.environ.get("NAVER_INFL_METRICS", "1") != "0"  # 0이면 지표 기록 생략
+
 # 저장 설정
 DEFAULT_FORMAT = "txt"  # CLI 기본값 (키워드명만)
 SUPPORTED_FORMATS = ["txt", "tsv", "csv"]
+STREAM_FORMATS = ["txt", "tsv", "csv", "ndjson"]  # 스트리밍 응답 포맷
+
+# 내보내기(export) 설정 - 키워드를 한 번 읽으며 여러 포맷으로 동시에 저장 / /api/export zip 스트리밍
+EXPORT_FORMATS = ["txt", "tsv", "csv", "ndjson", "parquet", "arrow"]  # parquet / arrow 는 pyarrow 필요 (전체 카테고리를 파일 하나로)
+EXPORT_COMPRESSIONS = ["none", "gzip", "zstd"]  # 텍스트 포맷 압축 (zstd는 zstandard 필요)
+EXPORT_OUTPUT_DIR = "./export"  # CLI 내보내기 저장 디렉토리
+EXPORT_CHUNK_ROWS = 10_000  # 모든 포맷에 한꺼번에 넘기는 행 묶음 크기 (파일 저장 시 이만큼씩 씀)
+EXPORT_GZIP_LEVEL = 6  # gzip 압축 수준 (1~9)
+EXPORT_ZSTD_LEVEL = 3  # zstd 압축 수준 (1~22)
+EXPORT_SPOOL_BYTES = 16 * 1024 * 1024  # /api/export 의 parquet / arrow 를 메모리에 두는 최대 크기 (넘으면 임시 파일)
+
+# GraphQL 요청 설정
+GRAPHQL_BATCHING = os.environ.get("NAVER_INFL_GRAPHQL_BATCH", "1") != "0"  # 여러 카테고리 추천 키워드를 한 요청으로 묶기
+GRAPHQL_BATCH_SIZE = 50  # 요청 하나에 묶을 최대 카테고리 수
 
 # HTTP 헤더
 HEADERS_HTML = {
@@ -36,7 +181,7 @@ HEADERS_GRAPHQL = {
     'content-type': 'application/json',
 }
 
-# GraphQL 쿼리
+# 웹 클라이언트가 보내는 원본 GraphQL 쿼리 (참고/비교용, 수집에는 backend/queries.py의 최소 쿼리 사용)
 QUERY_WHITE_POOL_KEYWORDS = """query getWhitePoolKeywords($input: WhitePoolKeywordInput!) {
   whitePoolKeywords(input: $input) {
     ...Keyword
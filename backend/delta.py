@@ -0,0 +1,168 @@
+"""
+증분 동기화(delta sync) 모듈
+
+카테고리 키워드를 다시 수집하면서 키워드 저장소(KeywordStore)와 비교해
+추가/삭제/변경된 키워드만 골라냅니다.
+
+키워드 목록은 매번 같은 순서로 내려오므로, 이전에 끝까지 수집한 적이 있는 카테고리는
+연속으로 DELTA_EARLY_STOP_PAGES 페이지 동안 변경이 없으면 나머지도 그대로라고 보고
+페이지네이션을 일찍 멈춥니다. 일찍 멈춘 동기화는 목록 끝부분을 보지 못했으므로
+삭제된 키워드는 판단하지 않습니다 (끝까지 수집한 동기화에서만 삭제 반영).
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .scraper import iter_keyword_pages_async, _run_sync
+from .keyword_store import KeywordStore, KeywordChanges, get_default_store
+from .ratelimit import TokenBucket
+from .pacing import AdaptivePacer
+from .config import DELTA_EARLY_STOP_PAGES
+
+
+@dataclass
+class DeltaResult:
+    """증분 동기화 결과"""
+    category_id: str
+    added: List[Dict] = field(default_factory=list)
+    removed: List[Dict] = field(default_factory=list)
+    changed: List[Dict] = field(default_factory=list)
+    pages: int = 0
+    seen: int = 0
+    total: Optional[int] = None
+    complete: bool = False  # 마지막 페이지까지 수집했는지 여부
+    early_stopped: bool = False
+    elapsed: float = 0.0
+    synced_at: Optional[float] = None
+
+    def as_dict(self) -> Dict:
+        return {
+            'categoryId': self.category_id,
+            'pages': self.pages,
+            'seen': self.seen,
+            'total': self.total,
+            'complete': self.complete,
+            'earlyStopped': self.early_stopped,
+            'elapsedSec': round(self.elapsed, 3),
+            'syncedAt': self.synced_at,
+            'added': self.added,
+            'removed': self.removed,
+            'changed': self.changed,
+        }
+
+    def iter_changes(self):
+        """변경 내용을 한 줄씩 내보내기 위한 제너레이터 ({'change': 'added', ...})"""
+        for change_type in ('added', 'removed', 'changed'):
+            for keyword in getattr(self, change_type):
+                yield {'change': change_type, **keyword}
+
+
+async def delta_sync_async(
+    category_id: str,
+    store: Optional[KeywordStore] = None,
+    sleep_sec: float = 2.0,
+    limiter: Optional[TokenBucket] = None,
+    pacer: Optional[AdaptivePacer] = None,
+    early_stop_pages: int = DELTA_EARLY_STOP_PAGES,
+) -> DeltaResult:
+    """
+    카테고리 증분 동기화
+
+    Args:
+        category_id: 카테고리 ID
+        store: 키워드 저장소 (None이면 공용 저장소)
+        sleep_sec: 시작 요청 간 대기 시간 (초, pacer 미지정 시에만 사용)
+        limiter: 공유 속도 제한기
+        pacer: 공유 간격 조절기
+        early_stop_pages: 연속 무변경 페이지 수 기준 (0이면 항상 끝까지 수집)
+
+    Returns:
+        DeltaResult
+
+    Raises:
+        httpx.HTTPError: 네트워크 오류
+        ValueError: GraphQL 응답 오류
+    """
+    if store is None:
+        store = get_default_store()
+
+    started = time.time()
+    known, last_complete = await asyncio.gather(
+        asyncio.to_thread(store.load_current, category_id),
+        asyncio.to_thread(store.last_complete_run, category_id),
+    )
+    # 저장소가 비어 있거나 끝까지 수집한 적이 없으면 조기 중단하지 않음
+    can_stop_early = early_stop_pages > 0 and last_complete is not None
+
+    result = DeltaResult(category_id=category_id)
+    changes = KeywordChanges()
+    seen_ids = set()
+    unchanged_pages = 0
+
+    # 저장소가 키워드 id 기준이므로 체크포인트 저널 없이 id를 포함해 수집
+    pages = iter_keyword_pages_async(category_id, sleep_sec, limiter, pacer, include_id=True)
+    try:
+        async for page in pages:
+            result.pages += 1
+            result.total = page.total
+            page_changed = False
+
+            for keyword in page.keywords:
+                keyword_id = keyword['id']
+                if keyword_id is None or keyword_id in seen_ids:
+                    continue
+                seen_ids.add(keyword_id)
+                changes.seen.append(keyword)
+
+                stored = known.get(keyword_id)
+                if stored is None:
+                    changes.added.append(keyword)
+                    page_changed = True
+                elif stored.participant_count != keyword['participantCount']:
+                    changes.changed.append({**keyword, 'previousCount': stored.participant_count})
+                    page_changed = True
+
+            unchanged_pages = 0 if page_changed else unchanged_pages + 1
+
+            if not page.next_cursor:
+                result.complete = True
+            elif can_stop_early and unchanged_pages >= early_stop_pages:
+                result.early_stopped = True
+                break
+    finally:
+        await pages.aclose()
+
+    if result.complete:
+        changes.removed = [
+            {'id': k.id, 'name': k.name, 'participantCount': k.participant_count}
+            for keyword_id, k in known.items()
+            if keyword_id not in seen_ids
+        ]
+
+    run = await asyncio.to_thread(
+        store.apply_sync, category_id, changes, started, result.complete, result.pages
+    )
+
+    result.added = changes.added
+    result.removed = changes.removed
+    result.changed = changes.changed
+    result.seen = len(seen_ids)
+    result.synced_at = run.finished_at
+    result.elapsed = run.finished_at - started
+    return result
+
+
+def delta_sync(category_id: str, **kwargs) -> DeltaResult:
+    """
+    카테고리 증분 동기화 (CLI용 동기 래퍼)
+
+    Args:
+        category_id: 카테고리 ID
+        **kwargs: delta_sync_async에 전달할 옵션
+
+    Returns:
+        DeltaResult
+    """
+    return _run_sync(delta_sync_async(category_id, **kwargs))
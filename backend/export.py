@@ -0,0 +1,471 @@
+"""
+키워드 내보내기(export) 모듈
+
+카테고리 키워드를 EXPORT_CHUNK_ROWS씩 한 번만 읽으면서 여러 포맷 작성기에 동시에 넘깁니다.
+txt / tsv / csv를 모두 저장해도 수집이나 포맷 변환을 포맷마다 다시 하지 않습니다.
+
+- 텍스트 포맷(txt/tsv/csv/ndjson): 카테고리별 파일 ({카테고리명}.{포맷}[.gz|.zst]), save_keywords와 같은 내용
+- 컬럼 포맷(parquet/arrow): 모든 카테고리를 파일 하나(keywords.parquet / keywords.arrow)에
+  categoryId, categoryName, recommended, name, participantCount 컬럼으로 저장 (분석용)
+- 모든 파일은 임시 파일에 쓴 뒤 rename으로 교체하므로 중간에 실패해도 반쯤 쓴 파일이 남지 않음
+- ZipExporter: /api/export 응답용 zip을 메모리에 모으지 않고 조각(bytes)으로 생성
+
+zstd 압축에는 zstandard, 컬럼 포맷에는 pyarrow가 필요합니다 (선택 의존성, 없으면 ExportUnavailable).
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from array import array
+from contextlib import ExitStack
+from itertools import islice
+from typing import IO, Dict, Iterator, List, Tuple
+
+from .batch import MISSING_COUNT, Keywords, KeywordView, iter_chunks
+from .utils import KeywordWriter, atomic_write
+from .config import (
+    STREAM_FORMATS,
+    EXPORT_FORMATS,
+    EXPORT_COMPRESSIONS,
+    EXPORT_CHUNK_ROWS,
+    EXPORT_GZIP_LEVEL,
+    EXPORT_ZSTD_LEVEL,
+    EXPORT_SPOOL_BYTES,
+)
+
+# zstandard가 설치되어 있어야 zstd 압축 가능 (선택 의존성)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# pyarrow가 설치되어 있어야 parquet / arrow 저장 가능 (선택 의존성)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+COLUMNAR_FORMATS = ["parquet", "arrow"]
+COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+# 컬럼 포맷은 파일 안에서 압축 (arrow IPC는 gzip을 지원하지 않으므로 zstd일 때만 압축)
+PARQUET_CODECS = {"none": "snappy", "gzip": "gzip", "zstd": "zstd"}
+ARROW_CODECS = {"none": None, "gzip": None, "zstd": "zstd"}
+# zip 항목을 응답으로 내보내는 단위 / 임시 파일에서 zip으로 옮기는 단위
+ZIP_CHUNK_BYTES = 64 * 1024
+
+
+class ExportUnavailable(Exception):
+    """선택 의존성(zstandard, pyarrow)이 없어 요청한 포맷/압축을 쓸 수 없음"""
+
+
+def parse_formats(value: str) -> List[str]:
+    """
+    쉼표로 구분한 포맷 목록 파싱 (중복 제거, 순서 유지)
+
+    Raises:
+        ValueError: 비어 있거나 지원하지 않는 포맷
+    """
+    formats = list(dict.fromkeys(f.strip().lower() for f in value.split(",") if f.strip()))
+    if not formats:
+        raise ValueError("포맷을 하나 이상 지정해야 합니다.")
+    unknown = [f for f in formats if f not in EXPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 포맷: {', '.join(unknown)}. 사용 가능: {EXPORT_FORMATS}")
+    return formats
+
+
+def check_options(formats: List[str], compression: str = "none") -> None:
+    """
+    포맷 / 압축 조합 확인
+
+    Raises:
+        ValueError: 지원하지 않는 포맷 또는 압축
+        ExportUnavailable: 필요한 선택 의존성 없음
+    """
+    parse_formats(",".join(formats))
+    if compression not in EXPORT_COMPRESSIONS:
+        raise ValueError(f"지원하지 않는 압축: {compression}. 사용 가능: {EXPORT_COMPRESSIONS}")
+    if compression == "zstd" and zstandard is None:
+        raise ExportUnavailable("zstd 압축에는 zstandard가 필요합니다 (pip install zstandard)")
+    if pa is None and any(f in COLUMNAR_FORMATS for f in formats):
+        raise ExportUnavailable("parquet / arrow 저장에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+
+def _safe_name(category_name: str) -> str:
+    # 파일명에서 슬래시 제거 (save_keywords와 같은 규칙)
+    return category_name.replace('/', '')
+
+
+def _sections(keywords: Dict, include_recomm: bool) -> List[Tuple[bool, Keywords]]:
+    """(추천 키워드 여부, 키워드) 순서 - 추천 키워드가 맨 위"""
+    sections = []
+    if include_recomm and keywords.get('recomm'):
+        sections.append((True, keywords['recomm']))
+    sections.append((False, keywords['normal']))
+    return sections
+
+
+def _compressed(raw: IO[bytes], compression: str) -> IO[bytes]:
+    """raw 위에 압축 스트림을 씌움 (닫아도 raw는 닫지 않음)"""
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=EXPORT_GZIP_LEVEL, mtime=0)
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=EXPORT_ZSTD_LEVEL).stream_writer(raw, closefd=False)
+    return raw
+
+
+class _TextSink:
+    """텍스트 포맷 작성기 하나 (KeywordWriter 출력을 UTF-8로 인코딩해 스트림에 씀)"""
+
+    def __init__(self, stream: IO[bytes], format: str, section_breaks: bool = False):
+        self.stream = stream
+        self.writer = KeywordWriter(format)
+        self.section_breaks = section_breaks
+        self.bytes = 0
+        self._put(self.writer.begin())
+
+    def write(self, chunk: Keywords) -> None:
+        self._put(self.writer.write(chunk))
+
+    def section_break(self) -> None:
+        if self.section_breaks:
+            self._put(self.writer.section_break())
+
+    def end(self) -> None:
+        self._put(self.writer.end())
+
+    def _put(self, text: str) -> None:
+        if text:
+            data = text.encode("utf-8")
+            self.stream.write(data)
+            self.bytes += len(data)
+
+
+class _ColumnarSink:
+    """parquet / arrow 작성기 (행 묶음을 RecordBatch로 변환해 씀)"""
+
+    def __init__(self, stream: IO[bytes], format: str, compression: str = "none"):
+        self.schema = pa.schema([
+            ('categoryId', pa.string()),
+            ('categoryName', pa.string()),
+            ('recommended', pa.bool_()),
+            ('name', pa.string()),
+            ('participantCount', pa.int64()),
+        ])
+        self.rows = 0
+        if format == "parquet":
+            self._writer = pq.ParquetWriter(stream, self.schema, compression=PARQUET_CODECS[compression])
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=ARROW_CODECS[compression])
+            self._writer = pa.ipc.new_file(stream, self.schema, options=options)
+
+    def batch(self, category_id: str, category_name: str, recommended: bool, chunk: KeywordView):
+        """행 묶음을 RecordBatch로 변환 (키워드명 / 참여자수 컬럼을 그대로 옮김)"""
+        names: List[str] = []
+        counts = array('l')
+        for batch, start, stop in chunk.segments:
+            names.extend(islice(batch.names, start, stop))
+            counts.extend(batch.counts[start:stop])
+        size = len(names)
+        # array('l')은 플랫폼에 따라 4바이트 또는 8바이트
+        values = pa.Array.from_buffers(pa.int64() if counts.itemsize == 8 else pa.int32(), size, [None, pa.py_buffer(counts)])
+        values = values.cast(pa.int64())
+        if MISSING_COUNT in counts:
+            values = pc.if_else(pc.equal(values, MISSING_COUNT), pa.scalar(None, pa.int64()), values)
+        return pa.RecordBatch.from_arrays([
+            pa.repeat(pa.scalar(category_id, pa.string()), size),
+            pa.repeat(pa.scalar(category_name, pa.string()), size),
+            pa.repeat(pa.scalar(recommended), size),
+            pa.array(names, pa.string()),
+            values,
+        ], schema=self.schema)
+
+    def write(self, batches: List) -> None:
+        for batch in batches:
+            self._writer.write_batch(batch)
+            self.rows += batch.num_rows
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class ExportPipeline:
+    """
+    여러 카테고리를 여러 포맷으로 한 번에 저장
+
+    카테고리마다 텍스트 포맷 파일을 모두 열어 두고 행 묶음을 한 번씩 모든 작성기에 넘기며,
+    컬럼 포맷 행은 카테고리 파일이 모두 저장된 뒤 공용 파일에 이어 씁니다.
+    write_category는 여러 스레드에서 동시에 호출해도 됩니다.
+
+    Args:
+        output_dir: 저장 디렉토리 (없으면 생성)
+        formats: EXPORT_FORMATS 중 하나 이상
+        compression: 'none' | 'gzip' | 'zstd' (텍스트 포맷 파일 압축, 컬럼 포맷은 파일 안에서 압축)
+        include_recomm: 추천 키워드 포함 여부 (컬럼 포맷은 recommended 컬럼으로 구분)
+
+    Raises:
+        ValueError: 지원하지 않는 포맷 또는 압축
+        ExportUnavailable: 필요한 선택 의존성 없음
+    """
+
+    def __init__(self, output_dir: str, formats: List[str], compression: str = "none", include_recomm: bool = False):
+        check_options(formats, compression)
+        self.output_dir = output_dir
+        self.text_formats = [f for f in formats if f in STREAM_FORMATS]
+        self.columnar_formats = [f for f in formats if f in COLUMNAR_FORMATS]
+        self.compression = compression
+        self.include_recomm = include_recomm
+        self.categories = 0
+        self.rows = 0
+        self.bytes: Dict[str, int] = {f: 0 for f in formats}
+        self.files: List[str] = []
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+        self._stack = ExitStack()
+        self._columnar: List[Tuple[str, str, IO[bytes], _ColumnarSink]] = []
+        self._started = 0.0
+
+    def open(self) -> "ExportPipeline":
+        """컬럼 포맷 파일 열기 (임시 파일)"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._started = time.monotonic()
+        for format in self.columnar_formats:
+            path = os.path.join(self.output_dir, f"keywords.{format}")
+            raw = self._stack.enter_context(atomic_write(path))
+            self._columnar.append((format, path, raw, _ColumnarSink(raw, format, self.compression)))
+        return self
+
+    def write_category(self, category_id: str, category_name: str, keywords: Dict) -> List[str]:
+        """
+        카테고리 하나 저장
+
+        Args:
+            category_id: 카테고리 ID
+            category_name: 카테고리명 (파일명으로 사용)
+            keywords: {'recomm': [...], 'normal': [...]}
+
+        Returns:
+            저장한 텍스트 포맷 파일 경로 (포맷 순서)
+        """
+        safe = _safe_name(category_name)
+        suffix = COMPRESSION_SUFFIXES[self.compression]
+        paths = [os.path.join(self.output_dir, f"{safe}.{f}{suffix}") for f in self.text_formats]
+        batches: List[List] = [[] for _ in self._columnar]
+        rows = 0
+
+        with ExitStack() as files:
+            sinks = []
+            for format, path in zip(self.text_formats, paths):
+                raw = files.enter_context(atomic_write(path))
+                stream = _compressed(raw, self.compression)
+                if stream is not raw:
+                    # 압축 스트림은 임시 파일을 rename하기 전에 닫아야 끝부분까지 써짐
+                    files.callback(stream.close)
+                sinks.append(_TextSink(stream, format))
+
+            for recommended, part in _sections(keywords, self.include_recomm):
+                for chunk in iter_chunks(part, EXPORT_CHUNK_ROWS):
+                    for sink in sinks:
+                        sink.write(chunk)
+                    for (_, _, _, columnar), pending in zip(self._columnar, batches):
+                        pending.append(columnar.batch(category_id, category_name, recommended, chunk))
+                    rows += len(chunk)
+            for sink in sinks:
+                sink.end()
+
+        with self._lock:
+            for (format, _, _, columnar), pending in zip(self._columnar, batches):
+                columnar.write(pending)
+            self.categories += 1
+            self.rows += rows
+            for format, sink in zip(self.text_formats, sinks):
+                self.bytes[format] += sink.bytes
+            self.files.extend(paths)
+        return paths
+
+    def close(self) -> None:
+        """컬럼 포맷 파일을 마무리하고 제자리로 옮김"""
+        for _, _, _, columnar in self._columnar:
+            columnar.close()
+        self._stack.close()
+        for format, path, _, _ in self._columnar:
+            self.bytes[format] = os.path.getsize(path)
+            self.files.append(path)
+        self.elapsed = time.monotonic() - self._started
+
+    def abort(self) -> None:
+        """쓰던 컬럼 포맷 임시 파일 삭제 (기존 파일은 그대로, 다 쓴 카테고리 파일은 남음)"""
+        for _, _, _, columnar in self._columnar:
+            try:
+                columnar.close()
+            except Exception:
+                pass
+        error = RuntimeError("내보내기 중단")
+        self._stack.__exit__(type(error), error, None)
+
+    def __enter__(self) -> "ExportPipeline":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def summary(self) -> Dict:
+        return {
+            'outputDir': self.output_dir,
+            'categories': self.categories,
+            'rows': self.rows,
+            'compression': self.compression,
+            'bytes': dict(self.bytes),
+            'elapsedSec': round(self.elapsed, 3),
+            'rowsPerSec': round(self.rows / self.elapsed) if self.elapsed > 0 else None,
+        }
+
+
+class _ChunkBuffer:
+    """zipfile 출력 버퍼 (tell/seek가 없어 zipfile이 data descriptor 방식으로 씀, 모인 바이트는 drain으로 꺼냄)"""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        self.size = 0
+        return data
+
+
+class ZipExporter:
+    """
+    여러 카테고리를 zip 하나로 묶어 조각(bytes) 단위로 생성 (응답 스트리밍용)
+
+    항목 구성:
+    - {포맷}/{카테고리명}.{포맷}: 텍스트 포맷 (deflate, /api/keywords.txt 와 같은 내용)
+    - keywords.parquet / keywords.arrow: 모든 카테고리 (끝날 때 추가, 그 전까지는 EXPORT_SPOOL_BYTES를
+      넘으면 임시 파일에 보관)
+    - manifest.json: 카테고리별 행 수, 건너뛴 / 실패한 카테고리
+
+    zip 항목은 차례로만 쓸 수 있으므로 텍스트 포맷은 카테고리마다 포맷 수만큼 메모리의 키워드를 읽습니다.
+    메모리에는 카테고리 하나의 ZIP_CHUNK_BYTES 남짓한 출력만 남습니다.
+
+    Args:
+        formats: EXPORT_FORMATS 중 하나 이상
+        include_recomm: 추천 키워드 포함 여부
+
+    Raises:
+        ValueError: 지원하지 않는 포맷
+        ExportUnavailable: 필요한 선택 의존성 없음
+    """
+
+    def __init__(self, formats: List[str], include_recomm: bool = False):
+        check_options(formats)
+        self.text_formats = [f for f in formats if f in STREAM_FORMATS]
+        self.columnar_formats = [f for f in formats if f in COLUMNAR_FORMATS]
+        self.include_recomm = include_recomm
+        self.manifest: Dict = {'formats': formats, 'categories': [], 'skipped': [], 'errors': []}
+        self._output = _ChunkBuffer()
+        self._zip = zipfile.ZipFile(self._output, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=EXPORT_GZIP_LEVEL)
+        self._entries = set()
+        self._spools = []
+        for format in self.columnar_formats:
+            spool = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+            self._spools.append((format, spool, _ColumnarSink(spool, format)))
+
+    def _drain(self, force: bool = False) -> Iterator[bytes]:
+        if self._output.size >= ZIP_CHUNK_BYTES or (force and self._output.size):
+            yield self._output.drain()
+
+    def _entry_name(self, format: str, category_id: str, category_name: str) -> str:
+        name = f"{format}/{_safe_name(category_name)}.{format}"
+        if name in self._entries:
+            name = f"{format}/{_safe_name(category_name)}_{category_id}.{format}"
+        self._entries.add(name)
+        return name
+
+    def add_category(self, category_id: str, category_name: str, keywords: Dict) -> Iterator[bytes]:
+        """
+        카테고리 하나를 zip 항목으로 추가
+
+        Yields:
+            그동안 만들어진 zip 바이트 (ZIP_CHUNK_BYTES 이상 모였을 때마다)
+        """
+        sections = _sections(keywords, self.include_recomm)
+        for format in self.text_formats:
+            with self._zip.open(self._entry_name(format, category_id, category_name), "w") as entry:
+                sink = _TextSink(entry, format, section_breaks=True)
+                for recommended, part in sections:
+                    if not recommended:
+                        sink.section_break()
+                    for chunk in iter_chunks(part, EXPORT_CHUNK_ROWS):
+                        sink.write(chunk)
+                        yield from self._drain()
+                sink.end()
+            yield from self._drain()
+
+        for _, _, columnar in self._spools:
+            columnar.write([
+                columnar.batch(category_id, category_name, recommended, chunk)
+                for recommended, part in sections
+                for chunk in iter_chunks(part, EXPORT_CHUNK_ROWS)
+            ])
+        self.manifest['categories'].append({
+            'categoryId': category_id,
+            'name': category_name,
+            'rows': sum(len(part) for _, part in sections),
+        })
+
+    def skip(self, category_id: str, category_name: str, reason: str) -> None:
+        """내보내지 못한 카테고리 기록 (manifest.json)"""
+        target = self.manifest['errors'] if reason != "not_cached" else self.manifest['skipped']
+        target.append({'categoryId': category_id, 'name': category_name, 'reason': reason})
+
+    def finish(self) -> Iterator[bytes]:
+        """
+        컬럼 포맷 / manifest.json 항목을 추가하고 zip 마무리
+
+        Yields:
+            남은 zip 바이트
+        """
+        for format, spool, columnar in self._spools:
+            columnar.close()
+            size = spool.tell()
+            spool.seek(0)
+            info = zipfile.ZipInfo(f"keywords.{format}", time.localtime()[:6])
+            # parquet는 파일 안에서 이미 압축되어 있으므로 그대로 저장
+            info.compress_type = zipfile.ZIP_STORED if format == "parquet" else zipfile.ZIP_DEFLATED
+            info.file_size = size
+            with self._zip.open(info, "w", force_zip64=size >= zipfile.ZIP64_LIMIT) as entry:
+                while True:
+                    data = spool.read(ZIP_CHUNK_BYTES)
+                    if not data:
+                        break
+                    entry.write(data)
+                    yield from self._drain()
+            spool.close()
+        self.manifest['rows'] = sum(c['rows'] for c in self.manifest['categories'])
+        self._zip.writestr("manifest.json", json.dumps(self.manifest, ensure_ascii=False, indent=2))
+        self._zip.close()
+        yield from self._drain(force=True)
+
+    def close(self) -> None:
+        """중간에 멈췄을 때 임시 파일 정리"""
+        for _, spool, _ in self._spools:
+            spool.close()
@@ -0,0 +1,259 @@
+"""
+일괄 수집(harvest) 모듈
+
+모든 카테고리를 제한된 수의 워커로 동시에 수집합니다.
+카테고리별 고정 대기(sleep_sec) 대신 하나의 공유 토큰 버킷으로 전체 요청 속도를
+제한하므로, 소요 시간이 "카테고리별 시간의 합"에서 "가장 긴 카테고리의 시간"
+수준으로 줄어듭니다.
+
+추천 키워드는 시작할 때 모든 카테고리 것을 묶음 요청으로 한꺼번에 받아 두므로
+카테고리마다 추천 키워드 요청을 따로 보내지 않습니다.
+"""
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from .scraper import (
+    fetch_categories_async,
+    fetch_recommend_keywords_batch_async,
+    fetch_all_keywords_async,
+    get_all_keywords_async,
+    _run_sync,
+)
+from .ratelimit import TokenBucket
+from .pacing import AdaptivePacer
+from .checkpoint import get_default_journal
+from .utils import save_keywords
+from .export import ExportPipeline
+from .config import (
+    HARVEST_CONCURRENCY,
+    HARVEST_RATE_PER_SEC,
+    HARVEST_BURST,
+    HARVEST_OUTPUT_DIR,
+    DEFAULT_FORMAT,
+)
+
+
+@dataclass
+class CategoryResult:
+    """카테고리 하나의 수집 결과"""
+    category_id: str
+    category_name: str
+    keyword_count: int = 0
+    pages: int = 0
+    elapsed: float = 0.0
+    filepath: Optional[str] = None
+    error: Optional[str] = None
+    recomm_error: Optional[str] = None  # 추천 키워드 없이 수집한 경우 그 오류
+
+
+@dataclass
+class HarvestReport:
+    """일괄 수집 결과 요약"""
+    results: List[CategoryResult] = field(default_factory=list)
+    requests: int = 0
+    elapsed: float = 0.0
+    pacing: Dict = field(default_factory=dict)
+
+    @property
+    def pages(self) -> int:
+        return sum(r.pages for r in self.results)
+
+    @property
+    def keywords(self) -> int:
+        return sum(r.keyword_count for r in self.results)
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if r.error)
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.pages / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def keywords_per_sec(self) -> float:
+        return self.keywords / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            'categories': len(self.results),
+            'failed': self.failed,
+            'pages': self.pages,
+            'keywords': self.keywords,
+            'requests': self.requests,
+            'elapsedSec': round(self.elapsed, 3),
+            'pagesPerSec': round(self.pages_per_sec, 3),
+            'keywordsPerSec': round(self.keywords_per_sec, 3),
+            'pacing': self.pacing,
+            'results': [r.__dict__ for r in self.results],
+        }
+
+
+async def harvest_all_async(
+    categories: Optional[List[Dict]] = None,
+    concurrency: int = HARVEST_CONCURRENCY,
+    rate: float = HARVEST_RATE_PER_SEC,
+    burst: int = HARVEST_BURST,
+    format: str = DEFAULT_FORMAT,
+    include_recomm: bool = False,
+    output_dir: Optional[str] = HARVEST_OUTPUT_DIR,
+    on_result: Optional[Callable[[CategoryResult, Dict], None]] = None,
+    exporter: Optional[ExportPipeline] = None,
+) -> HarvestReport:
+    """
+    모든 카테고리 동시 수집
+
+    Args:
+        categories: 수집할 카테고리 목록 (None이면 fetch_categories_async 결과 전체)
+        concurrency: 동시에 수집할 카테고리 수 (워커 수)
+        rate: 전체 요청 속도 상한 (초당 요청 수)
+        burst: 토큰 버킷 최대 버스트
+        format: 저장 포맷 ('txt' | 'tsv' | 'csv')
+        include_recomm: 추천 키워드 포함 여부
+        output_dir: 카테고리별 결과 저장 디렉토리 (None이면 저장하지 않음)
+        on_result: 카테고리 수집이 끝날 때마다 호출할 콜백 (결과, 키워드 데이터)
+        exporter: 지정하면 format / include_recomm / output_dir 대신 여러 포맷으로 한 번에 저장
+            (filepath는 첫 번째 텍스트 포맷 파일, 컬럼 포맷은 exporter를 닫을 때 완성)
+
+    Returns:
+        HarvestReport
+
+    Raises:
+        httpx.HTTPError: 카테고리 목록 조회 실패
+        ValueError: 카테고리 목록 파싱 실패
+    """
+    if categories is None:
+        categories = await fetch_categories_async()
+
+    limiter = TokenBucket(rate, burst)
+    # 속도 상한은 토큰 버킷이, 스로틀링 백오프는 모든 워커가 공유하는 간격 조절기가 담당
+    pacer = AdaptivePacer(initial_delay=0, min_delay=0)
+    queue: "asyncio.Queue[Dict]" = asyncio.Queue()
+    for category in categories:
+        queue.put_nowait(category)
+
+    report = HarvestReport()
+    started = time.monotonic()
+
+    try:
+        recommendations = await fetch_recommend_keywords_batch_async([c['id'] for c in categories], limiter)
+    except Exception:
+        # 실패하면 카테고리마다 추천 키워드를 따로 요청
+        recommendations = {}
+
+    async def harvest_one(category: Dict) -> None:
+        result = CategoryResult(category_id=category['id'], category_name=category['name'])
+        category_started = time.monotonic()
+
+        def count_page(_: int) -> None:
+            result.pages += 1
+
+        keywords: Dict = {'recomm': [], 'normal': []}
+        try:
+            recomm = recommendations.get(result.category_id)
+            if recomm is None:
+                keywords = await get_all_keywords_async(
+                    result.category_id,
+                    limiter=limiter,
+                    on_page=count_page,
+                    pacer=pacer,
+                    journal=get_default_journal(),
+                )
+            else:
+                normal = await fetch_all_keywords_async(
+                    result.category_id,
+                    limiter=limiter,
+                    on_page=count_page,
+                    pacer=pacer,
+                    journal=get_default_journal(),
+                )
+                keywords = {'recomm': recomm, 'normal': normal}
+            result.keyword_count = len(keywords['normal'])
+            result.recomm_error = keywords.get('recommError')
+
+            # 끝나는 대로 카테고리별 파일 저장
+            if exporter is not None:
+                paths = await asyncio.to_thread(
+                    exporter.write_category, result.category_id, result.category_name, keywords,
+                )
+                result.filepath = paths[0] if paths else None
+            elif output_dir is not None:
+                result.filepath = await asyncio.to_thread(
+                    save_keywords,
+                    result.category_name,
+                    keywords,
+                    format,
+                    include_recomm,
+                    output_dir,
+                )
+        except Exception as e:
+            result.error = str(e)
+
+        result.elapsed = time.monotonic() - category_started
+        report.results.append(result)
+
+        if on_result is not None:
+            on_result(result, keywords)
+
+    async def worker() -> None:
+        while True:
+            try:
+                category = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await harvest_one(category)
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+
+    report.requests = limiter.acquired
+    report.pacing = pacer.snapshot()
+    report.elapsed = time.monotonic() - started
+    return report
+
+
+def harvest_all(**kwargs) -> HarvestReport:
+    """
+    모든 카테고리 동시 수집 (CLI용 동기 래퍼)
+
+    Args:
+        **kwargs: harvest_all_async에 전달할 옵션
+
+    Returns:
+        HarvestReport
+    """
+    return _run_sync(harvest_all_async(**kwargs))
+
+
+@dataclass
+class HarvestJob:
+    """API에서 실행하는 일괄 수집 작업 상태"""
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "pending"  # pending | running | done | failed
+    total: int = 0
+    completed: List[CategoryResult] = field(default_factory=list)
+    report: Optional[HarvestReport] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    def as_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'status': self.status,
+            'total': self.total,
+            'completed': len(self.completed),
+            'failed': sum(1 for r in self.completed if r.error),
+            'createdAt': self.created_at,
+            'finishedAt': self.finished_at,
+            'error': self.error,
+            'report': self.report.as_dict() if self.report else None,
+        }
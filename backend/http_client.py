@@ -0,0 +1,176 @@
+"""
+HTTP 세션 관리 모듈
+
+스크래퍼 전체가 공유하는 keep-alive 커넥션 풀(httpx.AsyncClient)을 관리합니다.
+in.naver.com 으로의 모든 요청이 같은 풀을 재사용하므로 페이지마다
+TCP/TLS 핸드셰이크를 다시 하지 않습니다.
+"""
+
+import asyncio
+import httpx
+from typing import AsyncIterator, Callable, Dict, Optional
+
+from .config import (
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_READ_TIMEOUT,
+)
+
+# brotli 디코더가 설치되어 있을 때만 br 인코딩을 협상 (httpx 선택 의존성)
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """응답 본문 스트림이 닫힐 때 release를 한 번 호출하는 래퍼"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class PerHostLimitTransport(httpx.AsyncHTTPTransport):
+    """
+    호스트별 동시 연결 수를 제한하는 전송 계층
+
+    httpx.Limits는 풀 전체 연결 수만 제한하므로, 호스트 단위 제한은
+    세마포어로 별도 처리합니다. 자리는 응답 본문을 다 읽고 스트림이 닫힐 때 반납하므로
+    client.stream(...)으로 큰 본문을 읽는 동안에도 제한이 유지됩니다.
+    """
+
+    def __init__(self, max_per_host: int, **kwargs):
+        super().__init__(**kwargs)
+        self._max_per_host = max_per_host
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self._max_per_host)
+
+        await semaphore.acquire()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        response.stream = _ReleasingStream(response.stream, semaphore.release)
+        return response
+
+
+# 공유 클라이언트 (이벤트 루프 단위로 관리)
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def create_client(
+    max_connections: int = HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    max_connections_per_host: int = HTTP_MAX_CONNECTIONS_PER_HOST,
+    keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+    connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+    read_timeout: float = HTTP_READ_TIMEOUT,
+) -> httpx.AsyncClient:
+    """
+    커넥션 풀이 설정된 새 비동기 HTTP 클라이언트 생성
+
+    Args:
+        max_connections: 풀 전체 최대 연결 수
+        max_keepalive_connections: 유지할 keep-alive 연결 수
+        max_connections_per_host: 호스트별 최대 동시 연결 수
+        keepalive_expiry: 유휴 keep-alive 연결 유지 시간 (초)
+        connect_timeout: 연결 타임아웃 (초)
+        read_timeout: 읽기 타임아웃 (초)
+
+    Returns:
+        httpx.AsyncClient 인스턴스
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    timeout = httpx.Timeout(
+        connect=connect_timeout,
+        read=read_timeout,
+        write=read_timeout,
+        pool=read_timeout,
+    )
+    transport = PerHostLimitTransport(max_connections_per_host, limits=limits)
+
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=timeout,
+        headers={'Accept-Encoding': ACCEPT_ENCODING},
+    )
+
+
+async def open_client(**kwargs) -> httpx.AsyncClient:
+    """
+    공유 클라이언트 열기 (FastAPI 시작 시 호출)
+
+    Args:
+        **kwargs: create_client에 전달할 풀 설정
+
+    Returns:
+        httpx.AsyncClient 인스턴스
+    """
+    global _client, _client_loop
+
+    await close_client()
+    _client = create_client(**kwargs)
+    _client_loop = asyncio.get_running_loop()
+    return _client
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    공유 클라이언트 반환
+
+    현재 이벤트 루프에 묶인 클라이언트가 없으면 기본 설정으로 새로 생성합니다.
+    (CLI 동기 래퍼는 호출마다 새 이벤트 루프를 사용하므로 루프 단위로 관리)
+
+    Returns:
+        httpx.AsyncClient 인스턴스
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = create_client()
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """공유 클라이언트 닫기 (FastAPI 종료 시 호출)"""
+    global _client, _client_loop
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -0,0 +1,349 @@
+"""
+백그라운드 수집 작업(job) 모듈
+
+카테고리 하나의 전체 키워드 수집을 작업으로 등록하고, 제한된 수의 워커가 순서대로 실행합니다.
+
+- 같은 카테고리 작업이 대기/실행 중이거나 결과가 아직 신선하면(keywords_ttl 이내) 새로 만들지 않고 그 작업을 반환
+- 진행 상황(받은 페이지/키워드 수, 예상 남은 시간)은 페이지마다 갱신
+- 취소는 페이지 사이에서 확인하는 협조적 방식 (받은 페이지는 체크포인트에 남아 다음 수집이 이어받음)
+- 결과는 JOB_RESULT_DIR에 JSON으로 저장하고 JOB_RESULT_TTL이 지나면 삭제
+"""
+
+import asyncio
+import glob
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from .scraper import try_fetch_recommend_keywords_async, iter_keyword_pages_async, keywords_result, keywords_ttl
+from .pacing import AdaptivePacer
+from .checkpoint import get_default_journal
+from .batch import KeywordBatch, dumps_json
+from .utils import save_keywords
+from .config import (
+    JOB_WORKERS,
+    JOB_QUEUE_MAXSIZE,
+    JOB_RESULT_DIR,
+    JOB_RESULT_TTL,
+    DEFAULT_SLEEP_SEC_API,
+    SUPPORTED_FORMATS,
+)
+
+logger = logging.getLogger(__name__)
+
+# 대기/실행 중 상태
+ACTIVE_STATUSES = ("queued", "running")
+
+
+class JobQueueFull(Exception):
+    """대기 중인 작업이 JOB_QUEUE_MAXSIZE 개를 넘음"""
+
+
+class JobCancelled(Exception):
+    """페이지 사이에서 취소 요청을 확인함"""
+
+
+@dataclass
+class CrawlJob:
+    """카테고리 수집 작업 상태"""
+    category_id: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "queued"  # queued | running | done | failed | cancelled
+    pages: int = 0
+    keywords: int = 0
+    total: Optional[int] = None  # 전체 키워드 수 (paging.total, 첫 페이지 이후)
+    error: Optional[str] = None
+    recomm_error: Optional[str] = None  # 추천 키워드 없이 완료한 경우 그 오류
+    result_path: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    expires_at: Optional[float] = None
+    fresh_until: Optional[float] = None  # 이 시각까지는 같은 카테고리 작업 요청에 이 결과를 재사용 (keywords_ttl)
+
+    @property
+    def active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+    @property
+    def eta(self) -> Optional[float]:
+        """지금까지의 키워드 수집 속도 기준 예상 남은 시간 (초)"""
+        if self.status != "running" or not self.total or not self.keywords or self.started_at is None:
+            return None
+        elapsed = time.time() - self.started_at
+        return max(0.0, (self.total - self.keywords) * elapsed / self.keywords)
+
+    def as_dict(self) -> Dict:
+        eta = self.eta
+        return {
+            'id': self.id,
+            'categoryId': self.category_id,
+            'status': self.status,
+            'pages': self.pages,
+            'keywords': self.keywords,
+            'total': self.total,
+            'etaSec': None if eta is None else round(eta, 1),
+            'cancelRequested': self.cancel_requested,
+            'createdAt': self.created_at,
+            'startedAt': self.started_at,
+            'finishedAt': self.finished_at,
+            'expiresAt': self.expires_at,
+            'error': self.error,
+            'recommError': self.recomm_error,
+        }
+
+
+def _write_atomic(path: str, content: str) -> None:
+    # 임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 완성된 파일만 봄
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def _read_result(path: str) -> Dict[str, KeywordBatch]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {'recomm': KeywordBatch(data['recomm']), 'normal': KeywordBatch(data['normal'])}
+
+
+class JobManager:
+    """
+    수집 작업 관리자 (워커 풀 + 작업 목록)
+
+    start()는 이벤트 루프 안에서 (FastAPI lifespan 등) 호출해야 합니다.
+
+    Args:
+        workers: 동시에 실행할 작업 수
+        result_dir: 결과 저장 디렉토리
+        result_ttl: 결과 보관 시간 (초)
+        pacer: 모든 작업이 공유할 간격 조절기 (None이면 작업마다 DEFAULT_SLEEP_SEC_API로 시작)
+        on_done: 작업이 끝날 때마다 호출할 콜백 (작업, 키워드 데이터)
+    """
+
+    def __init__(
+        self,
+        workers: int = JOB_WORKERS,
+        result_dir: str = JOB_RESULT_DIR,
+        result_ttl: float = JOB_RESULT_TTL,
+        pacer: Optional[AdaptivePacer] = None,
+        on_done: Optional[Callable[[CrawlJob, Dict], None]] = None,
+    ):
+        self.workers = max(1, workers)
+        self.result_dir = result_dir
+        self.result_ttl = result_ttl
+        self.pacer = pacer
+        self.on_done = on_done
+        self.jobs: Dict[str, CrawlJob] = {}
+        self._queue: Optional["asyncio.Queue[str]"] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """워커 시작 (이전 실행에서 남은 만료 결과 파일 정리)"""
+        if self._tasks:
+            return
+        os.makedirs(self.result_dir, exist_ok=True)
+        await asyncio.to_thread(self._remove_stale_files)
+        self._queue = asyncio.Queue(maxsize=JOB_QUEUE_MAXSIZE)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """워커 종료 (실행 중인 작업은 중단)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def submit(self, category_id: str) -> CrawlJob:
+        """
+        수집 작업 등록
+
+        같은 카테고리 작업이 대기/실행 중이거나 아직 신선한 결과가 있으면 그 작업을 반환합니다.
+
+        Args:
+            category_id: 카테고리 ID
+
+        Returns:
+            CrawlJob
+
+        Raises:
+            JobQueueFull: 대기열이 가득 참
+            RuntimeError: start()를 호출하지 않음
+        """
+        if self._queue is None:
+            raise RuntimeError("JobManager.start()를 먼저 호출해야 합니다.")
+        job = self.find(category_id)
+        if job is not None:
+            return job
+
+        job = CrawlJob(category_id=category_id)
+        try:
+            self._queue.put_nowait(job.id)
+        except asyncio.QueueFull:
+            raise JobQueueFull(f"대기 중인 작업이 너무 많습니다 (최대 {JOB_QUEUE_MAXSIZE}개).")
+        self.jobs[job.id] = job
+        return job
+
+    def find(self, category_id: str) -> Optional[CrawlJob]:
+        """
+        같은 카테고리의 대기/실행 중이거나 신선한 결과가 있는 작업 (없으면 None)
+
+        끝난 작업 결과는 JOB_RESULT_TTL 동안 내려받을 수 있지만, 새 작업 요청에는 keywords_ttl 이내의 결과만 재사용합니다.
+        """
+        self.purge_expired()
+        now = time.time()
+        for job in self.jobs.values():
+            if job.category_id != category_id:
+                continue
+            if job.active or (job.status == "done" and job.fresh_until is not None and now < job.fresh_until):
+                return job
+        return None
+
+    def get(self, job_id: str) -> Optional[CrawlJob]:
+        """작업 조회 (없거나 만료되었으면 None)"""
+        self.purge_expired()
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[CrawlJob]:
+        """
+        작업 취소 요청
+
+        대기 중인 작업은 바로 취소되고, 실행 중인 작업은 현재 페이지를 받은 뒤 멈춥니다.
+        이미 끝난 작업은 결과 파일을 지우고 목록에서 제거합니다.
+
+        Returns:
+            CrawlJob (없으면 None)
+        """
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        if job.status == "queued":
+            job.status = "cancelled"
+            job.finished_at = time.time()
+        elif job.status == "running":
+            job.cancel_requested = True
+        else:
+            self._remove(job)
+        return job
+
+    async def load_result(self, job: CrawlJob) -> Dict[str, KeywordBatch]:
+        """완료된 작업 결과 읽기 ({'recomm': KeywordBatch, 'normal': KeywordBatch})"""
+        return await asyncio.to_thread(_read_result, job.result_path)
+
+    async def export_result(self, job: CrawlJob, format: str, include_recomm: bool = False) -> str:
+        """
+        완료된 작업 결과를 포맷별 파일로 변환 (같은 포맷은 한 번만 만들고 재사용)
+
+        Args:
+            job: 완료된 작업
+            format: 'txt' | 'tsv' | 'csv'
+            include_recomm: 추천 키워드 포함 여부
+
+        Returns:
+            변환된 파일 경로
+
+        Raises:
+            ValueError: 지원하지 않는 포맷
+        """
+        if format not in SUPPORTED_FORMATS:
+            raise ValueError(f"지원하지 않는 포맷: {format}. 사용 가능: {SUPPORTED_FORMATS}")
+        name = f"{job.id}.recomm" if include_recomm else job.id
+        path = os.path.join(self.result_dir, f"{name}.{format}")
+        if os.path.exists(path):
+            return path
+        keywords = await self.load_result(job)
+        await asyncio.to_thread(self._export, name, keywords, format, include_recomm, path)
+        return path
+
+    def _export(self, name: str, keywords: Dict, format: str, include_recomm: bool, path: str) -> None:
+        # 다른 요청이 만들다 만 파일을 내려주지 않도록 임시 이름으로 저장한 뒤 교체
+        tmp_path = save_keywords(f"{name}.{uuid.uuid4().hex[:8]}.tmp", keywords, format, include_recomm, self.result_dir)
+        os.replace(tmp_path, path)
+
+    def purge_expired(self) -> None:
+        """보관 시간이 지난 결과와 작업 삭제"""
+        now = time.time()
+        for job in list(self.jobs.values()):
+            if not job.active and job.finished_at is not None and now - job.finished_at > self.result_ttl:
+                self._remove(job)
+
+    def _remove(self, job: CrawlJob) -> None:
+        self.jobs.pop(job.id, None)
+        for path in glob.glob(os.path.join(self.result_dir, f"{job.id}.*")):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _remove_stale_files(self) -> None:
+        cutoff = time.time() - self.result_ttl
+        for path in glob.glob(os.path.join(self.result_dir, "*")):
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            job = self.jobs.get(job_id)
+            # 대기 중에 취소/삭제된 작업은 건너뜀
+            if job is not None and job.status == "queued":
+                await self._run(job)
+
+    async def _run(self, job: CrawlJob) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        keywords: Dict = {'recomm': KeywordBatch(), 'normal': KeywordBatch()}
+        # 추천 키워드는 페이지 수집과 동시에 요청 (실패해도 일반 키워드만으로 완료)
+        recomm_task = asyncio.ensure_future(try_fetch_recommend_keywords_async(job.category_id))
+        try:
+            pages = iter_keyword_pages_async(
+                job.category_id, DEFAULT_SLEEP_SEC_API, pacer=self.pacer, journal=get_default_journal()
+            )
+            try:
+                async for page in pages:
+                    keywords['normal'].extend(page.keywords)
+                    job.pages += 1
+                    job.keywords = len(keywords['normal'])
+                    job.total = page.total
+                    # 다음 페이지를 요청하기 전에 취소 여부 확인
+                    if job.cancel_requested and page.next_cursor:
+                        raise JobCancelled()
+            finally:
+                await pages.aclose()
+
+            recomm, job.recomm_error = await recomm_task
+            keywords = keywords_result(recomm, keywords['normal'], job.recomm_error)
+            path = os.path.join(self.result_dir, f"{job.id}.json")
+            await asyncio.to_thread(_write_atomic, path, dumps_json(keywords))
+            job.result_path = path
+            job.status = "done"
+        except JobCancelled:
+            job.status = "cancelled"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            recomm_task.cancel()
+            job.finished_at = time.time()
+            if job.status == "done":
+                job.expires_at = job.finished_at + self.result_ttl
+                job.fresh_until = job.finished_at + keywords_ttl(keywords)
+
+        if job.status == "done" and self.on_done is not None:
+            # 콜백이 실패해도 워커는 계속 다음 작업을 처리
+            try:
+                self.on_done(job, keywords)
+            except Exception:
+                logger.exception("작업 완료 콜백 실패 (%s)", job.category_id)
@@ -0,0 +1,346 @@
+"""
+키워드 저장소 모듈
+
+카테고리별 키워드를 GraphQL 키워드 id 기준으로 SQLite에 보관합니다.
+
+- keywords: 현재 상태 (이름, 참여자수, 처음/마지막 확인 시각, 삭제 시각)
+- keyword_history: 참여자수 변화 이력
+- keyword_changes: 추가/삭제/변경 기록 (delta 조회용)
+- sync_runs: 동기화 실행 기록
+"""
+
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .config import KEYWORD_STORE_DB_PATH
+
+
+@dataclass
+class StoredKeyword:
+    """저장소에 있는 키워드 하나"""
+    id: str
+    name: str
+    participant_count: int
+    first_seen: float
+    last_seen: float
+
+
+@dataclass
+class SyncRun:
+    """동기화 실행 기록"""
+    category_id: str
+    started_at: float
+    finished_at: float
+    complete: bool
+    pages: int
+    added: int
+    removed: int
+    changed: int
+
+
+@dataclass
+class KeywordChanges:
+    """이번 동기화에서 저장소에 반영할 변경 내용"""
+    seen: List[Dict] = field(default_factory=list)
+    added: List[Dict] = field(default_factory=list)
+    changed: List[Dict] = field(default_factory=list)
+    removed: List[Dict] = field(default_factory=list)
+
+
+class KeywordStore:
+    """
+    카테고리별 키워드 저장소 (SQLite)
+
+    Args:
+        path: SQLite 파일 경로
+    """
+
+    def __init__(self, path: str = KEYWORD_STORE_DB_PATH):
+        self.path = path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS keywords (
+                    category_id TEXT NOT NULL,
+                    keyword_id TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    participant_count INTEGER,
+                    first_seen REAL NOT NULL,
+                    last_seen REAL NOT NULL,
+                    removed_at REAL,
+                    PRIMARY KEY (category_id, keyword_id)
+                );
+                CREATE TABLE IF NOT EXISTS keyword_history (
+                    category_id TEXT NOT NULL,
+                    keyword_id TEXT NOT NULL,
+                    observed_at REAL NOT NULL,
+                    participant_count INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS idx_history_keyword
+                    ON keyword_history (category_id, keyword_id, observed_at);
+                CREATE TABLE IF NOT EXISTS keyword_changes (
+                    category_id TEXT NOT NULL,
+                    keyword_id TEXT NOT NULL,
+                    change_type TEXT NOT NULL,
+                    changed_at REAL NOT NULL,
+                    name TEXT NOT NULL,
+                    old_count INTEGER,
+                    new_count INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS idx_changes_category
+                    ON keyword_changes (category_id, changed_at);
+                CREATE TABLE IF NOT EXISTS sync_runs (
+                    category_id TEXT NOT NULL,
+                    started_at REAL NOT NULL,
+                    finished_at REAL NOT NULL,
+                    complete INTEGER NOT NULL,
+                    pages INTEGER NOT NULL,
+                    added INTEGER NOT NULL,
+                    removed INTEGER NOT NULL,
+                    changed INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_sync_runs_category
+                    ON sync_runs (category_id, finished_at);
+            """)
+            self._initialized = True
+        return conn
+
+    def load_current(self, category_id: str) -> Dict[str, StoredKeyword]:
+        """
+        카테고리의 현재 키워드 조회 (삭제된 키워드 제외)
+
+        Args:
+            category_id: 카테고리 ID
+
+        Returns:
+            {keyword_id: StoredKeyword}
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT keyword_id, name, participant_count, first_seen, last_seen FROM keywords "
+                "WHERE category_id = ? AND removed_at IS NULL",
+                (category_id,),
+            )
+            return {row[0]: StoredKeyword(*row) for row in rows}
+        finally:
+            conn.close()
+
+    def last_complete_run(self, category_id: str) -> Optional[SyncRun]:
+        """마지막으로 끝까지 수집한 동기화 기록 조회"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT category_id, started_at, finished_at, complete, pages, added, removed, changed "
+                "FROM sync_runs WHERE category_id = ? AND complete = 1 "
+                "ORDER BY finished_at DESC LIMIT 1",
+                (category_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            return SyncRun(row[0], row[1], row[2], bool(row[3]), *row[4:])
+        finally:
+            conn.close()
+
+    def last_run(self, category_id: str) -> Optional[SyncRun]:
+        """마지막 동기화 기록 조회"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT category_id, started_at, finished_at, complete, pages, added, removed, changed "
+                "FROM sync_runs WHERE category_id = ? ORDER BY finished_at DESC LIMIT 1",
+                (category_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            return SyncRun(row[0], row[1], row[2], bool(row[3]), *row[4:])
+        finally:
+            conn.close()
+
+    def apply_sync(
+        self,
+        category_id: str,
+        changes: KeywordChanges,
+        started_at: float,
+        complete: bool,
+        pages: int,
+    ) -> SyncRun:
+        """
+        동기화 결과를 한 트랜잭션으로 반영
+
+        Args:
+            category_id: 카테고리 ID
+            changes: 확인한 키워드와 추가/변경/삭제 목록
+            started_at: 동기화 시작 시각
+            complete: 끝까지 수집했는지 여부
+            pages: 받은 페이지 수
+
+        Returns:
+            기록된 SyncRun
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                # 확인한 키워드: 현재 상태 갱신 (삭제되었다가 다시 나타난 키워드 포함)
+                conn.executemany(
+                    "INSERT INTO keywords "
+                    "(category_id, keyword_id, name, participant_count, first_seen, last_seen, removed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, NULL) "
+                    "ON CONFLICT(category_id, keyword_id) DO UPDATE SET "
+                    "name = excluded.name, participant_count = excluded.participant_count, "
+                    "last_seen = excluded.last_seen, removed_at = NULL",
+                    [
+                        (category_id, k['id'], k['name'], k['participantCount'], now, now)
+                        for k in changes.seen
+                    ],
+                )
+                conn.executemany(
+                    "UPDATE keywords SET removed_at = ? WHERE category_id = ? AND keyword_id = ?",
+                    [(now, category_id, k['id']) for k in changes.removed],
+                )
+
+                # 참여자수 이력 (새 키워드 + 값이 바뀐 키워드)
+                conn.executemany(
+                    "INSERT INTO keyword_history (category_id, keyword_id, observed_at, participant_count) "
+                    "VALUES (?, ?, ?, ?)",
+                    [
+                        (category_id, k['id'], now, k['participantCount'])
+                        for k in changes.added + changes.changed
+                    ],
+                )
+
+                # 변경 기록
+                records = (
+                    [('added', k, None, k['participantCount']) for k in changes.added]
+                    + [('changed', k, k.get('previousCount'), k['participantCount']) for k in changes.changed]
+                    + [('removed', k, k['participantCount'], None) for k in changes.removed]
+                )
+                conn.executemany(
+                    "INSERT INTO keyword_changes "
+                    "(category_id, keyword_id, change_type, changed_at, name, old_count, new_count) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (category_id, k['id'], change_type, now, k['name'], old, new)
+                        for change_type, k, old, new in records
+                    ],
+                )
+
+                run = SyncRun(
+                    category_id=category_id,
+                    started_at=started_at,
+                    finished_at=now,
+                    complete=complete,
+                    pages=pages,
+                    added=len(changes.added),
+                    removed=len(changes.removed),
+                    changed=len(changes.changed),
+                )
+                conn.execute(
+                    "INSERT INTO sync_runs "
+                    "(category_id, started_at, finished_at, complete, pages, added, removed, changed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (category_id, started_at, now, int(complete), pages, run.added, run.removed, run.changed),
+                )
+            return run
+        finally:
+            conn.close()
+
+    def changes_since(self, category_id: str, since: float) -> Dict[str, List[Dict]]:
+        """
+        since 이후의 순변경 조회
+
+        같은 키워드가 여러 번 바뀌었으면 하나로 합칩니다.
+        (기간 안에 추가되었다가 삭제된 키워드는 제외)
+
+        Args:
+            category_id: 카테고리 ID
+            since: 기준 시각 (epoch 초)
+
+        Returns:
+            {'added': [...], 'removed': [...], 'changed': [...]}
+        """
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT keyword_id, change_type, changed_at, name, old_count, new_count "
+                "FROM keyword_changes WHERE category_id = ? AND changed_at > ? "
+                "ORDER BY changed_at, rowid",
+                (category_id, since),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        net: Dict[str, Dict] = {}
+        for keyword_id, change_type, changed_at, name, old_count, new_count in rows:
+            item = net.get(keyword_id)
+            if item is None:
+                # 기간 시작 시점의 상태: 'added'가 처음이면 기간 전에는 없던 키워드
+                item = net[keyword_id] = {
+                    'id': keyword_id,
+                    'existedBefore': change_type != 'added',
+                    'previousCount': old_count,
+                }
+            item.update({
+                'name': name,
+                'participantCount': new_count,
+                'exists': change_type != 'removed',
+                'changedAt': changed_at,
+            })
+
+        result: Dict[str, List[Dict]] = {'added': [], 'removed': [], 'changed': []}
+        for item in net.values():
+            existed, exists = item.pop('existedBefore'), item.pop('exists')
+            if not existed and exists:
+                item.pop('previousCount')
+                result['added'].append(item)
+            elif existed and not exists:
+                item['participantCount'] = item.pop('previousCount')
+                result['removed'].append(item)
+            elif existed and exists and item['previousCount'] != item['participantCount']:
+                result['changed'].append(item)
+        return result
+
+    def history(self, category_id: str, keyword_id: str) -> List[Dict]:
+        """
+        키워드 참여자수 이력 조회
+
+        Returns:
+            [{'observedAt': ..., 'participantCount': ...}, ...] (시간순)
+        """
+        conn = self._connect()
+        try:
+            return [
+                {'observedAt': observed_at, 'participantCount': count}
+                for observed_at, count in conn.execute(
+                    "SELECT observed_at, participant_count FROM keyword_history "
+                    "WHERE category_id = ? AND keyword_id = ? ORDER BY observed_at",
+                    (category_id, keyword_id),
+                )
+            ]
+        finally:
+            conn.close()
+
+
+_default_store: Optional[KeywordStore] = None
+
+
+def get_default_store() -> KeywordStore:
+    """설정 경로(KEYWORD_STORE_DB_PATH)를 사용하는 공용 저장소 반환"""
+    global _default_store
+
+    if _default_store is None:
+        _default_store = KeywordStore()
+    return _default_store
@@ -0,0 +1,359 @@
+"""
+지표(metrics) 및 단계별 시간 측정 모듈
+
+Prometheus 텍스트 형식(/metrics)으로 내보낼 카운터/게이지/히스토그램과,
+API 응답마다 Server-Timing 헤더를 붙이는 ASGI 미들웨어를 제공합니다.
+
+단계(phase) 시간은 두 곳에 동시에 기록됩니다.
+- naver_phase_seconds_total{phase}: 프로세스 전체 누적 (대기 vs 작업 비율 확인용)
+- 현재 API 요청의 Server-Timing 헤더 (요청 처리 중에 실행된 수집/변환만 포함)
+
+단계 이름: fetch (upstream HTTP 요청), parse (응답 JSON/HTML 파싱),
+sleep (페이지 간 대기, 속도 제한 대기), format (응답 본문 변환)
+
+지표 갱신은 이벤트 루프 스레드에서 하는 것을 전제로 잠금 없이 처리합니다.
+"""
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .config import METRICS_ENABLED
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 요청 지연 시간 히스토그램 기본 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_enabled = METRICS_ENABLED
+
+
+def set_enabled(enabled: bool) -> None:
+    """지표 기록 켜기/끄기 (계측 오버헤드 측정용)"""
+    global _enabled
+    _enabled = enabled
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """레이블별 값을 가진 지표 공통 부분"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values: str):
+        """레이블 값에 해당하는 하위 지표 (처음 쓰는 조합이면 생성)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 레이블 {self.labelnames} 값이 필요합니다.")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class _Value:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if _enabled:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        if _enabled:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        if _enabled:
+            self.value = value
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """레이블 없는 카운터 증가"""
+        self.labels().inc(amount)
+
+    def _samples(self) -> Iterator[str]:
+        for values, child in self._children.items():
+            yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class Gauge(Counter):
+    """
+    게이지 (증가/감소/설정 가능)
+
+    set_function으로 지정한 함수가 있으면 내보낼 때마다 그 값을 읽습니다.
+    """
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._function: Optional[Callable[[], float]] = None
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._function = function
+
+    def _samples(self) -> Iterator[str]:
+        if self._function is not None:
+            yield f"{self.name} {_format_value(self._function())}"
+            return
+        yield from super()._samples()
+
+
+class _HistogramValue:
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        if _enabled:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.sum += value
+            self.count += 1
+
+
+class Histogram(_Metric):
+    """
+    누적 구간 히스토그램
+
+    Args:
+        buckets: 구간 상한 (오름차순, +Inf는 자동 추가)
+    """
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """레이블 없는 히스토그램에 값 기록"""
+        self.labels().observe(value)
+
+    def _samples(self) -> Iterator[str]:
+        for values, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), child.counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, values, f'le="{_format_value(bound)}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(child.sum)}"
+            yield f"{self.name}_count{labels} {child.count}"
+
+
+class Registry:
+    """지표 목록 (등록 순서대로 내보냄)"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        return "\n".join(metric.render() for metric in self._metrics) + "\n"
+
+
+REGISTRY = Registry()
+
+UPSTREAM_LATENCY = REGISTRY.register(Histogram(
+    "naver_upstream_request_duration_seconds",
+    "Upstream request latency by GraphQL operation (keywordsPage = category HTML page)",
+    ["operation"],
+))
+UPSTREAM_ERRORS = REGISTRY.register(Counter(
+    "naver_upstream_errors_total",
+    "Upstream errors by operation and type (http_<status>, transport, graphql, parse)",
+    ["operation", "type"],
+))
+PAGES_FETCHED = REGISTRY.register(Counter(
+    "naver_pages_fetched_total", "Keyword pages fetched per category", ["category"],
+))
+KEYWORDS_FETCHED = REGISTRY.register(Counter(
+    "naver_keywords_fetched_total", "Keywords fetched per category", ["category"],
+))
+PHASE_SECONDS = REGISTRY.register(Counter(
+    "naver_phase_seconds_total", "Time spent per phase (fetch, parse, sleep, format)", ["phase"],
+))
+DEGRADED_RESULTS = REGISTRY.register(Counter(
+    "naver_degraded_results_total", "Keyword results returned without a part after its error or timeout", ["part"],
+))
+PREWARM_REFRESHES = REGISTRY.register(Counter(
+    "naver_prewarm_refreshes_total", "Background prewarm crawls by result (ok, error, budget)", ["result"],
+))
+UPSTREAM_HEDGES = REGISTRY.register(Counter(
+    "naver_upstream_hedges_total", "Hedged page requests by outcome (sent, won)", ["result"],
+))
+BREAKER_STATE = REGISTRY.register(Gauge(
+    "naver_breaker_state", "Upstream circuit breaker state (0 closed, 1 half-open, 2 open)",
+))
+BREAKER_REJECTIONS = REGISTRY.register(Counter(
+    "naver_breaker_rejections_total", "Upstream calls rejected without a request while the breaker was open",
+))
+ADMISSION_QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "naver_admission_queue_depth", "Requests waiting for a crawl slot by lane (priority, crawl)", ["lane"],
+))
+ADMISSION_RUNNING = REGISTRY.register(Gauge(
+    "naver_admission_running", "Admitted requests holding a slot by lane (priority, crawl)", ["lane"],
+))
+ADMISSION_REJECTIONS = REGISTRY.register(Counter(
+    "naver_admission_rejections_total", "Requests rejected with 429 by reason (queue_full, client_quota, timeout)", ["reason"],
+))
+ADMISSION_WAIT = REGISTRY.register(Histogram(
+    "naver_admission_wait_seconds", "Time admitted requests waited in the queue by lane", ["lane"],
+))
+CRAWLS_IN_FLIGHT = REGISTRY.register(Gauge(
+    "naver_crawls_in_flight", "Keyword crawls currently paginating",
+))
+PACER_DELAY = REGISTRY.register(Gauge(
+    "naver_pacer_delay_seconds", "Current delay between pages of the shared API pacer",
+))
+API_LATENCY = REGISTRY.register(Histogram(
+    "naver_api_request_duration_seconds", "API latency by route", ["method", "route", "status"],
+))
+
+# 현재 API 요청의 단계별 누적 시간 (요청 밖에서는 None)
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_timings", default=None)
+
+
+def add_phase_time(name: str, seconds: float) -> None:
+    """단계 시간 기록 (전체 누적 + 현재 요청의 Server-Timing)"""
+    if not _enabled:
+        return
+    PHASE_SECONDS.labels(name).inc(seconds)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + seconds
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """with 블록 실행 시간을 단계 시간으로 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_phase_time(name, time.perf_counter() - started)
+
+
+def server_timing_header(timings: Dict[str, float], total: float) -> str:
+    """Server-Timing 헤더 값 (ms 단위)"""
+    parts = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in timings.items()]
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def _route_name(scope: Dict) -> str:
+    # 경로 대신 라우트 템플릿을 레이블로 사용 (/api/jobs/{job_id} 등 레이블 수 제한)
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path:
+        return path
+    endpoint = scope.get("endpoint")
+    return getattr(endpoint, "__name__", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    API 지연 시간 지표 + Server-Timing 헤더 ASGI 미들웨어
+
+    응답 시작 시점까지의 fetch/parse/sleep/format 시간을 Server-Timing 헤더에 담습니다.
+    스트리밍 응답은 첫 바이트 전까지의 시간만 헤더에 포함되고, 지연 시간 지표는 본문 전송이 끝난 뒤 기록합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: Dict[str, float] = {}
+        token = _request_timings.set(timings)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                header = server_timing_header(timings, time.perf_counter() - started)
+                message = {**message, "headers": [*message.get("headers", []), (b"server-timing", header.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_timings.reset(token)
+            API_LATENCY.labels(scope["method"], _route_name(scope), str(status)).observe(
+                time.perf_counter() - started
+            )
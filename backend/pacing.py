@@ -0,0 +1,178 @@
+"""
+적응형 요청 간격 조절 모듈
+
+페이지 사이 대기 시간을 고정값(sleep_sec) 대신 응답 상태에 따라 조절합니다 (AIMD).
+
+- 응답이 빠르고 오류가 없으면 대기 시간을 조금씩(가산적으로) 줄임
+- 429/5xx, GraphQL errors 시 대기 시간을 지수적으로(승산적으로) 늘림 (jitter 포함)
+- 지연 시간 급증(평균의 PACER_LATENCY_FACTOR 배 이상이면서 PACER_LATENCY_MIN_SEC 이상)이
+  PACER_LATENCY_SAMPLES 번 연속될 때만 대기 시간을 조금씩(가산적으로) 늘림
+  (꼬리가 긴 지연 시간 분포의 일시적인 느린 응답으로 간격이 커지지 않도록)
+- Retry-After 헤더가 있으면 다음 요청까지 최소 그 시간만큼 대기
+- 대기 시간은 항상 MIN_SLEEP_SEC ~ MAX_SLEEP_SEC 범위 안에서만 움직임
+"""
+
+import asyncio
+import email.utils
+import random
+import time
+from typing import Dict, Optional
+
+from .config import (
+    MIN_SLEEP_SEC,
+    MAX_SLEEP_SEC,
+    PACER_MIN_DELAY,
+    PACER_DECREASE_STEP,
+    PACER_BACKOFF_FACTOR,
+    PACER_BACKOFF_BASE,
+    PACER_JITTER,
+    PACER_LATENCY_FACTOR,
+    PACER_LATENCY_MIN_SEC,
+    PACER_LATENCY_SAMPLES,
+    PACER_LATENCY_STEP,
+)
+from .metrics import phase
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 파싱
+
+    Args:
+        value: 헤더 값 (초 단위 숫자 또는 HTTP-date)
+
+    Returns:
+        대기할 시간 (초), 파싱 불가 시 None
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class AdaptivePacer:
+    """
+    AIMD 방식의 적응형 요청 간격 조절기
+
+    여러 수집 작업이 하나의 인스턴스를 공유하면 한 작업에서 감지한 스로틀링이
+    다른 작업의 간격에도 반영됩니다.
+
+    Args:
+        initial_delay: 시작 대기 시간 (초)
+        min_delay: 응답이 좋을 때 줄일 수 있는 최소 대기 시간 (초)
+        max_delay: 백오프 시 최대 대기 시간 (초)
+    """
+
+    # 지연 시간 급증 판단 전에 필요한 최소 표본 수
+    WARMUP_SAMPLES = 3
+    # 지연 시간 이동 평균 가중치
+    LATENCY_ALPHA = 0.2
+
+    def __init__(
+        self,
+        initial_delay: float,
+        min_delay: float = PACER_MIN_DELAY,
+        max_delay: float = MAX_SLEEP_SEC,
+    ):
+        # MIN_SLEEP_SEC / MAX_SLEEP_SEC 는 어떤 경우에도 넘지 않는 경계
+        self.max_delay = min(max(max_delay, MIN_SLEEP_SEC), MAX_SLEEP_SEC)
+        self.min_delay = min(max(min_delay, MIN_SLEEP_SEC), self.max_delay)
+        self.delay = self._clamp(initial_delay)
+        self.latency_avg: Optional[float] = None
+        self.successes = 0
+        self.throttles = 0
+        self.slowdowns = 0
+        self._samples = 0
+        self._slow_streak = 0  # 연속된 지연 시간 급증 표본 수
+        self._not_before = 0.0  # Retry-After로 지정된 다음 요청 가능 시각 (monotonic)
+
+    def _clamp(self, delay: float) -> float:
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    @property
+    def rate(self) -> Optional[float]:
+        """현재 허용 요청 속도 (초당 요청 수, 대기 없음이면 None)"""
+        return 1.0 / self.delay if self.delay > 0 else None
+
+    async def wait(self) -> None:
+        """다음 요청 전 대기 (현재 간격 및 Retry-After 반영)"""
+        delay = self.delay
+        remaining = self._not_before - time.monotonic()
+        if remaining > delay:
+            delay = remaining
+        if delay > 0:
+            with phase('sleep'):
+                await asyncio.sleep(delay)
+
+    def on_success(self, latency: float) -> None:
+        """
+        정상 응답 기록
+
+        Args:
+            latency: 요청 소요 시간 (초)
+        """
+        self.successes += 1
+        self._samples += 1
+
+        slow = (
+            self.latency_avg is not None
+            and self._samples > self.WARMUP_SAMPLES
+            and latency >= PACER_LATENCY_MIN_SEC
+            and latency > self.latency_avg * PACER_LATENCY_FACTOR
+        )
+        if not slow:
+            # 가산적 감소 (요청 속도를 조금씩 올림)
+            self._slow_streak = 0
+            self.delay = self._clamp(self.delay - PACER_DECREASE_STEP)
+        else:
+            self._slow_streak += 1
+            if self._slow_streak >= PACER_LATENCY_SAMPLES:
+                # 지연 시간 급증이 이어짐: 서버가 밀리고 있다는 신호로 보고 간격을 조금씩 늘림
+                self.slowdowns += 1
+                self.delay = self._clamp(self.delay + PACER_LATENCY_STEP)
+
+        if self.latency_avg is None:
+            self.latency_avg = latency
+        else:
+            self.latency_avg += self.LATENCY_ALPHA * (latency - self.latency_avg)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        스로틀링/오류 응답 기록 (429, 5xx, GraphQL errors)
+
+        Args:
+            retry_after: Retry-After 헤더로 받은 대기 시간 (초)
+        """
+        self.throttles += 1
+        self._back_off()
+        if retry_after is not None:
+            self._not_before = max(self._not_before, time.monotonic() + retry_after)
+
+    def _back_off(self) -> None:
+        # 승산적 증가 + jitter (동시에 백오프한 작업들이 한꺼번에 재시도하지 않도록)
+        base = max(self.delay, PACER_BACKOFF_BASE)
+        jitter = 1 + random.uniform(-PACER_JITTER, PACER_JITTER)
+        self.delay = self._clamp(base * PACER_BACKOFF_FACTOR * jitter)
+
+    def snapshot(self) -> Dict:
+        """현재 상태 (지표 노출용)"""
+        return {
+            'delaySec': round(self.delay, 3),
+            'ratePerSec': round(self.rate, 3) if self.rate is not None else None,
+            'minDelaySec': self.min_delay,
+            'maxDelaySec': self.max_delay,
+            'latencyAvgSec': round(self.latency_avg, 4) if self.latency_avg is not None else None,
+            'successes': self.successes,
+            'throttles': self.throttles,
+            'slowdowns': self.slowdowns,
+        }
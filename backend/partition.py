@@ -0,0 +1,203 @@
+"""
+분할 수집(partition) 모듈
+
+키워드가 많은 카테고리 하나는 커서를 하나씩 따라가야 하므로 아무리 빨라도
+"페이지 수 × (응답 시간 + 대기 시간)"보다 빨리 끝낼 수 없습니다.
+같은 getSearchCategoryKeywords 작업이 검색어(name)를 받는 점을 이용해,
+카테고리를 키워드명 첫 글자별 검색어로 나누고 각 커서 체인을 동시에 따라갑니다.
+
+- 전체 목록(name='') 체인도 함께 진행하며, 여기서 처음 보는 첫 글자가 나오면 새 검색어로 추가
+- 전체 목록 체인은 새 검색어가 한동안 나오지 않으면 검색어 체인이 모두 끝날 때까지 멈춤
+- 모든 체인은 하나의 토큰 버킷(전체 요청 속도 상한)과 백오프용 간격 조절기를 공유
+- 키워드 id 기준으로 중복 제거 (검색어가 부분 일치라면 여러 검색어에 같은 키워드가 나올 수 있음)
+- 모은 키워드 수가 전체 목록의 paging.total에 도달하면 나머지 체인은 모두 중단
+- 검색어들로 다 채우지 못하면 전체 목록 체인이 멈춘 곳부터 끝까지 진행 (직렬 수집으로 대체)
+
+검색어 체인의 응답 순서가 섞이므로 결과 순서는 직렬 수집(API 순서)과 다를 수 있습니다.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from .scraper import _iter_pages, _run_sync
+from .ratelimit import TokenBucket
+from .pacing import AdaptivePacer
+from .batch import KeywordBatch
+from .metrics import CRAWLS_IN_FLIGHT
+from .config import (
+    PARTITION_CONCURRENCY,
+    PARTITION_RATE_PER_SEC,
+    PARTITION_BURST,
+    PARTITION_MAX_TERMS,
+    PARTITION_DISCOVERY_PAGES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PartitionedCrawl:
+    """분할 수집 결과"""
+    category_id: str
+    keywords: KeywordBatch = field(default_factory=KeywordBatch)
+    total: Optional[int] = None  # 전체 목록의 paging.total
+    pages: int = 0  # 모든 체인에서 받은 페이지 수
+    serial_pages: int = 0  # 전체 목록 체인에서 받은 페이지 수
+    terms: Dict[str, int] = field(default_factory=dict)  # 검색어별 받은 페이지 수
+    failed_terms: Dict[str, str] = field(default_factory=dict)  # 실패한 검색어 -> 오류
+    covered_by_partitions: bool = False  # 전체 목록 체인이 끝나기 전에 total을 다 채웠는지
+    elapsed: float = 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            'categoryId': self.category_id,
+            'keywords': len(self.keywords),
+            'total': self.total,
+            'pages': self.pages,
+            'serialPages': self.serial_pages,
+            'partitions': len(self.terms),
+            'failedTerms': self.failed_terms,
+            'coveredByPartitions': self.covered_by_partitions,
+            'elapsedSec': round(self.elapsed, 3),
+        }
+
+
+def partition_term(name: str) -> Optional[str]:
+    """
+    키워드명의 분할 검색어 (공백을 제외한 첫 글자)
+
+    검색어가 접두어 검색이면 첫 글자별 분할은 서로 겹치지 않고,
+    부분 일치 검색이어도 모든 키워드는 자기 첫 글자 검색 결과에 포함됩니다.
+    """
+    stripped = name.lstrip()
+    return stripped[0] if stripped else None
+
+
+async def fetch_partitioned_keywords_async(
+    category_id: str,
+    concurrency: int = PARTITION_CONCURRENCY,
+    rate: float = PARTITION_RATE_PER_SEC,
+    burst: int = PARTITION_BURST,
+    max_terms: int = PARTITION_MAX_TERMS,
+    discovery_pages: int = PARTITION_DISCOVERY_PAGES,
+    limiter: Optional[TokenBucket] = None,
+    pacer: Optional[AdaptivePacer] = None,
+) -> PartitionedCrawl:
+    """
+    카테고리 키워드를 검색어별로 나눠 동시에 수집
+
+    Args:
+        category_id: 카테고리 ID
+        concurrency: 전체 목록 체인과 함께 동시에 진행할 검색어 체인 수
+        rate: 전체 요청 속도 상한 (초당 요청 수, limiter 미지정 시 사용)
+        burst: 토큰 버킷 최대 버스트 (limiter 미지정 시 사용)
+        max_terms: 최대 검색어 수
+        discovery_pages: 전체 목록 체인에서 새 검색어 없이 이 페이지 수가 지나면
+            검색어 체인이 모두 끝날 때까지 전체 목록 체인을 멈춤
+        limiter: 공유 속도 제한기 (None이면 rate/burst로 새로 생성)
+        pacer: 공유 간격 조절기 (None이면 스로틀링 백오프만 하는 조절기 생성)
+
+    Returns:
+        PartitionedCrawl (keywords는 id 기준 중복 제거된 KeywordBatch)
+
+    Raises:
+        httpx.HTTPError: 전체 목록 체인의 네트워크 오류 (검색어 체인 오류는 failed_terms에 기록)
+        ValueError: 전체 목록 체인의 GraphQL 응답 오류
+    """
+    if limiter is None:
+        limiter = TokenBucket(rate, burst)
+    if pacer is None:
+        # 속도 상한은 토큰 버킷이 담당하므로 스로틀링 시 백오프만 적용
+        pacer = AdaptivePacer(initial_delay=0, min_delay=0)
+
+    crawl = PartitionedCrawl(category_id)
+    rows: Dict[str, Tuple[str, Optional[int]]] = {}
+    pending: "asyncio.Queue[str]" = asyncio.Queue()
+    covered = asyncio.Event()
+    started = time.monotonic()
+
+    def merge(keywords) -> None:
+        for k in keywords:
+            rows.setdefault(k['id'] or k['name'], (k['name'], k['participantCount']))
+        if crawl.total is not None and len(rows) >= crawl.total:
+            covered.set()
+
+    async def serial() -> None:
+        pages = _iter_pages(category_id, pacer, limiter, None)
+        try:
+            quiet = 0
+            async for page in pages:
+                crawl.pages += 1
+                crawl.serial_pages += 1
+                crawl.total = page.total
+                quiet += 1
+                for k in page.keywords:
+                    term = partition_term(k['name'])
+                    if term is not None and term not in crawl.terms and len(crawl.terms) < max_terms:
+                        crawl.terms[term] = 0
+                        pending.put_nowait(term)
+                        quiet = 0
+                merge(page.keywords)
+                if quiet >= discovery_pages:
+                    # 검색어를 충분히 찾았으면 요청 예산을 검색어 체인에 양보하고,
+                    # 그것으로 다 채우지 못했을 때만 이어서 진행
+                    await pending.join()
+                    quiet = 0
+        finally:
+            await pages.aclose()
+        # 끝까지 받았으면 검색어 체인 결과와 관계없이 전부 모은 것
+        covered.set()
+
+    async def worker() -> None:
+        while True:
+            term = await pending.get()
+            pages = _iter_pages(category_id, pacer, limiter, None, name=term)
+            try:
+                async for page in pages:
+                    crawl.pages += 1
+                    crawl.terms[term] += 1
+                    merge(page.keywords)
+            except Exception as e:
+                # 검색어 하나가 실패해도 전체 목록 체인이 남은 키워드를 채움
+                logger.warning("분할 수집 실패 (%s, %r): %s", category_id, term, e)
+                crawl.failed_terms[term] = str(e)
+            finally:
+                await pages.aclose()
+                pending.task_done()
+
+    CRAWLS_IN_FLIGHT.inc()
+    serial_task = asyncio.ensure_future(serial())
+    workers = [asyncio.ensure_future(worker()) for _ in range(max(1, concurrency))]
+    covered_task = asyncio.ensure_future(covered.wait())
+    try:
+        await asyncio.wait([serial_task, covered_task], return_when=asyncio.FIRST_COMPLETED)
+        if not covered.is_set():
+            serial_task.result()  # 전체 목록 체인 오류
+        crawl.covered_by_partitions = not serial_task.done()
+    finally:
+        CRAWLS_IN_FLIGHT.dec()
+        tasks = [serial_task, covered_task, *workers]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    crawl.keywords = KeywordBatch.from_rows(rows.values())
+    crawl.elapsed = time.monotonic() - started
+    return crawl
+
+
+def fetch_partitioned_keywords(category_id: str, **kwargs) -> PartitionedCrawl:
+    """
+    카테고리 키워드 분할 수집 (CLI용 동기 래퍼)
+
+    Args:
+        category_id: 카테고리 ID
+        **kwargs: fetch_partitioned_keywords_async에 전달할 옵션
+
+    Returns:
+        PartitionedCrawl
+    """
+    return _run_sync(fetch_partitioned_keywords_async(category_id, **kwargs))
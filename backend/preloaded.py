@@ -0,0 +1,283 @@
+"""
+__PRELOADED_STATE__ 추출 모듈
+
+키워드 페이지 HTML에 포함된 `window.__PRELOADED_STATE__ = {...};` 에서 필요한 부분만 꺼냅니다.
+
+정규식 `(.*?);` 는 JSON 문자열 안에 `;` 가 있으면 중간에서 잘리고, 전체 상태를 json.loads 하면
+필요 없는 부분까지 모두 파싱합니다. 이 모듈은 응답 본문을 조각 단위로 받아
+
+- 할당문을 찾은 뒤 JSON 문자열/괄호 구조를 따라가며
+- 경로(기본값: keyword.categoryGroups)에 없는 값은 파싱하지 않고 건너뛰고
+- 목표 값 하나만 json.loads 한 뒤 바로 멈춥니다 (나머지 본문은 읽지 않음)
+"""
+
+import json
+import re
+from typing import Any, Generator, Optional, Pattern, Sequence
+
+MARKER = "__PRELOADED_STATE__"
+CATEGORY_GROUPS_PATH = ("keyword", "categoryGroups")
+
+_ASSIGN = re.compile(r'\s*=(?!=)')  # 비교문(==, ===)은 할당문이 아님
+_WHITESPACE = re.compile(r'\s*')
+_STRING_PATTERN = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_STRING = re.compile(_STRING_PATTERN)
+_SCALAR = re.compile(r'[^\s,:{}\[\]"]+')
+# 건너뛸 때 정규식 한 번으로 통째로 넘길 수 있는 중첩 깊이
+_SKIP_DEPTH = 8
+
+
+def _balanced_pattern(depth: int) -> str:
+    """
+    괄호가 아닌 문자, 완결된 문자열, depth 단계까지 짝이 맞는 객체/배열로 이루어진 구간
+
+    "normal* (special normal*)*" 형태라 한 위치를 해석하는 방법이 하나뿐이므로
+    일치하지 않는 경우에도 백트래킹이 폭증하지 않습니다.
+    """
+    normal = r'[^"{}\[\]]*'
+    special = _STRING_PATTERN
+    for _ in range(depth):
+        inner = normal + '(?:(?:' + special + ')' + normal + ')*'
+        special = _STRING_PATTERN + r'|[{\[]' + inner + r'[}\]]'
+    return normal + '(?:(?:' + special + ')' + normal + ')*'
+
+
+_BALANCED = re.compile(_balanced_pattern(_SKIP_DEPTH))
+
+
+class _NotFound(Exception):
+    """경로의 키가 객체에 없음"""
+
+
+class PreloadedStateExtractor:
+    """
+    __PRELOADED_STATE__ 증분 추출기
+
+    feed()로 HTML 조각을 넣다가 True가 반환되면 value에 목표 값이 들어 있습니다.
+    본문을 끝까지 넣었는데도 찾지 못했으면 close()가 ValueError를 발생시킵니다.
+
+    Args:
+        path: 상태 객체 안에서 꺼낼 값의 키 경로
+        marker: 할당문 변수명
+    """
+
+    def __init__(self, path: Sequence[str] = CATEGORY_GROUPS_PATH, marker: str = MARKER):
+        self.path = tuple(path)
+        self.marker = marker
+        self.value: Any = None
+        self.done = False
+        self.bytes_scanned = 0  # 지금까지 받은 문자 수 (지표용)
+        self._buf = ""
+        self._pos = 0
+        self._start: Optional[int] = None  # 목표 값 시작 위치 (읽는 중에만 설정)
+        self._eof = False
+        self._parser = self._parse()
+        next(self._parser)
+
+    def feed(self, chunk: str) -> bool:
+        """
+        본문 조각 추가
+
+        Args:
+            chunk: HTML 텍스트 조각
+
+        Returns:
+            목표 값을 모두 읽었으면 True (이후 본문은 읽을 필요 없음)
+
+        Raises:
+            ValueError: 상태 JSON 구조가 잘못됨
+        """
+        if self.done:
+            return True
+        self.bytes_scanned += len(chunk)
+        self._compact()
+        self._buf += chunk
+        self._resume()
+        return self.done
+
+    def close(self) -> Any:
+        """
+        본문 끝 알림
+
+        Returns:
+            목표 값
+
+        Raises:
+            ValueError: 할당문이나 목표 값을 찾지 못함
+        """
+        if not self.done:
+            self._eof = True
+            self._resume()
+        if not self.done:
+            raise ValueError("카테고리 정보를 찾을 수 없습니다. 페이지 구조가 변경되었을 수 있습니다.")
+        return self.value
+
+    def _resume(self) -> None:
+        try:
+            next(self._parser)
+        except StopIteration:
+            pass
+        except _NotFound:
+            raise ValueError("예상하지 못한 데이터 구조입니다.")
+
+    def _compact(self) -> None:
+        # 이미 지나간 부분은 버려 버퍼가 본문 전체 크기로 커지지 않게 함
+        # (목표 값을 읽는 중이면 그 시작 위치부터는 보존)
+        keep = self._pos if self._start is None else self._start
+        if keep > 0:
+            self._buf = self._buf[keep:]
+            self._pos -= keep
+            if self._start is not None:
+                self._start -= keep
+
+    # --- 파서 (데이터가 더 필요하면 yield) ---
+
+    def _parse(self) -> Generator[None, None, None]:
+        yield
+        # 1. 할당문 찾기
+        while True:
+            index = self._buf.find(self.marker, self._pos)
+            if index < 0:
+                self._pos = max(self._pos, len(self._buf) - len(self.marker) + 1)
+                if self._eof:
+                    return
+                yield
+                continue
+            self._pos = index + len(self.marker)
+            match = yield from self._match(_ASSIGN)
+            if match is not None:
+                self._pos = match.end()
+                break
+
+        # 2. 경로를 따라 내려가며 목표 값 읽기
+        yield from self._skip_whitespace()
+        yield from self._find(0)
+        self.done = True
+
+    def _find(self, depth: int) -> Generator[None, None, None]:
+        """현재 위치의 객체에서 path[depth] 키를 찾아 내려감"""
+        if (yield from self._peek()) != '{':
+            raise _NotFound()
+        self._pos += 1
+
+        while True:
+            yield from self._skip_whitespace()
+            char = yield from self._peek()
+            if char == '}':
+                raise _NotFound()
+            if char == ',':
+                self._pos += 1
+                continue
+
+            if char != '"':
+                raise ValueError(f"상태 JSON 파싱 실패 (위치 {self._pos})")
+            key_match = yield from self._match(_STRING)
+            if key_match is None:
+                raise ValueError(f"상태 JSON 파싱 실패 (위치 {self._pos})")
+            key = json.loads(key_match.group())
+            self._pos = key_match.end()
+
+            yield from self._skip_whitespace()
+            if (yield from self._peek()) != ':':
+                raise ValueError(f"상태 JSON 파싱 실패 (위치 {self._pos})")
+            self._pos += 1
+            yield from self._skip_whitespace()
+
+            if key != self.path[depth]:
+                yield from self._skip_value()
+                continue
+
+            if depth + 1 < len(self.path):
+                yield from self._find(depth + 1)
+                return
+
+            # 목표 값만 파싱
+            self._start = self._pos
+            yield from self._skip_value()
+            self.value = json.loads(self._buf[self._start:self._pos])
+            self._start = None
+            return
+
+    def _skip_value(self) -> Generator[None, None, None]:
+        """현재 위치의 JSON 값 하나를 파싱하지 않고 건너뜀"""
+        char = yield from self._peek()
+        if char == '"':
+            match = yield from self._match(_STRING)
+        elif char not in '{[':
+            match = yield from self._match(_SCALAR)
+        else:
+            yield from self._skip_container()
+            return
+        if match is None:
+            raise ValueError(f"상태 JSON 파싱 실패 (위치 {self._pos})")
+        self._pos = match.end()
+
+    def _skip_container(self) -> Generator[None, None, None]:
+        """괄호 짝을 맞춰 객체/배열 하나를 건너뜀 (문자열 안의 괄호는 무시)"""
+        depth = 0
+        while True:
+            buf = self._buf
+            pos = self._pos
+            if depth > 0:
+                # 완결된 하위 값들은 정규식 한 번으로 건너뛰고 현재 단계의 괄호에서 멈춤
+                pos = _BALANCED.match(buf, pos).end()
+            if pos >= len(buf) or buf[pos] == '"':
+                # 본문 끝이거나 문자열이 아직 닫히지 않음
+                self._pos = pos
+                if self._eof:
+                    raise ValueError("상태 JSON이 중간에 끝났습니다.")
+                yield
+                continue
+            depth += 1 if buf[pos] in '{[' else -1
+            self._pos = pos + 1
+            if depth == 0:
+                return
+
+    def _skip_whitespace(self) -> Generator[None, None, None]:
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or self._eof:
+                return
+            yield
+
+    def _peek(self) -> Generator[None, None, str]:
+        while self._pos >= len(self._buf):
+            if self._eof:
+                raise ValueError("상태 JSON이 중간에 끝났습니다.")
+            yield
+        return self._buf[self._pos]
+
+    def _match(self, pattern: Pattern) -> Generator[None, None, Optional["re.Match"]]:
+        # 일치 구간이 버퍼 끝에 닿으면 다음 조각에서 더 길어질 수 있으므로 기다림
+        # (문자열은 호출 전에 여는 따옴표를 확인하므로, 일치하지 않으면 아직 닫히지 않은 것)
+        while True:
+            match = pattern.match(self._buf, self._pos)
+            if self._eof or (match is not None and match.end() < len(self._buf)):
+                return match
+            if (
+                match is None
+                and pattern is not _STRING
+                and _WHITESPACE.match(self._buf, self._pos).end() < len(self._buf)
+            ):
+                return None
+            yield
+
+
+def extract_preloaded_state(html: str, path: Sequence[str] = CATEGORY_GROUPS_PATH) -> Any:
+    """
+    HTML 전체 문자열에서 목표 값 추출 (동기, 한 번에)
+
+    Args:
+        html: 키워드 페이지 HTML
+        path: 상태 객체 안의 키 경로
+
+    Returns:
+        목표 값
+
+    Raises:
+        ValueError: 할당문/목표 값을 찾지 못하거나 JSON 구조가 잘못됨
+    """
+    extractor = PreloadedStateExtractor(path)
+    if extractor.feed(html):
+        return extractor.value
+    return extractor.close()
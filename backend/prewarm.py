@@ -0,0 +1,648 @@
+"""
+인기 카테고리 미리 갱신(prewarm) 모듈
+
+하루의 첫 사용자가 전체 페이지 수집을 기다리지 않도록, 자주 요청되는 카테고리를
+결과가 만료되기 전에 백그라운드에서 다시 수집해 둡니다.
+
+- 요청 빈도: 워커마다 메모리에 모았다가 확인할 때마다 SQLite(prewarm.sqlite3)에 합산
+  (반감기 PREWARM_HALF_LIFE 로 줄어드는 인기 점수, 모든 워커/프로세스 공통)
+- 일정: 인기 점수 상위 PREWARM_TOP_K 카테고리 중 공유 저장소의 결과가 PREWARM_LEAD 안에 만료되거나
+  없는 카테고리, 카테고리 목록의 keywordCount가 바뀐 카테고리를 인기 순으로 다시 수집
+  (같은 카테고리는 PREWARM_LEAD 보다 자주 수집하지 않음 - 실패나 짧은 TTL 결과의 반복 수집 방지)
+- 예산: PREWARM_BUDGET_WINDOW 동안 미리 갱신에 쓴 upstream 요청 수(모든 프로세스 합산)가
+  PREWARM_BUDGET을 넘지 않도록, 예상 요청 수가 남은 예산보다 큰 카테고리는 건너뜀
+- 쉬는 시간대(PREWARM_QUIET_HOURS)와 회로 차단 중에는 수집하지 않으며, 인기 카테고리가 없으면 아무 요청도 보내지 않음
+- 카테고리 목록은 PREWARM_CATEGORIES_INTERVAL 마다 따로 다시 받아 새 카테고리와 keywordCount 변화를 반영
+- 여러 워커/프로세스 중 임대(공유 저장소 lease)를 가진 하나만 수집
+  (API 서버 안에서 실행하거나 python main.py prewarm 으로 별도 프로세스로 실행)
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .config import (
+    DEFAULT_LIMIT,
+    DEFAULT_SLEEP_SEC_API,
+    CATEGORY_CACHE_TTL,
+    PREWARM_DB_PATH,
+    PREWARM_INTERVAL,
+    PREWARM_LEAD,
+    PREWARM_TOP_K,
+    PREWARM_MIN_SCORE,
+    PREWARM_HALF_LIFE,
+    PREWARM_BUDGET,
+    PREWARM_BUDGET_WINDOW,
+    PREWARM_QUIET_HOURS,
+    PREWARM_CATEGORIES_INTERVAL,
+)
+from .metrics import PREWARM_REFRESHES
+from .scraper import fetch_categories_async, get_all_keywords_async, keywords_ttl, _run_sync
+from .pacing import AdaptivePacer
+from .checkpoint import get_default_journal
+from .search_index import get_default_search_index
+from .trends import record_snapshot
+from .resilience import CircuitBreaker, get_default_breaker
+from .shared_store import (
+    SharedResultStore,
+    get_default_shared_store,
+    keywords_key,
+    CATEGORIES_KEY,
+    KEYWORDS_CODEC,
+)
+
+logger = logging.getLogger(__name__)
+
+# 여러 프로세스 중 미리 갱신을 맡을 하나를 정하는 임대 키
+LEADER_KEY = "prewarm:leader"
+# 갱신 기록에서 카테고리 목록 요청을 나타내는 ID
+CATEGORIES_ID = "*"
+# 이보다 오래된 갱신 기록은 삭제 (초)
+RUN_RETENTION = 7 * 24 * 3600
+
+
+def parse_quiet_hours(value: str) -> Optional[Tuple[int, int]]:
+    """
+    쉬는 시간대 문자열 파싱
+
+    Args:
+        value: 'HH-HH' (로컬 시각, 시작 포함 / 끝 제외, '23-06'처럼 자정을 넘을 수 있음), 빈 값이면 없음
+
+    Returns:
+        (시작 시, 끝 시) 또는 None
+
+    Raises:
+        ValueError: 형식 오류
+    """
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        start, end = (int(part) for part in value.split("-"))
+    except ValueError:
+        raise ValueError(f"쉬는 시간대 형식 오류 (HH-HH): {value}")
+    if not (0 <= start < 24 and 0 <= end <= 24):
+        raise ValueError(f"쉬는 시간대는 0~24시 사이여야 합니다: {value}")
+    return start, end
+
+
+def in_quiet_hours(quiet: Optional[Tuple[int, int]], now: float) -> bool:
+    """now(epoch 초)의 로컬 시각이 쉬는 시간대인지 확인"""
+    if quiet is None:
+        return False
+    start, end = quiet
+    hour = datetime.fromtimestamp(now).hour
+    if start <= end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+def estimate_requests(keyword_count: Optional[int]) -> int:
+    """카테고리 하나를 끝까지 수집하는 upstream 요청 수 추정 (페이지 수 + 추천 키워드 1)"""
+    return max(1, math.ceil((keyword_count or 0) / DEFAULT_LIMIT)) + 1
+
+
+@dataclass
+class PrewarmRun:
+    """미리 갱신 1회 기록"""
+    category_id: str
+    started_at: float
+    elapsed: float
+    requests: int
+    keywords: int
+    error: Optional[str] = None
+
+    def as_dict(self) -> Dict:
+        return {
+            'startedAt': self.started_at,
+            'elapsedSec': round(self.elapsed, 3),
+            'requests': self.requests,
+            'keywords': self.keywords,
+            'error': self.error,
+        }
+
+
+@dataclass
+class ScheduleItem:
+    """인기 카테고리 하나의 갱신 일정"""
+    category_id: str
+    name: Optional[str]
+    score: float
+    keyword_count: Optional[int]
+    expires_at: Optional[float]  # 공유 저장소 결과 만료 시각 (결과가 없으면 None)
+    refresh_at: float  # 다시 수집할 시각
+    last_run: Optional[PrewarmRun] = None
+
+    @property
+    def estimated_requests(self) -> int:
+        if self.keyword_count is None and self.last_run is not None and not self.last_run.error:
+            return self.last_run.requests
+        return estimate_requests(self.keyword_count)
+
+    def is_due(self, now: float) -> bool:
+        return self.refresh_at <= now
+
+    def as_dict(self, now: float) -> Dict:
+        return {
+            'categoryId': self.category_id,
+            'name': self.name,
+            'score': round(self.score, 2),
+            'keywordCount': self.keyword_count,
+            'estimatedRequests': self.estimated_requests,
+            'expiresAt': self.expires_at,
+            'refreshAt': self.refresh_at,
+            'due': self.is_due(now),
+            'lastRefresh': self.last_run.as_dict() if self.last_run else None,
+        }
+
+
+class PrewarmStore:
+    """
+    요청 빈도(인기 점수)와 미리 갱신 기록 저장소 (SQLite, 여러 프로세스 공용)
+
+    Args:
+        path: SQLite 파일 경로
+        half_life: 인기 점수 반감기 (초)
+    """
+
+    def __init__(self, path: str = PREWARM_DB_PATH, half_life: float = PREWARM_HALF_LIFE):
+        self.path = path
+        self.half_life = half_life
+        self._pending: Counter = Counter()
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS prewarm_popularity (
+                    category_id TEXT PRIMARY KEY,
+                    score REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS prewarm_runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    category_id TEXT NOT NULL,
+                    started_at REAL NOT NULL,
+                    elapsed REAL NOT NULL,
+                    requests INTEGER NOT NULL,
+                    keywords INTEGER NOT NULL,
+                    error TEXT
+                );
+                CREATE INDEX IF NOT EXISTS prewarm_runs_started ON prewarm_runs (started_at);
+                CREATE TABLE IF NOT EXISTS prewarm_state (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+            """)
+            self._initialized = True
+        return conn
+
+    def _decay(self, score: float, updated_at: float, now: float) -> float:
+        return score * 0.5 ** (max(0.0, now - updated_at) / self.half_life)
+
+    def record(self, category_id: str) -> None:
+        """카테고리 요청 1회 기록 (메모리에만 모아 두고 flush 때 저장)"""
+        with self._lock:
+            self._pending[category_id] += 1
+
+    def flush(self, now: Optional[float] = None) -> int:
+        """
+        모아 둔 요청 수를 인기 점수에 합산
+
+        Returns:
+            저장한 요청 수
+        """
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        if not pending:
+            return 0
+
+        now = time.time() if now is None else now
+        conn = self._connect()
+        try:
+            with conn:
+                # 읽고 쓰는 사이에 다른 프로세스가 끼어들지 않도록 처음부터 쓰기 잠금
+                conn.execute("BEGIN IMMEDIATE")
+                for category_id, count in pending.items():
+                    row = conn.execute(
+                        "SELECT score, updated_at FROM prewarm_popularity WHERE category_id = ?", (category_id,),
+                    ).fetchone()
+                    score = count + (self._decay(row[0], row[1], now) if row else 0.0)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO prewarm_popularity (category_id, score, updated_at) VALUES (?, ?, ?)",
+                        (category_id, score, now),
+                    )
+        finally:
+            conn.close()
+        return sum(pending.values())
+
+    def scores(self, now: Optional[float] = None) -> Dict[str, float]:
+        """카테고리별 인기 점수 (now 기준 반감기 적용)"""
+        now = time.time() if now is None else now
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT category_id, score, updated_at FROM prewarm_popularity").fetchall()
+        finally:
+            conn.close()
+        return {category_id: self._decay(score, updated_at, now) for category_id, score, updated_at in rows}
+
+    def add_run(self, run: PrewarmRun) -> int:
+        """
+        갱신 기록 추가 (보관 기간이 지난 기록은 삭제)
+
+        Returns:
+            기록 ID (update_run 용)
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "INSERT INTO prewarm_runs (category_id, started_at, elapsed, requests, keywords, error) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (run.category_id, run.started_at, run.elapsed, run.requests, run.keywords, run.error),
+                )
+                conn.execute("DELETE FROM prewarm_runs WHERE started_at < ?", (run.started_at - RUN_RETENTION,))
+        finally:
+            conn.close()
+        return cursor.lastrowid
+
+    def update_run(self, run_id: int, run: PrewarmRun) -> None:
+        """수집을 시작할 때 추가한 기록을 결과로 갱신"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE prewarm_runs SET elapsed = ?, requests = ?, keywords = ?, error = ? WHERE id = ?",
+                    (run.elapsed, run.requests, run.keywords, run.error, run_id),
+                )
+        finally:
+            conn.close()
+
+    def spent(self, since: float) -> int:
+        """since 이후 미리 갱신에 쓴 upstream 요청 수"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(requests), 0) FROM prewarm_runs WHERE started_at >= ?", (since,),
+            ).fetchone()
+        finally:
+            conn.close()
+        return row[0]
+
+    def last_runs(self) -> Dict[str, PrewarmRun]:
+        """카테고리별 마지막 갱신 기록"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT category_id, started_at, elapsed, requests, keywords, error FROM prewarm_runs "
+                "WHERE id IN (SELECT MAX(id) FROM prewarm_runs GROUP BY category_id)"
+            ).fetchall()
+        finally:
+            conn.close()
+        return {row[0]: PrewarmRun(*row) for row in rows}
+
+    def save_categories(self, categories: List[Dict], now: float) -> None:
+        """마지막으로 받은 카테고리 목록 저장 (keywordCount 변화 비교용)"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO prewarm_state (key, value, updated_at) VALUES ('categories', ?, ?)",
+                    (json.dumps(categories, ensure_ascii=False), now),
+                )
+        finally:
+            conn.close()
+
+    def load_categories(self) -> Tuple[Optional[List[Dict]], Optional[float]]:
+        """마지막으로 받은 카테고리 목록과 받은 시각 (없으면 (None, None))"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value, updated_at FROM prewarm_state WHERE key = 'categories'").fetchone()
+        finally:
+            conn.close()
+        return (json.loads(row[0]), row[1]) if row else (None, None)
+
+
+class PrewarmScheduler:
+    """
+    인기 카테고리 미리 갱신 스케줄러
+
+    Args:
+        refresh: 카테고리 ID -> 다시 수집한 키워드 결과 ({'recomm': ..., 'normal': ...})를 돌려주는 코루틴 함수
+            (공유 저장소 결과를 쓰지 않고 새로 수집해 저장까지 해야 함)
+        load_categories: 카테고리 목록을 캐시 없이 다시 받아 저장하는 코루틴 함수
+        store: 요청 빈도 / 갱신 기록 저장소
+        shared: 공유 결과 저장소 (결과 만료 시각 확인, 수집 임대)
+        enabled: False면 요청 빈도만 저장 (수집은 다른 프로세스가 담당)
+        interval: 확인 간격 (초)
+        lead: 만료 이 시간 전부터 다시 수집 (초)
+        top_k: 미리 갱신할 최대 카테고리 수
+        min_score: 미리 갱신할 최소 인기 점수
+        budget: budget_window 동안 쓸 수 있는 최대 upstream 요청 수
+        budget_window: 요청 예산 기간 (초)
+        quiet_hours: 쉬는 시간대 ('HH-HH', 빈 값이면 없음)
+        categories_interval: 카테고리 목록을 다시 받는 간격 (초)
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[str], Awaitable[Dict]],
+        load_categories: Callable[[], Awaitable[List[Dict]]],
+        store: PrewarmStore,
+        shared: SharedResultStore,
+        enabled: bool = True,
+        interval: float = PREWARM_INTERVAL,
+        lead: float = PREWARM_LEAD,
+        top_k: int = PREWARM_TOP_K,
+        min_score: float = PREWARM_MIN_SCORE,
+        budget: int = PREWARM_BUDGET,
+        budget_window: float = PREWARM_BUDGET_WINDOW,
+        quiet_hours: str = PREWARM_QUIET_HOURS,
+        categories_interval: float = PREWARM_CATEGORIES_INTERVAL,
+    ):
+        self.refresh = refresh
+        self.load_categories = load_categories
+        self.store = store
+        self.shared = shared
+        self.enabled = enabled
+        self.interval = interval
+        self.lead = lead
+        self.top_k = top_k
+        self.min_score = min_score
+        self.budget = budget
+        self.budget_window = budget_window
+        self.quiet_hours = quiet_hours
+        self.categories_interval = categories_interval
+        self.leader = False  # 이 프로세스가 수집을 맡고 있는지 (마지막 확인 기준)
+        self.running: Optional[str] = None  # 지금 다시 수집 중인 카테고리
+        self.last_tick_at: Optional[float] = None
+        self._quiet = parse_quiet_hours(quiet_hours)
+        self._counts_changed: Dict[str, float] = {}  # keywordCount가 바뀐 것을 확인한 시각
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, category_id: str) -> None:
+        """카테고리 요청 1회 기록"""
+        self.store.record(category_id)
+
+    def start(self) -> None:
+        """백그라운드 실행 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """백그라운드 실행 종료 (진행 중인 수집은 중단, 수집 임대 반납)"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await asyncio.to_thread(self.store.flush)
+        if self.leader:
+            await asyncio.to_thread(self.shared.release, LEADER_KEY)
+            self.leader = False
+
+    async def run(self) -> None:
+        """interval 마다 tick 실행 (오류가 나도 계속)"""
+        while True:
+            try:
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("미리 갱신 확인 실패")
+            await asyncio.sleep(self.interval)
+
+    def budget_remaining(self, now: float) -> int:
+        """남은 요청 예산"""
+        return max(0, self.budget - self.store.spent(now - self.budget_window))
+
+    def plan(self, now: Optional[float] = None) -> List[ScheduleItem]:
+        """
+        인기 카테고리 갱신 일정 (인기 순)
+
+        카테고리 목록을 받은 적이 있으면 목록에 없는 카테고리 ID는 제외합니다.
+        """
+        now = time.time() if now is None else now
+        scores = self.store.scores(now)
+        categories, _ = self.store.load_categories()
+        by_id = {str(c['id']): c for c in categories or []}
+        runs = self.store.last_runs()
+
+        hot = sorted(
+            ((category_id, score) for category_id, score in scores.items()
+             if score >= self.min_score and (not by_id or category_id in by_id)),
+            key=lambda item: -item[1],
+        )[:self.top_k]
+
+        items = []
+        for category_id, score in hot:
+            result = self.shared.get(keywords_key(category_id))
+            expires_at = result.expires_at if result is not None else None
+            last_run = runs.get(category_id)
+            refresh_at = now if expires_at is None else expires_at - self.lead
+            changed_at = self._counts_changed.get(category_id)
+            if changed_at is not None and (last_run is None or changed_at > last_run.started_at):
+                refresh_at = min(refresh_at, changed_at)
+            if last_run is not None:
+                refresh_at = max(refresh_at, last_run.started_at + self.lead)
+            category = by_id.get(category_id, {})
+            items.append(ScheduleItem(
+                category_id=category_id,
+                name=category.get('name'),
+                score=score,
+                keyword_count=category.get('keywordCount'),
+                expires_at=expires_at,
+                refresh_at=refresh_at,
+                last_run=last_run,
+            ))
+        return items
+
+    async def tick(self) -> List[str]:
+        """
+        한 번 확인 - 요청 빈도를 저장하고, 수집을 맡은 프로세스면 만료가 가까운 인기 카테고리를 다시 수집
+
+        Returns:
+            다시 수집한 카테고리 ID 목록
+        """
+        await asyncio.to_thread(self.store.flush)
+        self.last_tick_at = now = time.time()
+        if not self.enabled or in_quiet_hours(self._quiet, now) or self._circuit_open():
+            return []
+        self.leader = await asyncio.to_thread(self.shared.try_acquire, LEADER_KEY)
+        if not self.leader:
+            return []
+
+        plan = await asyncio.to_thread(self.plan, now)
+        if not plan:
+            # 인기 카테고리가 없으면 카테고리 목록도 받지 않음
+            return []
+
+        _, fetched_at = await asyncio.to_thread(self.store.load_categories)
+        if fetched_at is None or now - fetched_at >= self.categories_interval:
+            if await asyncio.to_thread(self.budget_remaining, now) >= 1:
+                await self._refresh_categories()
+                plan = await asyncio.to_thread(self.plan, time.time())
+
+        refreshed = []
+        for item in plan:
+            now = time.time()
+            if self._circuit_open():
+                break
+            if not item.is_due(now):
+                continue
+            if item.estimated_requests > await asyncio.to_thread(self.budget_remaining, now):
+                PREWARM_REFRESHES.labels('budget').inc()
+                continue
+            # 오래 걸리는 수집 중에도 다른 프로세스가 수집을 넘겨받지 않도록 임대 연장
+            if not await asyncio.to_thread(self.shared.try_acquire, LEADER_KEY):
+                self.leader = False
+                break
+            if await self._refresh_category(item):
+                refreshed.append(item.category_id)
+        return refreshed
+
+    def _circuit_open(self) -> bool:
+        # 네이버 요청이 차단된 동안에는 실패할 수집으로 예산을 쓰지 않음
+        return get_default_breaker().state == CircuitBreaker.OPEN
+
+    async def _refresh_categories(self) -> None:
+        started = time.time()
+        error = None
+        categories: List[Dict] = []
+        keeper = asyncio.ensure_future(self.shared._keep_lease(LEADER_KEY))
+        try:
+            categories = await self.load_categories()
+        except Exception as e:
+            error = str(e)
+            logger.warning("미리 갱신 - 카테고리 목록 조회 실패: %s", e)
+        else:
+            previous, _ = await asyncio.to_thread(self.store.load_categories)
+            counts = {str(c['id']): c.get('keywordCount') for c in previous or []}
+            for category in categories:
+                category_id = str(category['id'])
+                if category_id in counts and counts[category_id] != category.get('keywordCount'):
+                    self._counts_changed[category_id] = started
+            await asyncio.to_thread(self.store.save_categories, categories, started)
+        finally:
+            keeper.cancel()
+        run = PrewarmRun(CATEGORIES_ID, started, time.time() - started, 1, len(categories), error)
+        await asyncio.to_thread(self.store.add_run, run)
+
+    async def _refresh_category(self, item: ScheduleItem) -> bool:
+        started = time.time()
+        # 수집 전에 진행 중 기록을 남겨, 수집 도중 수집을 넘겨받은 프로세스도 같은 카테고리를
+        # 다시 수집하지 않고(PREWARM_LEAD 간격) 예상 요청 수를 예산에 포함하게 함
+        run_id = await asyncio.to_thread(
+            self.store.add_run, PrewarmRun(item.category_id, started, 0.0, item.estimated_requests, 0),
+        )
+        self.running = item.category_id
+        # 수집이 임대 TTL 보다 오래 걸려도 다른 프로세스가 수집을 넘겨받지 않도록 수집하는 동안 계속 연장
+        keeper = asyncio.ensure_future(self.shared._keep_lease(LEADER_KEY))
+        try:
+            keywords = await self.refresh(item.category_id)
+        except Exception as e:
+            PREWARM_REFRESHES.labels('error').inc()
+            logger.warning("미리 갱신 실패 (%s): %s", item.category_id, e)
+            run = PrewarmRun(item.category_id, started, time.time() - started, item.estimated_requests, 0, str(e))
+        else:
+            PREWARM_REFRESHES.labels('ok').inc()
+            count = len(keywords['normal'])
+            run = PrewarmRun(item.category_id, started, time.time() - started, estimate_requests(count), count)
+        finally:
+            keeper.cancel()
+            self.running = None
+        await asyncio.to_thread(self.store.update_run, run_id, run)
+        return run.error is None
+
+    def schedule(self) -> Dict[str, Any]:
+        """
+        현재 일정과 마지막 갱신 시각 (/api/prewarm 응답)
+
+        Returns:
+            {'enabled': ..., 'leader': ..., 'quiet': ..., 'budget': {...}, 'items': [...], ...}
+        """
+        now = time.time()
+        plan = self.plan(now)
+        _, categories_at = self.store.load_categories()
+        used = self.store.spent(now - self.budget_window)
+        return {
+            'enabled': self.enabled,
+            'leader': self.leader,
+            'quiet': in_quiet_hours(self._quiet, now),
+            'quietHours': self.quiet_hours or None,
+            'intervalSec': self.interval,
+            'leadSec': self.lead,
+            'lastTickAt': self.last_tick_at,
+            'running': self.running,
+            'budget': {
+                'limit': self.budget,
+                'windowSec': self.budget_window,
+                'used': used,
+                'remaining': max(0, self.budget - used),
+            },
+            'categoriesRefreshedAt': categories_at,
+            'items': [item.as_dict(now) for item in plan],
+        }
+
+
+async def run_worker_async(once: bool = False, **options) -> List[str]:
+    """
+    API 서버 밖에서 미리 갱신 실행 (python main.py prewarm)
+
+    수집한 결과는 공유 저장소와 검색 색인에 저장하므로 API 워커들이 그대로 사용합니다.
+    API 서버와 함께 실행하면 임대를 가진 쪽 하나만 수집합니다.
+
+    Args:
+        once: True면 한 번만 확인하고 종료
+        **options: PrewarmScheduler 옵션 (interval, budget, quiet_hours 등)
+
+    Returns:
+        once=True일 때 다시 수집한 카테고리 ID 목록
+    """
+    shared = get_default_shared_store()
+    pacer = AdaptivePacer(initial_delay=DEFAULT_SLEEP_SEC_API)
+
+    async def refresh(category_id: str) -> Dict:
+        keywords = await get_all_keywords_async(
+            category_id, DEFAULT_SLEEP_SEC_API, pacer=pacer, journal=get_default_journal(),
+        )
+        await asyncio.to_thread(shared.put_value, keywords_key(category_id), keywords, keywords_ttl, KEYWORDS_CODEC)
+        await asyncio.to_thread(get_default_search_index().update, category_id, keywords['normal'])
+        await asyncio.to_thread(record_snapshot, category_id, keywords['normal'])
+        return keywords
+
+    async def load_categories() -> List[Dict]:
+        categories = await fetch_categories_async()
+        await asyncio.to_thread(shared.put_value, CATEGORIES_KEY, categories, CATEGORY_CACHE_TTL)
+        return categories
+
+    scheduler = PrewarmScheduler(refresh, load_categories, PrewarmStore(), shared, **options)
+    try:
+        if once:
+            return await scheduler.tick()
+        await scheduler.run()
+        return []
+    finally:
+        await scheduler.stop()
+
+
+def run_worker(once: bool = False, **options) -> List[str]:
+    """미리 갱신 실행 (동기 래퍼)"""
+    return _run_sync(run_worker_async(once, **options))
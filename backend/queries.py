@@ -0,0 +1,110 @@
+"""
+GraphQL 쿼리 생성 모듈
+
+웹 클라이언트가 보내는 쿼리(config.QUERY_*)는 썸네일, 챌린지 여부 등 수집에 쓰지 않는
+필드까지 요청하고(issueKeyword는 두 번), 들여쓰기가 포함된 쿼리 본문을 페이지마다 보냅니다.
+여기서는 호출하는 쪽이 실제로 쓰는 필드만 담은 최소 쿼리를 만듭니다.
+
+- 키워드 필드는 name, participantCount가 기본이며, 중복 제거/체크포인트가 필요하면 id 추가
+- 공백을 줄인 한 줄 쿼리 (요청 본문 크기 최소화)
+- 여러 카테고리의 추천 키워드를 별칭(alias)으로 묶어 쿼리 하나로 요청 (POST 한 번)
+
+같은 필드 조합의 쿼리는 한 번만 만들고 재사용합니다.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+# 수집 결과에 쓰는 키워드 필드
+KEYWORD_FIELDS: Tuple[str, ...] = ('name', 'participantCount')
+# id 기준 중복 제거, 체크포인트 이어받기, 증분 동기화에 필요한 필드
+KEYWORD_ID_FIELDS: Tuple[str, ...] = ('id', 'name', 'participantCount')
+
+# 요청할 수 있는 키워드 필드 (웹 클라이언트 쿼리에 있는 필드)
+AVAILABLE_FIELDS = frozenset({
+    'id',
+    'name',
+    'participantCount',
+    'categoryId',
+    'challengeable',
+    'challengeableContentCount',
+    'challengedKeyword',
+    'issueKeyword',
+    'property',
+    'thumbnailUrl',
+    '__typename',
+})
+
+# 묶음 요청에서 카테고리별 결과 별칭 접두어 (c0, c1, ...)
+BATCH_ALIAS_PREFIX = "c"
+
+
+def _selection(fields: Sequence[str]) -> str:
+    unknown = set(fields) - AVAILABLE_FIELDS
+    if unknown:
+        raise ValueError(f"알 수 없는 키워드 필드: {', '.join(sorted(unknown))}")
+    if not fields:
+        raise ValueError("키워드 필드를 하나 이상 지정해야 합니다.")
+    return " ".join(fields)
+
+
+@lru_cache(maxsize=None)
+def search_keywords_query(fields: Tuple[str, ...] = KEYWORD_FIELDS) -> str:
+    """
+    카테고리 키워드 페이지 쿼리 (getSearchCategoryKeywords)
+
+    Args:
+        fields: 키워드 필드 (튜플)
+
+    Returns:
+        쿼리 문자열 (items + paging.nextCursor/total)
+    """
+    return (
+        "query getSearchCategoryKeywords($input:SearchKeywordInput!,$paging:PagingInput!)"
+        "{searchCategoryKeywords(input:$input,paging:$paging)"
+        f"{{items{{...on Keyword{{{_selection(fields)}}}}}paging{{nextCursor total}}}}}}"
+    )
+
+
+@lru_cache(maxsize=None)
+def white_pool_query(fields: Tuple[str, ...] = KEYWORD_FIELDS) -> str:
+    """
+    추천 키워드 쿼리 (getWhitePoolKeywords)
+
+    Args:
+        fields: 키워드 필드 (튜플)
+
+    Returns:
+        쿼리 문자열
+    """
+    return (
+        "query getWhitePoolKeywords($input:WhitePoolKeywordInput!)"
+        f"{{whitePoolKeywords(input:$input){{{_selection(fields)}}}}}"
+    )
+
+
+@lru_cache(maxsize=None)
+def white_pool_batch_query(count: int, fields: Tuple[str, ...] = KEYWORD_FIELDS) -> str:
+    """
+    여러 카테고리 추천 키워드를 한 번에 요청하는 쿼리
+
+    카테고리 i의 결과는 별칭 c{i}, 입력 변수는 $input{i} 입니다.
+
+    Args:
+        count: 카테고리 수
+        fields: 키워드 필드 (튜플)
+
+    Returns:
+        쿼리 문자열
+    """
+    selection = _selection(fields)
+    variables = ",".join(f"$input{i}:WhitePoolKeywordInput!" for i in range(count))
+    aliases = "".join(
+        f"{BATCH_ALIAS_PREFIX}{i}:whitePoolKeywords(input:$input{i}){{{selection}}}" for i in range(count)
+    )
+    return f"query getWhitePoolKeywordsBatch({variables}){{{aliases}}}"
+
+
+def white_pool_batch_variables(category_ids: List[str], limit: int) -> Dict[str, Dict]:
+    """white_pool_batch_query 변수 ({'input0': {...}, 'input1': {...}, ...})"""
+    return {f"input{i}": {'categoryId': category_id, 'limit': limit} for i, category_id in enumerate(category_ids)}
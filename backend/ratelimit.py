@@ -0,0 +1,56 @@
+"""
+요청 속도 제한 모듈
+
+여러 카테고리를 동시에 수집할 때 전체 요청 속도가 설정한 상한을 넘지 않도록
+모든 작업이 공유하는 토큰 버킷을 제공합니다.
+"""
+
+import asyncio
+import time
+
+from .metrics import add_phase_time
+
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷 속도 제한기
+
+    초당 rate개의 토큰이 채워지고 최대 burst개까지 쌓입니다.
+    요청 전에 acquire()로 토큰 하나를 가져가며, 토큰이 없으면 채워질 때까지 대기합니다.
+    대기 순서는 요청 순서(FIFO)를 따릅니다.
+
+    Args:
+        rate: 초당 허용 요청 수 (0 이하이면 제한 없음)
+        burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.acquired = 0  # 지금까지 발급한 토큰 수 (= 보낸 요청 수)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """토큰 하나를 가져옴 (없으면 대기)"""
+        if self.rate <= 0:
+            self.acquired += 1
+            return
+
+        started = time.perf_counter()
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.acquired += 1
+                    break
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+        # 토큰을 기다린 시간은 페이지 간 대기와 같은 sleep 단계로 기록
+        add_phase_time('sleep', time.perf_counter() - started)
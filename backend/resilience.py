@@ -0,0 +1,354 @@
+"""
+upstream 장애 대응 모듈
+
+네이버가 느려지거나 실패할 때 요청 하나가 수집 전체를 멈추거나, 모든 API 요청이
+타임아웃까지 기다렸다가 실패하지 않도록 합니다.
+
+- hedged request: 페이지 응답이 최근 지연 시간 백분위수(HEDGE_PERCENTILE)보다 늦으면 같은 요청을
+  한 번 더 보내고 먼저 성공한 응답을 사용 (나머지는 취소, 두 번째 요청은 전체의 HEDGE_MAX_RATIO 이하)
+- 재시도 jitter: 같은 페이지 재시도 사이에 0 ~ RETRY_BASE_DELAY x 2^시도 사이 임의 시간 대기 (full jitter)
+- 회로 차단기: 429/5xx, 타임아웃 등이 BREAKER_FAILURE_THRESHOLD번 연속되면 BREAKER_RESET_TIMEOUT 동안
+  요청을 보내지 않고 바로 CircuitOpenError를 발생시키며, 이후 시험 요청 하나가 성공하면 다시 엶
+  (API는 이 동안 마지막으로 받은 결과를 stale 표시와 함께 돌려주거나 바로 503으로 응답)
+
+상태는 이벤트 루프 스레드에서만 바꾸는 것을 전제로 잠금 없이 처리합니다.
+"""
+
+import asyncio
+import math
+import random
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Deque, Dict, Iterator, Optional, TypeVar
+
+import httpx
+
+from .config import (
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    HEDGE_ENABLED,
+    HEDGE_PERCENTILE,
+    HEDGE_MIN_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_WINDOW,
+    HEDGE_MAX_RATIO,
+    BREAKER_ENABLED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+)
+from .metrics import UPSTREAM_HEDGES, BREAKER_STATE, BREAKER_REJECTIONS
+
+T = TypeVar("T")
+
+
+def retry_delay(attempt: int) -> float:
+    """
+    재시도 전 추가 대기 시간 (full jitter)
+
+    Args:
+        attempt: 지금까지 실패한 횟수 (0부터)
+
+    Returns:
+        0 ~ min(RETRY_MAX_DELAY, RETRY_BASE_DELAY x 2^attempt) 사이 임의 시간 (초)
+    """
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
+
+def is_failure_status(status: int) -> bool:
+    """upstream 장애로 볼 응답 상태 (429, 5xx)"""
+    return status == 429 or status >= 500
+
+
+class CircuitOpenError(Exception):
+    """회로 차단 중이라 upstream 요청을 보내지 않음"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} 요청 차단 중 (연속 실패, {math.ceil(retry_after)}초 후 다시 시도)")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 회로 차단기 (closed -> open -> half-open -> closed)
+
+    Args:
+        name: 이름 (오류 메시지용)
+        failure_threshold: 차단까지 연속 실패 수
+        reset_timeout: 차단 후 시험 요청까지 시간 (초)
+        enabled: False면 상태만 기록하고 차단하지 않음
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+        enabled: bool = BREAKER_ENABLED,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.enabled = enabled
+        self.failures = 0  # 연속 실패 수
+        self.opened = 0  # 차단된 횟수
+        self.rejected = 0  # 차단 중 보내지 않은 요청 수
+        self._opened_at: Optional[float] = None  # monotonic
+        self._probing = False  # half-open 시험 요청 진행 중
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._probing or time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    @property
+    def retry_after(self) -> float:
+        """다음 시험 요청까지 남은 시간 (초, 차단 중이 아니면 0)"""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def before_call(self) -> None:
+        """
+        요청 전 확인 (half-open이면 시험 요청 하나만 통과)
+
+        Raises:
+            CircuitOpenError: 차단 중이거나 다른 시험 요청이 진행 중
+        """
+        if self._opened_at is None or not self.enabled:
+            return
+        if self.state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        self.rejected += 1
+        BREAKER_REJECTIONS.inc()
+        raise CircuitOpenError(self.name, max(self.retry_after, 1.0))
+
+    def record(self, ok: Optional[bool]) -> None:
+        """
+        요청 결과 기록
+
+        Args:
+            ok: 성공 True, upstream 장애 False, 결과 없음(취소 등) None
+        """
+        if ok is None:
+            self._probing = False
+        elif ok:
+            self.failures = 0
+            self._opened_at = None
+            self._probing = False
+        else:
+            self.failures += 1
+            if self._probing or (self._opened_at is None and self.failures >= self.failure_threshold):
+                if self._opened_at is None:
+                    self.opened += 1
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        요청 하나를 감싸 결과 기록 (429/5xx, 네트워크 오류는 실패, 그 밖의 응답은 성공)
+
+        Raises:
+            CircuitOpenError: 차단 중
+        """
+        self.before_call()
+        ok: Optional[bool] = None
+        try:
+            yield
+            ok = True
+        except httpx.HTTPStatusError as e:
+            ok = not is_failure_status(e.response.status_code)
+            raise
+        except httpx.TransportError:
+            ok = False
+            raise
+        finally:
+            self.record(ok)
+
+    def reset(self) -> None:
+        """닫힌 상태로 초기화"""
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def snapshot(self) -> Dict:
+        """현재 상태 (지표 노출용)"""
+        return {
+            'state': self.state,
+            'enabled': self.enabled,
+            'failures': self.failures,
+            'failureThreshold': self.failure_threshold,
+            'resetTimeoutSec': self.reset_timeout,
+            'retryAfterSec': round(self.retry_after, 3),
+            'opened': self.opened,
+            'rejected': self.rejected,
+        }
+
+
+class Hedger:
+    """
+    지연 시간 백분위수 기반 hedged request
+
+    최근 성공한 응답 지연 시간의 percentile 백분위수가 지나도 응답이 없으면
+    같은 요청을 한 번 더 보내고, 먼저 성공한 쪽을 사용합니다.
+
+    Args:
+        percentile: 두 번째 요청을 보낼 지연 시간 백분위수
+        min_delay: 두 번째 요청까지 최소 대기 시간 (초)
+        min_samples: 두 번째 요청을 보내기 시작할 최소 응답 수
+        window: 백분위수 계산에 쓰는 최근 응답 수
+        max_ratio: 전체 요청 대비 두 번째 요청 최대 비율
+        enabled: False면 지연 시간만 기록하고 두 번째 요청은 보내지 않음
+    """
+
+    def __init__(
+        self,
+        percentile: float = HEDGE_PERCENTILE,
+        min_delay: float = HEDGE_MIN_DELAY,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        window: int = HEDGE_WINDOW,
+        max_ratio: float = HEDGE_MAX_RATIO,
+        enabled: bool = HEDGE_ENABLED,
+    ):
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_ratio = max_ratio
+        self.enabled = enabled
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def observe(self, latency: float) -> None:
+        """성공한 응답 지연 시간 기록 (초)"""
+        self._samples.append(latency)
+
+    def delay(self) -> Optional[float]:
+        """두 번째 요청까지 대기 시간 (초, 표본이 부족하면 None)"""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+        return max(self.min_delay, ordered[index])
+
+    def _can_hedge(self) -> bool:
+        return self.enabled and self.hedges + 1 <= self.max_ratio * self.calls
+
+    async def _timed(self, call: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        result = await call()
+        self.observe(time.monotonic() - started)
+        return result
+
+    async def _hedge(self, call: Callable[[], Awaitable[T]], acquire: Optional[Callable[[], Awaitable[None]]]) -> T:
+        # 토큰을 기다린 시간은 지연 시간에 넣지 않음
+        if acquire is not None:
+            await acquire()
+        return await self._timed(call)
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        acquire: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> T:
+        """
+        call 실행 (늦으면 한 번 더 보내고 먼저 성공한 결과 반환)
+
+        첫 번째 요청의 속도 제한 토큰은 호출하는 쪽이 미리 받아 두어야 합니다.
+
+        Args:
+            call: 요청 하나를 보내는 코루틴 함수 (인자 없음, 여러 번 호출해도 안전해야 함)
+            acquire: 두 번째 요청을 보내기 전에 기다릴 코루틴 함수 (속도 제한 토큰 등, None이면 바로 보냄)
+
+        Returns:
+            먼저 성공한 요청의 결과
+
+        Raises:
+            모든 요청이 실패하면 마지막 예외
+        """
+        self.calls += 1
+        delay = self.delay()
+        if delay is None or not self._can_hedge():
+            return await self._timed(call)
+
+        first = asyncio.ensure_future(self._timed(call))
+        tasks = {first}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                if self._can_hedge():
+                    self.hedges += 1
+                    UPSTREAM_HEDGES.labels('sent').inc()
+                    tasks.add(asyncio.ensure_future(self._hedge(call, acquire)))
+
+            error: Optional[BaseException] = None
+            pending = tasks
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            self.hedge_wins += 1
+                            UPSTREAM_HEDGES.labels('won').inc()
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def reset(self) -> None:
+        """기록한 지연 시간과 통계 초기화"""
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._samples.clear()
+
+    def snapshot(self) -> Dict:
+        """현재 상태 (지표 노출용)"""
+        delay = self.delay()
+        return {
+            'enabled': self.enabled,
+            'percentile': self.percentile,
+            'delaySec': round(delay, 4) if delay is not None else None,
+            'samples': len(self._samples),
+            'calls': self.calls,
+            'hedges': self.hedges,
+            'hedgeWins': self.hedge_wins,
+            'maxRatio': self.max_ratio,
+        }
+
+
+_default_breaker: Optional[CircuitBreaker] = None
+_default_hedger: Optional[Hedger] = None
+
+
+def get_default_breaker() -> CircuitBreaker:
+    """네이버 요청 공용 회로 차단기 반환"""
+    global _default_breaker
+
+    if _default_breaker is None:
+        _default_breaker = CircuitBreaker("네이버")
+        states = {CircuitBreaker.CLOSED: 0, CircuitBreaker.HALF_OPEN: 1, CircuitBreaker.OPEN: 2}
+        BREAKER_STATE.set_function(lambda: states[_default_breaker.state])
+    return _default_breaker
+
+
+def get_default_hedger() -> Hedger:
+    """키워드 페이지 요청 공용 hedger 반환"""
+    global _default_hedger
+
+    if _default_hedger is None:
+        _default_hedger = Hedger()
+    return _default_hedger
@@ -2,229 +2,855 @@
 스크래핑 비즈니스 로직 모듈
 
 네이버 인플루언서 플랫폼에서 카테고리 및 키워드 데이터를 수집하는 함수들을 제공합니다.
+
+FastAPI 엔드포인트가 이벤트 루프를 막지 않도록 모든 수집 로직은 asyncio 기반
+(`*_async` 함수)으로 작성되어 있으며, 동기 함수들은 CLI(`main.py`)를 위한
+얇은 래퍼입니다.
 """
 
-import requests
+import asyncio
+import httpx
 import json
-import re
+import logging
 import time
-from typing import List, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Dict, Optional, Tuple, TypeVar
 
 from .config import (
     NAVER_INFLUENCER_URL,
     GRAPHQL_URL,
     HEADERS_HTML,
     HEADERS_GRAPHQL,
-    QUERY_WHITE_POOL_KEYWORDS,
-    QUERY_SEARCH_CATEGORY_KEYWORDS,
     RECOMMEND_LIMIT,
     DEFAULT_LIMIT,
+    PACER_MIN_DELAY,
+    PACER_ADAPTIVE,
+    PAGE_MAX_RETRIES,
+    CATEGORY_CACHE_TTL,
+    KEYWORD_CACHE_TTL,
+    GRAPHQL_BATCHING,
+    GRAPHQL_BATCH_SIZE,
+    RECOMMEND_TIMEOUT,
+    NORMAL_KEYWORDS_TIMEOUT,
+    DEGRADED_CACHE_TTL,
+)
+from .http_client import get_client, close_client
+from .ratelimit import TokenBucket
+from .pacing import AdaptivePacer, parse_retry_after
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_default_breaker,
+    get_default_hedger,
+    is_failure_status,
+    retry_delay,
+)
+from .checkpoint import CrawlJournal, get_default_journal
+from .shared_store import (
+    SharedResultStore,
+    KEYWORDS_CODEC,
+    CATEGORIES_KEY,
+    keywords_key,
+    get_default_shared_store,
+)
+from .batch import KeywordBatch
+from .queries import (
+    KEYWORD_FIELDS,
+    KEYWORD_ID_FIELDS,
+    BATCH_ALIAS_PREFIX,
+    search_keywords_query,
+    white_pool_query,
+    white_pool_batch_query,
+    white_pool_batch_variables,
+)
+from .preloaded import PreloadedStateExtractor, CATEGORY_GROUPS_PATH
+from .metrics import (
+    UPSTREAM_LATENCY,
+    UPSTREAM_ERRORS,
+    PAGES_FETCHED,
+    KEYWORDS_FETCHED,
+    CRAWLS_IN_FLIGHT,
+    DEGRADED_RESULTS,
+    add_phase_time,
+    phase,
 )
 
+T = TypeVar("T")
 
-def fetch_categories() -> List[Dict]:
+logger = logging.getLogger(__name__)
+
+# 서버가 별칭으로 묶은 쿼리를 거부하면 False로 바꾸고 이후에는 카테고리별로 요청
+_batching_supported = GRAPHQL_BATCHING
+
+async def _post_graphql(
+    operation_name: str,
+    variables: Dict,
+    query: str,
+    allow_partial: bool = False,
+) -> Dict[str, Any]:
+    """
+    GraphQL 요청 전송 및 공통 응답 검증
+
+    Args:
+        operation_name: GraphQL operationName
+        variables: GraphQL 변수
+        query: GraphQL 쿼리 문자열
+        allow_partial: errors가 있어도 data가 있으면 반환 (묶음 요청에서 일부 별칭만 실패한 경우)
+
+    Returns:
+        응답의 data 객체
+
+    Raises:
+        httpx.HTTPError: 네트워크 오류
+        ValueError: GraphQL 응답에 errors 포함 또는 data 없음
+        json.JSONDecodeError: 응답 파싱 실패
+        CircuitOpenError: 연속 실패로 요청 차단 중 (요청을 보내지 않음)
+    """
+    json_data = {
+        'operationName': operation_name,
+        'variables': variables,
+        'query': query,
+    }
+
+    client = get_client()
+    started = time.perf_counter()
+    try:
+        with get_default_breaker().guard(), phase('fetch'):
+            response = await client.post(GRAPHQL_URL, headers=HEADERS_GRAPHQL, json=json_data)
+            response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        UPSTREAM_ERRORS.labels(operation_name, f"http_{e.response.status_code}").inc()
+        raise
+    except httpx.TransportError:
+        UPSTREAM_ERRORS.labels(operation_name, "transport").inc()
+        raise
+    finally:
+        UPSTREAM_LATENCY.labels(operation_name).observe(time.perf_counter() - started)
+
+    try:
+        with phase('parse'):
+            result = response.json()
+    except json.JSONDecodeError:
+        UPSTREAM_ERRORS.labels(operation_name, "parse").inc()
+        raise
+
+    # GraphQL 오류 확인
+    if 'errors' in result:
+        UPSTREAM_ERRORS.labels(operation_name, "graphql").inc()
+        if allow_partial and result.get('data'):
+            return result['data']
+        error_msg = result['errors'][0].get('message', '알 수 없는 오류') if result['errors'] else '알 수 없는 오류'
+        raise ValueError(f"GraphQL 오류: {error_msg}")
+
+    if not result.get('data'):
+        UPSTREAM_ERRORS.labels(operation_name, "graphql").inc()
+        raise ValueError("응답에 data가 없습니다.")
+
+    return result['data']
+
+
+async def fetch_categories_async(store: Optional[SharedResultStore] = None) -> List[Dict]:
     """
-    네이버 인플루언서 카테고리 목록 조회
-    
+    네이버 인플루언서 카테고리 목록 조회 (비동기)
+
+    Args:
+        store: 공유 결과 저장소 (지정 시 다른 프로세스가 받아 둔 목록을 재사용하고,
+            여러 프로세스가 동시에 요청해도 한 곳에서만 수집)
+
     Returns:
         카테고리 정보 리스트 [{'id': ..., 'name': ..., 'keywordCount': ...}, ...]
-        
+
     Raises:
-        requests.RequestException: 네트워크 오류
+        httpx.HTTPError: 네트워크 오류
         ValueError: 응답 파싱 실패
     """
+    if store is not None:
+        return await store.get_or_load(CATEGORIES_KEY, _fetch_categories_async, CATEGORY_CACHE_TTL)
+    return await _fetch_categories_async()
+
+
+async def _fetch_categories_async() -> List[Dict]:
+    operation = 'keywordsPage'
+    started = time.perf_counter()
     try:
-        response = requests.get(NAVER_INFLUENCER_URL, headers=HEADERS_HTML, timeout=10)
-        response.raise_for_status()
-        
-        # window.__PRELOADED_STATE__ 추출
-        pattern = r'window.__PRELOADED_STATE__ = (.*?);'
-        match = re.search(pattern, response.text)
-        
-        if not match:
-            raise ValueError("카테고리 정보를 찾을 수 없습니다. 페이지 구조가 변경되었을 수 있습니다.")
-        
-        data = json.loads(match.group(1))
-        
-        # 데이터 구조 검증
-        if 'keyword' not in data or 'categoryGroups' not in data['keyword']:
-            raise ValueError("예상하지 못한 데이터 구조입니다.")
-        
-        category_groups = data['keyword']['categoryGroups']['data']
-        
+        client = get_client()
+        extractor = PreloadedStateExtractor(CATEGORY_GROUPS_PATH)
+        parse_time = 0.0
+
+        # window.__PRELOADED_STATE__ 의 keyword.categoryGroups 만 추출
+        # (HTML 전체를 받거나 상태 전체를 파싱하지 않고, 다 읽으면 바로 연결을 닫음)
+        with get_default_breaker().guard():
+            async with client.stream('GET', NAVER_INFLUENCER_URL, headers=HEADERS_HTML) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_text():
+                    feed_started = time.perf_counter()
+                    done = extractor.feed(chunk)
+                    parse_time += time.perf_counter() - feed_started
+                    if done:
+                        break
+                else:
+                    extractor.close()
+
+        elapsed = time.perf_counter() - started
+        UPSTREAM_LATENCY.labels(operation).observe(elapsed)
+        add_phase_time('fetch', elapsed - parse_time)
+        add_phase_time('parse', parse_time)
+
+        category_groups = extractor.value['data']
+
         # 모든 카테고리 평탄화
         categories = []
         for group in category_groups:
             if 'categories' in group:
                 categories.extend(group['categories'])
-        
+
         return categories
-        
-    except requests.RequestException as e:
-        raise requests.RequestException(f"카테고리 목록 조회 실패: {str(e)}")
-    except (json.JSONDecodeError, KeyError) as e:
+
+    except httpx.HTTPStatusError as e:
+        UPSTREAM_ERRORS.labels(operation, f"http_{e.response.status_code}").inc()
+        raise httpx.HTTPError(f"카테고리 목록 조회 실패: {str(e)}")
+    except httpx.HTTPError as e:
+        UPSTREAM_ERRORS.labels(operation, "transport").inc()
+        raise httpx.HTTPError(f"카테고리 목록 조회 실패: {str(e)}")
+    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        UPSTREAM_ERRORS.labels(operation, "parse").inc()
         raise ValueError(f"응답 파싱 실패: {str(e)}")
 
 
-def fetch_recommend_keywords(category_id: str) -> List[Dict]:
+async def fetch_recommend_keywords_async(
+    category_id: str,
+    limiter: Optional[TokenBucket] = None,
+) -> KeywordBatch:
     """
-    추천 키워드 조회 (상위 3개)
-    
+    추천 키워드 조회 (상위 3개, 비동기)
+
     Args:
         category_id: 카테고리 ID
-        
+        limiter: 공유 속도 제한기 (지정 시 요청 전에 토큰 획득)
+
     Returns:
-        [{'name': '키워드명', 'participantCount': 123}, ...]
-        
+        KeywordBatch (반복 시 {'name': '키워드명', 'participantCount': 123})
+
     Raises:
-        requests.RequestException: 네트워크 오류
+        httpx.HTTPError: 네트워크 오류
         ValueError: GraphQL 응답에 errors 포함 또는 data 없음
     """
-    json_data = {
-        'operationName': 'getWhitePoolKeywords',
-        'variables': {
-            'input': {
-                'categoryId': category_id,
-                'limit': RECOMMEND_LIMIT,
-            },
+    variables = {
+        'input': {
+            'categoryId': category_id,
+            'limit': RECOMMEND_LIMIT,
         },
-        'query': QUERY_WHITE_POOL_KEYWORDS,
     }
-    
+
     try:
-        response = requests.post(GRAPHQL_URL, headers=HEADERS_GRAPHQL, json=json_data, timeout=10)
-        response.raise_for_status()
-        
-        result = response.json()
-        
-        # GraphQL 오류 확인
-        if 'errors' in result:
-            error_msg = result['errors'][0].get('message', '알 수 없는 오류') if result['errors'] else '알 수 없는 오류'
-            raise ValueError(f"GraphQL 오류: {error_msg}")
-        
-        if 'data' not in result or 'whitePoolKeywords' not in result['data']:
+        if limiter is not None:
+            await limiter.acquire()
+
+        data = await _post_graphql('getWhitePoolKeywords', variables, white_pool_query(KEYWORD_FIELDS))
+
+        if 'whitePoolKeywords' not in data:
             raise ValueError("응답에 data가 없습니다.")
-        
-        keywords_data = result['data']['whitePoolKeywords']
-        
-        # 필요한 필드만 추출
-        keywords = []
-        for k in keywords_data:
-            keywords.append({
-                'name': k['name'],
-                'participantCount': k['participantCount']
-            })
-        
-        return keywords
-        
-    except requests.RequestException as e:
-        raise requests.RequestException(f"추천 키워드 조회 실패: {str(e)}")
+
+        return _to_batch(data['whitePoolKeywords'])
+
+    except httpx.HTTPError as e:
+        raise httpx.HTTPError(f"추천 키워드 조회 실패: {str(e)}")
     except (json.JSONDecodeError, KeyError) as e:
         raise ValueError(f"응답 파싱 실패: {str(e)}")
 
 
-def fetch_all_keywords(category_id: str, sleep_sec: float = 2.0) -> List[Dict]:
+def _to_batch(items: List[Dict]) -> KeywordBatch:
+    keywords = KeywordBatch()
+    for k in items:
+        keywords.append(k['name'], k['participantCount'])
+    return keywords
+
+
+async def fetch_recommend_keywords_batch_async(
+    category_ids: List[str],
+    limiter: Optional[TokenBucket] = None,
+) -> Dict[str, KeywordBatch]:
+    """
+    여러 카테고리 추천 키워드 조회 (비동기)
+
+    GRAPHQL_BATCH_SIZE개씩 별칭으로 묶어 POST 한 번에 요청합니다.
+    서버가 묶은 쿼리를 거부하면(4xx, data 없는 GraphQL errors) 이후로는 묶지 않고,
+    묶음 요청으로 받지 못한 카테고리는 하나씩 다시 요청합니다.
+
+    Args:
+        category_ids: 카테고리 ID 목록
+        limiter: 공유 속도 제한기 (묶음 요청 하나당 토큰 하나)
+
+    Returns:
+        {카테고리 ID: KeywordBatch}
+
+    Raises:
+        httpx.HTTPError: 네트워크 오류 (하나씩 요청할 때)
+        ValueError: GraphQL 응답 오류 (하나씩 요청할 때)
+    """
+    global _batching_supported
+
+    results: Dict[str, KeywordBatch] = {}
+    for start in range(0, len(category_ids), GRAPHQL_BATCH_SIZE):
+        chunk = category_ids[start:start + GRAPHQL_BATCH_SIZE]
+        if not _batching_supported or len(chunk) < 2:
+            break
+
+        if limiter is not None:
+            await limiter.acquire()
+        try:
+            data = await _post_graphql(
+                'getWhitePoolKeywordsBatch',
+                white_pool_batch_variables(chunk, RECOMMEND_LIMIT),
+                white_pool_batch_query(len(chunk), KEYWORD_FIELDS),
+                allow_partial=True,
+            )
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if 400 <= status < 500 and status != 429:
+                _batching_supported = False
+            break
+        except ValueError:
+            # data 없이 errors만 온 경우 (묶은 쿼리 자체를 받지 않는 서버)
+            _batching_supported = False
+            break
+        except (httpx.HTTPError, json.JSONDecodeError):
+            break
+
+        for i, category_id in enumerate(chunk):
+            items = data.get(f"{BATCH_ALIAS_PREFIX}{i}")
+            if items is not None:
+                results[category_id] = _to_batch(items)
+
+    for category_id in category_ids:
+        if category_id not in results:
+            results[category_id] = await fetch_recommend_keywords_async(category_id, limiter)
+    return results
+
+
+def _make_pacer(sleep_sec: float, limiter: Optional[TokenBucket]) -> AdaptivePacer:
+    """pacer를 지정하지 않았을 때 사용할 기본 간격 조절기 생성"""
+    if not PACER_ADAPTIVE:
+        # 고정 간격: 백오프 없이 sleep_sec 유지 (Retry-After만 지킴)
+        delay = 0 if limiter is not None else sleep_sec
+        return AdaptivePacer(initial_delay=delay, min_delay=delay, max_delay=delay)
+    if limiter is not None:
+        # 속도 상한은 토큰 버킷이 담당하므로 스로틀링 시 백오프만 적용
+        return AdaptivePacer(initial_delay=0, min_delay=0)
+    return AdaptivePacer(initial_delay=sleep_sec, min_delay=min(sleep_sec, PACER_MIN_DELAY))
+
+
+async def _fetch_keyword_page(
+    variables: Dict,
+    pacer: AdaptivePacer,
+    limiter: Optional[TokenBucket] = None,
+    fields: Tuple[str, ...] = KEYWORD_ID_FIELDS,
+) -> Dict[str, Any]:
+    """
+    키워드 한 페이지 요청 (늦으면 hedged request, 실패 시 백오프 후 재시도)
+
+    응답이 최근 지연 시간 백분위수보다 늦으면 같은 페이지를 한 번 더 요청해 먼저 온 응답을 씁니다.
+    429/5xx 응답(Retry-After 반영), 타임아웃 등 네트워크 오류, GraphQL errors 응답은
+    간격 조절기를 백오프시키고 jitter만큼 더 기다린 뒤 같은 페이지를 최대 PAGE_MAX_RETRIES번 재시도합니다.
+    그 밖의 4xx 응답과 회로 차단 중(CircuitOpenError)에는 재시도하지 않습니다.
+
+    Raises:
+        httpx.HTTPError: 네트워크 오류 (재시도 횟수 초과 포함)
+        ValueError: GraphQL 응답 오류 (재시도 횟수 초과)
+        CircuitOpenError: 연속 실패로 요청 차단 중
+    """
+    query = search_keywords_query(fields)
+
+    async def request() -> Dict[str, Any]:
+        return await _post_graphql('getSearchCategoryKeywords', variables, query)
+
+    acquire = limiter.acquire if limiter is not None else None
+    attempt = 0
+    while True:
+        # 토큰 대기 시간은 응답 지연 시간에 넣지 않음 (두 번째 요청은 Hedger가 따로 토큰을 받음)
+        if limiter is not None:
+            await limiter.acquire()
+
+        started = time.monotonic()
+        try:
+            data = await get_default_hedger().run(request, acquire)
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if not is_failure_status(status):
+                raise
+            pacer.on_throttle(parse_retry_after(e.response.headers.get('Retry-After')))
+            if attempt >= PAGE_MAX_RETRIES:
+                raise
+        except (httpx.TransportError, ValueError):
+            # 타임아웃/연결 오류, GraphQL errors
+            pacer.on_throttle()
+            if attempt >= PAGE_MAX_RETRIES:
+                raise
+        else:
+            pacer.on_success(time.monotonic() - started)
+            return data
+
+        attempt += 1
+        await pacer.wait()
+        with phase('sleep'):
+            await asyncio.sleep(retry_delay(attempt - 1))
+
+
+@dataclass
+class KeywordPage:
+    """키워드 한 페이지"""
+    keywords: List[Dict]
+    total: Optional[int]
+    next_cursor: Optional[str]
+    resumed: bool = False  # 체크포인트에서 복원한 키워드 묶음인지 여부
+
+
+async def iter_keyword_pages_async(
+    category_id: str,
+    sleep_sec: float = 2.0,
+    limiter: Optional[TokenBucket] = None,
+    pacer: Optional[AdaptivePacer] = None,
+    journal: Optional[CrawlJournal] = None,
+    include_id: bool = False,
+) -> AsyncIterator[KeywordPage]:
     """
-    카테고리의 모든 키워드 조회 (페이지네이션)
-    
+    카테고리 키워드를 페이지 단위로 조회 (비동기 제너레이터)
+
+    GraphQL 페이지가 도착할 때마다 바로 내보내므로, 전체 수집이 끝나기 전에
+    결과를 스트리밍하거나 원하는 개수만큼만 읽고 멈출 수 있습니다.
+
+    페이지 사이의 대기는 적응형 간격 조절기(AdaptivePacer)가 결정합니다.
+    응답이 좋으면 간격을 줄이고, 스로틀링 신호가 오면 지수적으로 늘립니다.
+    limiter를 지정하면 공유 토큰 버킷으로 전체 요청 속도도 함께 제한합니다.
+
+    journal을 지정하면 페이지마다 다음 커서와 받은 키워드를 기록하고, 이전 수집이
+    중간에 실패했다면 기록된 키워드를 먼저 내보낸 뒤(resumed=True) 마지막 커서부터
+    이어서 수집합니다. 끝까지 받으면 기록을 지웁니다.
+
     Args:
         category_id: 카테고리 ID
-        sleep_sec: 요청 간 대기 시간 (초)
-        
-    Returns:
-        [{'name': '키워드명', 'participantCount': 123}, ...]
-        
+        sleep_sec: 시작 요청 간 대기 시간 (초, pacer 미지정 시에만 사용)
+        limiter: 공유 속도 제한기
+        pacer: 공유 간격 조절기 (None이면 sleep_sec로 시작하는 새 조절기 사용)
+        journal: 체크포인트 저널 (None이면 체크포인트 없이 수집)
+        include_id: 키워드 행에 GraphQL 키워드 'id' 포함 여부
+
+    Yields:
+        KeywordPage (keywords: [{'name': ..., 'participantCount': ...}], total, next_cursor)
+
     Raises:
-        requests.RequestException: 네트워크 오류
+        httpx.HTTPError: 네트워크 오류
         ValueError: GraphQL 응답 오류
     """
-    keywords = []
+    if pacer is None:
+        pacer = _make_pacer(sleep_sec, limiter)
+
+    # 같은 카테고리를 이미 다른 수집이 기록 중이면 저널 없이 수집
+    if journal is not None and not journal.claim(category_id):
+        journal = None
+
+    CRAWLS_IN_FLIGHT.inc()
+    try:
+        # 체크포인트 이어받기에는 id가 필요하므로 저널을 쓸 때는 id도 요청
+        fields = KEYWORD_ID_FIELDS if include_id or journal is not None else KEYWORD_FIELDS
+        async for page in _iter_pages(category_id, pacer, limiter, journal, fields=fields):
+            if not include_id:
+                page.keywords = _without_id(page.keywords)
+            yield page
+    finally:
+        CRAWLS_IN_FLIGHT.dec()
+        if journal is not None:
+            journal.release(category_id)
+
+
+def _without_id(keywords: List[Dict]) -> List[Dict]:
+    """키워드 행에서 'id' 제거 (공개 응답 형식 유지)"""
+    return [{'name': k['name'], 'participantCount': k['participantCount']} for k in keywords]
+
+
+async def _iter_pages(
+    category_id: str,
+    pacer: AdaptivePacer,
+    limiter: Optional[TokenBucket],
+    journal: Optional[CrawlJournal],
+    name: str = '',
+    fields: Tuple[str, ...] = KEYWORD_ID_FIELDS,
+) -> AsyncIterator[KeywordPage]:
+    """
+    iter_keyword_pages_async 본체 (저널 claim 이후 실행, 행에 'id' 키 포함)
+
+    name을 지정하면 그 검색어에 해당하는 키워드만 조회합니다 (분할 수집용, 저널 없이 사용).
+    fields에 'id'가 없으면 행의 'id'는 None입니다.
+    """
     cursor: Optional[str] = None
-    
+
+    if journal is not None:
+        checkpoint = await asyncio.to_thread(journal.load, category_id)
+        if checkpoint is not None and checkpoint.next_cursor and checkpoint.has_ids:
+            # 마지막으로 성공한 커서부터 이어서 수집
+            cursor = checkpoint.next_cursor
+            yield KeywordPage(
+                keywords=checkpoint.keywords,
+                total=checkpoint.total,
+                next_cursor=cursor,
+                resumed=True,
+            )
+            await pacer.wait()
+        elif checkpoint is not None:
+            # 이어받을 수 없는 기록은 지우고 처음부터 수집
+            await asyncio.to_thread(journal.clear, category_id)
+
     while True:
         try:
             # 페이지네이션 변수 설정
             variables = {
                 'input': {
                     'categoryId': category_id,
-                    'name': '',
+                    'name': name,
                 },
                 'paging': {
                     'limit': DEFAULT_LIMIT,
                 },
             }
-            
+
             if cursor:
                 variables['paging']['cursor'] = cursor
-            
-            json_data = {
-                'operationName': 'getSearchCategoryKeywords',
-                'variables': variables,
-                'query': QUERY_SEARCH_CATEGORY_KEYWORDS,
-            }
-            
-            response = requests.post(GRAPHQL_URL, headers=HEADERS_GRAPHQL, json=json_data, timeout=10)
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            # GraphQL 오류 확인
-            if 'errors' in result:
-                error_msg = result['errors'][0].get('message', '알 수 없는 오류') if result['errors'] else '알 수 없는 오류'
-                raise ValueError(f"GraphQL 오류: {error_msg}")
-            
-            if 'data' not in result or 'searchCategoryKeywords' not in result['data']:
+
+            data = await _fetch_keyword_page(variables, pacer, limiter, fields)
+
+            if 'searchCategoryKeywords' not in data:
                 raise ValueError("응답에 data가 없습니다.")
-            
-            main_data = result['data']['searchCategoryKeywords']
+
+            main_data = data['searchCategoryKeywords']
             items = main_data['items']
             paging = main_data['paging']
-            
-            # 키워드 추출
+
+            # 키워드 추출 (id는 체크포인트/중복 제거용으로 보관)
+            keywords = []
             for k in items:
                 keywords.append({
+                    'id': k.get('id'),
                     'name': k['name'],
                     'participantCount': k['participantCount']
                 })
-            
-            # 다음 페이지 확인
-            next_cursor = paging.get('nextCursor')
-            if not next_cursor:
-                break
-            
-            cursor = next_cursor
-            
-            # Rate limiting 방지
-            if sleep_sec > 0:
-                time.sleep(sleep_sec)
-                
-        except requests.RequestException as e:
-            raise requests.RequestException(f"키워드 조회 실패: {str(e)}")
+
+            page = KeywordPage(
+                keywords=keywords,
+                total=paging.get('total'),
+                next_cursor=paging.get('nextCursor'),
+            )
+
+        except httpx.HTTPError as e:
+            raise httpx.HTTPError(f"키워드 조회 실패: {str(e)}")
         except (json.JSONDecodeError, KeyError) as e:
+            UPSTREAM_ERRORS.labels('getSearchCategoryKeywords', "parse").inc()
             raise ValueError(f"응답 파싱 실패: {str(e)}")
-    
-    return keywords
 
+        PAGES_FETCHED.labels(category_id).inc()
+        KEYWORDS_FETCHED.labels(category_id).inc(len(page.keywords))
+
+        # 내보내기 전에 기록 (소비자가 중간에 멈춰도 받은 페이지까지는 보존)
+        if journal is not None:
+            if page.next_cursor:
+                await asyncio.to_thread(
+                    journal.append_page, category_id, page.keywords, page.next_cursor, page.total
+                )
+            else:
+                await asyncio.to_thread(journal.clear, category_id)
 
-def get_all_keywords(category_id: str, sleep_sec: float = 2.0) -> Dict[str, List[Dict]]:
+        yield page
+
+        # 다음 페이지 확인
+        if not page.next_cursor:
+            break
+
+        cursor = page.next_cursor
+
+        # Rate limiting 방지 (이벤트 루프를 막지 않음)
+        await pacer.wait()
+
+
+async def fetch_all_keywords_async(
+    category_id: str,
+    sleep_sec: float = 2.0,
+    limiter: Optional[TokenBucket] = None,
+    on_page: Optional[Callable[[int], None]] = None,
+    pacer: Optional[AdaptivePacer] = None,
+    journal: Optional[CrawlJournal] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    min_participants: Optional[int] = None,
+) -> KeywordBatch:
     """
-    추천 + 일반 키워드 모두 조회
-    
+    카테고리의 모든 키워드 조회 (페이지네이션, 비동기)
+
+    iter_keyword_pages_async의 페이지를 하나의 KeywordBatch로 모읍니다.
+    (행마다 딕셔너리를 보관하지 않는 컬럼형 표현)
+
+    limit을 지정하면 조건에 맞는 키워드가 그만큼 모이는 즉시 페이지네이션을 멈추므로,
+    미리보기처럼 앞부분만 필요할 때는 첫 페이지 하나로 끝날 수 있습니다.
+
     Args:
         category_id: 카테고리 ID
-        sleep_sec: 요청 간 대기 시간 (초)
-        
+        sleep_sec: 시작 요청 간 대기 시간 (초, pacer 미지정 시에만 사용)
+        limiter: 공유 속도 제한기
+        on_page: 페이지 수신 시 호출할 콜백 (해당 페이지 키워드 수 전달)
+        pacer: 공유 간격 조절기 (None이면 sleep_sec로 시작하는 새 조절기 사용)
+        journal: 체크포인트 저널 (지정 시 중단된 수집을 이어서 진행)
+        limit: 최대 개수 (None이면 전부)
+        offset: 건너뛸 개수 (min_participants 적용 후 기준)
+        min_participants: 최소 참여자수 (미만이거나 참여자수가 없으면 제외)
+
     Returns:
-        {'recomm': [...], 'normal': [...]}
-        
+        KeywordBatch (반복 시 {'name': '키워드명', 'participantCount': 123})
+
     Raises:
-        requests.RequestException: 네트워크 오류
+        httpx.HTTPError: 네트워크 오류
         ValueError: GraphQL 응답 오류
     """
-    recomm = fetch_recommend_keywords(category_id)
-    normal = fetch_all_keywords(category_id, sleep_sec)
-    
-    return {
-        'recomm': recomm,
-        'normal': normal
-    }
+    keywords = KeywordBatch()
+    bounded = limit is not None or offset > 0 or min_participants is not None
+    skipped = 0
+
+    pages = iter_keyword_pages_async(category_id, sleep_sec, limiter, pacer, journal)
+    try:
+        async for page in pages:
+            if on_page is not None:
+                on_page(len(page.keywords))
+            if not bounded:
+                keywords.extend(page.keywords)
+                continue
+
+            for k in page.keywords:
+                count = k['participantCount']
+                if min_participants is not None and (count is None or count < min_participants):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                keywords.append(k['name'], count)
+                if limit is not None and len(keywords) >= limit:
+                    # 충분히 모였으면 남은 페이지는 요청하지 않음
+                    return keywords
+    finally:
+        await pages.aclose()
+
+    return keywords
+
+
+async def try_fetch_recommend_keywords_async(
+    category_id: str,
+    limiter: Optional[TokenBucket] = None,
+    timeout: Optional[float] = RECOMMEND_TIMEOUT,
+) -> Tuple[KeywordBatch, Optional[str]]:
+    """
+    추천 키워드 조회 (실패해도 예외 없이 오류 메시지 반환)
+
+    회로 차단 중(half-open 포함)에는 요청을 보내지 않아, 시험 요청은 일반 키워드 첫 페이지가 사용합니다.
+
+    Args:
+        category_id: 카테고리 ID
+        limiter: 공유 속도 제한기
+        timeout: 제한 시간 (초, None이면 제한 없음)
+
+    Returns:
+        (추천 KeywordBatch, None) 또는 실패/시간 초과 시 (빈 KeywordBatch, 오류 메시지)
+    """
+    breaker = get_default_breaker()
+    try:
+        if breaker.enabled and breaker.state != CircuitBreaker.CLOSED:
+            raise CircuitOpenError(breaker.name, max(breaker.retry_after, 1.0))
+        recomm = await asyncio.wait_for(fetch_recommend_keywords_async(category_id, limiter), timeout)
+        return recomm, None
+    except asyncio.TimeoutError:
+        error = f"추천 키워드 조회 시간 초과 ({timeout}초)"
+    except (httpx.HTTPError, ValueError, CircuitOpenError) as e:
+        error = str(e)
+    logger.warning("추천 키워드 없이 진행 (%s): %s", category_id, error)
+    DEGRADED_RESULTS.labels("recomm").inc()
+    return KeywordBatch(), error
+
+
+def keywords_result(recomm: KeywordBatch, normal: KeywordBatch, recomm_error: Optional[str] = None) -> Dict:
+    """
+    키워드 조회 결과 딕셔너리 생성
+
+    Returns:
+        {'recomm': ..., 'normal': ...} (추천 키워드가 실패했으면 'recommError': 오류 메시지 추가)
+    """
+    result: Dict = {'recomm': recomm, 'normal': normal}
+    if recomm_error is not None:
+        result['recommError'] = recomm_error
+    return result
+
+
+def keywords_ttl(keywords: Dict) -> float:
+    """키워드 결과 캐시 유지 시간 (추천 키워드가 빠진 결과는 짧게 두어 곧 다시 시도)"""
+    return DEGRADED_CACHE_TTL if 'recommError' in keywords else KEYWORD_CACHE_TTL
+
+
+async def gather_keywords_async(
+    category_id: str,
+    normal: Awaitable[KeywordBatch],
+    limiter: Optional[TokenBucket] = None,
+    recomm_timeout: Optional[float] = RECOMMEND_TIMEOUT,
+    normal_timeout: Optional[float] = NORMAL_KEYWORDS_TIMEOUT,
+) -> Dict:
+    """
+    추천 키워드와 일반 키워드 수집을 동시에 진행
+
+    추천 키워드는 요청 하나라 일반 키워드 첫 페이지와 함께 끝나므로 전체 시간에 더해지지 않습니다.
+    추천 키워드가 실패하거나 시간을 넘기면 일반 키워드만 반환하고 'recommError'로 표시하며,
+    일반 키워드가 실패하면 추천 키워드 요청도 취소하고 예외를 그대로 전달합니다.
+
+    Args:
+        category_id: 카테고리 ID
+        normal: 일반 키워드 수집 코루틴
+        limiter: 추천 키워드 요청에 쓸 공유 속도 제한기
+        recomm_timeout: 추천 키워드 제한 시간 (초, None이면 제한 없음)
+        normal_timeout: 일반 키워드 수집 제한 시간 (초, None이면 제한 없음)
+
+    Returns:
+        keywords_result() 딕셔너리
+
+    Raises:
+        httpx.TimeoutException: 일반 키워드 수집 시간 초과
+        httpx.HTTPError: 일반 키워드 네트워크 오류
+        ValueError: 일반 키워드 GraphQL 응답 오류
+    """
+    recomm_task = asyncio.ensure_future(
+        try_fetch_recommend_keywords_async(category_id, limiter, recomm_timeout)
+    )
+    try:
+        try:
+            normal_keywords = await asyncio.wait_for(normal, normal_timeout)
+        except asyncio.TimeoutError:
+            DEGRADED_RESULTS.labels("normal").inc()
+            raise httpx.TimeoutException(f"일반 키워드 수집 시간 초과 ({normal_timeout}초)")
+    except BaseException:
+        recomm_task.cancel()
+        await asyncio.gather(recomm_task, return_exceptions=True)
+        raise
+
+    recomm, recomm_error = await recomm_task
+    return keywords_result(recomm, normal_keywords, recomm_error)
+
+
+async def get_all_keywords_async(
+    category_id: str,
+    sleep_sec: float = 2.0,
+    limiter: Optional[TokenBucket] = None,
+    on_page: Optional[Callable[[int], None]] = None,
+    pacer: Optional[AdaptivePacer] = None,
+    journal: Optional[CrawlJournal] = None,
+    store: Optional[SharedResultStore] = None,
+    recomm_timeout: Optional[float] = RECOMMEND_TIMEOUT,
+    normal_timeout: Optional[float] = NORMAL_KEYWORDS_TIMEOUT,
+) -> Dict:
+    """
+    추천 + 일반 키워드 모두 조회 (비동기, 두 수집을 동시에 진행)
+
+    Args:
+        category_id: 카테고리 ID
+        sleep_sec: 시작 요청 간 대기 시간 (초, pacer 미지정 시에만 사용)
+        limiter: 공유 속도 제한기
+        on_page: 일반 키워드 페이지 수신 시 호출할 콜백
+        pacer: 공유 간격 조절기
+        journal: 체크포인트 저널 (지정 시 중단된 수집을 이어서 진행)
+        store: 공유 결과 저장소 (지정 시 다른 프로세스의 결과를 재사용하고,
+            같은 카테고리는 여러 프로세스 중 한 곳에서만 수집)
+        recomm_timeout: 추천 키워드 제한 시간 (초, None이면 제한 없음)
+        normal_timeout: 일반 키워드 수집 제한 시간 (초, None이면 제한 없음)
+
+    Returns:
+        {'recomm': KeywordBatch, 'normal': KeywordBatch}
+        (추천 키워드가 실패/시간 초과하면 recomm은 비어 있고 'recommError': 오류 메시지 추가)
+
+    Raises:
+        httpx.HTTPError: 일반 키워드 네트워크 오류 / 시간 초과
+        ValueError: 일반 키워드 GraphQL 응답 오류
+    """
+    async def crawl() -> Dict:
+        return await gather_keywords_async(
+            category_id,
+            fetch_all_keywords_async(category_id, sleep_sec, limiter, on_page, pacer, journal),
+            limiter,
+            recomm_timeout,
+            normal_timeout,
+        )
+
+    if store is not None:
+        return await store.get_or_load(keywords_key(category_id), crawl, keywords_ttl, KEYWORDS_CODEC)
+    return await crawl()
+
+
+def _run_sync(coro: Awaitable[T]) -> T:
+    """
+    코루틴을 새 이벤트 루프에서 실행 (CLI용 동기 래퍼)
+
+    실행이 끝나면 해당 루프에 묶인 공유 클라이언트도 함께 정리합니다.
+    """
+    async def runner() -> T:
+        try:
+            return await coro
+        finally:
+            await close_client()
+
+    return asyncio.run(runner())
+
+
+def fetch_categories() -> List[Dict]:
+    """
+    네이버 인플루언서 카테고리 목록 조회 (동기 래퍼)
+
+    Returns:
+        카테고리 정보 리스트 [{'id': ..., 'name': ..., 'keywordCount': ...}, ...]
+        (공유 저장소에 신선한 목록이 있으면 그대로 사용)
+    """
+    return _run_sync(fetch_categories_async(store=get_default_shared_store()))
+
+
+def fetch_recommend_keywords(category_id: str) -> KeywordBatch:
+    """
+    추천 키워드 조회 (동기 래퍼)
+
+    Args:
+        category_id: 카테고리 ID
+
+    Returns:
+        KeywordBatch (반복 시 {'name': '키워드명', 'participantCount': 123})
+    """
+    return _run_sync(fetch_recommend_keywords_async(category_id))
+
+
+def fetch_all_keywords(category_id: str, sleep_sec: float = 2.0) -> KeywordBatch:
+    """
+    카테고리의 모든 키워드 조회 (동기 래퍼, 중단 시 이어서 수집)
+
+    Args:
+        category_id: 카테고리 ID
+        sleep_sec: 시작 요청 간 대기 시간 (초)
+
+    Returns:
+        KeywordBatch (반복 시 {'name': '키워드명', 'participantCount': 123})
+    """
+    return _run_sync(fetch_all_keywords_async(category_id, sleep_sec, journal=get_default_journal()))
+
+
+def get_all_keywords(category_id: str, sleep_sec: float = 2.0) -> Dict[str, KeywordBatch]:
+    """
+    추천 + 일반 키워드 모두 조회 (동기 래퍼, 중단 시 이어서 수집)
+
+    API 서버와 같은 공유 저장소를 사용하므로 서버가 최근에 수집한 카테고리는 다시 수집하지 않고,
+    서버가 수집 중인 카테고리는 그 수집이 끝나기를 기다립니다.
+
+    Args:
+        category_id: 카테고리 ID
+        sleep_sec: 시작 요청 간 대기 시간 (초)
+
+    Returns:
+        {'recomm': KeywordBatch, 'normal': KeywordBatch}
+    """
+    return _run_sync(get_all_keywords_async(
+        category_id, sleep_sec, journal=get_default_journal(), store=get_default_shared_store(),
+    ))
@@ -0,0 +1,498 @@
+"""
+키워드 검색 색인 모듈
+
+수집을 마친 카테고리의 키워드를 로컬에 색인해, 네이버에 다시 요청하지 않고
+"'캠핑'이 들어간 키워드가 있는 카테고리", "X가 들어간 참여자수 상위 키워드"를 바로 찾습니다.
+
+- 카테고리 하나가 세그먼트 하나: 수집이 끝날 때마다 그 카테고리 세그먼트만 새로 만들어 교체 (증분 갱신)
+- 세그먼트 안의 문서 번호는 참여자수 내림차순으로 매기므로, n-gram 역색인의 문서 번호 목록이
+  그대로 참여자수 순으로 정렬된 열이 됨 -> 여러 세그먼트를 heapq.merge로 합쳐 상위 limit개에서 멈춤
+- 한글 검색: NFC 정규화 + 대소문자/공백 무시, 글자 1-gram + 2-gram 색인
+  (한글 키워드는 두 음절 단어가 많아 2-gram이면 대부분 색인 조회만으로 결과가 확정되고,
+  세 글자 이상은 가장 짧은 목록만 부분 문자열로 확인)
+- 초성 검색: 'ㅋㅍ'처럼 초성만 입력하면 키워드명의 초성열('캠핑' -> 'ㅋㅍ')에서 찾음
+- 세그먼트(키워드 열 + 역색인)는 SQLite에 저장하므로 재시작 시 다시 만들지 않고 읽기만 하며,
+  다른 프로세스(API 워커, CLI)가 갱신한 카테고리는 지문(fingerprint)을 비교해 다시 읽음
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .batch import MISSING_COUNT, Keywords, iter_rows
+from .config import SEARCH_INDEX_DB_PATH, SEARCH_REFRESH_INTERVAL
+
+# 한글 음절 (가 ~ 힣) 과 초성 (음절 코드 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성)
+_HANGUL_FIRST = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_SYLLABLES_PER_INITIAL = 21 * 28
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(CHOSEONG)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# 역색인 종류
+_GRAMS = 0  # 정규화한 키워드명
+_INITIALS = 1  # 초성열
+
+SEARCH_SORTS = ("participants", "name")
+
+
+def normalize(text: str) -> str:
+    """
+    검색용 정규화 (NFC, 대소문자 무시, 공백 제거)
+
+    NFKC는 호환용 자모('ㄱ')를 첫가끝 자모로 바꿔 초성 검색을 깨뜨리므로 NFC를 사용합니다.
+    """
+    return _WHITESPACE.sub("", unicodedata.normalize("NFC", text).casefold())
+
+
+def initials(text: str) -> str:
+    """한글 음절을 초성으로 바꾼 문자열 ('캠핑 추천' -> 'ㅋㅍ ㅊㅊ', 다른 문자는 그대로)"""
+    return "".join(
+        CHOSEONG[(ord(c) - _HANGUL_FIRST) // _SYLLABLES_PER_INITIAL]
+        if _HANGUL_FIRST <= ord(c) <= _HANGUL_LAST else c
+        for c in text
+    )
+
+
+def is_initials_query(query: str) -> bool:
+    """초성으로만 이루어진 검색어인지 (정규화 후 기준)"""
+    return bool(query) and all(c in _CHOSEONG_SET for c in query)
+
+
+def _grams(text: str) -> Iterator[str]:
+    # 색인할 1-gram, 2-gram
+    yield from text
+    for i in range(len(text) - 1):
+        yield text[i:i + 2]
+
+
+def _query_grams(query: str) -> List[str]:
+    # 검색어를 모두 포함하는 문서는 이 gram들을 모두 가짐
+    if len(query) == 1:
+        return [query]
+    return list({query[i:i + 2] for i in range(len(query) - 1)})
+
+
+def _fingerprint(names: Sequence[str], counts: array) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\n".join(names).encode("utf-8"))
+    digest.update(counts.tobytes())
+    return digest.hexdigest()
+
+
+def _ranked(segment: "Segment", docs: Sequence[int], index: int) -> Iterator[Tuple[int, int, int]]:
+    # (-참여자수, 세그먼트 순서, 문서 번호) - 세그먼트 안에서는 이미 이 순서
+    counts = segment.counts
+    return ((-counts[doc], index, doc) for doc in docs)
+
+
+class Segment:
+    """
+    카테고리 하나의 색인 (문서 번호 = 참여자수 내림차순 순위)
+
+    Args:
+        category_id: 카테고리 ID
+        category_name: 카테고리 이름 (모르면 None)
+        names: 키워드명 (참여자수 내림차순)
+        counts: 참여자수 (null은 MISSING_COUNT, names와 같은 순서)
+        postings: {종류: {gram: 문서 번호 array}}
+        fingerprint: 키워드 목록 지문
+        updated_at: 색인 시각
+    """
+
+    __slots__ = (
+        'category_id', 'category_name', 'names', 'counts', 'postings', 'fingerprint', 'updated_at',
+        '_texts',
+    )
+
+    def __init__(
+        self,
+        category_id: str,
+        category_name: Optional[str],
+        names: List[str],
+        counts: array,
+        postings: Dict[int, Dict[str, array]],
+        fingerprint: str,
+        updated_at: float,
+    ):
+        self.category_id = category_id
+        self.category_name = category_name
+        self.names = names
+        self.counts = counts
+        self.postings = postings
+        self.fingerprint = fingerprint
+        self.updated_at = updated_at
+        # 부분 문자열 확인용 정규화 이름/초성열 (세 글자 이상 검색에서 처음 필요할 때 생성)
+        self._texts: Dict[int, List[str]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        category_id: str,
+        keywords: Keywords,
+        category_name: Optional[str] = None,
+    ) -> "Segment":
+        """키워드 묶음으로 세그먼트 생성"""
+        rows = sorted(
+            ((name, MISSING_COUNT if count is None else count) for name, count in iter_rows(keywords)),
+            key=lambda row: -row[1],
+        )
+        names = [name for name, _ in rows]
+        counts = array('l', (count for _, count in rows))
+        postings: Dict[int, Dict[str, array]] = {_GRAMS: {}, _INITIALS: {}}
+        grams, initial_grams = postings[_GRAMS], postings[_INITIALS]
+        for doc, name in enumerate(names):
+            text = normalize(name)
+            for gram in set(_grams(text)):
+                docs = grams.get(gram)
+                if docs is None:
+                    docs = grams[gram] = array('I')
+                docs.append(doc)
+            chosung = initials(text)
+            if chosung != text:
+                for gram in set(_grams(chosung)):
+                    docs = initial_grams.get(gram)
+                    if docs is None:
+                        docs = initial_grams[gram] = array('I')
+                    docs.append(doc)
+        return cls(category_id, category_name, names, counts, postings, _fingerprint(names, counts), time.time())
+
+    def _text(self, kind: int, doc: int) -> str:
+        texts = self._texts.get(kind)
+        if texts is None:
+            texts = [normalize(name) for name in self.names]
+            if kind == _INITIALS:
+                texts = [initials(text) for text in texts]
+            self._texts[kind] = texts
+        return texts[doc]
+
+    def match(self, query: str, kind: int) -> Sequence[int]:
+        """
+        정규화한 검색어를 포함하는 문서 번호 (오름차순 = 참여자수 내림차순)
+
+        Args:
+            query: 정규화한 검색어
+            kind: 역색인 종류 (_GRAMS | _INITIALS)
+        """
+        postings = self.postings[kind]
+        lists = []
+        for gram in _query_grams(query):
+            docs = postings.get(gram)
+            if docs is None:
+                return ()
+            lists.append(docs)
+        smallest = min(lists, key=len)
+        if len(query) <= 2:
+            # 검색어 자체가 gram이므로 색인 목록이 곧 결과
+            return smallest
+        return [doc for doc in smallest if query in self._text(kind, doc)]
+
+    @property
+    def gram_count(self) -> int:
+        return sum(len(grams) for grams in self.postings.values())
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@dataclass
+class SearchHit:
+    """검색 결과 키워드 하나"""
+    category_id: str
+    name: str
+    participant_count: Optional[int]
+
+    def as_dict(self) -> Dict:
+        return {'categoryId': self.category_id, 'name': self.name, 'participantCount': self.participant_count}
+
+
+@dataclass
+class SearchResult:
+    """검색 결과"""
+    query: str
+    total: int = 0  # 조건에 맞는 전체 키워드 수
+    categories: List[Dict] = field(default_factory=list)  # 카테고리별 일치 수 (많은 순)
+    items: List[SearchHit] = field(default_factory=list)
+    initials: bool = False  # 초성 검색 여부
+    elapsed: float = 0.0
+
+    def as_dict(self) -> Dict:
+        return {
+            'query': self.query,
+            'initials': self.initials,
+            'total': self.total,
+            'categories': self.categories,
+            'items': [hit.as_dict() for hit in self.items],
+            'tookMs': round(self.elapsed * 1000, 3),
+        }
+
+
+@dataclass
+class SearchIndexStats:
+    """색인 사용 통계"""
+    searches: int = 0
+    updates: int = 0  # 새로 색인한 카테고리 수
+    unchanged: int = 0  # 키워드가 그대로여서 건너뛴 갱신 수
+    reloads: int = 0  # 디스크(다른 프로세스 갱신 포함)에서 읽은 세그먼트 수
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(self.__dict__)
+
+
+class SearchIndex:
+    """
+    카테고리별 세그먼트로 이루어진 키워드 검색 색인 (SQLite 저장)
+
+    Args:
+        path: SQLite 파일 경로
+        refresh_interval: 다른 프로세스가 갱신한 세그먼트를 확인하는 최소 간격 (초)
+    """
+
+    def __init__(self, path: str = SEARCH_INDEX_DB_PATH, refresh_interval: float = SEARCH_REFRESH_INTERVAL):
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.stats = SearchIndexStats()
+        self._segments: Dict[str, Segment] = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS search_segments (
+                    category_id TEXT PRIMARY KEY,
+                    category_name TEXT,
+                    fingerprint TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    names TEXT NOT NULL,
+                    counts BLOB NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS search_postings (
+                    category_id TEXT NOT NULL,
+                    kind INTEGER NOT NULL,
+                    gram TEXT NOT NULL,
+                    docs BLOB NOT NULL,
+                    PRIMARY KEY (category_id, kind, gram)
+                ) WITHOUT ROWID;
+            """)
+            self._initialized = True
+        return conn
+
+    def update(self, category_id: str, keywords: Keywords, category_name: Optional[str] = None) -> bool:
+        """
+        카테고리 세그먼트 교체 (수집을 끝까지 마친 결과로)
+
+        Args:
+            category_id: 카테고리 ID
+            keywords: 일반 키워드 (KeywordBatch / KeywordView / 딕셔너리 리스트)
+            category_name: 카테고리 이름 (None이면 기존 이름 유지)
+
+        Returns:
+            새로 색인했으면 True, 키워드가 그대로여서 건너뛰었으면 False
+        """
+        segment = Segment.build(category_id, keywords, category_name)
+        with self._lock:
+            current = self._segments.get(category_id)
+            if current is not None:
+                segment.category_name = segment.category_name or current.category_name
+                if current.fingerprint == segment.fingerprint and current.category_name == segment.category_name:
+                    self.stats.unchanged += 1
+                    return False
+            self._save(segment)
+            self._segments[category_id] = segment
+            self.stats.updates += 1
+        return True
+
+    def _save(self, segment: Segment) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM search_postings WHERE category_id = ?", (segment.category_id,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_segments "
+                    "(category_id, category_name, fingerprint, updated_at, names, counts) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        segment.category_id,
+                        segment.category_name,
+                        segment.fingerprint,
+                        segment.updated_at,
+                        json.dumps(segment.names, ensure_ascii=False),
+                        segment.counts.tobytes(),
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO search_postings (category_id, kind, gram, docs) VALUES (?, ?, ?, ?)",
+                    (
+                        (segment.category_id, kind, gram, docs.tobytes())
+                        for kind, grams in segment.postings.items()
+                        for gram, docs in grams.items()
+                    ),
+                )
+        finally:
+            conn.close()
+
+    def _load(self, conn: sqlite3.Connection, category_id: str) -> Optional[Segment]:
+        row = conn.execute(
+            "SELECT category_name, fingerprint, updated_at, names, counts FROM search_segments WHERE category_id = ?",
+            (category_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        category_name, fingerprint, updated_at, names, counts_blob = row
+        counts = array('l')
+        counts.frombytes(counts_blob)
+        postings: Dict[int, Dict[str, array]] = {_GRAMS: {}, _INITIALS: {}}
+        for kind, gram, blob in conn.execute(
+            "SELECT kind, gram, docs FROM search_postings WHERE category_id = ?", (category_id,)
+        ):
+            docs = array('I')
+            docs.frombytes(blob)
+            postings[kind][gram] = docs
+        return Segment(category_id, category_name, json.loads(names), counts, postings, fingerprint, updated_at)
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        디스크의 세그먼트 목록과 맞춤 (처음 호출 시 전체 읽기, 이후 바뀐 카테고리만)
+
+        Args:
+            force: refresh_interval과 관계없이 확인
+        """
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.refresh_interval:
+            return
+        self._checked_at = now
+
+        conn = self._connect()
+        try:
+            stored = dict(conn.execute("SELECT category_id, fingerprint FROM search_segments"))
+            with self._lock:
+                for category_id in list(self._segments):
+                    if category_id not in stored:
+                        del self._segments[category_id]
+                for category_id, fingerprint in stored.items():
+                    current = self._segments.get(category_id)
+                    if current is not None and current.fingerprint == fingerprint:
+                        continue
+                    segment = self._load(conn, category_id)
+                    if segment is not None:
+                        self._segments[category_id] = segment
+                        self.stats.reloads += 1
+        finally:
+            conn.close()
+
+    def search(
+        self,
+        query: str,
+        categories: Optional[Iterable[str]] = None,
+        sort: str = "participants",
+        limit: int = 50,
+    ) -> SearchResult:
+        """
+        키워드 검색
+
+        Args:
+            query: 검색어 (공백/대소문자 무시, 초성만 입력하면 초성 검색)
+            categories: 검색할 카테고리 ID (None이면 전체)
+            sort: 'participants' (참여자수 내림차순, 동률은 카테고리 ID 순) | 'name' (키워드명 순)
+            limit: 최대 결과 수
+
+        Returns:
+            SearchResult (total과 카테고리별 일치 수는 limit과 관계없이 전체 기준)
+
+        Raises:
+            ValueError: 빈 검색어, 알 수 없는 정렬
+        """
+        started = time.perf_counter()
+        if sort not in SEARCH_SORTS:
+            raise ValueError(f"알 수 없는 정렬: {sort}")
+        normalized = normalize(query)
+        if not normalized:
+            raise ValueError("검색어를 입력하세요.")
+
+        self.refresh()
+        self.stats.searches += 1
+        kind = _INITIALS if is_initials_query(normalized) else _GRAMS
+
+        wanted = None if categories is None else set(categories)
+        matches: List[Tuple[Segment, Sequence[int]]] = []
+        for category_id, segment in sorted(self._segments.items()):
+            if wanted is not None and category_id not in wanted:
+                continue
+            docs = segment.match(normalized, kind)
+            if docs:
+                matches.append((segment, docs))
+
+        result = SearchResult(query=query, initials=kind == _INITIALS)
+        result.total = sum(len(docs) for _, docs in matches)
+        result.categories = sorted(
+            (
+                {'categoryId': segment.category_id, 'name': segment.category_name, 'matches': len(docs)}
+                for segment, docs in matches
+            ),
+            key=lambda c: -c['matches'],
+        )
+
+        if sort == "participants":
+            # 세그먼트마다 이미 참여자수 내림차순이므로 병합하며 limit개에서 멈춤
+            ranked = heapq.merge(*(
+                _ranked(segment, docs, index) for index, (segment, docs) in enumerate(matches)
+            ))
+            top = [(matches[index][0], doc) for _, index, doc in islice(ranked, limit)]
+        else:
+            top = heapq.nsmallest(
+                limit,
+                ((segment, doc) for segment, docs in matches for doc in docs),
+                key=lambda item: (item[0].names[item[1]], item[0].category_id),
+            )
+
+        result.items = [
+            SearchHit(
+                segment.category_id,
+                segment.names[doc],
+                None if segment.counts[doc] == MISSING_COUNT else segment.counts[doc],
+            )
+            for segment, doc in top
+        ]
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def summary(self) -> Dict:
+        """색인 크기 요약 (카테고리 수, 키워드 수, gram 수)"""
+        segments = list(self._segments.values())
+        return {
+            'categories': len(segments),
+            'keywords': sum(len(segment) for segment in segments),
+            'grams': sum(segment.gram_count for segment in segments),
+        }
+
+
+_default_index: Optional[SearchIndex] = None
+
+
+def get_default_search_index() -> SearchIndex:
+    """설정 경로(SEARCH_INDEX_DB_PATH)를 사용하는 공용 검색 색인 반환"""
+    global _default_index
+
+    if _default_index is None:
+        _default_index = SearchIndex()
+    return _default_index
@@ -0,0 +1,317 @@
+"""
+프로세스 간 공유 결과 저장소 모듈
+
+uvicorn --workers N, 여러 인스턴스, CLI(main.py)가 같은 데이터 디렉토리를 쓰면
+카테고리 목록과 카테고리별 키워드 결과를 SQLite(WAL) 파일 하나로 공유합니다.
+
+- shared_results: 키별 결과 (JSON, 키워드는 컬럼 단위로 저장)와 만료 시각
+- shared_leases: 키별 수집 임대(lease). 한 번에 한 프로세스만 같은 키를 수집하고,
+  나머지 프로세스는 임대가 풀릴 때까지 기다렸다가 저장된 결과를 읽습니다.
+
+임대는 수집하는 동안 주기적으로 연장되며, 수집하던 프로세스가 죽으면 SHARED_LEASE_TTL 뒤
+만료되어 다른 프로세스가 이어받습니다. (이어받은 수집은 체크포인트 저널로 중단 지점부터 진행)
+같은 프로세스 안의 동시 요청 병합은 AsyncTTLCache가 담당하므로 여기서는 다루지 않습니다.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from .batch import KeywordBatch
+from .config import SHARED_STORE_DB_PATH, SHARED_LEASE_TTL, SHARED_POLL_INTERVAL
+
+
+@dataclass
+class Codec:
+    """저장소에 넣고 뺄 때 쓰는 값 변환 함수 쌍"""
+    encode: Callable[[Any], str]
+    decode: Callable[[str], Any]
+
+
+def _encode_keywords(value: Dict[str, Any]) -> str:
+    # {'recomm': [[이름...], [참여자수...]], 'normal': ...} (행마다 딕셔너리를 만들지 않음)
+    columns = {}
+    for part, keywords in value.items():
+        if isinstance(keywords, str):
+            columns[part] = keywords  # recommError 등 부가 정보
+            continue
+        batch = keywords if isinstance(keywords, KeywordBatch) else KeywordBatch(keywords)
+        columns[part] = [batch.names, batch.counts.tolist()]
+    return json.dumps(columns, ensure_ascii=False)
+
+
+def _decode_keywords(payload: str) -> Dict[str, Any]:
+    return {
+        part: value if isinstance(value, str) else KeywordBatch.from_columns(*value)
+        for part, value in json.loads(payload).items()
+    }
+
+
+JSON_CODEC = Codec(lambda value: json.dumps(value, ensure_ascii=False), json.loads)
+KEYWORDS_CODEC = Codec(_encode_keywords, _decode_keywords)
+
+
+@dataclass
+class SharedResult:
+    """저장된 결과 하나"""
+    payload: str
+    created_at: float
+    expires_at: float
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+
+@dataclass
+class SharedStoreStats:
+    """저장소 사용 통계 (이 프로세스 기준)"""
+    hits: int = 0
+    loads: int = 0
+    waits: int = 0
+    lease_takeovers: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(self.__dict__)
+
+
+class SharedResultStore:
+    """
+    여러 프로세스가 함께 쓰는 결과 저장소 (SQLite)
+
+    Args:
+        path: SQLite 파일 경로
+        lease_ttl: 수집 임대 유지 시간 (초)
+        poll_interval: 다른 프로세스의 수집 완료 확인 간격 (초)
+    """
+
+    def __init__(
+        self,
+        path: str = SHARED_STORE_DB_PATH,
+        lease_ttl: float = SHARED_LEASE_TTL,
+        poll_interval: float = SHARED_POLL_INTERVAL,
+    ):
+        self.path = path
+        self.lease_ttl = lease_ttl
+        self.poll_interval = poll_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.stats = SharedStoreStats()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS shared_results (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS shared_leases (
+                    key TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                );
+            """)
+            self._initialized = True
+        return conn
+
+    def get(self, key: str) -> Optional[SharedResult]:
+        """저장된 결과 조회 (만료 여부 무관, 없으면 None)"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT payload, created_at, expires_at FROM shared_results WHERE key = ?", (key,),
+            ).fetchone()
+            return SharedResult(*row) if row else None
+        finally:
+            conn.close()
+
+    def get_fresh(self, key: str, codec: Codec = JSON_CODEC) -> Optional[Any]:
+        """아직 신선한 결과를 변환해 반환 (없거나 만료되었으면 None)"""
+        result = self.get(key)
+        if result is None or not result.is_fresh(time.time()):
+            return None
+        return codec.decode(result.payload)
+
+    def put(self, key: str, payload: str, ttl: float) -> None:
+        """
+        결과 저장 (같은 키는 덮어씀)
+
+        Args:
+            key: 결과 키
+            payload: 변환된 값 (Codec.encode 결과)
+            ttl: 신선 유지 시간 (초)
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO shared_results (key, payload, created_at, expires_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET payload = excluded.payload, "
+                    "created_at = excluded.created_at, expires_at = excluded.expires_at",
+                    (key, payload, now, now + ttl),
+                )
+        finally:
+            conn.close()
+
+    def put_value(self, key: str, value: Any, ttl: Union[float, Callable[[Any], float]], codec: Codec = JSON_CODEC) -> None:
+        """값을 codec으로 변환해 저장 (ttl은 초 또는 값을 받아 시간을 돌려주는 함수)"""
+        self.put(key, codec.encode(value), ttl(value) if callable(ttl) else ttl)
+
+    def invalidate(self, key: str) -> None:
+        """결과 삭제 (다음 조회 시 다시 수집)"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM shared_results WHERE key = ?", (key,))
+        finally:
+            conn.close()
+
+    def try_acquire(self, key: str) -> bool:
+        """
+        수집 임대 획득 시도
+
+        임대가 없거나 만료되었거나 이미 이 프로세스 것이면 획득합니다.
+        확인과 기록을 UPSERT 한 문장으로 처리하므로 여러 프로세스가 동시에 시도해도 하나만 성공합니다.
+
+        Returns:
+            획득 여부
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                previous = conn.execute(
+                    "SELECT owner FROM shared_leases WHERE key = ? AND expires_at <= ?", (key, now),
+                ).fetchone()
+                cursor = conn.execute(
+                    "INSERT INTO shared_leases (key, owner, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                    "WHERE shared_leases.expires_at <= ? OR shared_leases.owner = excluded.owner",
+                    (key, self.owner, now + self.lease_ttl, now),
+                )
+                acquired = cursor.rowcount > 0
+        finally:
+            conn.close()
+
+        if acquired and previous is not None and previous[0] != self.owner:
+            self.stats.lease_takeovers += 1
+        return acquired
+
+    def renew(self, key: str) -> bool:
+        """이 프로세스가 가진 임대 연장 (임대를 잃었으면 False)"""
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    "UPDATE shared_leases SET expires_at = ? WHERE key = ? AND owner = ?",
+                    (time.time() + self.lease_ttl, key, self.owner),
+                )
+                return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def release(self, key: str) -> None:
+        """이 프로세스가 가진 임대 반납"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM shared_leases WHERE key = ? AND owner = ?", (key, self.owner))
+        finally:
+            conn.close()
+
+    async def _keep_lease(self, key: str) -> None:
+        while True:
+            await asyncio.sleep(self.lease_ttl / 3)
+            await asyncio.to_thread(self.renew, key)
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Union[float, Callable[[Any], float]],
+        codec: Codec = JSON_CODEC,
+    ) -> Any:
+        """
+        저장된 결과 조회, 없거나 만료되었으면 임대를 얻어 loader로 수집
+
+        다른 프로세스가 같은 키를 수집 중이면 그 수집이 끝날 때까지 기다렸다가 결과를 읽습니다.
+        (그 수집이 실패하면 임대가 풀리므로 기다리던 프로세스 중 하나가 다시 수집)
+
+        Args:
+            key: 결과 키
+            loader: 값을 수집하는 코루틴 함수 (인자 없음)
+            ttl: 신선 유지 시간 (초, 값에 따라 정하려면 값을 받아 시간을 돌려주는 함수)
+            codec: 값 변환 함수
+
+        Returns:
+            저장된 값 또는 새로 수집한 값
+
+        Raises:
+            loader가 발생시킨 예외
+        """
+        # SQLite 호출(다른 프로세스가 쓰는 중이면 최대 30초 대기)과 변환은 이벤트 루프를 막지 않도록 스레드에서
+        waited = False
+        while True:
+            value = await asyncio.to_thread(self.get_fresh, key, codec)
+            if value is not None:
+                self.stats.hits += 1
+                return value
+            if await asyncio.to_thread(self.try_acquire, key):
+                break
+            if not waited:
+                self.stats.waits += 1
+                waited = True
+            await asyncio.sleep(self.poll_interval)
+
+        try:
+            # 조회와 임대 획득 사이에 다른 프로세스가 수집을 끝냈을 수 있음
+            value = await asyncio.to_thread(self.get_fresh, key, codec)
+            if value is not None:
+                self.stats.hits += 1
+                return value
+
+            keeper = asyncio.ensure_future(self._keep_lease(key))
+            try:
+                value = await loader()
+            finally:
+                keeper.cancel()
+
+            await asyncio.to_thread(self.put_value, key, value, ttl, codec)
+            self.stats.loads += 1
+            return value
+        finally:
+            await asyncio.to_thread(self.release, key)
+
+
+def keywords_key(category_id: str) -> str:
+    """카테고리 키워드 결과 키"""
+    return f"keywords:{category_id}"
+
+
+CATEGORIES_KEY = "categories"
+
+_default_store: Optional[SharedResultStore] = None
+
+
+def get_default_shared_store() -> SharedResultStore:
+    """설정 경로(SHARED_STORE_DB_PATH)를 사용하는 공용 저장소 반환"""
+    global _default_store
+
+    if _default_store is None:
+        _default_store = SharedResultStore()
+    return _default_store
@@ -0,0 +1,375 @@
+"""
+참여자수 추이 분석 모듈
+
+수집을 끝까지 마칠 때마다 카테고리별 참여자수 스냅샷을 컬럼 파일로 쌓아 두고,
+"최근 N번 수집 동안 가장 많이 늘어난 키워드"를 텍스트 파일 비교 없이 바로 계산합니다.
+
+- 저장: 카테고리마다 키워드명 파일(keys.txt, 행 번호 = 키워드 번호)과 참여자수 파일(counts.i32)을 두고,
+  스냅샷 하나는 그때까지 나온 모든 키워드 번호 순서의 int32 행 하나 (없는 키워드는 -1)
+- 스냅샷 목록(시각, 파일 위치)은 SQLite에 기록하며, 기록은 BEGIN IMMEDIATE 안에서 하므로
+  여러 프로세스(API 워커, CLI)가 함께 써도 파일이 섞이지 않음 (기록 도중 중단된 꼬리는 다음 기록 때 잘라냄)
+- 분석: 최근 window개 스냅샷을 numpy memmap으로 읽어 (스냅샷 x 키워드) 행렬을 만들고
+  변화량 / 증가율 / 이동 평균 / 상위 K개(argpartition)를 키워드 반복 없이 한 번에 계산
+
+기록은 표준 라이브러리만 쓰고, 분석에는 numpy가 필요합니다 (선택 의존성, 없으면 TrendsUnavailable).
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .batch import MISSING_COUNT, Keywords, iter_rows
+from .config import TRENDS_ENABLED, TRENDS_DIR, TRENDS_MIN_INTERVAL, TRENDS_MIN_BASE
+
+# numpy가 설치되어 있어야 추이를 계산 (선택 의존성, 스냅샷 기록에는 필요 없음)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 참여자수 저장 형식 (int32 little-endian, 넘는 값은 최대값으로 저장)
+_COUNT_TYPECODE = 'i'
+_COUNT_DTYPE = '<i4'
+_COUNT_BYTES = 4
+_COUNT_MAX = 2**31 - 1
+
+SORT_KEYS = ("change", "rate")
+
+
+class TrendsUnavailable(Exception):
+    """numpy가 없어 추이를 계산할 수 없음"""
+
+
+@dataclass
+class Snapshot:
+    """스냅샷 하나의 위치 (offset / length 는 참여자수 개수 단위)"""
+    taken_at: float
+    offset: int
+    length: int
+
+
+def _sanitize(name: str) -> str:
+    """keys.txt 한 줄에 들어가도록 줄바꿈 제거"""
+    return name.replace("\r", " ").replace("\n", " ")
+
+
+class TrendStore:
+    """
+    카테고리별 참여자수 스냅샷 저장소
+
+    Args:
+        directory: 저장 디렉토리 (카테고리별 하위 디렉토리 + index.sqlite3)
+        min_interval: 같은 카테고리 스냅샷 최소 간격 (초, 그보다 자주 수집해도 기록하지 않음)
+    """
+
+    def __init__(self, directory: str = TRENDS_DIR, min_interval: float = TRENDS_MIN_INTERVAL):
+        self.directory = directory
+        self.min_interval = min_interval
+        self.path = os.path.join(directory, "index.sqlite3")
+        self._initialized = False
+        self._lock = threading.Lock()
+        # 카테고리별 키워드명 목록과 이름 -> 번호 (다른 프로세스가 늘렸으면 다시 읽음)
+        self._keys: Dict[str, Tuple[List[str], Dict[str, int]]] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            os.makedirs(self.directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS trend_categories (
+                    category_id TEXT PRIMARY KEY,
+                    key_count INTEGER NOT NULL,
+                    keys_bytes INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS trend_snapshots (
+                    category_id TEXT NOT NULL,
+                    taken_at REAL NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_trend_snapshots_category
+                    ON trend_snapshots (category_id, taken_at);
+            """)
+            self._initialized = True
+        return conn
+
+    def _paths(self, category_id: str) -> Tuple[str, str]:
+        directory = os.path.join(self.directory, category_id.replace(os.sep, "_"))
+        return os.path.join(directory, "keys.txt"), os.path.join(directory, "counts.i32")
+
+    def _read_keys(self, category_id: str, key_count: int) -> Tuple[List[str], Dict[str, int]]:
+        """키워드명 목록 (key_count개, 보관한 목록이 같으면 다시 읽지 않음)"""
+        cached = self._keys.get(category_id)
+        if cached is not None and len(cached[0]) == key_count:
+            return cached
+        keys_path, _ = self._paths(category_id)
+        names: List[str] = []
+        if key_count:
+            with open(keys_path, encoding="utf-8", newline="\n") as f:
+                names = f.read().split("\n", key_count)[:key_count]
+        cached = (names, {name: index for index, name in enumerate(names)})
+        self._keys[category_id] = cached
+        return cached
+
+    # ---- 기록 ----
+
+    def append(self, category_id: str, keywords: Keywords, taken_at: Optional[float] = None) -> bool:
+        """
+        스냅샷 하나 기록
+
+        Args:
+            category_id: 카테고리 ID
+            keywords: 끝까지 수집한 일반 키워드
+            taken_at: 수집 시각 (None이면 현재)
+
+        Returns:
+            기록 여부 (마지막 스냅샷이 min_interval 안이면 False)
+        """
+        taken_at = time.time() if taken_at is None else taken_at
+        keys_path, counts_path = self._paths(category_id)
+        with self._lock:
+            conn = self._connect()
+            try:
+                # 다른 프로세스의 기록과 겹치지 않도록 쓰기 잠금을 먼저 잡음
+                conn.execute("BEGIN IMMEDIATE")
+                last = conn.execute(
+                    "SELECT taken_at, offset, length FROM trend_snapshots WHERE category_id = ? "
+                    "ORDER BY taken_at DESC LIMIT 1", (category_id,),
+                ).fetchone()
+                if last is not None and taken_at - last[0] < self.min_interval:
+                    conn.rollback()
+                    return False
+                row = conn.execute(
+                    "SELECT key_count, keys_bytes FROM trend_categories WHERE category_id = ?", (category_id,),
+                ).fetchone()
+                key_count, keys_bytes = row if row else (0, 0)
+                counts_end = last[1] + last[2] if last else 0
+
+                names, index = self._read_keys(category_id, key_count)
+                added: List[str] = []
+                values = array(_COUNT_TYPECODE, [MISSING_COUNT]) * key_count
+                for name, count in iter_rows(keywords):
+                    name = _sanitize(name)
+                    position = index.get(name)
+                    if position is None:
+                        position = index[name] = len(names)
+                        names.append(name)
+                        added.append(name)
+                        values.append(MISSING_COUNT)
+                    values[position] = MISSING_COUNT if count is None else min(count, _COUNT_MAX)
+
+                os.makedirs(os.path.dirname(keys_path), exist_ok=True)
+                new_keys = "".join(f"{name}\n" for name in added).encode("utf-8")
+                # 이전 기록이 중간에 끊겼으면 커밋된 길이까지 잘라낸 뒤 이어 씀
+                for path, size, data in (
+                    (keys_path, keys_bytes, new_keys),
+                    (counts_path, counts_end * _COUNT_BYTES, values.tobytes()),
+                ):
+                    with open(path, "ab") as f:
+                        f.truncate(size)
+                        f.write(data)
+                        f.flush()
+                        os.fsync(f.fileno())
+
+                conn.execute(
+                    "INSERT INTO trend_snapshots (category_id, taken_at, offset, length) VALUES (?, ?, ?, ?)",
+                    (category_id, taken_at, counts_end, len(values)),
+                )
+                conn.execute(
+                    "INSERT INTO trend_categories (category_id, key_count, keys_bytes) VALUES (?, ?, ?) "
+                    "ON CONFLICT(category_id) DO UPDATE SET key_count = excluded.key_count, "
+                    "keys_bytes = excluded.keys_bytes",
+                    (category_id, len(names), keys_bytes + len(new_keys)),
+                )
+                conn.commit()
+                return True
+            except BaseException:
+                conn.rollback()
+                # 보관한 키워드 목록에 커밋되지 않은 이름이 들어갔을 수 있음
+                self._keys.pop(category_id, None)
+                raise
+            finally:
+                conn.close()
+
+    # ---- 조회 ----
+
+    def snapshots(self, category_id: str) -> List[Snapshot]:
+        """카테고리 스냅샷 목록 (오래된 순)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT taken_at, offset, length FROM trend_snapshots WHERE category_id = ? ORDER BY taken_at",
+                (category_id,),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [Snapshot(*row) for row in rows]
+
+    def categories(self) -> Dict[str, int]:
+        """기록된 카테고리별 스냅샷 수"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT category_id, COUNT(*) FROM trend_snapshots GROUP BY category_id",
+            ).fetchall()
+        finally:
+            conn.close()
+        return dict(rows)
+
+    def matrix(self, category_id: str, window: int):
+        """
+        최근 window개 스냅샷의 (스냅샷 x 키워드) 참여자수 행렬
+
+        Returns:
+            (수집 시각 배열, int32 행렬 - 그 스냅샷에 없던 키워드는 -1, 키워드명 목록)
+
+        Raises:
+            TrendsUnavailable: numpy 없음
+        """
+        if np is None:
+            raise TrendsUnavailable("참여자수 추이 계산에는 numpy가 필요합니다 (pip install numpy)")
+        snapshots = self.snapshots(category_id)[-window:]
+        if not snapshots:
+            return np.empty(0), np.empty((0, 0), dtype=np.int32), []
+        width = max(s.length for s in snapshots)
+        _, counts_path = self._paths(category_id)
+        end = snapshots[-1].offset + snapshots[-1].length
+        column = np.memmap(counts_path, dtype=_COUNT_DTYPE, mode="r", shape=(end,))
+        counts = np.full((len(snapshots), width), MISSING_COUNT, dtype=np.int32)
+        for row, snapshot in enumerate(snapshots):
+            counts[row, :snapshot.length] = column[snapshot.offset:snapshot.offset + snapshot.length]
+        del column
+        with self._lock:
+            cached = self._keys.get(category_id)
+            if cached is not None and len(cached[0]) >= width:
+                names = cached[0][:width]
+            else:
+                names, _ = self._read_keys(category_id, width)
+        taken_at = np.array([s.taken_at for s in snapshots], dtype=np.float64)
+        return taken_at, counts, names
+
+    def trends(self, category_id: str, window: int, k: int, sort: str = "change") -> Optional[Dict]:
+        """
+        카테고리 참여자수 추이 (최근 window개 스냅샷)
+
+        Returns:
+            compute_trends 결과 + 'categoryId', 'snapshots'(전체 스냅샷 수) (스냅샷이 2개 미만이면 None)
+
+        Raises:
+            TrendsUnavailable: numpy 없음
+            ValueError: window가 2 미만이거나 k가 1 미만
+        """
+        if window < 2 or k < 1:
+            raise ValueError(f"window는 2 이상, k는 1 이상이어야 합니다 (window={window}, k={k})")
+        taken_at, counts, names = self.matrix(category_id, window)
+        if len(taken_at) < 2:
+            return None
+        result = compute_trends(taken_at, counts, names, k, sort)
+        return {'categoryId': category_id, 'snapshots': len(self.snapshots(category_id)), **result}
+
+
+def compute_trends(taken_at, counts, names: List[str], k: int, sort: str = "change", min_base: int = TRENDS_MIN_BASE) -> Dict:
+    """
+    (스냅샷 x 키워드) 행렬에서 변화량 / 증가율 / 이동 평균 / 상위 K개 계산
+
+    키워드마다 기준값은 구간 안에서 처음 확인된 참여자수, 현재값은 마지막 스냅샷의 참여자수입니다.
+    마지막 스냅샷에 없는 키워드는 순위에서 빼고 'removed'로만 셉니다.
+
+    Args:
+        taken_at: 스냅샷 수집 시각 배열 (오래된 순)
+        counts: int32 행렬 (없는 값 -1)
+        names: 키워드명 목록 (열 번호 순)
+        k: 늘어난 / 줄어든 키워드 각각 최대 개수
+        sort: change(변화량) | rate(증가율, 기준값 min_base 이상만)
+        min_base: 증가율 순위에 넣을 최소 기준값
+
+    Returns:
+        {'window', 'from', 'to', 'keywords', 'new', 'removed', 'takenAt', 'totals', 'gainers', 'losers'}
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"지원하지 않는 정렬: {sort}. 사용 가능: {SORT_KEYS}")
+    rows, width = counts.shape
+    valid = counts >= 0
+    seen = valid.any(axis=0)
+    first_row = valid.argmax(axis=0)  # 처음 확인된 스냅샷
+    columns = np.arange(width)
+    base = counts[first_row, columns].astype(np.int64)
+    current = counts[-1].astype(np.int64)
+    present = current >= 0
+
+    change = current - base
+    rate = change / np.maximum(base, 1)
+    values = np.where(valid, counts, 0)
+    observed = valid.sum(axis=0)
+    moving_average = values.sum(axis=0, dtype=np.int64) / np.maximum(observed, 1)
+    days = (taken_at[-1] - taken_at[first_row]) / 86400
+
+    rankable = present & (first_row < rows - 1)
+    if sort == "rate":
+        rankable &= base >= min_base
+        score = rate
+    else:
+        score = change.astype(np.float64)
+    score = np.where(rankable, score, np.nan)
+
+    def top(direction: int) -> List[Dict]:
+        signed = direction * score
+        candidates = np.flatnonzero(signed > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-signed[candidates], k - 1)[:k]]
+        ordered = candidates[np.lexsort((candidates, -signed[candidates]))]
+        series = counts[:, ordered].T
+        return [
+            {
+                'name': names[column],
+                'participantCount': int(current[column]),
+                'previous': int(base[column]),
+                'change': int(change[column]),
+                'growthRate': round(float(rate[column]), 4),
+                'perDay': round(float(change[column] / days[column]), 2) if days[column] > 0 else None,
+                'movingAverage': round(float(moving_average[column]), 2),
+                'series': [int(v) if v >= 0 else None for v in row],
+            }
+            for column, row in zip(ordered.tolist(), series)
+        ]
+
+    totals = values.sum(axis=1, dtype=np.int64)
+    return {
+        'window': rows,
+        'sort': sort,
+        'from': float(taken_at[0]),
+        'to': float(taken_at[-1]),
+        'keywords': int(present.sum()),
+        'new': int((present & ~valid[0]).sum()),
+        'removed': int((seen & ~present).sum()),
+        'takenAt': [float(t) for t in taken_at],
+        'totals': [int(t) for t in totals],
+        'gainers': top(1),
+        'losers': top(-1),
+    }
+
+
+_default_store: Optional[TrendStore] = None
+
+
+def get_default_trend_store() -> TrendStore:
+    """설정 경로(TRENDS_DIR)를 사용하는 공용 추이 저장소 반환"""
+    global _default_store
+
+    if _default_store is None:
+        _default_store = TrendStore()
+    return _default_store
+
+
+def record_snapshot(category_id: str, keywords: Keywords) -> bool:
+    """끝까지 수집한 일반 키워드를 공용 추이 저장소에 기록 (TRENDS_ENABLED가 꺼져 있으면 건너뜀)"""
+    if not TRENDS_ENABLED:
+        return False
+    return get_default_trend_store().append(category_id, keywords)
@@ -6,68 +6,202 @@
 
 import csv
 import io
-from typing import List, Dict
+import json
+import os
+import uuid
+from contextlib import contextmanager
+from typing import IO, Iterable, Iterator, List, Dict, Optional
 
-from .config import DEFAULT_FORMAT, SUPPORTED_FORMATS
+from .batch import Keywords, concat_keywords, iter_chunks, iter_rows
+from .config import DEFAULT_FORMAT, SUPPORTED_FORMATS, STREAM_FORMATS, EXPORT_CHUNK_ROWS
 
 
-def format_keywords_txt(keywords: List[Dict]) -> str:
+def encode_keyword_row(keyword: Dict, format: str) -> str:
+    """
+    키워드 한 행 인코딩 (모든 포맷 변환기가 공유하는 행 표현)
+    
+    Args:
+        keyword: {'name': ..., 'participantCount': ...}
+        format: 'txt' | 'tsv' | 'csv' | 'ndjson'
+        
+    Returns:
+        줄바꿈을 제외한 한 행 문자열 (csv는 행 종결자 포함)
+    """
+    return _encode_row(keyword['name'], keyword['participantCount'], format)
+
+
+def _encode_row(name: str, participant_count: Optional[int], format: str) -> str:
+    if format == "txt":
+        return name
+    if format == "tsv":
+        return f"{name}\t{participant_count}"
+    if format == "ndjson":
+        return json.dumps({'name': name, 'participantCount': participant_count}, ensure_ascii=False)
+    # csv: 따옴표/쉼표 이스케이프는 csv 모듈에 맡김
+    output = io.StringIO()
+    csv.writer(output).writerow([name, participant_count])
+    return output.getvalue()
+
+
+class KeywordWriter:
+    """
+    증분 포맷 변환기
+    
+    키워드를 페이지 단위로 받아 해당 부분의 텍스트만 반환합니다.
+    begin() + write(...) 반복 + end() 결과를 이어 붙이면 format_keywords_* 결과와 같습니다.
+    
+    Args:
+        format: 'txt' | 'tsv' | 'csv' | 'ndjson'
+        
+    Raises:
+        ValueError: 지원하지 않는 포맷
+    """
+    
+    def __init__(self, format: str):
+        if format not in STREAM_FORMATS:
+            raise ValueError(f"지원하지 않는 포맷: {format}. 사용 가능: {STREAM_FORMATS}")
+        self.format = format
+        self.rows = 0
+        self._csv_buffer = io.StringIO()
+        self._csv_writer = csv.writer(self._csv_buffer)
+    
+    def begin(self) -> str:
+        """시작 부분 (csv 헤더)"""
+        if self.format == "csv":
+            return self._encode_csv(['keyword', 'participantCount'])
+        return ""
+    
+    def write(self, keywords: Keywords) -> str:
+        """
+        키워드 여러 개 인코딩
+        
+        Args:
+            keywords: KeywordBatch / KeywordView / [{'name': ..., 'participantCount': ...}, ...]
+            
+        Returns:
+            인코딩된 텍스트 조각
+        """
+        if self.format == "csv":
+            # 행마다 StringIO를 만들지 않도록 writer 하나를 재사용
+            for row in iter_rows(keywords):
+                self._csv_writer.writerow(row)
+                self.rows += 1
+            return self._drain_csv()
+        
+        parts = []
+        for name, count in iter_rows(keywords):
+            row = _encode_row(name, count, self.format)
+            if self.format == "ndjson":
+                parts.append(row + "\n")
+            elif self.rows == 0:
+                parts.append(row)
+            else:
+                # txt/tsv는 행 사이에만 줄바꿈 (마지막 줄바꿈 없음)
+                parts.append("\n" + row)
+            self.rows += 1
+        return "".join(parts)
+    
+    def section_break(self) -> str:
+        """추천/일반 키워드 사이 구분 (txt 포맷만 빈 줄 추가)"""
+        if self.format == "txt" and self.rows > 0:
+            return "\n"
+        return ""
+    
+    def end(self) -> str:
+        """끝 부분"""
+        return ""
+    
+    def _encode_csv(self, row: List) -> str:
+        self._csv_writer.writerow(row)
+        return self._drain_csv()
+    
+    def _drain_csv(self) -> str:
+        text = self._csv_buffer.getvalue()
+        self._csv_buffer.seek(0)
+        self._csv_buffer.truncate()
+        return text
+
+
+def _format_keywords(keywords: Keywords, format: str) -> str:
+    writer = KeywordWriter(format)
+    return writer.begin() + writer.write(keywords) + writer.end()
+
+
+def format_keywords_txt(keywords: Keywords) -> str:
     """
     키워드명만 추출 (기존 CLI 방식)
     
     Args:
-        keywords: [{'name': ..., 'participantCount': ...}, ...]
+        keywords: KeywordBatch / KeywordView / [{'name': ..., 'participantCount': ...}, ...]
         
     Returns:
         키워드명을 줄바꿈으로 구분한 문자열
     """
-    return "\n".join(k['name'] for k in keywords)
+    return _format_keywords(keywords, "txt")
 
 
-def format_keywords_tsv(keywords: List[Dict]) -> str:
+def format_keywords_tsv(keywords: Keywords) -> str:
     """
     키워드명\t참여자수 형식 (TSV)
     
     Args:
-        keywords: [{'name': ..., 'participantCount': ...}, ...]
+        keywords: KeywordBatch / KeywordView / [{'name': ..., 'participantCount': ...}, ...]
         
     Returns:
         TSV 형식 문자열
     """
-    lines = []
-    for k in keywords:
-        lines.append(f"{k['name']}\t{k['participantCount']}")
-    return "\n".join(lines)
+    return _format_keywords(keywords, "tsv")
 
 
-def format_keywords_csv(keywords: List[Dict]) -> str:
+def format_keywords_csv(keywords: Keywords) -> str:
     """
     CSV 형식 (헤더 포함)
     
     Args:
-        keywords: [{'name': ..., 'participantCount': ...}, ...]
+        keywords: KeywordBatch / KeywordView / [{'name': ..., 'participantCount': ...}, ...]
         
     Returns:
         CSV 형식 문자열
     """
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # 헤더
-    writer.writerow(['keyword', 'participantCount'])
+    return _format_keywords(keywords, "csv")
+
+
+@contextmanager
+def atomic_write(filepath: str, mode: str = "wb", **kwargs) -> Iterator[IO]:
+    """
+    같은 디렉토리의 임시 파일에 쓴 뒤 끝나면 rename으로 교체
     
-    # 데이터
-    for k in keywords:
-        writer.writerow([k['name'], k['participantCount']])
+    쓰는 도중 실패하거나 중단돼도 기존 파일이 그대로 남고, 읽는 쪽은 완성된 파일만 봅니다.
     
-    return output.getvalue()
+    Args:
+        filepath: 최종 파일 경로
+        mode: open 모드 ('wb' | 'w')
+        **kwargs: open 옵션 (encoding 등)
+        
+    Yields:
+        임시 파일 객체
+    """
+    tmp_path = f"{filepath}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
 
 
 def save_keywords(
     category_name: str, 
     keywords: Dict[str, List[Dict]], 
     format: str = DEFAULT_FORMAT, 
-    include_recomm: bool = False
+    include_recomm: bool = False,
+    output_dir: str = "."
 ) -> str:
     """
     키워드 데이터를 파일로 저장
@@ -77,6 +211,7 @@ def save_keywords(
         keywords: {'recomm': [...], 'normal': [...]}
         format: 'txt' | 'tsv' | 'csv'
         include_recomm: 추천 키워드 포함 여부
+        output_dir: 저장 디렉토리 (없으면 생성)
         
     Returns:
         저장된 파일 경로
@@ -87,25 +222,50 @@ def save_keywords(
     if format not in SUPPORTED_FORMATS:
         raise ValueError(f"지원하지 않는 포맷: {format}. 사용 가능: {SUPPORTED_FORMATS}")
     
-    # 데이터 병합
-    data = keywords['normal'].copy()
+    # 데이터 병합 (복사 없이 이어 붙인 뷰)
+    data = keywords['normal']
     if include_recomm and keywords['recomm']:
-        data = keywords['recomm'] + data
-    
-    # 포맷 변환
-    if format == "txt":
-        content = format_keywords_txt(data)
-    elif format == "tsv":
-        content = format_keywords_tsv(data)
-    else:  # csv
-        content = format_keywords_csv(data)
+        data = concat_keywords(keywords['recomm'], data)
     
     # 파일 저장
     # 파일명에서 슬래시 제거 (기존 동작 유지)
     safe_filename = category_name.replace('/', '')
-    filepath = f"./{safe_filename}.{format}"
+    if output_dir == ".":
+        filepath = f"./{safe_filename}.{format}"
+    else:
+        os.makedirs(output_dir, exist_ok=True)
+        filepath = os.path.join(output_dir, f"{safe_filename}.{format}")
+    
+    # 전체 문자열을 만들지 않고 EXPORT_CHUNK_ROWS씩 변환해 임시 파일에 쓴 뒤 교체
+    writer = KeywordWriter(format)
+    with atomic_write(filepath, "w", encoding="utf-8") as f:
+        f.write(writer.begin())
+        for chunk in iter_chunks(data, EXPORT_CHUNK_ROWS):
+            f.write(writer.write(chunk))
+        f.write(writer.end())
+    
+    return filepath
+
+
+def save_delta(category_name: str, changes: Iterable[Dict], output_dir: str = ".") -> str:
+    """
+    증분 동기화 변경분을 NDJSON 파일로 저장 ({카테고리명}.delta.ndjson)
+    
+    Args:
+        category_name: 카테고리명 (파일명으로 사용)
+        changes: [{'change': 'added' | 'removed' | 'changed', 'id': ..., 'name': ..., ...}]
+        output_dir: 저장 디렉토리 (없으면 생성)
+        
+    Returns:
+        저장된 파일 경로
+    """
+    safe_filename = category_name.replace('/', '')
+    os.makedirs(output_dir, exist_ok=True)
+    filepath = os.path.join(output_dir, f"{safe_filename}.delta.ndjson")
     
     with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
+        for change in changes:
+            f.write(json.dumps(change, ensure_ascii=False))
+            f.write("\n")
     
     return filepath
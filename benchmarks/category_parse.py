@@ -0,0 +1,153 @@
+"""
+카테고리 페이지 파싱 벤치마크
+
+수 MB 크기의 가상 키워드 페이지 HTML로 기존 방식과 증분 추출기를 비교합니다.
+
+- regex: 기존 방식 (HTML 전체에 `(.*?);` 정규식 + 상태 전체 json.loads)
+- extractor: PreloadedStateExtractor (64KB 조각 단위로 넣고, keyword.categoryGroups 만 파싱)
+
+상태 안에서 keyword 가 앞에 있는 경우와 뒤에 있는 경우를 모두 측정하며,
+측정 전에 JSON 문자열 안의 `;` / 괄호 처리 정확성을 확인합니다.
+
+사용법:
+    python -m benchmarks.category_parse
+    python -m benchmarks.category_parse --size-mb 8 --repeat 5 --save-dir ./fixtures
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+
+from backend.preloaded import PreloadedStateExtractor, extract_preloaded_state
+
+CHUNK_SIZE = 64 * 1024
+
+
+def build_state(size_mb: float, keyword_first: bool, semicolons: bool) -> dict:
+    """keyword.categoryGroups 외에 size_mb 만큼의 다른 상태를 가진 가상 상태"""
+    text = '설명;본문 {괄호} [배열] "따옴표" \\' if semicolons else '설명 본문 {괄호} [배열] "따옴표" \\'
+    category_groups = {
+        'data': [
+            {
+                'name': f'그룹{g}',
+                'categories': [
+                    {'id': f'{g}{c}', 'name': f'카테고리{g}-{c}' + (';' if semicolons else ''), 'keywordCount': c * 10}
+                    for c in range(10)
+                ],
+            }
+            for g in range(8)
+        ],
+    }
+
+    filler = []
+    item = {'id': 0, 'title': text, 'tags': ['a', 'b', 'c'], 'meta': {'views': 1234, 'ok': True, 'score': -1.5e3}}
+    item_size = len(json.dumps(item, ensure_ascii=False))
+    for i in range(int(size_mb * 1024 * 1024 / item_size)):
+        filler.append({**item, 'id': i})
+
+    keyword = {'categoryGroups': category_groups, 'recent': filler[:10]}
+    if keyword_first:
+        return {'keyword': keyword, 'feed': {'items': filler}, 'user': {'name': text}}
+    return {'feed': {'items': filler}, 'user': {'name': text}, 'keyword': keyword}
+
+
+def build_html(state: dict) -> str:
+    return (
+        '<!DOCTYPE html><html><head><title>키워드</title></head><body><div id="root"></div>'
+        '<script>window.__PRELOADED_STATE__ = ' + json.dumps(state, ensure_ascii=False) + ';</script>'
+        '<script src="/static/app.js"></script>' + '<div class="footer">푸터</div>' * 2000 + '</body></html>'
+    )
+
+
+def parse_regex(html: str):
+    match = re.search(r'window.__PRELOADED_STATE__ = (.*?);', html)
+    if not match:
+        raise ValueError("not found")
+    return json.loads(match.group(1))['keyword']['categoryGroups']
+
+
+def parse_extractor(html: str):
+    extractor = PreloadedStateExtractor()
+    for start in range(0, len(html), CHUNK_SIZE):
+        if extractor.feed(html[start:start + CHUNK_SIZE]):
+            return extractor.value, extractor.bytes_scanned
+    return extractor.close(), extractor.bytes_scanned
+
+
+def check_correctness() -> None:
+    """문자열 안의 ';', 괄호, 이스케이프된 따옴표, 할당문 앞의 비교문과 조각 경계 처리 확인"""
+    state = build_state(0.05, keyword_first=False, semicolons=True)
+    html = build_html(state)
+    expected = state['keyword']['categoryGroups']
+    # 할당문 앞에 같은 변수를 비교하는 코드가 있는 페이지
+    guarded = html.replace(
+        '<script>window.__PRELOADED_STATE__ = ',
+        '<script>if (window.__PRELOADED_STATE__ == null || window.__PRELOADED_STATE__===undefined) {}</script>'
+        '<script>window.__PRELOADED_STATE__ = ',
+        1,
+    )
+
+    try:
+        regex_ok = parse_regex(html) == expected
+    except ValueError:
+        regex_ok = False
+    assert extract_preloaded_state(html) == expected
+    assert extract_preloaded_state(guarded) == expected, "할당문 앞의 비교문(==)을 할당문으로 읽음"
+
+    for page in (html, guarded):
+        for size in (1, 7, 64, 1000):
+            extractor = PreloadedStateExtractor()
+            done = False
+            for start in range(0, len(page), size):
+                if extractor.feed(page[start:start + size]):
+                    done = True
+                    break
+            assert done and extractor.value == expected, size
+
+    print(f"정확성: ';' 포함 문자열 - regex {'통과' if regex_ok else '실패'}, extractor 통과 "
+          f"(조각 크기 1/7/64/1000, 할당문 앞 비교문 포함)")
+
+
+def bench(func, html: str, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(html)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="카테고리 페이지 파싱 벤치마크")
+    parser.add_argument("--size-mb", type=float, default=4, help="가상 상태 크기 (MB, 기본값: 4)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용, 기본값: 5)")
+    parser.add_argument("--save-dir", help="생성한 HTML 픽스처 저장 디렉토리")
+    args = parser.parse_args(argv)
+
+    check_correctness()
+
+    for keyword_first in (True, False):
+        layout = "keyword 앞" if keyword_first else "keyword 뒤"
+        # 기존 정규식이 동작하도록 타이밍용 픽스처에는 문자열 안에 ';' 를 넣지 않음
+        html = build_html(build_state(args.size_mb, keyword_first, semicolons=False))
+        if args.save_dir:
+            os.makedirs(args.save_dir, exist_ok=True)
+            path = os.path.join(args.save_dir, f"keywords_{'first' if keyword_first else 'last'}.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(html)
+
+        assert parse_regex(html) == parse_extractor(html)[0]
+        _, scanned = parse_extractor(html)
+        regex_time = bench(parse_regex, html, args.repeat)
+        extractor_time = bench(parse_extractor, html, args.repeat)
+        print(
+            f"[{layout}] HTML {len(html.encode('utf-8')) / 2**20:.1f}MB | "
+            f"regex {regex_time * 1000:.1f}ms | extractor {extractor_time * 1000:.1f}ms "
+            f"({regex_time / extractor_time:.1f}배) | 읽은 본문 {scanned / len(html) * 100:.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
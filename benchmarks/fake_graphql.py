@@ -0,0 +1,270 @@
+"""
+가짜 서버용 최소 GraphQL 실행기
+
+가짜 네이버 서버가 실제 서버처럼 요청한 필드만 돌려주고(projection),
+별칭으로 여러 필드를 묶은 쿼리도 처리할 수 있도록 필요한 만큼만 구현합니다.
+
+지원 범위: query 연산(변수 정의 포함), 별칭, 인자($변수 / 리터럴), 하위 선택,
+인라인 프래그먼트(... on Type), 이름 있는 프래그먼트(...Name / fragment Name on Type), __typename.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_TOKEN = re.compile(r'\s+|,|#[^\n]*|(\.\.\.|[{}()\[\]:!$=@])|("(?:[^"\\]|\\.)*")|(-?\d+(?:\.\d+)?)|([_A-Za-z][_0-9A-Za-z]*)')
+
+
+class GraphQLError(Exception):
+    """쿼리 파싱/실행 오류 (응답의 errors로 변환)"""
+
+
+@dataclass
+class Field:
+    name: str
+    alias: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    selections: Optional[List] = None
+
+
+@dataclass
+class Fragment:
+    type_condition: Optional[str]
+    selections: List
+
+
+@dataclass
+class Spread:
+    name: str
+
+
+@dataclass
+class Document:
+    operations: Dict[Optional[str], List]
+    fragments: Dict[str, Fragment]
+
+
+class _Variable(str):
+    pass
+
+
+def _tokenize(source: str) -> List[str]:
+    tokens = []
+    position = 0
+    while position < len(source):
+        match = _TOKEN.match(source, position)
+        if match is None:
+            raise GraphQLError(f"Syntax Error: Unexpected character {source[position]!r}")
+        position = match.end()
+        token = match.group(1) or match.group(2) or match.group(3) or match.group(4)
+        if token:
+            tokens.append(token)
+    return tokens
+
+
+class _Parser:
+    def __init__(self, source: str):
+        self.tokens = _tokenize(source)
+        self.position = 0
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self, expected: Optional[str] = None) -> str:
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise GraphQLError(f"Syntax Error: Expected {expected or 'token'}, found {token or '<EOF>'}")
+        self.position += 1
+        return token
+
+    def document(self) -> Document:
+        operations: Dict[Optional[str], List] = {}
+        fragments: Dict[str, Fragment] = {}
+        while self.peek() is not None:
+            token = self.peek()
+            if token == "fragment":
+                self.take()
+                name = self.take()
+                self.take("on")
+                fragments[name] = Fragment(self.take(), self.selection_set())
+            elif token == "{":
+                operations[None] = self.selection_set()
+            else:
+                if self.take() != "query":
+                    raise GraphQLError(f"Syntax Error: Unsupported operation {token}")
+                name = self.take() if self.peek() not in ("(", "{") else None
+                if self.peek() == "(":
+                    self.variable_definitions()
+                operations[name] = self.selection_set()
+        return Document(operations, fragments)
+
+    def variable_definitions(self) -> None:
+        # 타입은 검사하지 않으므로 괄호 안을 건너뜀
+        depth = 0
+        while True:
+            token = self.take()
+            if token == "(":
+                depth += 1
+            elif token == ")":
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def selection_set(self) -> List:
+        self.take("{")
+        selections = []
+        while self.peek() != "}":
+            if self.peek() == "...":
+                self.take()
+                if self.peek() == "on":
+                    self.take()
+                    selections.append(Fragment(self.take(), self.selection_set()))
+                elif self.peek() == "{":
+                    selections.append(Fragment(None, self.selection_set()))
+                else:
+                    selections.append(Spread(self.take()))
+                continue
+            name = self.take()
+            alias = name
+            if self.peek() == ":":
+                self.take()
+                name = self.take()
+            arguments = self.arguments() if self.peek() == "(" else {}
+            sub = self.selection_set() if self.peek() == "{" else None
+            selections.append(Field(name, alias, arguments, sub))
+        self.take("}")
+        return selections
+
+    def arguments(self) -> Dict[str, Any]:
+        self.take("(")
+        arguments = {}
+        while self.peek() != ")":
+            name = self.take()
+            self.take(":")
+            arguments[name] = self.value()
+        self.take(")")
+        return arguments
+
+    def value(self) -> Any:
+        token = self.take()
+        if token == "$":
+            return _Variable(self.take())
+        if token == "{":
+            obj = {}
+            while self.peek() != "}":
+                key = self.take()
+                self.take(":")
+                obj[key] = self.value()
+            self.take("}")
+            return obj
+        if token == "[":
+            items = []
+            while self.peek() != "]":
+                items.append(self.value())
+            self.take("]")
+            return items
+        if token.startswith('"'):
+            return token[1:-1]
+        if token in ("true", "false"):
+            return token == "true"
+        if token == "null":
+            return None
+        if re.fullmatch(r'-?\d+', token):
+            return int(token)
+        try:
+            return float(token)
+        except ValueError:
+            return token  # enum
+
+
+_cache: Dict[str, Document] = {}
+
+
+def parse(source: str) -> Document:
+    """쿼리 문자열 파싱 (같은 쿼리는 캐시)"""
+    document = _cache.get(source)
+    if document is None:
+        document = _cache[source] = _Parser(source).document()
+    return document
+
+
+def _resolve_arguments(value: Any, variables: Dict) -> Any:
+    if isinstance(value, _Variable):
+        return variables.get(value)
+    if isinstance(value, dict):
+        return {key: _resolve_arguments(item, variables) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_resolve_arguments(item, variables) for item in value]
+    return value
+
+
+def _project(value: Any, selections: List, fragments: Dict[str, Fragment], out: Optional[Dict] = None) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [_project(item, selections, fragments) for item in value]
+
+    result = {} if out is None else out
+    for selection in selections:
+        if isinstance(selection, Spread):
+            fragment = fragments.get(selection.name)
+            if fragment is None:
+                raise GraphQLError(f'Unknown fragment "{selection.name}".')
+            selection = fragment
+        if isinstance(selection, Fragment):
+            if selection.type_condition in (None, value.get('__typename')):
+                _project(value, selection.selections, fragments, result)
+            continue
+        if selection.name not in value:
+            raise GraphQLError(f'Cannot query field "{selection.name}" on type "{value.get("__typename")}".')
+        item = value[selection.name]
+        result[selection.alias] = item if selection.selections is None else _project(item, selection.selections, fragments)
+    return result
+
+
+def execute(
+    query: str,
+    variables: Dict,
+    operation_name: Optional[str],
+    resolvers: Dict[str, Callable[..., Any]],
+) -> Tuple[Dict, List[Dict]]:
+    """
+    쿼리 실행
+
+    Args:
+        query: 쿼리 문자열
+        variables: 변수
+        operation_name: 실행할 연산 이름 (연산이 하나면 무시)
+        resolvers: 최상위 필드 이름 -> 함수(**인자) (반환값은 선택한 필드만 남김)
+
+    Returns:
+        (data, errors) - 최상위 필드 하나가 실패하면 그 별칭만 null, errors에 추가
+
+    Raises:
+        GraphQLError: 파싱 오류, 알 수 없는 연산
+    """
+    document = parse(query)
+    if len(document.operations) == 1:
+        selections = next(iter(document.operations.values()))
+    elif operation_name in document.operations:
+        selections = document.operations[operation_name]
+    else:
+        raise GraphQLError(f'Unknown operation named "{operation_name}".')
+
+    data: Dict[str, Any] = {}
+    errors: List[Dict] = []
+    for selection in selections:
+        if not isinstance(selection, Field):
+            raise GraphQLError("Fragments on the root type are not supported.")
+        resolver = resolvers.get(selection.name)
+        if resolver is None:
+            raise GraphQLError(f'Cannot query field "{selection.name}" on type "Query".')
+        try:
+            value = resolver(**_resolve_arguments(selection.arguments, variables))
+            data[selection.alias] = (
+                value if selection.selections is None else _project(value, selection.selections, document.fragments)
+            )
+        except GraphQLError as e:
+            data[selection.alias] = None
+            errors.append({'message': str(e), 'path': [selection.alias]})
+    return data, errors
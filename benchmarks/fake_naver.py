@@ -0,0 +1,395 @@
+"""
+가짜 네이버 인플루언서 서버 (오프라인 벤치마크용)
+
+in.naver.com 대신 로컬에서 다음을 제공합니다.
+
+- GET /keywords: window.__PRELOADED_STATE__ 가 들어 있는 키워드 페이지 HTML
+- POST /graphql: 커서 기반 getSearchCategoryKeywords / getWhitePoolKeywords 응답
+  (쿼리를 해석해 선택한 필드만 응답하고, 별칭으로 여러 필드를 묶은 쿼리도 처리)
+
+응답 지연(고정 + jitter, 일부 요청만 느리게), 5xx / GraphQL errors / 429(Retry-After)
+주입, 초당 요청 수 상한(넘으면 429), 새 연결의 첫 요청 지연(TLS 핸드셰이크 대역), 추천 키워드 요청만 느리게/실패하게 하기와 카테고리 크기(최대 10만 키워드 이상)를 설정할 수 있습니다. 키워드는 카테고리 ID로
+시드를 정한 난수로 만들므로 같은 설정이면 실행할 때마다 같은 응답을 돌려줍니다.
+
+제어용 엔드포인트:
+- GET /_fake/health: 준비 상태
+- GET /_fake/stats: 작업(operation)/카테고리별 요청 수, 주입한 오류 수, 새 연결 수
+- POST /_fake/config: 설정 일부 변경 (JSON 본문, FakeNaverConfig 필드명)
+- POST /_fake/reset: 통계 초기화
+
+사용법:
+    python -m benchmarks.fake_naver --port 8765 --category-sizes 200,20000,100000
+    NAVER_INFL_BASE_URL=http://127.0.0.1:8765 python main.py
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field, fields
+from typing import Dict, List, Optional, Set, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+
+from benchmarks import fake_graphql
+
+# 키워드명 앞부분 (검색 벤치마크에서 쓸 수 있도록 실제 단어를 섞음)
+WORDS = [
+    "캠핑", "요리", "여행", "맛집", "뷰티", "육아", "운동", "패션", "인테리어", "반려견",
+    "반려묘", "독서", "영화", "음악", "게임", "자동차", "재테크", "주식", "부동산", "다이어트",
+    "홈트", "등산", "낚시", "골프", "카페", "베이킹", "와인", "커피", "사진", "드로잉",
+]
+SUFFIXES = ["추천", "후기", "리뷰", "꿀팁", "브이로그", "정보", "일상", "비교", "가이드", ""]
+
+DEFAULT_CATEGORY_SIZES = [200, 2000, 20000]
+RECOMMEND_SIZE = 10
+
+
+@dataclass
+class FakeNaverConfig:
+    """가짜 서버 설정"""
+    category_sizes: List[int] = field(default_factory=lambda: list(DEFAULT_CATEGORY_SIZES))
+    latency_ms: float = 0.0  # 모든 요청의 기본 지연
+    handshake_ms: float = 0.0  # 새 연결의 첫 요청에만 더하는 지연 (TLS 핸드셰이크 대역, keep-alive 재사용 효과 측정용)
+    jitter_ms: float = 0.0  # 0 ~ jitter_ms 사이의 추가 지연
+    slow_rate: float = 0.0  # slow_ms 만큼 더 느린 요청 비율 (꼬리 지연 재현)
+    slow_ms: float = 0.0
+    error_rate: float = 0.0  # 500 응답 비율
+    graphql_error_rate: float = 0.0  # 200 + errors 응답 비율
+    throttle_rate: float = 0.0  # 429 응답 비율
+    retry_after: float = 1.0  # 429 응답의 Retry-After (초)
+    rate_limit: float = 0.0  # 초당 GraphQL 요청 수 상한, 넘으면 429 (토큰 버킷, Retry-After는 다음 토큰까지, 0이면 제한 없음)
+    recommend_latency_ms: float = 0.0  # 추천 키워드(getWhitePoolKeywords*) 요청에만 더하는 지연
+    recommend_error_rate: float = 0.0  # 추천 키워드 요청의 500 응답 비율
+    seed: int = 0
+
+    def update(self, values: Dict) -> None:
+        names = {f.name for f in fields(self)}
+        for key, value in values.items():
+            if key not in names:
+                raise ValueError(f"알 수 없는 설정: {key}")
+            setattr(self, key, value)
+
+
+def category_id(index: int) -> str:
+    """index 번째 가짜 카테고리 ID"""
+    return str(1000 + index)
+
+
+def _keyword_name(rng: random.Random) -> str:
+    # 실제 단어 + 임의 음절 2개 (+ 접미어) - 음절 조합이 충분히 많아 중복이 거의 없음
+    syllables = "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(2))
+    suffix = rng.choice(SUFFIXES)
+    return f"{rng.choice(WORDS)}{syllables}" + (f" {suffix}" if suffix else "")
+
+
+class FakeCategory:
+    """카테고리 하나의 키워드 (수집 순서대로)"""
+
+    def __init__(self, index: int, size: int, seed: int):
+        self.id = category_id(index)
+        self.name = f"카테고리{index}"
+        rng = random.Random(f"{seed}-{self.id}")
+        names = set()
+        self.keywords: List[Dict] = []
+        while len(self.keywords) < size:
+            name = _keyword_name(rng)
+            if name in names:
+                continue
+            names.add(name)
+            self.keywords.append({
+                'categoryId': self.id,
+                'challengeable': True,
+                'challengeableContentCount': 0,
+                'id': f"{self.id}-{len(self.keywords)}",
+                'issueKeyword': False,
+                'name': name,
+                'participantCount': int(rng.paretovariate(1.2) * 10),
+                'property': None,
+                'thumbnailUrl': f"https://example.invalid/thumb/{self.id}/{len(self.keywords)}.jpg",
+                'challengedKeyword': False,
+                '__typename': 'Keyword',
+            })
+        self.recommend = sorted(self.keywords, key=lambda k: -k['participantCount'])[:RECOMMEND_SIZE]
+        self._matches: Dict[str, List[Dict]] = {'': self.keywords}
+
+    def search(self, name: str) -> List[Dict]:
+        """name 검색어를 포함하는 키워드 (검색어가 없으면 전체)"""
+        matches = self._matches.get(name)
+        if matches is None:
+            matches = self._matches[name] = [k for k in self.keywords if name in k['name']]
+        return matches
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    if not cursor:
+        return 0
+    return int(base64.urlsafe_b64decode(cursor.encode()).decode().split(":", 1)[1])
+
+
+class FakeNaver:
+    """가짜 서버 상태 (카테고리 데이터, 설정, 통계)"""
+
+    def __init__(self, config: FakeNaverConfig):
+        self.config = config
+        self.categories: Dict[str, FakeCategory] = {}
+        self.rng = random.Random(config.seed)
+        self.requests = 0
+        self.operations: Counter = Counter()
+        self.faults: Counter = Counter()
+        self.category_requests: Dict[str, Counter] = {}
+        self.connections = 0
+        self._seen_clients: Set[Tuple[str, int]] = set()
+        self._tokens = 0.0  # rate_limit 토큰 버킷 (받아 준 요청만 토큰을 씀)
+        self._tokens_at = 0.0
+        self.build()
+
+    def build(self) -> None:
+        self.categories = {
+            c.id: c
+            for c in (FakeCategory(i, size, self.config.seed) for i, size in enumerate(self.config.category_sizes))
+        }
+
+    def count_category(self, category: Optional[str], kind: str) -> None:
+        self.category_requests.setdefault(str(category), Counter())[kind] += 1
+
+    def reset_stats(self) -> None:
+        self.requests = 0
+        self.operations.clear()
+        self.faults.clear()
+        self.category_requests.clear()
+        self.connections = 0
+        self._seen_clients.clear()
+
+    def stats_dict(self) -> Dict:
+        return {
+            'requests': self.requests,
+            'operations': dict(self.operations),
+            'categories': {key: dict(counts) for key, counts in self.category_requests.items()},
+            'faults': dict(self.faults),
+            'connections': self.connections,
+        }
+
+    async def handshake(self, request: Request) -> None:
+        """새 연결(클라이언트 주소/포트가 처음)의 첫 요청이면 handshake_ms 만큼 지연"""
+        client = request.scope.get('client')
+        key = tuple(client) if client else ('', 0)
+        if key in self._seen_clients:
+            return
+        self._seen_clients.add(key)
+        self.connections += 1
+        if self.config.handshake_ms > 0:
+            await asyncio.sleep(self.config.handshake_ms / 1000)
+
+    async def delay(self) -> None:
+        config = self.config
+        delay = config.latency_ms + self.rng.uniform(0, config.jitter_ms)
+        if config.slow_rate and self.rng.random() < config.slow_rate:
+            delay += config.slow_ms
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+    def rate_limit_fault(self) -> Optional[Response]:
+        """rate_limit을 넘는 요청에 돌려줄 429 응답 (없으면 None, 버킷 크기는 max(1, rate_limit))"""
+        limit = self.config.rate_limit
+        if limit <= 0:
+            return None
+        now = time.monotonic()
+        capacity = max(1.0, limit)
+        if self._tokens_at == 0.0:
+            self._tokens = capacity
+        else:
+            self._tokens = min(capacity, self._tokens + (now - self._tokens_at) * limit)
+        self._tokens_at = now
+        if self._tokens < 1.0:
+            self.faults['rate_limit'] += 1
+            retry_after = (1.0 - self._tokens) / limit
+            return JSONResponse({'message': 'Too Many Requests'}, status_code=429,
+                                headers={'Retry-After': f"{retry_after:.3f}"})
+        self._tokens -= 1.0
+        return None
+
+    def fault(self) -> Optional[Response]:
+        """설정한 비율에 따라 주입할 오류 응답 (없으면 None)"""
+        config = self.config
+        roll = self.rng.random()
+        if roll < config.throttle_rate:
+            self.faults['429'] += 1
+            return JSONResponse({'message': 'Too Many Requests'}, status_code=429,
+                                headers={'Retry-After': str(config.retry_after)})
+        roll -= config.throttle_rate
+        if roll < config.error_rate:
+            self.faults['500'] += 1
+            return JSONResponse({'message': 'Internal Server Error'}, status_code=500)
+        roll -= config.error_rate
+        if roll < config.graphql_error_rate:
+            self.faults['graphql'] += 1
+            return JSONResponse({'errors': [{'message': 'fake upstream error'}], 'data': None})
+        return None
+
+    async def recommend_fault(self) -> Optional[Response]:
+        """추천 키워드 요청에만 주입하는 지연/오류 (일반 키워드와 따로 느려지거나 실패하는 경우 재현)"""
+        config = self.config
+        if config.recommend_latency_ms > 0:
+            await asyncio.sleep(config.recommend_latency_ms / 1000)
+        if config.recommend_error_rate and self.rng.random() < config.recommend_error_rate:
+            self.faults['recommend_500'] += 1
+            return JSONResponse({'message': 'Internal Server Error'}, status_code=500)
+        return None
+
+    def preloaded_state(self) -> Dict:
+        groups: List[Dict] = [{'name': '그룹', 'categories': []}]
+        for c in self.categories.values():
+            groups[-1]['categories'].append({'id': c.id, 'name': c.name, 'keywordCount': len(c.keywords)})
+            if len(groups[-1]['categories']) >= 10:
+                groups.append({'name': f'그룹{len(groups)}', 'categories': []})
+        return {
+            'user': {'isLogin': False, 'profile': None},
+            'feed': {'items': [{'id': i, 'title': f'피드 {i}; 설명'} for i in range(200)]},
+            'keyword': {'categoryGroups': {'data': groups, 'status': 'SUCCESS'}},
+        }
+
+    def search_category_keywords(self, input: Dict, paging: Dict) -> Dict:
+        category = self.categories.get(input.get('categoryId'))
+        self.count_category(input.get('categoryId'), 'pages')
+        matches = category.search(input.get('name') or '') if category else []
+        offset = decode_cursor(paging.get('cursor'))
+        limit = paging.get('limit') or 20
+        items = matches[offset:offset + limit]
+        next_offset = offset + len(items)
+        return {
+            'items': items,
+            'paging': {
+                'nextCursor': encode_cursor(next_offset) if next_offset < len(matches) else None,
+                'total': len(matches),
+                '__typename': 'Paging',
+            },
+            '__typename': 'SearchKeywordResult',
+        }
+
+    def white_pool_keywords(self, input: Dict) -> List[Dict]:
+        category = self.categories.get(input.get('categoryId'))
+        self.count_category(input.get('categoryId'), 'recommend')
+        return category.recommend[:input.get('limit') or 3] if category else []
+
+    def execute(self, operation: Dict) -> Tuple[int, Dict]:
+        # 실제 서버처럼 쿼리를 해석해 선택한 필드만, 별칭 그대로 응답
+        name = operation.get('operationName')
+        self.operations[name] += 1
+        try:
+            data, errors = fake_graphql.execute(
+                operation.get('query') or '',
+                operation.get('variables') or {},
+                name,
+                {
+                    'searchCategoryKeywords': self.search_category_keywords,
+                    'whitePoolKeywords': self.white_pool_keywords,
+                },
+            )
+        except fake_graphql.GraphQLError as e:
+            return 400, {'errors': [{'message': str(e)}]}
+        body: Dict = {'data': data}
+        if errors:
+            body['errors'] = errors
+        return 200, body
+
+
+def create_app(config: Optional[FakeNaverConfig] = None) -> FastAPI:
+    """가짜 서버 ASGI 앱 생성"""
+    fake = FakeNaver(config or FakeNaverConfig())
+    app = FastAPI(title="Fake Naver Influencer")
+    app.state.fake = fake
+
+    @app.get("/keywords")
+    async def keywords_page(request: Request):
+        await fake.handshake(request)
+        await fake.delay()
+        fake.requests += 1
+        fake.operations['keywordsPage'] += 1
+        state = json.dumps(fake.preloaded_state(), ensure_ascii=False)
+        html = (
+            '<!DOCTYPE html><html><head><title>키워드 챌린지</title></head><body><div id="root"></div>'
+            f'<script>window.__PRELOADED_STATE__ = {state};</script>'
+            '<script src="/static/app.js"></script></body></html>'
+        )
+        return HTMLResponse(html)
+
+    @app.post("/graphql")
+    async def graphql(request: Request):
+        operation = await request.json()
+        await fake.handshake(request)
+        await fake.delay()
+        fake.requests += 1
+        injected = fake.rate_limit_fault()
+        if injected is None:
+            injected = fake.fault()
+        if injected is None and (operation.get('operationName') or '').startswith('getWhitePoolKeywords'):
+            injected = await fake.recommend_fault()
+        if injected is not None:
+            return injected
+        status, body = fake.execute(operation)
+        return JSONResponse(body, status_code=status)
+
+    @app.get("/_fake/health")
+    async def health():
+        return {'ok': True, 'categories': len(fake.categories)}
+
+    @app.get("/_fake/stats")
+    async def stats():
+        return fake.stats_dict()
+
+    @app.post("/_fake/reset")
+    async def reset():
+        fake.reset_stats()
+        return fake.stats_dict()
+
+    @app.post("/_fake/config")
+    async def configure(request: Request):
+        values = await request.json()
+        previous_sizes = list(fake.config.category_sizes)
+        try:
+            fake.config.update(values)
+        except ValueError as e:
+            return JSONResponse({'detail': str(e)}, status_code=400)
+        if fake.config.category_sizes != previous_sizes:
+            fake.build()
+        return asdict(fake.config)
+
+    return app
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="가짜 네이버 인플루언서 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--category-sizes", default=",".join(map(str, DEFAULT_CATEGORY_SIZES)),
+                        help="카테고리별 키워드 수 (쉼표 구분)")
+    for f in fields(FakeNaverConfig):
+        if f.name != 'category_sizes':
+            parser.add_argument(f"--{f.name.replace('_', '-')}", type=type(f.default), default=f.default)
+    return parser.parse_args(argv)
+
+
+def config_from_args(args: argparse.Namespace) -> FakeNaverConfig:
+    values = {f.name: getattr(args, f.name) for f in fields(FakeNaverConfig) if f.name != 'category_sizes'}
+    sizes = [int(s) for s in args.category_sizes.split(",") if s.strip()]
+    return FakeNaverConfig(category_sizes=sizes, **values)
+
+
+def main(argv=None) -> None:
+    import uvicorn
+
+    args = parse_args(argv)
+    uvicorn.run(create_app(config_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+벤치마크용 서버 실행 도우미
+
+가짜 네이버 서버와 API 서버(uvicorn)를 별도 프로세스로 띄웁니다.
+벤치마크 클라이언트와 GIL을 나눠 쓰지 않도록 같은 프로세스에서 실행하지 않습니다.
+"""
+
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    """사용 가능한 로컬 포트 번호"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def local_env(**extra: str) -> Dict[str, str]:
+    """프록시 설정이 로컬 주소에 적용되지 않도록 한 환경 변수"""
+    env = dict(os.environ)
+    env['NO_PROXY'] = ",".join(filter(None, [env.get('NO_PROXY'), "127.0.0.1", "localhost"]))
+    env.update(extra)
+    return env
+
+
+class ServerProcess:
+    """
+    하위 프로세스로 실행하는 HTTP 서버
+
+    Args:
+        args: python 인터프리터 뒤에 붙일 인자 (예: ['-m', 'uvicorn', ...])
+        port: 서버 포트
+        health_path: 준비 상태 확인 경로
+        env: 추가 환경 변수
+    """
+
+    def __init__(self, args: List[str], port: int, health_path: str, env: Optional[Dict[str, str]] = None):
+        self.args = args
+        self.port = port
+        self.health_path = health_path
+        self.env = env or {}
+        self.process: Optional[subprocess.Popen] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self, timeout: float = 30.0) -> "ServerProcess":
+        self.process = subprocess.Popen(
+            [sys.executable, *self.args],
+            cwd=ROOT_DIR,
+            env=local_env(**self.env),
+        )
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"서버 프로세스가 종료되었습니다 (코드 {self.process.returncode}): {self.args}")
+            try:
+                if httpx.get(self.base_url + self.health_path, timeout=1.0, trust_env=False).status_code == 200:
+                    return self
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.1)
+        self.stop()
+        raise RuntimeError(f"서버가 {timeout}초 안에 준비되지 않았습니다: {self.args}")
+
+    def stop(self) -> None:
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+    def __enter__(self) -> "ServerProcess":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class FakeNaverServer(ServerProcess):
+    """
+    가짜 네이버 서버 프로세스
+
+    Args:
+        category_sizes: 카테고리별 키워드 수
+        **options: FakeNaverConfig 필드 (latency_ms, throttle_rate 등)
+    """
+
+    def __init__(self, category_sizes: Optional[List[int]] = None, **options):
+        port = free_port()
+        args = ["-m", "benchmarks.fake_naver", "--port", str(port)]
+        if category_sizes:
+            args += ["--category-sizes", ",".join(map(str, category_sizes))]
+        for key, value in options.items():
+            args += [f"--{key.replace('_', '-')}", str(value)]
+        super().__init__(args, port, "/_fake/health")
+
+    def stats(self) -> Dict:
+        return httpx.get(self.base_url + "/_fake/stats", trust_env=False).json()
+
+    def reset(self) -> None:
+        httpx.post(self.base_url + "/_fake/reset", trust_env=False).raise_for_status()
+
+    def configure(self, **options) -> Dict:
+        response = httpx.post(self.base_url + "/_fake/config", json=options, trust_env=False)
+        response.raise_for_status()
+        return response.json()
+
+
+class ApiServer(ServerProcess):
+    """
+    API 서버(backend.app) 프로세스 - 가짜 네이버 서버와 임시 데이터 디렉토리 사용
+
+    Args:
+        naver_base_url: 가짜 네이버 서버 주소
+        workers: uvicorn 워커 수
+        env: 추가 환경 변수
+    """
+
+    def __init__(self, naver_base_url: str, workers: int = 1, env: Optional[Dict[str, str]] = None):
+        port = free_port()
+        self.data_dir = tempfile.mkdtemp(prefix="naver_infl_bench_")
+        args = ["-m", "uvicorn", "backend.app:app", "--port", str(port), "--log-level", "warning"]
+        if workers > 1:
+            args += ["--workers", str(workers)]
+        super().__init__(args, port, "/api/pacing", {
+            'NAVER_INFL_BASE_URL': naver_base_url,
+            'NAVER_INFL_DATA_DIR': self.data_dir,
+            # 미리 갱신 / hedged request가 측정 중에 upstream 요청을 더 보내지 않도록 기본으로 끔
+            'NAVER_INFL_PREWARM': '0',
+            'NAVER_INFL_HEDGE': '0',
+            **(env or {}),
+        })
+
+    def stop(self) -> None:
+        super().stop()
+        shutil.rmtree(self.data_dir, ignore_errors=True)
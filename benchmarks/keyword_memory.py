@@ -0,0 +1,118 @@
+"""
+키워드 표현별 메모리 벤치마크
+
+가상의 일괄 수집(기본 100만 키워드, 50개 카테고리)을 두 가지 방식으로 모아
+tracemalloc으로 메모리를 비교합니다.
+
+- dict: 기존 방식 (행마다 {'name': ..., 'participantCount': ...} 딕셔너리,
+  저장 시 recomm + normal 리스트 복사)
+- batch: KeywordBatch (키워드명 리스트 + 참여자수 array, 저장 시 복사 없는 뷰)
+
+사용법:
+    python -m benchmarks.keyword_memory
+    python -m benchmarks.keyword_memory --keywords 200000 --categories 10
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from backend.batch import KeywordBatch, concat_keywords
+from backend.config import DEFAULT_LIMIT, RECOMMEND_LIMIT
+from backend.utils import format_keywords_tsv
+
+
+def _pages(category: int, count: int):
+    """GraphQL 응답을 파싱한 것과 같은 페이지 단위 행 (페이지마다 새 객체)"""
+    for start in range(0, count, DEFAULT_LIMIT):
+        yield [
+            {
+                'id': f'{category}-{i}',
+                'name': f'키워드{category}_{i}',
+                'participantCount': (i * 7919) % 100000,
+            }
+            for i in range(start, min(start + DEFAULT_LIMIT, count))
+        ]
+
+
+def _recomm(category: int):
+    return [{'name': f'추천{category}_{i}', 'participantCount': 1000 - i} for i in range(RECOMMEND_LIMIT)]
+
+
+def harvest_dicts(categories: int, per_category: int):
+    results = {}
+    for c in range(categories):
+        normal = []
+        for page in _pages(c, per_category):
+            normal.extend({'name': k['name'], 'participantCount': k['participantCount']} for k in page)
+        results[c] = {'recomm': _recomm(c), 'normal': normal}
+    return results
+
+
+def harvest_batches(categories: int, per_category: int):
+    results = {}
+    for c in range(categories):
+        normal = KeywordBatch()
+        for page in _pages(c, per_category):
+            normal.extend(page)
+        results[c] = {'recomm': KeywordBatch(_recomm(c)), 'normal': normal}
+    return results
+
+
+def merge_dicts(keywords):
+    return keywords['recomm'] + keywords['normal']
+
+
+def merge_batches(keywords):
+    return concat_keywords(keywords['recomm'], keywords['normal'])
+
+
+def measure(name: str, harvest, merge, categories: int, per_category: int) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+
+    results = harvest(categories, per_category)
+    retained, _ = tracemalloc.get_traced_memory()
+
+    # 저장 단계: 카테고리 하나씩 recomm + normal 병합 후 포맷 변환
+    tracemalloc.reset_peak()
+    for keywords in results.values():
+        format_keywords_tsv(merge(keywords))
+    _, save_peak = tracemalloc.get_traced_memory()
+
+    elapsed = time.perf_counter() - started
+    tracemalloc.stop()
+    del results
+    gc.collect()
+    return {'name': name, 'retained': retained, 'save_peak': save_peak, 'elapsed': elapsed}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="키워드 표현별 메모리 벤치마크")
+    parser.add_argument("--keywords", type=int, default=1_000_000, help="전체 키워드 수 (기본값: 1,000,000)")
+    parser.add_argument("--categories", type=int, default=50, help="카테고리 수 (기본값: 50)")
+    args = parser.parse_args(argv)
+
+    per_category = args.keywords // args.categories
+    total = per_category * args.categories
+    print(f"가상 일괄 수집: {args.categories}개 카테고리 x {per_category:,}개 = {total:,}개 키워드")
+    print(f"{'방식':<8}{'보관 메모리':>14}{'키워드당':>12}{'저장 시 최대':>14}{'소요 시간':>12}")
+
+    rows = [
+        measure("dict", harvest_dicts, merge_dicts, args.categories, per_category),
+        measure("batch", harvest_batches, merge_batches, args.categories, per_category),
+    ]
+    for row in rows:
+        print(
+            f"{row['name']:<8}{row['retained'] / 2**20:>12.1f}MB{row['retained'] / total:>10.1f}B"
+            f"{row['save_peak'] / 2**20:>12.1f}MB{row['elapsed']:>11.2f}s"
+        )
+
+    dict_row, batch_row = rows
+    print(f"보관 메모리 {dict_row['retained'] / batch_row['retained']:.2f}배 감소")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1934 @@
+"""
+오프라인 벤치마크 모음
+
+가짜 네이버 서버(benchmarks.fake_naver)를 띄워 실제 in.naver.com 에 요청하지 않고 측정합니다.
+
+- categories: fetch_categories_async 지연 시간
+- keyword_pages: fetch_all_keywords_async 처리량 (pages/sec, 간격 조절 없음)
+- connection_pool: 새 연결마다 핸드셰이크 지연(TLS 대역)을 주는 가짜 서버에서 keep-alive 풀 on/off의
+  페이지 지연 시간과 수집 소요 시간, 새 연결 수 (결과가 같은지 확인)
+- pacing: 초당 요청 수 상한을 넘으면 429를 돌려주는 가짜 서버에서 고정 간격 대비 적응형 간격 조절기(AIMD)의
+  429 비율, 실제 요청 속도, 간격 변화 (간격이 상한 근처로 수렴하는지 확인), 스로틀링 없이 지연 시간만 들쭉날쭉할 때
+  간격이 시작 간격(sleepSec) 근처에 머무는지 확인
+- categories_under_load: 큰 카테고리 키워드를 동시에 새로 수집하는 동안 API 서버의 /api/categories 지연 시간
+  (수집이 이벤트 루프를 막지 않아 유휴 상태와 비슷하게 유지되는지 확인)
+- api_text: API 서버의 /api/keywords.txt 처리량 (동시 클라이언트, 캐시된 카테고리)
+- formatters: backend/utils.py 포맷 변환기 처리량 (rows/sec)
+- instrumentation: 지표 기록 1회 비용(ns)과 지표를 끈 수집 대비 처리량 차이
+- shared_workers: API 워커 여러 개에 같은 카테고리를 동시에 요청했을 때
+  upstream 수집이 카테고리당 정확히 한 번인지 확인하고 전체 소요 시간 측정
+- partitioned: 응답 지연이 있을 때 직렬 수집 대비 검색어 분할 수집의 소요 시간/추가 페이지 수
+- checkpoint_resume: 별도 프로세스의 수집을 중간에 강제 종료한 뒤 체크포인트로 이어받은 결과가
+  처음부터 끝까지 받은 결과와 같은지, 이어받을 때 남은 페이지만 요청하는지 확인
+- graphql_payload: 웹 클라이언트 쿼리 대비 최소 쿼리의 페이지당 요청/응답 바이트,
+  추천 키워드 묶음 요청 on/off 일괄 수집 1회의 upstream 요청 수 (결과가 같은지 확인)
+- keywords_overlap: 추천/일반 키워드 순차 조회 대비 동시 조회의 지연 시간,
+  추천 키워드만 느리거나 실패할 때 일반 키워드만 반환하는지(recommError, X-Degraded) 확인
+- search_index: 키워드 검색 색인 생성/저장본 읽기 시간, 선형 탐색 대비 검색 지연 시간
+  (결과가 선형 탐색과 같은지 확인), API 재시작 후 네이버 요청 없이 /api/search 응답 확인
+- response_bodies: 가장 큰 카테고리의 JSON/텍스트 인코딩 시간(표준 json 대비 orjson, 보관한 본문 재사용)과
+  응답 본문 보관 on/off API 서버의 /api/keywords, /api/keywords.txt 지연 시간 (본문이 같은지 확인)
+- prewarm: 짧은 TTL로 인기 카테고리를 반복 요청할 때 미리 갱신 on/off의 지연 시간과 캐시 미스 비율,
+  요청 예산 / 쉬는 시간대 / 인기 없는 카테고리에서 upstream 요청을 보내지 않는지 확인
+- resilience: 일부 페이지만 느린 가짜 서버에서 hedged request on/off의 페이지 지연 시간(p50/p99)과 추가 요청 비율,
+  5xx 주입 시 재시도로 결과가 같은지, 네이버 장애 중 회로 차단기 on/off의 API 지연 시간과 upstream 요청 수
+  (차단 중 503 + Retry-After, 이전 결과는 Warning: 110 stale 응답, 복구 후 정상 응답 확인)
+- admission: 많은 클라이언트가 서로 다른 카테고리를 계속 새로 수집하는 동안(soak) 수집 동시 실행 제한 on/off의
+  동시 수집 수 최댓값, 대기열 길이, 최대 RSS, 응답 상태/지연 시간, 부하 중 카테고리 목록(우선 대기열) 지연 시간
+  (429에 Retry-After / X-Queue-Position이 있는지, 클라이언트 한도를 넘으면 429인지 확인)
+- trends: 합성 참여자수 이력(키워드 x 스냅샷)의 스냅샷 기록 시간, 구간별 추이 계산 지연 시간,
+  키워드마다 반복하는 기준 구현 대비 속도 (상위 키워드가 같은지 확인), /api/trends 지연 시간
+  (numpy 필요, 네이버에 요청하지 않는지, 수집을 마치면 스냅샷이 기록되는지 확인)
+- export: 포맷마다 save_keywords를 부르는 방식 대비 한 번에 여러 포맷으로 저장하는 내보내기의 처리량(rows/sec)과
+  최대 RSS 증가량 (압축 none/gzip/zstd, parquet/arrow), 받아 둔 카테고리 전체를 /api/export zip으로 스트리밍할 때
+  API 서버 최대 RSS 증가량과 처리량 (내용이 save_keywords / /api/keywords.txt 와 같은지 확인)
+
+결과는 JSON(커밋, 실행 환경, 설정 포함)으로 저장할 수 있고, 다른 커밋에서 저장한 결과와
+지표별로 비교할 수 있습니다. 같은 설정이면 가짜 서버 응답도 항상 같습니다.
+
+사용법:
+    python -m benchmarks.run
+    python -m benchmarks.run --only formatters,keyword_pages --output bench.json
+    python -m benchmarks.run --output new.json --compare old.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.harness import ROOT_DIR, ApiServer, FakeNaverServer, local_env
+
+BENCHMARKS = ["categories", "keyword_pages", "connection_pool", "pacing", "categories_under_load", "api_text", "formatters", "instrumentation", "shared_workers",
+              "partitioned", "checkpoint_resume", "graphql_payload", "keywords_overlap", "search_index",
+              "response_bodies", "prewarm", "resilience", "admission", "trends", "export"]
+FORMATS = ["txt", "tsv", "csv", "ndjson"]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """nearest-rank 백분위수"""
+    ordered = sorted(samples)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def summarize_ms(samples: List[float]) -> Dict[str, float]:
+    """초 단위 표본을 ms 단위 요약 통계로 변환"""
+    return {
+        'p50Ms': round(statistics.median(samples) * 1000, 3),
+        'p95Ms': round(percentile(samples, 95) * 1000, 3),
+        'p99Ms': round(percentile(samples, 99) * 1000, 3),
+        'maxMs': round(max(samples) * 1000, 3),
+    }
+
+
+class NoWaitPacer:
+    """대기하지 않는 간격 조절기 (지연 급증 감지로 인한 백오프가 측정을 흔들지 않도록)"""
+
+    def __init__(self):
+        from backend.pacing import AdaptivePacer
+
+        self._pacer = AdaptivePacer(initial_delay=0, min_delay=0)
+
+    async def wait(self) -> None:
+        pass
+
+    def __getattr__(self, name: str):
+        return getattr(self._pacer, name)
+
+
+def git_revision() -> Dict:
+    def git(*args: str) -> str:
+        try:
+            return subprocess.run(["git", *args], cwd=ROOT_DIR, capture_output=True, text=True).stdout.strip()
+        except OSError:
+            return ""
+
+    return {'commit': git("rev-parse", "HEAD") or None, 'dirty': bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+async def bench_categories(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    from backend.scraper import fetch_categories_async
+    from backend.http_client import close_client
+
+    samples = []
+    try:
+        for _ in range(args.repeat * 10):
+            started = time.perf_counter()
+            categories = await fetch_categories_async()
+            samples.append(time.perf_counter() - started)
+    finally:
+        await close_client()
+    return {'categories': len(categories), 'runs': len(samples), **summarize_ms(samples)}
+
+
+async def bench_keyword_pages(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    from backend.scraper import fetch_all_keywords_async
+    from backend.http_client import close_client
+
+    category_id = args.crawl_category
+    best = None
+    try:
+        for _ in range(args.repeat):
+            pages = 0
+
+            def count_page(_: int) -> None:
+                nonlocal pages
+                pages += 1
+
+            # 페이지 사이 대기 없이 수집 경로 자체의 처리량만 측정
+            pacer = NoWaitPacer()
+            started = time.perf_counter()
+            keywords = await fetch_all_keywords_async(category_id, pacer=pacer, on_page=count_page)
+            elapsed = time.perf_counter() - started
+            if best is None or elapsed < best['elapsed']:
+                best = {'elapsed': elapsed, 'pages': pages, 'keywords': len(keywords)}
+    finally:
+        await close_client()
+    return {
+        'categoryId': category_id,
+        'pages': best['pages'],
+        'keywords': best['keywords'],
+        'elapsedSec': round(best['elapsed'], 4),
+        'pagesPerSec': round(best['pages'] / best['elapsed'], 1),
+        'keywordsPerSec': round(best['keywords'] / best['elapsed'], 1),
+    }
+
+
+async def bench_connection_pool(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    from backend.http_client import close_client, open_client
+    from backend.scraper import iter_keyword_pages_async
+
+    category_id = args.pool_category
+
+    async def crawl() -> Dict:
+        # 페이지를 받을 때마다 직전 페이지 이후 걸린 시간 기록 (대기 없이 순서대로 요청)
+        latencies = []
+        names = []
+        fake.reset()
+        started = last = time.perf_counter()
+        pages = iter_keyword_pages_async(category_id, pacer=NoWaitPacer())
+        try:
+            async for page in pages:
+                now = time.perf_counter()
+                latencies.append(now - last)
+                last = now
+                names.extend(k['name'] for k in page.keywords)
+                if len(latencies) >= args.pool_pages:
+                    break
+        finally:
+            await pages.aclose()
+        elapsed = time.perf_counter() - started
+        return {
+            'pages': len(latencies),
+            'elapsedSec': round(elapsed, 3),
+            'pageLatency': summarize_ms(latencies),
+            'connections': fake.stats()['connections'],
+            '_names': names,
+        }
+
+    results = {}
+    fake.configure(latency_ms=args.pool_latency_ms, handshake_ms=args.pool_handshake_ms)
+    try:
+        # noPool: 응답마다 연결을 닫으므로 페이지마다 연결/핸드셰이크를 새로 함 (풀 도입 전 동작)
+        for label, options in (('noPool', {'max_keepalive_connections': 0}), ('pooled', {})):
+            best = None
+            for _ in range(args.repeat):
+                await open_client(**options)
+                try:
+                    run = await crawl()
+                finally:
+                    await close_client()
+                if best is None or run['elapsedSec'] < best['elapsedSec']:
+                    best = run
+            results[label] = best
+    finally:
+        fake.configure(latency_ms=args.latency_ms, handshake_ms=0.0)
+        await close_client()
+
+    pooled, no_pool = results['pooled'], results['noPool']
+    assert pooled.pop('_names') == no_pool.pop('_names'), "풀 사용 여부에 따라 수집 결과가 다름"
+    assert pooled['connections'] < no_pool['connections'] / 10, \
+        f"풀을 써도 새 연결이 많음 ({pooled['connections']} vs {no_pool['connections']})"
+    assert pooled['pageLatency']['p50Ms'] < no_pool['pageLatency']['p50Ms'], "풀을 써도 페이지 지연 시간이 줄지 않음"
+    assert pooled['elapsedSec'] < no_pool['elapsedSec'], "풀을 써도 수집 시간이 줄지 않음"
+    return {
+        'categoryId': category_id,
+        'latencyMs': args.pool_latency_ms,
+        'handshakeMs': args.pool_handshake_ms,
+        **results,
+        'p50Speedup': round(no_pool['pageLatency']['p50Ms'] / pooled['pageLatency']['p50Ms'], 2),
+        'crawlSpeedup': round(no_pool['elapsedSec'] / pooled['elapsedSec'], 2),
+    }
+
+
+async def bench_pacing(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    from backend.http_client import close_client
+    from backend.pacing import AdaptivePacer
+    from backend.scraper import _make_pacer, iter_keyword_pages_async
+
+    category_id = args.pacing_category
+    limit = args.pacing_rate_limit
+    start_delay = args.pacing_start_delay
+
+    async def crawl(pacer: AdaptivePacer, max_pages: Optional[int] = None) -> Dict:
+        # 페이지를 받을 때마다 (경과 시간, 현재 간격, 누적 스로틀링 수) 기록
+        trace = []
+        fake.reset()
+        started = time.perf_counter()
+        pages = iter_keyword_pages_async(category_id, pacer=pacer)
+        try:
+            async for _ in pages:
+                trace.append((time.perf_counter() - started, pacer.delay, pacer.throttles))
+                if trace[-1][0] >= args.pacing_duration or len(trace) == max_pages:
+                    break
+        finally:
+            await pages.aclose()
+        elapsed = time.perf_counter() - started
+        rejected = fake.stats()['faults'].get('rate_limit', 0)
+
+        # 뒤쪽 절반 (수렴한 뒤의 상태)
+        late = [entry for entry in trace if entry[0] >= elapsed / 2]
+        late_throttles = pacer.throttles - late[0][2] if late else 0
+        return {
+            'pages': len(trace),
+            'elapsedSec': round(elapsed, 3),
+            'pagesPerSec': round(len(trace) / elapsed, 2),
+            'rejected429': rejected,
+            'rejectedRatio': round(rejected / (len(trace) + rejected), 4),
+            'latePagesPerSec': round(len(late) / (elapsed / 2), 2),
+            'lateThrottles': late_throttles,
+            'slowdowns': pacer.slowdowns,
+            'delay': {
+                'finalSec': round(pacer.delay, 3),
+                'meanSec': round(statistics.mean(entry[1] for entry in trace), 3),
+                'maxSec': round(max(entry[1] for entry in trace), 3),
+                'lateMedianSec': round(statistics.median(entry[1] for entry in late), 3) if late else None,
+            },
+        }
+
+    fake.configure(rate_limit=limit)
+    try:
+        # 고정 간격: 같은 시작 간격을 유지 (Retry-After만 지킴)
+        fixed = await crawl(AdaptivePacer(initial_delay=start_delay, min_delay=start_delay, max_delay=start_delay))
+        adaptive = await crawl(AdaptivePacer(initial_delay=start_delay, min_delay=start_delay))
+
+        # 스로틀링 없이 지연 시간만 꼬리가 긴 경우: API의 sleepSec 과 같은 기본 간격 조절기
+        fake.configure(rate_limit=0, latency_ms=args.pacing_noise_latency_ms, jitter_ms=args.pacing_noise_latency_ms * 3,
+                       slow_rate=args.pacing_noise_slow_rate, slow_ms=args.pacing_noise_slow_ms)
+        noisy = await crawl(_make_pacer(args.pacing_noise_sleep, None), max_pages=args.pacing_noise_pages)
+    finally:
+        fake.configure(rate_limit=0, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, slow_rate=0.0, slow_ms=0.0)
+        await close_client()
+
+    # 수렴: 429를 덜 받으면서 뒤쪽 절반의 간격과 요청 속도가 상한 근처에 머묾
+    target = 1 / limit
+    late_delay = adaptive['delay']['lateMedianSec']
+    assert adaptive['rejectedRatio'] < fixed['rejectedRatio'], "적응형 간격이 고정 간격보다 429를 더 받음"
+    assert late_delay is not None and target / 2 <= late_delay <= target * 2, \
+        f"뒤쪽 절반 간격 {late_delay}초가 상한 간격 {target:.3f}초 근처가 아님"
+    assert adaptive['latePagesPerSec'] >= limit / 2, f"요청 속도가 상한 {limit}/s 보다 너무 낮음"
+    # 가끔 느린 응답만으로는 간격이 커지지 않음 (sleepSec 근처 유지)
+    noisy_delay = noisy['delay']
+    assert noisy['rejected429'] == 0
+    assert noisy_delay['meanSec'] <= args.pacing_noise_sleep + 0.05, \
+        f"스로틀링 없이 평균 간격이 {noisy_delay['meanSec']}초로 sleepSec {args.pacing_noise_sleep}초보다 커짐"
+    assert noisy_delay['maxSec'] <= args.pacing_noise_sleep + 0.5, \
+        f"스로틀링 없이 간격이 {noisy_delay['maxSec']}초까지 커짐"
+
+    return {
+        'categoryId': category_id,
+        'rateLimit': limit,
+        'targetDelaySec': round(target, 3),
+        'startDelaySec': start_delay,
+        'fixed': fixed,
+        'adaptive': adaptive,
+        'noisyLatency': {
+            'sleepSec': args.pacing_noise_sleep,
+            'latencyMs': args.pacing_noise_latency_ms,
+            'jitterMs': args.pacing_noise_latency_ms * 3,
+            'slowRate': args.pacing_noise_slow_rate,
+            'slowMs': args.pacing_noise_slow_ms,
+            **noisy,
+        },
+    }
+
+
+async def bench_categories_under_load(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import httpx
+
+    category_ids = args.load_categories.split(",")
+    fake.configure(latency_ms=args.load_latency_ms)
+    try:
+        # 수집마다 다른 클라이언트로 보내 클라이언트별 수집 한도(ADMISSION_PER_CLIENT)에 걸리지 않게 함
+        with ApiServer(fake.base_url, env={'NAVER_INFL_CLIENT_HEADER': "X-Client-Id"}) as api:
+            async with httpx.AsyncClient(base_url=api.base_url, timeout=300, trust_env=False) as client:
+                (await client.get("/api/categories")).raise_for_status()
+
+                async def probe(until: Callable[[], bool]) -> List[float]:
+                    # 캐시된 카테고리 목록 요청 - 이벤트 루프가 막히면 그만큼 늦어짐
+                    latencies = []
+                    while not until():
+                        sent = time.perf_counter()
+                        (await client.get("/api/categories")).raise_for_status()
+                        latencies.append(time.perf_counter() - sent)
+                        await asyncio.sleep(args.load_probe_interval)
+                    return latencies
+
+                deadline = time.perf_counter() + args.load_idle_sec
+                idle = await probe(lambda: time.perf_counter() >= deadline)
+
+                async def crawl(category_id: str) -> int:
+                    r = await client.get("/api/keywords", params={'categoryId': category_id, 'sleepSec': 0},
+                                         headers={'X-Client-Id': f"crawl-{category_id}"})
+                    r.raise_for_status()
+                    return len(r.json()['normal'])
+
+                fake.reset()
+                started = time.perf_counter()
+                crawls = asyncio.gather(*(crawl(category_id) for category_id in category_ids))
+                busy = await probe(crawls.done)
+                keywords = await crawls
+                crawl_elapsed = time.perf_counter() - started
+    finally:
+        fake.configure(latency_ms=args.latency_ms)
+
+    pages = sum(counts.get('pages', 0) for counts in fake.stats()['categories'].values())
+    idle_stats, busy_stats = summarize_ms(idle), summarize_ms(busy)
+    assert len(busy) >= 10, f"수집 중 카테고리 목록 요청이 {len(busy)}번뿐 (수집이 너무 짧음)"
+    # 수집 중에도 카테고리 목록은 수집을 기다리지 않음 (유휴 대비 p95가 크게 늘지 않음)
+    limit_ms = max(idle_stats['p95Ms'] * 5, idle_stats['p95Ms'] + args.load_slack_ms)
+    assert busy_stats['p95Ms'] <= limit_ms, f"수집 중 p95 {busy_stats['p95Ms']}ms > {limit_ms:.1f}ms"
+
+    return {
+        'categories': category_ids,
+        'keywords': sum(keywords),
+        'upstreamPages': pages,
+        'crawlSec': round(crawl_elapsed, 3),
+        'idle': {'requests': len(idle), **idle_stats},
+        'duringCrawls': {'requests': len(busy), **busy_stats},
+        'p95Ratio': round(busy_stats['p95Ms'] / idle_stats['p95Ms'], 2),
+    }
+
+
+async def bench_api_text(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import httpx
+
+    category_id = args.api_category
+    with ApiServer(fake.base_url) as api:
+        async with httpx.AsyncClient(base_url=api.base_url, timeout=120, trust_env=False) as client:
+            # 처음 한 번은 간격 없이(sleepSec=0) 수집해 캐시를 채움
+            started = time.perf_counter()
+            response = await client.get("/api/keywords", params={'categoryId': category_id, 'sleepSec': 0})
+            response.raise_for_status()
+            cold = time.perf_counter() - started
+
+            params = {'categoryId': category_id, 'format': args.api_format}
+            latencies: List[float] = []
+            received = 0
+
+            async def client_loop() -> None:
+                nonlocal received
+                for _ in range(args.requests):
+                    sent = time.perf_counter()
+                    r = await client.get("/api/keywords.txt", params=params)
+                    r.raise_for_status()
+                    latencies.append(time.perf_counter() - sent)
+                    received += len(r.content)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(client_loop() for _ in range(args.clients)))
+            elapsed = time.perf_counter() - started
+
+    return {
+        'categoryId': category_id,
+        'format': args.api_format,
+        'keywords': len(response.json()['normal']),
+        'coldLoadSec': round(cold, 3),
+        'clients': args.clients,
+        'requests': len(latencies),
+        'requestsPerSec': round(len(latencies) / elapsed, 2),
+        'mbPerSec': round(received / elapsed / 2**20, 2),
+        **summarize_ms(latencies),
+    }
+
+
+async def bench_formatters(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    from backend.batch import KeywordBatch
+    from backend.utils import KeywordWriter
+    from benchmarks.fake_naver import FakeCategory
+
+    keywords = KeywordBatch(FakeCategory(0, args.format_rows, seed=0).keywords)
+    results = {}
+    for format in FORMATS:
+        best = float('inf')
+        for _ in range(args.repeat):
+            writer = KeywordWriter(format)
+            started = time.perf_counter()
+            writer.begin() + writer.write(keywords) + writer.end()
+            best = min(best, time.perf_counter() - started)
+        results[format] = {'bestMs': round(best * 1000, 3), 'rowsPerSec': round(len(keywords) / best)}
+    return {'rows': len(keywords), **results}
+
+
+async def bench_instrumentation(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    from backend import metrics
+
+    calls = 200_000
+
+    def per_call_ns(func: Callable[[], None]) -> float:
+        best = float('inf')
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            for _ in range(calls):
+                func()
+            best = min(best, time.perf_counter() - started)
+        return round(best / calls * 1e9, 1)
+
+    def timed_phase() -> None:
+        with metrics.phase('bench'):
+            pass
+
+    results = {
+        'counterIncNs': per_call_ns(lambda: metrics.PAGES_FETCHED.labels('bench').inc()),
+        'histogramObserveNs': per_call_ns(lambda: metrics.UPSTREAM_LATENCY.labels('bench').observe(0.05)),
+        'phaseNs': per_call_ns(timed_phase),
+    }
+
+    # 같은 수집을 지표를 켜고/끄고 번갈아 실행해 페이지당 시간 비교
+    page_times = {True: [], False: []}
+    for _ in range(args.repeat):
+        for enabled in (False, True):
+            metrics.set_enabled(enabled)
+            result = await bench_keyword_pages(fake, argparse.Namespace(**{**vars(args), 'repeat': 1}))
+            page_times[enabled].append(result['elapsedSec'] / result['pages'])
+    metrics.set_enabled(True)
+    on, off = min(page_times[True]), min(page_times[False])
+    results.update({
+        'pageUsEnabled': round(on * 1e6, 1),
+        'pageUsDisabled': round(off * 1e6, 1),
+        'overheadPct': round((on - off) / off * 100, 2),
+    })
+    return results
+
+
+async def bench_shared_workers(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import httpx
+
+    category_ids = args.shared_categories.split(",")
+    fake.reset()
+    # 공유 저장소의 중복 제거만 확인하도록 간격 조절 없이(sleepSec=0 고정) 수집
+    with ApiServer(fake.base_url, workers=args.workers, env={'NAVER_INFL_ADAPTIVE_PACING': '0'}) as api:
+        async with httpx.AsyncClient(base_url=api.base_url, timeout=args.shared_timeout, trust_env=False) as client:
+            async def request(path: str, params: Dict) -> Dict:
+                # 요청마다 새 연결을 열어 여러 워커에 고르게 나뉘도록 함
+                r = await client.get(path, params=params, headers={'Connection': 'close'})
+                r.raise_for_status()
+                return r.json()
+
+            requested = [category_id for category_id in category_ids for _ in range(args.clients)]
+            started = time.perf_counter()
+            categories, *keyword_results = await asyncio.gather(
+                request("/api/categories", {}),
+                *(request("/api/keywords", {'categoryId': category_id, 'sleepSec': 0}) for category_id in requested),
+            )
+            elapsed = time.perf_counter() - started
+
+            # 카테고리 목록도 워커마다 다시 받지 않는지 확인
+            await asyncio.gather(*(request("/api/categories", {}) for _ in range(args.clients)))
+
+    stats = fake.stats()
+    sizes = {c['id']: c['keywordCount'] for c in categories}
+    crawls = {}
+    for category_id in category_ids:
+        counts = stats['categories'].get(category_id, {})
+        expected_pages = max(1, math.ceil(sizes[category_id] / 20))
+        crawls[category_id] = counts.get('recommend', 0)
+        assert counts.get('recommend', 0) == 1, f"{category_id}: 추천 키워드 요청 {counts}"
+        assert counts.get('pages', 0) == expected_pages, f"{category_id}: 페이지 요청 {counts} (예상 {expected_pages})"
+    assert stats['operations'].get('keywordsPage', 0) == 1, f"카테고리 목록 요청 {stats['operations']}"
+    for category_id, result in zip(requested, keyword_results):
+        assert len(result['normal']) == sizes[category_id], f"{category_id}: 키워드 {len(result['normal'])}개"
+
+    return {
+        'workers': args.workers,
+        'clientsPerCategory': args.clients,
+        'crawlsPerCategory': crawls,
+        'upstreamRequests': stats['requests'],
+        'elapsedSec': round(elapsed, 3),
+    }
+
+
+async def bench_partitioned(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    from backend.scraper import fetch_all_keywords_async
+    from backend.partition import fetch_partitioned_keywords_async
+    from backend.http_client import close_client
+
+    category_id = args.crawl_category
+    # 페이지 수 × 응답 시간이 병목이 되도록 지연을 주고 측정
+    fake.configure(latency_ms=args.partition_latency_ms)
+    try:
+        started = time.perf_counter()
+        serial = await fetch_all_keywords_async(category_id, pacer=NoWaitPacer())
+        serial_elapsed = time.perf_counter() - started
+
+        results = {}
+        for concurrency in args.partition_concurrency:
+            crawl = await fetch_partitioned_keywords_async(
+                category_id, concurrency=concurrency, rate=args.partition_rate, pacer=NoWaitPacer(),
+            )
+            assert crawl.total == len(serial), f"total {crawl.total} != {len(serial)}"
+            assert sorted(crawl.keywords.names) == sorted(serial.names), "분할 수집 결과가 직렬 수집과 다름"
+            results[str(concurrency)] = {
+                **crawl.as_dict(),
+                'pagesOverSerial': round(crawl.pages / math.ceil(len(serial) / 20), 3),
+                'speedup': round(serial_elapsed / crawl.elapsed, 2),
+            }
+    finally:
+        fake.configure(latency_ms=args.latency_ms)
+        await close_client()
+
+    return {
+        'categoryId': category_id,
+        'latencyMs': args.partition_latency_ms,
+        'rate': args.partition_rate,
+        'serialSec': round(serial_elapsed, 3),
+        'partitioned': results,
+    }
+
+
+async def bench_checkpoint_resume(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    from backend.checkpoint import get_default_journal
+    from backend.scraper import fetch_all_keywords_async
+    from backend.http_client import close_client
+
+    category_id = args.resume_category
+    journal = get_default_journal()
+    # 강제 종료 시점을 맞출 수 있도록 페이지마다 지연을 줌
+    fake.configure(latency_ms=args.resume_latency_ms)
+    try:
+        fake.reset()
+        started = time.perf_counter()
+        clean = await fetch_all_keywords_async(category_id, pacer=NoWaitPacer())
+        clean_elapsed = time.perf_counter() - started
+        total_pages = fake.stats()['categories'][category_id]['pages']
+
+        # 같은 데이터 디렉토리(저널)를 쓰는 별도 프로세스로 수집하다가 절반쯤에서 SIGKILL
+        fake.reset()
+        code = (
+            "import asyncio\n"
+            "from backend.checkpoint import get_default_journal\n"
+            "from backend.scraper import fetch_all_keywords_async\n"
+            f"asyncio.run(fetch_all_keywords_async({category_id!r}, 0, journal=get_default_journal()))\n"
+        )
+        process = subprocess.Popen([sys.executable, "-c", code], cwd=ROOT_DIR, env=local_env())
+        kill_at = max(1, int(total_pages * args.resume_kill_fraction))
+        served = 0
+        try:
+            while served < kill_at:
+                assert process.poll() is None, f"수집 프로세스가 먼저 끝남 (코드 {process.returncode})"
+                await asyncio.sleep(0.02)
+                served = fake.stats()['categories'].get(category_id, {}).get('pages', 0)
+        finally:
+            process.kill()
+            process.wait()
+        checkpoint = await asyncio.to_thread(journal.load, category_id)
+        assert checkpoint is not None and checkpoint.pages > 0, "강제 종료한 수집의 체크포인트가 없음"
+
+        fake.reset()
+        started = time.perf_counter()
+        resumed = await fetch_all_keywords_async(category_id, pacer=NoWaitPacer(), journal=journal)
+        resume_elapsed = time.perf_counter() - started
+        resumed_pages = fake.stats()['categories'][category_id]['pages']
+    finally:
+        fake.configure(latency_ms=args.latency_ms)
+        await close_client()
+
+    assert resumed == clean, "이어받은 결과가 처음부터 받은 결과와 다름"
+    assert resumed_pages == total_pages - checkpoint.pages, \
+        f"이어받을 때 {resumed_pages}페이지 요청 (남은 페이지 {total_pages - checkpoint.pages})"
+    assert await asyncio.to_thread(journal.load, category_id) is None, "수집을 마친 뒤 체크포인트가 남음"
+
+    return {
+        'categoryId': category_id,
+        'keywords': len(clean),
+        'pages': total_pages,
+        'killedAfterPages': served,
+        'checkpointPages': checkpoint.pages,
+        'resumedPages': resumed_pages,
+        'cleanSec': round(clean_elapsed, 3),
+        'resumeSec': round(resume_elapsed, 3),
+    }
+
+
+async def bench_graphql_payload(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import httpx
+    from backend import config, scraper
+    from backend.queries import KEYWORD_FIELDS, KEYWORD_ID_FIELDS, search_keywords_query
+    from backend.harvest import harvest_all_async
+    from backend.http_client import close_client
+    from benchmarks.fake_naver import category_id as fake_category_id
+
+    # 1) 페이지당 요청/응답 바이트: 웹 클라이언트 쿼리 vs 최소 쿼리 (같은 커서 체인)
+    queries = {
+        'legacy': config.QUERY_SEARCH_CATEGORY_KEYWORDS,
+        'idFields': search_keywords_query(KEYWORD_ID_FIELDS),
+        'minimal': search_keywords_query(KEYWORD_FIELDS),
+    }
+    payload = {}
+    rows = {}
+    async with httpx.AsyncClient(timeout=30, trust_env=False) as client:
+        for label, query in queries.items():
+            request_bytes = response_bytes = pages = 0
+            cursor = None
+            names = []
+            while pages < args.payload_pages:
+                paging = {'limit': 20, **({'cursor': cursor} if cursor else {})}
+                body = json.dumps({
+                    'operationName': 'getSearchCategoryKeywords',
+                    'variables': {'input': {'categoryId': args.crawl_category}, 'paging': paging},
+                    'query': query,
+                }, ensure_ascii=False).encode()
+                r = await client.post(f"{fake.base_url}/graphql", content=body,
+                                      headers={'Content-Type': 'application/json'})
+                r.raise_for_status()
+                data = r.json()['data']['searchCategoryKeywords']
+                request_bytes += len(body)
+                response_bytes += len(r.content)
+                pages += 1
+                names.extend((k['name'], k['participantCount']) for k in data['items'])
+                cursor = data['paging']['nextCursor']
+                if not cursor:
+                    break
+            rows[label] = names
+            payload[label] = {
+                'pages': pages,
+                'requestBytesPerPage': round(request_bytes / pages),
+                'responseBytesPerPage': round(response_bytes / pages),
+            }
+    assert rows['minimal'] == rows['legacy'] == rows['idFields'], "최소 쿼리 결과가 원본 쿼리와 다름"
+    legacy = payload['legacy']
+    for label in ('idFields', 'minimal'):
+        total = payload[label]['requestBytesPerPage'] + payload[label]['responseBytesPerPage']
+        payload[label]['bytesVsLegacy'] = round(
+            total / (legacy['requestBytesPerPage'] + legacy['responseBytesPerPage']), 3)
+
+    # 2) 일괄 수집 1회의 upstream 요청 수: 추천 키워드 묶음 요청 on/off
+    # (작은 카테고리가 많을수록 카테고리당 추천 키워드 요청 비중이 큼)
+    sizes = [args.harvest_keywords] * args.harvest_categories
+    fake.configure(category_sizes=sizes)
+    categories = [{'id': fake_category_id(i), 'name': f"카테고리{i}"} for i in range(len(sizes))]
+    harvests = {}
+    results = {}
+    previous = scraper._batching_supported
+    try:
+        for label, batching in (('perCategory', False), ('batched', True)):
+            scraper._batching_supported = batching
+            collected = {}
+
+            def on_result(result, keywords) -> None:
+                assert result.error is None, f"{result.category_id}: {result.error}"
+                collected[result.category_id] = (list(keywords['recomm']), list(keywords['normal']))
+
+            fake.reset()
+            started = time.perf_counter()
+            report = await harvest_all_async(categories, rate=0, output_dir=None, on_result=on_result)
+            elapsed = time.perf_counter() - started
+            stats = fake.stats()
+            results[label] = collected
+            harvests[label] = {
+                'requests': stats['requests'],
+                'pages': report.pages,
+                'operations': stats['operations'],
+                'elapsedSec': round(elapsed, 3),
+            }
+    finally:
+        scraper._batching_supported = previous
+        fake.configure(category_sizes=[int(s) for s in args.category_sizes.split(",")])
+        await close_client()
+    assert results['batched'] == results['perCategory'], "묶음 요청 결과가 카테고리별 요청과 다름"
+    assert len(results['batched']) == len(categories)
+
+    return {
+        'categoryId': args.crawl_category,
+        'bytesPerPage': payload,
+        'harvest': {
+            'categories': len(categories),
+            'keywordsPerCategory': args.harvest_keywords,
+            **harvests,
+            'requestsSaved': harvests['perCategory']['requests'] - harvests['batched']['requests'],
+        },
+    }
+
+
+async def bench_keywords_overlap(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import httpx
+    from backend.scraper import fetch_recommend_keywords_async, fetch_all_keywords_async, get_all_keywords_async
+    from backend.http_client import close_client
+
+    category_id = args.overlap_category
+    runs = args.repeat * 5
+
+    async def serial(limit=None) -> Dict:
+        # 이전 get_all_keywords: 추천 키워드가 끝난 뒤 일반 키워드 수집 시작
+        recomm = await fetch_recommend_keywords_async(category_id)
+        normal = await fetch_all_keywords_async(category_id, pacer=NoWaitPacer(), limit=limit)
+        return {'recomm': recomm, 'normal': normal}
+
+    async def concurrent(limit=None, **options) -> Dict:
+        if limit is None:
+            return await get_all_keywords_async(category_id, pacer=NoWaitPacer(), **options)
+        from backend.scraper import gather_keywords_async
+        return await gather_keywords_async(
+            category_id, fetch_all_keywords_async(category_id, pacer=NoWaitPacer(), limit=limit), **options
+        )
+
+    async def measure(load, **kwargs):
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            result = await load(**kwargs)
+            samples.append(time.perf_counter() - started)
+        return result, summarize_ms(samples)
+
+    fake.configure(latency_ms=args.overlap_latency_ms)
+    results = {}
+    try:
+        for label, limit in (('full', None), ('firstPage', 20)):
+            expected, serial_ms = await measure(serial, limit=limit)
+            actual, concurrent_ms = await measure(concurrent, limit=limit)
+            assert actual == expected, f"{label}: 동시 조회 결과가 순차 조회와 다름"
+            if limit is None:
+                full = expected
+            results[label] = {
+                'pages': math.ceil(len(actual['normal']) / 20),
+                'serial': serial_ms,
+                'concurrent': concurrent_ms,
+                'speedup': round(serial_ms['p50Ms'] / concurrent_ms['p50Ms'], 2),
+            }
+
+        # 추천 키워드만 느린 경우: 제한 시간이 지나면 일반 키워드만 반환
+        fake.configure(recommend_latency_ms=args.overlap_recommend_delay_ms)
+        timeout = args.overlap_recommend_timeout
+        started = time.perf_counter()
+        await serial()
+        slow_serial = time.perf_counter() - started
+        degraded, slow_ms = await measure(concurrent, recomm_timeout=timeout)
+        assert 'recommError' in degraded and len(degraded['recomm']) == 0, "느린 추천 키워드가 제한 시간에 끊기지 않음"
+        assert degraded['normal'] == full['normal']
+        results['recommendSlow'] = {
+            'recommendDelayMs': args.overlap_recommend_delay_ms,
+            'recommTimeoutSec': timeout,
+            'serialMs': round(slow_serial * 1000, 3),
+            'concurrent': slow_ms,
+        }
+
+        # 추천 키워드가 실패하는 경우: 이전에는 전체 실패, 이제 일반 키워드 + recommError
+        fake.configure(recommend_latency_ms=0, recommend_error_rate=1.0)
+        try:
+            await serial()
+            serial_failed = False
+        except (httpx.HTTPError, ValueError):
+            serial_failed = True
+        degraded, failing_ms = await measure(concurrent)
+        assert serial_failed and 'recommError' in degraded and degraded['normal'] == full['normal']
+        results['recommendError'] = {'serialFailed': serial_failed, 'concurrent': failing_ms}
+
+        # API가 빠진 부분을 알려 주는지 확인
+        with ApiServer(fake.base_url) as api:
+            async with httpx.AsyncClient(base_url=api.base_url, timeout=60, trust_env=False) as client:
+                r = await client.get("/api/keywords", params={'categoryId': category_id, 'sleepSec': 0})
+                r.raise_for_status()
+                body = r.json()
+        assert r.headers.get('x-degraded') == 'recomm' and body.get('recommError'), "API가 추천 키워드 실패를 표시하지 않음"
+        assert len(body['normal']) == len(full['normal'])
+        results['recommendError']['apiDegradedHeader'] = r.headers.get('x-degraded')
+    finally:
+        fake.configure(latency_ms=args.latency_ms, recommend_latency_ms=0, recommend_error_rate=0)
+        await close_client()
+
+    return {'categoryId': category_id, 'latencyMs': args.overlap_latency_ms, 'runs': runs, **results}
+
+
+async def bench_search_index(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import httpx
+    from backend.batch import KeywordBatch
+    from backend.search_index import SearchIndex, initials, is_initials_query, normalize
+    from benchmarks.fake_naver import FakeCategory
+
+    categories = [FakeCategory(i, args.search_keywords, seed=0) for i in range(args.search_categories)]
+    batches = {c.id: KeywordBatch(c.keywords) for c in categories}
+    queries = args.search_queries.split(",")
+    limit = 50
+
+    def linear_scan(query: str, sort: str):
+        # 색인 없이 전체 키워드를 훑는 기준 구현
+        normalized = normalize(query)
+        use_initials = is_initials_query(normalized)
+        hits = []
+        for c in categories:
+            for k in c.keywords:
+                text = normalize(k['name'])
+                if normalized in (initials(text) if use_initials else text):
+                    hits.append((c.id, k['name'], k['participantCount']))
+        if sort == "participants":
+            hits.sort(key=lambda h: (-h[2], h[0]))
+        else:
+            hits.sort(key=lambda h: (h[1], h[0]))
+        return hits
+
+    with tempfile.TemporaryDirectory(prefix="naver_infl_search_") as directory:
+        path = os.path.join(directory, "search.sqlite3")
+        index = SearchIndex(path)
+        started = time.perf_counter()
+        for c in categories:
+            index.update(c.id, batches[c.id], c.name)
+        build = time.perf_counter() - started
+        assert not index.update(categories[0].id, batches[categories[0].id], categories[0].name), "같은 키워드를 다시 색인함"
+
+        # 재시작: 저장된 세그먼트만 읽음
+        started = time.perf_counter()
+        reloaded = SearchIndex(path)
+        reloaded.refresh(force=True)
+        load = time.perf_counter() - started
+        assert reloaded.summary() == index.summary()
+        summary = index.summary()
+        size_bytes = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+        results = {}
+        for sort in ("participants", "name"):
+            index_samples, scan_samples, totals = [], [], {}
+            for query in queries:
+                reloaded.search(query, sort=sort, limit=limit)  # 세 글자 이상 검색의 부분 문자열 확인용 열 준비
+                for _ in range(args.repeat * 10):
+                    started = time.perf_counter()
+                    result = reloaded.search(query, sort=sort, limit=limit)
+                    index_samples.append(time.perf_counter() - started)
+                started = time.perf_counter()
+                hits = linear_scan(query, sort)
+                scan_samples.append(time.perf_counter() - started)
+                actual = [(hit.category_id, hit.name, hit.participant_count) for hit in result.items]
+                assert result.total == len(hits), f"{query}: {result.total}개 (선형 탐색 {len(hits)}개)"
+                if sort == "participants":
+                    # 참여자수 동률 안의 순서는 정해져 있지 않으므로 (카테고리, 참여자수) 열과 포함 여부로 비교
+                    assert set(actual) <= set(hits), f"{query}: 일치하지 않는 키워드 포함"
+                    assert [(h[0], h[2]) for h in actual] == [(h[0], h[2]) for h in hits[:limit]], f"{query}: 순서 다름"
+                else:
+                    assert actual == hits[:limit], f"{query}: 결과 다름"
+                totals[query] = len(hits)
+            index_ms, scan_ms = summarize_ms(index_samples), summarize_ms(scan_samples)
+            results[sort] = {
+                'index': index_ms,
+                'linearScan': scan_ms,
+                'speedupP50': round(scan_ms['p50Ms'] / index_ms['p50Ms'], 1),
+            }
+        results['matches'] = totals
+
+    # API: 수집이 끝난 카테고리가 색인되고, 재시작 후에도 네이버 요청 없이 검색되는지 확인
+    category_id = args.api_category
+    with tempfile.TemporaryDirectory(prefix="naver_infl_bench_") as data_dir:
+        env = {'NAVER_INFL_DATA_DIR': data_dir}
+        with ApiServer(fake.base_url, env=env) as api:
+            async with httpx.AsyncClient(base_url=api.base_url, timeout=300, trust_env=False) as client:
+                r = await client.get("/api/keywords", params={'categoryId': category_id, 'sleepSec': 0})
+                r.raise_for_status()
+                query = r.json()['normal'][0]['name'][:2]
+                for _ in range(50):
+                    r = await client.get("/api/cache/stats")
+                    if r.json()['search']['updates']:
+                        break
+                    await asyncio.sleep(0.1)
+                first = (await client.get("/api/search", params={'q': query})).json()
+        fake.reset()
+        with ApiServer(fake.base_url, env=env) as api:
+            async with httpx.AsyncClient(base_url=api.base_url, timeout=60, trust_env=False) as client:
+                samples = []
+                for _ in range(args.repeat * 20):
+                    started = time.perf_counter()
+                    r = await client.get("/api/search", params={'q': query, 'category': category_id})
+                    samples.append(time.perf_counter() - started)
+                    r.raise_for_status()
+                bad = await client.get("/api/search", params={'q': ' '})
+        assert first['total'] > 0 and r.json()['items'] == first['items'], "재시작 후 검색 결과가 다름"
+        assert fake.stats()['requests'] == 0, "검색이 네이버에 요청함"
+        assert bad.status_code == 400
+
+    return {
+        'categories': summary['categories'],
+        'keywords': summary['keywords'],
+        'grams': summary['grams'],
+        'indexBytes': size_bytes,
+        'buildSec': round(build, 3),
+        'loadSec': round(load, 3),
+        **results,
+        'api': {'query': query, 'matches': first['total'], 'afterRestart': summarize_ms(samples)},
+    }
+
+
+async def bench_response_bodies(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import httpx
+    from backend import batch
+    from backend.app import _encode_keywords
+    from backend.batch import KeywordBatch, dumps_json, encode_json
+    from backend.cache import AsyncTTLCache
+    from backend.config import KEYWORD_CACHE_TTL
+    from backend.shared_store import SharedResultStore, keywords_key, KEYWORDS_CODEC
+    from benchmarks.fake_naver import FakeCategory
+
+    # 가장 큰 카테고리
+    sizes = [int(s) for s in args.category_sizes.split(",")]
+    index, size = max(enumerate(sizes), key=lambda item: item[1])
+    category = FakeCategory(index, size, seed=0)
+    keywords = {'recomm': KeywordBatch(category.recommend), 'normal': KeywordBatch(category.keywords)}
+
+    def best_ms(encode) -> float:
+        best = float('inf')
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            encode()
+            best = min(best, time.perf_counter() - started)
+        return round(best * 1000, 3)
+
+    expected = dumps_json(keywords).encode('utf-8')
+    assert encode_json(keywords) == expected, "orjson 인코딩 결과가 표준 json 경로와 다름"
+    cache = AsyncTTLCache("bench", 60, 60, 1)
+    entry = cache.set('k', keywords)
+    serialization = {
+        'json': {
+            'stdlibMs': best_ms(lambda: dumps_json(keywords).encode('utf-8')),
+            'orjsonMs': best_ms(lambda: encode_json(keywords)) if batch.orjson is not None else None,
+            'cachedMs': best_ms(lambda: entry.body('json', encode_json)),
+        },
+    }
+    for format in ("txt", "tsv", "csv"):
+        serialization[format] = {
+            'encodeMs': best_ms(lambda: _encode_keywords(keywords, format, True)),
+            'cachedMs': best_ms(lambda: entry.body((format, True), lambda v: _encode_keywords(v, format, True))),
+        }
+
+    requests = [
+        ("json", "/api/keywords", {'categoryId': category.id}),
+        ("tsv", "/api/keywords.txt", {'categoryId': category.id, 'format': 'tsv', 'includeRecomm': 1}),
+    ]
+    api: Dict[str, Dict] = {}
+    bodies: Dict[str, Dict[str, bytes]] = {}
+    for label, enabled in (("encodePerRequest", "0"), ("cachedBodies", "1")):
+        with ApiServer(fake.base_url, env={'NAVER_INFL_RESPONSE_BODY_CACHE': enabled}) as server:
+            # 수집(간격 조절) 대신 직렬화만 측정하도록 공유 저장소에 결과를 미리 넣어 둠
+            shared = SharedResultStore(os.path.join(server.data_dir, "shared.sqlite3"))
+            shared.put_value(keywords_key(category.id), keywords, KEYWORD_CACHE_TTL, KEYWORDS_CODEC)
+            fake.reset()
+            async with httpx.AsyncClient(base_url=server.base_url, timeout=60, trust_env=False) as client:
+                r = await client.get("/api/keywords", params={'categoryId': category.id})
+                r.raise_for_status()
+                assert category.id not in fake.stats()['categories'], "미리 넣어 둔 결과 대신 네이버에서 수집함"
+                api[label] = {}
+                bodies[label] = {}
+                for name, path, params in requests:
+                    latencies: List[float] = []
+
+                    async def client_loop() -> None:
+                        for _ in range(args.requests):
+                            sent = time.perf_counter()
+                            response = await client.get(path, params=params)
+                            response.raise_for_status()
+                            latencies.append(time.perf_counter() - sent)
+                            bodies[label][name] = response.content
+
+                    await asyncio.gather(*(client_loop() for _ in range(args.clients)))
+                    api[label][name] = summarize_ms(latencies)
+    assert bodies["cachedBodies"] == bodies["encodePerRequest"], "본문 보관 여부에 따라 응답이 다름"
+    assert json.loads(bodies["cachedBodies"]["json"])['normal'][0]['name'] == category.keywords[0]['name']
+    for name, _, _ in requests:
+        api[name + "P99Speedup"] = round(
+            api["encodePerRequest"][name]['p99Ms'] / api["cachedBodies"][name]['p99Ms'], 2
+        )
+
+    return {
+        'categoryId': category.id,
+        'keywords': size,
+        'jsonBytes': len(expected),
+        'serialization': serialization,
+        'clients': args.clients,
+        'requestsPerClient': args.requests,
+        'api': api,
+    }
+
+
+async def bench_prewarm(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import random
+    from backend.cache import AsyncTTLCache
+    from backend.http_client import close_client
+    from backend.prewarm import PrewarmScheduler, PrewarmStore, estimate_requests
+    from backend.scraper import fetch_categories_async, get_all_keywords_async
+    from backend.shared_store import SharedResultStore, keywords_key, KEYWORDS_CODEC
+
+    hot = args.prewarm_categories.split(",")
+    cold = args.prewarm_cold_category
+    ttl = args.prewarm_ttl
+
+    async def crawl(category_id: str) -> Dict:
+        return await get_all_keywords_async(category_id, pacer=NoWaitPacer())
+
+    def setup(data_dir: str, **options):
+        # API 서버와 같은 구성 (메모리 캐시 -> 공유 저장소 -> 수집), 만료되면 다음 요청이 수집을 기다림
+        cache = AsyncTTLCache("prewarm", ttl, 0, len(hot) + 1)
+        shared = SharedResultStore(os.path.join(data_dir, "shared.sqlite3"))
+
+        def load(category_id: str):
+            return lambda: shared.get_or_load(keywords_key(category_id), lambda: crawl(category_id), ttl, KEYWORDS_CODEC)
+
+        async def refresh(category_id: str) -> Dict:
+            async def load_fresh() -> Dict:
+                keywords = await crawl(category_id)
+                shared.put(keywords_key(category_id), KEYWORDS_CODEC.encode(keywords), ttl)
+                return keywords
+            return (await cache.refresh(category_id, load_fresh)).value
+
+        scheduler = PrewarmScheduler(
+            refresh, fetch_categories_async, PrewarmStore(os.path.join(data_dir, "prewarm.sqlite3")), shared,
+            **{'interval': args.prewarm_interval, 'lead': args.prewarm_lead, 'min_score': 3, 'quiet_hours': "", **options},
+        )
+        return cache, load, scheduler
+
+    async def simulate(enabled: bool) -> Dict:
+        rng = random.Random(0)
+        with tempfile.TemporaryDirectory(prefix="naver_infl_prewarm_") as data_dir:
+            cache, load, scheduler = setup(data_dir, enabled=enabled)
+            latencies: List[float] = []
+            # 인기 없는 카테고리는 한 번만 요청
+            scheduler.record(cold)
+            await cache.get_or_load(cold, load(cold))
+            for category_id in hot:
+                await cache.get_or_load(category_id, load(category_id))
+            warm_misses = cache.stats.misses
+            scheduler.start()
+            deadline = time.perf_counter() + args.prewarm_duration
+
+            async def user() -> None:
+                while time.perf_counter() < deadline:
+                    category_id = rng.choice(hot)
+                    scheduler.record(category_id)
+                    sent = time.perf_counter()
+                    await cache.get_or_load(category_id, load(category_id))
+                    latencies.append(time.perf_counter() - sent)
+                    await asyncio.sleep(rng.uniform(0.05, 0.25))
+
+            fake.reset()
+            await asyncio.gather(*(user() for _ in range(args.clients)))
+            await scheduler.stop()
+            # 멈출 때 진행 중이던 미리 갱신 수집은 캐시가 shield로 감싸 계속되므로 끝날 때까지 기다림
+            # (다음 측정의 upstream 요청 수에 섞이지 않도록)
+            await asyncio.gather(*cache._inflight.values(), return_exceptions=True)
+            upstream = fake.stats()
+            runs = scheduler.store.last_runs()
+            assert cold not in runs, "인기 없는 카테고리를 미리 갱신함"
+            requests = len(latencies)
+            return {
+                'requests': requests,
+                'missRatio': round((cache.stats.misses - warm_misses) / requests, 4),
+                'latency': summarize_ms(latencies),
+                'refreshes': cache.stats.refreshes,
+                'upstreamRequests': upstream['requests'],
+            }
+
+    fake.configure(latency_ms=args.prewarm_latency_ms)
+    try:
+        off = await simulate(False)
+        on = await simulate(True)
+        assert on['missRatio'] < off['missRatio'], "미리 갱신해도 캐시 미스가 줄지 않음"
+
+        # 요청 예산보다 큰 카테고리, 쉬는 시간대에는 upstream 요청을 보내지 않음
+        guards = {}
+        for label, options in (("budget", {'budget': 1}), ("quiet", {'quiet_hours': "00-24"})):
+            with tempfile.TemporaryDirectory(prefix="naver_infl_prewarm_") as data_dir:
+                _, _, scheduler = setup(data_dir, **options)
+                for category_id in hot:
+                    for _ in range(10):
+                        scheduler.record(category_id)
+                fake.reset()
+                refreshed = await scheduler.tick()
+                await scheduler.stop()
+                upstream = fake.stats()['requests']
+                assert refreshed == [] and upstream <= (1 if label == "budget" else 0), f"{label}: upstream 요청 발생"
+                guards[label] = {'refreshed': len(refreshed), 'upstreamRequests': upstream}
+    finally:
+        fake.configure(latency_ms=args.latency_ms)
+        await close_client()
+
+    sizes = [int(s) for s in args.category_sizes.split(",")]
+    return {
+        'categories': {category_id: sizes[int(category_id) - 1000] for category_id in hot},
+        'estimatedRequests': {category_id: estimate_requests(sizes[int(category_id) - 1000]) for category_id in hot},
+        'ttlSec': ttl,
+        'leadSec': args.prewarm_lead,
+        'latencyMs': args.prewarm_latency_ms,
+        'durationSec': args.prewarm_duration,
+        'clients': args.clients,
+        'off': off,
+        'on': on,
+        'p99Speedup': round(off['latency']['p99Ms'] / on['latency']['p99Ms'], 2),
+        'guards': guards,
+    }
+
+
+async def bench_resilience(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import httpx
+    from backend import app as api_app
+    from backend.http_client import close_client
+    from backend.resilience import CircuitBreaker, get_default_breaker, get_default_hedger
+    from backend.scraper import fetch_all_keywords_async, iter_keyword_pages_async
+    from backend.shared_store import get_default_shared_store, keywords_key
+
+    category_id = args.resilience_category
+    hedger = get_default_hedger()
+    breaker = get_default_breaker()
+    results: Dict = {}
+
+    async def crawl_pages() -> List[float]:
+        # NoWaitPacer 라 페이지 사이 시간이 곧 페이지 요청 지연 시간
+        latencies = []
+        pages = iter_keyword_pages_async(category_id, pacer=NoWaitPacer())
+        while True:
+            sent = time.perf_counter()
+            try:
+                await pages.__anext__()
+            except StopAsyncIteration:
+                break
+            latencies.append(time.perf_counter() - sent)
+        return latencies
+
+    try:
+        # 1) 꼬리 지연: 일부 페이지만 slow_ms 만큼 느릴 때 hedged request on/off
+        fake.configure(latency_ms=args.resilience_latency_ms, jitter_ms=args.resilience_latency_ms,
+                       slow_rate=args.resilience_slow_rate, slow_ms=args.resilience_slow_ms)
+        expected = await fetch_all_keywords_async(category_id, pacer=NoWaitPacer())
+        hedging = {}
+        for label, enabled in (("off", False), ("on", True)):
+            hedger.reset()
+            hedger.enabled = enabled
+            fake.reset()
+            samples: List[float] = []
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                samples += await crawl_pages()
+            elapsed = time.perf_counter() - started
+            upstream = fake.stats()['requests']
+            assert await fetch_all_keywords_async(category_id, pacer=NoWaitPacer()) == expected
+            hedging[label] = {
+                'pages': len(samples),
+                'latency': summarize_ms(samples),
+                'crawlSec': round(elapsed / args.repeat, 3),
+                'extraRequestRatio': round(upstream / len(samples) - 1, 4),
+                **({'hedges': hedger.hedges, 'hedgeWins': hedger.hedge_wins} if enabled else {}),
+            }
+        hedging['p99Speedup'] = round(hedging['off']['latency']['p99Ms'] / hedging['on']['latency']['p99Ms'], 2)
+        assert hedging['on']['latency']['p99Ms'] < hedging['off']['latency']['p99Ms'], "hedged request가 p99를 줄이지 못함"
+        results['hedging'] = hedging
+        hedger.enabled = False
+
+        # 2) 재시도 jitter: 5xx가 섞여도 결과가 같고 차단기가 열리지 않음
+        fake.configure(latency_ms=0, jitter_ms=0, slow_rate=0, error_rate=args.resilience_error_rate)
+        fake.reset()
+        started = time.perf_counter()
+        retried = await fetch_all_keywords_async(category_id, pacer=NoWaitPacer())
+        faults = fake.stats()['faults'].get('500', 0)
+        assert retried == expected and breaker.state == CircuitBreaker.CLOSED
+        results['retries'] = {
+            'errorRate': args.resilience_error_rate,
+            'injected500': faults,
+            'crawlSec': round(time.perf_counter() - started, 3),
+        }
+
+        # 3) 네이버 장애 중 API (같은 프로세스에서 실행해 캐시 만료와 차단 시간을 조절)
+        fake.configure(error_rate=0)
+        api_app.api_pacer = NoWaitPacer()
+        breaker.reset_timeout = args.resilience_breaker_reset
+        transport = httpx.ASGITransport(app=api_app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://api", timeout=300) as client:
+            stale_id = args.resilience_stale_category
+            r = await client.get("/api/keywords", params={'categoryId': stale_id})
+            r.raise_for_status()
+            before = r.content
+
+            outage = {}
+            for label, enabled in (("breakerOff", False), ("breakerOn", True)):
+                breaker.reset()
+                breaker.enabled = enabled
+                api_app.keywords_cache.invalidate(category_id)
+                fake.configure(error_rate=1.0)
+                fake.reset()
+                latencies: List[float] = []
+                statuses: Dict[int, int] = {}
+                deadline = time.perf_counter() + args.resilience_outage_sec
+
+                async def user() -> None:
+                    while time.perf_counter() < deadline:
+                        sent = time.perf_counter()
+                        response = await client.get("/api/keywords", params={'categoryId': category_id})
+                        latencies.append(time.perf_counter() - sent)
+                        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                        if response.status_code == 503:
+                            assert int(response.headers['retry-after']) >= 1
+                        await asyncio.sleep(0.05)
+
+                await asyncio.gather(*(user() for _ in range(args.clients)))
+                outage[label] = {
+                    'requests': len(latencies),
+                    'statuses': {str(k): v for k, v in sorted(statuses.items())},
+                    'latency': summarize_ms(latencies),
+                    'upstreamRequests': fake.stats()['requests'],
+                }
+            assert outage['breakerOn']['latency']['p99Ms'] < outage['breakerOff']['latency']['p99Ms']
+            assert outage['breakerOn']['upstreamRequests'] < outage['breakerOff']['upstreamRequests']
+            assert breaker.opened >= 1 and breaker.state != CircuitBreaker.CLOSED
+
+            # 차단 중 만료된 결과는 stale 표시와 함께 그대로 응답 (시험 요청이 끼지 않도록 차단 시간을 늘림)
+            breaker.reset_timeout = 60
+            entry = api_app.keywords_cache.peek(stale_id)
+            entry.expires_at = entry.stale_until = time.time() - 1
+            get_default_shared_store().invalidate(keywords_key(stale_id))
+            r = await client.get("/api/keywords", params={'categoryId': stale_id})
+            assert r.status_code == 200 and r.headers.get('warning', '').startswith('110') and r.content == before
+            outage['staleServed'] = {'status': r.status_code, 'warning': r.headers['warning'], 'age': r.headers['age']}
+
+            # 차단 시간이 지나면 시험 요청 하나로 다시 열림
+            fake.configure(error_rate=0)
+            breaker.reset_timeout = args.resilience_breaker_reset
+            await asyncio.sleep(breaker.retry_after)
+            r = await client.get("/api/keywords", params={'categoryId': category_id})
+            r.raise_for_status()
+            assert breaker.state == CircuitBreaker.CLOSED and len(r.json()['normal']) == len(expected)
+            outage['recovered'] = (await client.get("/api/upstream")).json()['breaker']
+        results['outage'] = outage
+    finally:
+        hedger.enabled = False
+        breaker.enabled = True
+        breaker.reset()
+        fake.configure(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, slow_rate=0, slow_ms=0, error_rate=0)
+        await close_client()
+
+    return {
+        'categoryId': category_id,
+        'slowRate': args.resilience_slow_rate,
+        'slowMs': args.resilience_slow_ms,
+        'outageSec': args.resilience_outage_sec,
+        'clients': args.clients,
+        **results,
+    }
+
+
+def _proc_status_mb(pid: int, field: str) -> float:
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return 0.0
+
+
+def peak_rss_mb(pid: int) -> float:
+    """프로세스 최대 RSS (MB, /proc 이 없으면 0)"""
+    return _proc_status_mb(pid, "VmHWM")
+
+
+def rss_mb(pid: int) -> float:
+    """프로세스 현재 RSS (MB, /proc 이 없으면 0)"""
+    return _proc_status_mb(pid, "VmRSS")
+
+
+def reset_peak_rss(pid: int) -> None:
+    """최대 RSS를 현재 RSS로 되돌림 (/proc/{pid}/clear_refs, 지원하지 않으면 무시)"""
+    try:
+        with open(f"/proc/{pid}/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+async def bench_admission(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import httpx
+
+    max_crawls = args.admission_max_crawls
+    quota_probe = 5  # 클라이언트 한도 확인에 남겨 둘 카테고리 수
+    sizes = [args.admission_category_size] * (args.admission_categories + quota_probe)
+    quota_ids = [str(1000 + args.admission_categories + i) for i in range(quota_probe)]
+
+    async def soak(enabled: bool) -> Dict:
+        env = {
+            'NAVER_INFL_ADMISSION': "1" if enabled else "0",
+            'NAVER_INFL_MAX_CRAWLS': str(max_crawls),
+            'NAVER_INFL_CLIENT_HEADER': "X-Client-Id",
+        }
+        # 카테고리가 많은 가짜 서버를 따로 띄워 요청마다 새로 수집하게 함 (캐시 적중 없음)
+        with FakeNaverServer(sizes, latency_ms=args.admission_latency_ms) as upstream, \
+                ApiServer(upstream.base_url, env=env) as api:
+            limits = httpx.Limits(max_connections=args.admission_clients + 8)
+            async with httpx.AsyncClient(base_url=api.base_url, timeout=300, trust_env=False, limits=limits) as client:
+                pending = iter(range(args.admission_categories))
+                latencies: Dict[str, List[float]] = {'ok': [], 'rejected': []}
+                statuses: Dict[int, int] = {}
+                positions = 0
+                peaks = {'crawls': 0, 'queued': 0}
+                deadline = time.perf_counter() + args.admission_duration
+
+                async def user(index: int) -> None:
+                    nonlocal positions
+                    headers = {'X-Client-Id': f"user-{index}"}
+                    while time.perf_counter() < deadline:
+                        index = next(pending, None)
+                        if index is None:
+                            return
+                        sent = time.perf_counter()
+                        r = await client.get("/api/keywords", params={'categoryId': 1000 + index, 'sleepSec': 0},
+                                             headers=headers)
+                        statuses[r.status_code] = statuses.get(r.status_code, 0) + 1
+                        if r.status_code == 429:
+                            latencies['rejected'].append(time.perf_counter() - sent)
+                            positions += 'x-queue-position' in r.headers
+                            # Retry-After를 따르되 측정 시간 안에서 다시 시도하도록 상한을 둠
+                            await asyncio.sleep(min(int(r.headers['retry-after']), args.admission_retry_cap))
+                            continue
+                        r.raise_for_status()
+                        latencies['ok'].append(time.perf_counter() - sent)
+
+                async def monitor() -> None:
+                    while time.perf_counter() < deadline:
+                        metrics = (await client.get("/metrics")).text
+                        for line in metrics.splitlines():
+                            if line.startswith("naver_crawls_in_flight "):
+                                peaks['crawls'] = max(peaks['crawls'], int(float(line.split()[1])))
+                        state = (await client.get("/api/admission")).json()
+                        peaks['queued'] = max(peaks['queued'], sum(state['queued'].values()))
+                        await asyncio.sleep(0.05)
+
+                async def categories_under_load() -> float:
+                    # 수집 자리가 꽉 찬 뒤 처음(캐시 없음) 카테고리 목록 요청
+                    await asyncio.sleep(min(2.0, args.admission_duration / 2))
+                    sent = time.perf_counter()
+                    r = await client.get("/api/categories", headers={'X-Client-Id': "categories"})
+                    r.raise_for_status()
+                    return time.perf_counter() - sent
+
+                upstream.reset()
+                started = time.perf_counter()
+                *_, categories_sec = await asyncio.gather(
+                    *(user(i) for i in range(args.admission_clients)), monitor(), categories_under_load(),
+                )
+                elapsed = time.perf_counter() - started
+                pages = upstream.stats()['requests']
+
+                quota = None
+                if enabled:
+                    # 같은 클라이언트가 한도보다 많은 카테고리를 한꺼번에 요청하면 넘는 만큼 429
+                    responses = await asyncio.gather(*(
+                        client.get("/api/keywords", params={'categoryId': category_id, 'sleepSec': 0},
+                                   headers={'X-Client-Id': "greedy"})
+                        for category_id in quota_ids
+                    ))
+                    state = (await client.get("/api/admission")).json()
+                    quota = {
+                        'requests': len(responses),
+                        'rejected': sum(r.status_code == 429 for r in responses),
+                        'perClient': state['perClient'],
+                    }
+                    assert quota['rejected'] >= quota['requests'] - quota['perClient'], "클라이언트 한도를 넘어도 거절하지 않음"
+                admission = (await client.get("/api/admission")).json()
+            rss = peak_rss_mb(api.process.pid)
+
+        result = {
+            'statuses': {str(k): v for k, v in sorted(statuses.items())},
+            'completedCrawls': len(latencies['ok']),
+            'crawlLatency': summarize_ms(latencies['ok']),
+            'rejectLatency': summarize_ms(latencies['rejected']) if latencies['rejected'] else None,
+            'rejectedWithPosition': positions,
+            'peakCrawlsInFlight': peaks['crawls'],
+            'peakQueued': peaks['queued'],
+            'peakRssMb': rss,
+            'upstreamRequestsPerSec': round(pages / elapsed, 1),
+            'categoriesUnderLoadMs': round(categories_sec * 1000, 3),
+            'rejectedByReason': admission['rejected'],
+        }
+        if quota is not None:
+            result['clientQuota'] = quota
+        return result
+
+    off = await soak(False)
+    on = await soak(True)
+    assert on['peakCrawlsInFlight'] <= max_crawls, "동시 수집 수가 제한을 넘음"
+    assert set(on['statuses']) <= {"200", "429"}, f"200/429 외의 응답: {on['statuses']}"
+    assert on['categoriesUnderLoadMs'] < on['crawlLatency']['p50Ms'], "카테고리 목록이 수집 대기열 뒤에서 기다림"
+    return {
+        'clients': args.admission_clients,
+        'maxCrawls': max_crawls,
+        'categorySize': args.admission_category_size,
+        'latencyMs': args.admission_latency_ms,
+        'durationSec': args.admission_duration,
+        'off': off,
+        'on': on,
+    }
+
+
+async def bench_trends(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import httpx
+    import numpy as np
+    from backend.batch import KeywordBatch
+    from backend.trends import TrendStore, compute_trends
+
+    keys, snapshots, k = args.trends_keywords, args.trends_snapshots, 20
+    rng = np.random.default_rng(0)
+    # 키워드는 처음에 절반, 이후 스냅샷마다 조금씩 새로 나오고 일부는 빠짐 (참여자수는 곱셈 random walk)
+    born = np.where(np.arange(keys) < keys // 2, 0, rng.integers(1, snapshots, keys))
+    counts = rng.lognormal(4, 1.5, keys)
+    names = [f"키워드{i:06d}" for i in range(keys)]
+    started_at = time.time() - snapshots * 86400
+
+    def baseline(store: TrendStore, category_id: str, window: int):
+        # numpy 없이 스냅샷을 행 단위로 읽어 키워드마다 반복하는 기준 구현
+        from array import array
+        selected = store.snapshots(category_id)[-window:]
+        _, counts_path = store._paths(category_id)
+        rows = []
+        with open(counts_path, "rb") as f:
+            for snapshot in selected:
+                f.seek(snapshot.offset * 4)
+                row = array('i')
+                row.frombytes(f.read(snapshot.length * 4))
+                rows.append(row)
+        changes = []
+        for column in range(len(rows[-1])):
+            current = rows[-1][column]
+            if current < 0:
+                continue
+            for row in rows[:-1]:
+                if column < len(row) and row[column] >= 0:
+                    changes.append((current - row[column], column))
+                    break
+        gainers = sorted((c for c in changes if c[0] > 0), key=lambda c: (-c[0], c[1]))[:k]
+        with open(os.path.join(os.path.dirname(counts_path), "keys.txt"), encoding="utf-8") as f:
+            columns = f.read().split("\n")
+        return [(columns[column], change) for change, column in gainers]
+
+    with tempfile.TemporaryDirectory(prefix="naver_infl_trends_") as data_dir:
+        store = TrendStore(os.path.join(data_dir, "trends"), min_interval=0)
+        category_id = "trends"
+        append_samples = []
+        for step in range(snapshots):
+            counts *= rng.lognormal(0.002, 0.05, keys)
+            alive = (born <= step) & (rng.random(keys) > 0.02)
+            order = np.flatnonzero(alive)
+            batch = KeywordBatch.from_columns([names[i] for i in order.tolist()], counts[order].astype(np.int64).tolist())
+            started = time.perf_counter()
+            store.append(category_id, batch, started_at + step * 86400)
+            append_samples.append(time.perf_counter() - started)
+        history_bytes = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, files in os.walk(store.directory) for name in files
+        )
+
+        windows = {}
+        for window in sorted({2, 7, 30, snapshots}):
+            samples = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                result = store.trends(category_id, window, k)
+                samples.append(time.perf_counter() - started)
+            windows[str(window)] = {**summarize_ms(samples), 'keywords': result['keywords']}
+
+        # 같은 구간을 키워드마다 반복하는 기준 구현과 비교 (상위 K개가 같은지 확인)
+        window = min(30, snapshots)
+        started = time.perf_counter()
+        expected = baseline(store, category_id, window)
+        scan = time.perf_counter() - started
+        actual = store.trends(category_id, window, k)
+        assert [(g['name'], g['change']) for g in actual['gainers']] == expected, "상위 키워드가 기준 구현과 다름"
+        taken_at, matrix, matrix_names = store.matrix(category_id, window)
+        started = time.perf_counter()
+        compute_trends(taken_at, matrix, matrix_names, k, "rate")
+        compute_only = time.perf_counter() - started
+
+        # API: 쌓인 스냅샷으로 네이버 요청 없이 응답하고, 수집을 마치면 스냅샷이 기록되는지 확인
+        fake.reset()
+        with ApiServer(fake.base_url, env={'NAVER_INFL_DATA_DIR': data_dir}) as api:
+            async with httpx.AsyncClient(base_url=api.base_url, timeout=300, trust_env=False) as client:
+                api_samples = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    r = await client.get("/api/trends", params={'categoryId': category_id, 'window': 7, 'k': k})
+                    api_samples.append(time.perf_counter() - started)
+                    r.raise_for_status()
+                assert r.json()['gainers'] == store.trends(category_id, 7, k)['gainers'], "API 결과가 다름"
+                assert fake.stats()['requests'] == 0, "추이 조회가 네이버에 요청함"
+                missing = await client.get("/api/trends", params={'categoryId': args.api_category})
+                r = await client.get("/api/keywords", params={'categoryId': args.api_category, 'sleepSec': 0})
+                r.raise_for_status()
+                recorded = 0
+                for _ in range(50):
+                    recorded = len(TrendStore(os.path.join(data_dir, "trends")).snapshots(args.api_category))
+                    if recorded:
+                        break
+                    await asyncio.sleep(0.1)
+        assert missing.status_code == 404, f"스냅샷 없는 카테고리: {missing.status_code}"
+        assert recorded == 1, "수집을 마친 카테고리의 스냅샷이 기록되지 않음"
+
+    window_ms = windows[str(window)]['p50Ms']
+    return {
+        'keywords': keys,
+        'snapshots': snapshots,
+        'historyMB': round(history_bytes / 2**20, 1),
+        'append': summarize_ms(append_samples),
+        'query': windows,
+        'computeOnlyMs': round(compute_only * 1000, 3),
+        'baseline': {'window': window, 'scanMs': round(scan * 1000, 3), 'speedup': round(scan * 1000 / window_ms, 1)},
+        'api': summarize_ms(api_samples),
+    }
+
+
+async def bench_export(fake: FakeNaverServer, args: argparse.Namespace) -> Dict:
+    import gzip
+    import zipfile
+    import httpx
+    from backend.batch import KeywordBatch
+    from backend.export import ExportPipeline, ExportUnavailable, check_options
+    from backend.utils import save_keywords
+    from benchmarks.fake_naver import FakeCategory
+
+    categories = [FakeCategory(i, args.export_keywords, seed=0) for i in range(args.export_categories)]
+    keywords = {c.id: {'recomm': [], 'normal': KeywordBatch(c.keywords)} for c in categories}
+    rows = sum(len(k['normal']) for k in keywords.values())
+    text_formats = ["txt", "tsv", "csv"]
+    pid = os.getpid()
+
+    def measured(run: Callable[[str], None]) -> Dict:
+        # 최대 RSS를 되돌린 뒤 실행해 그 실행이 늘린 메모리만 기록
+        samples, peaks = [], []
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory(prefix="naver_infl_export_") as directory:
+                reset_peak_rss(pid)
+                before = rss_mb(pid)
+                started = time.perf_counter()
+                run(directory)
+                samples.append(time.perf_counter() - started)
+                peaks.append(peak_rss_mb(pid) - before)
+                size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        best = min(samples)
+        return {
+            'sec': round(best, 3),
+            'rowsPerSec': round(rows / best),
+            'peakRssDeltaMB': round(max(peaks), 1),
+            'outputMB': round(size / 2**20, 2),
+        }
+
+    def per_format(directory: str) -> None:
+        # 기존 방식: 포맷마다 save_keywords (포맷마다 전체 문자열을 만들어 저장)
+        for c in categories:
+            for format in text_formats:
+                save_keywords(c.name, keywords[c.id], format, output_dir=directory)
+
+    def pipeline(formats: List[str], compression: str) -> Callable[[str], None]:
+        def run(directory: str) -> None:
+            with ExportPipeline(directory, formats, compression) as exporter:
+                for c in categories:
+                    exporter.write_category(c.id, c.name, keywords[c.id])
+        return run
+
+    files = {'saveKeywordsPerFormat': measured(per_format)}
+    variants = [(text_formats, "none"), (text_formats, "gzip"), (text_formats, "zstd"),
+                (["parquet"], "none"), (["arrow"], "none"), (text_formats + ["parquet"], "gzip")]
+    for formats, compression in variants:
+        try:
+            check_options(formats, compression)
+        except ExportUnavailable as e:
+            print(f"  건너뜀 ({'+'.join(formats)}/{compression}): {e}", file=sys.stderr)
+            continue
+        files[f"{'+'.join(formats)}/{compression}"] = measured(pipeline(formats, compression))
+    files['singlePassSpeedup'] = round(files['saveKeywordsPerFormat']['sec'] / files['txt+tsv+csv/none']['sec'], 2)
+
+    # 여러 포맷 / 압축으로 저장한 내용이 save_keywords 결과와 같은지 확인
+    with tempfile.TemporaryDirectory(prefix="naver_infl_export_") as directory:
+        with ExportPipeline(os.path.join(directory, "gz"), text_formats, "gzip") as exporter:
+            for c in categories[:2]:
+                exporter.write_category(c.id, c.name, keywords[c.id])
+        for c in categories[:2]:
+            for format in text_formats:
+                expected = save_keywords(c.name, keywords[c.id], format, output_dir=os.path.join(directory, "ref"))
+                with gzip.open(os.path.join(directory, "gz", f"{c.name}.{format}.gz")) as f, open(expected, "rb") as g:
+                    assert f.read() == g.read(), f"{c.name}.{format}: save_keywords 결과와 다름"
+        leftovers = [name for root, _, names in os.walk(directory) for name in names if name.endswith(".tmp")]
+        assert not leftovers, f"임시 파일이 남음: {leftovers}"
+
+    # API: 받아 둔 카테고리를 zip으로 스트리밍하는 동안 서버 최대 RSS 증가량과 처리량
+    formats = "txt,tsv,csv,parquet"
+    with ApiServer(fake.base_url) as api:
+        async with httpx.AsyncClient(base_url=api.base_url, timeout=300, trust_env=False) as client:
+            r = await client.get("/api/categories")
+            r.raise_for_status()
+            category_ids = [str(c['id']) for c in r.json()]
+            for category_id in category_ids:
+                (await client.get("/api/keywords", params={'categoryId': category_id, 'sleepSec': 0})).raise_for_status()
+            expected_txt = (await client.get("/api/keywords.txt", params={'categoryId': category_ids[-1]})).content
+            fake.reset()
+            server_pid = api.process.pid
+            # 첫 번째는 pyarrow / 스레드 풀 초기화가 포함되므로 따로 기록
+            streams = []
+            for _ in range(max(2, args.repeat)):
+                reset_peak_rss(server_pid)
+                before = rss_mb(server_pid)
+                body = tempfile.TemporaryFile()
+                size, first_byte = 0, None
+                started = time.perf_counter()
+                async with client.stream("GET", "/api/export", params={'format': formats, 'cachedOnly': 1}) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes():
+                        if first_byte is None:
+                            first_byte = time.perf_counter() - started
+                        body.write(chunk)
+                        size += len(chunk)
+                elapsed = time.perf_counter() - started
+                streams.append({
+                    'sec': round(elapsed, 3),
+                    'firstByteMs': round(first_byte * 1000, 1),
+                    'zipMB': round(size / 2**20, 2),
+                    'MBPerSec': round(size / 2**20 / elapsed, 1),
+                    'serverPeakRssDeltaMB': round(peak_rss_mb(server_pid) - before, 1),
+                })
+            bad = await client.get("/api/export", params={'format': "txt,xlsx"})
+        assert fake.stats()['requests'] == 0, "cachedOnly 내보내기가 네이버에 요청함"
+    assert bad.status_code == 400
+    body.seek(0)
+    with zipfile.ZipFile(body) as archive:
+        manifest = json.loads(archive.read("manifest.json"))
+        assert len(manifest['categories']) == len(category_ids) and not manifest['errors'], manifest
+        entry = next(n for n in archive.namelist() if n.startswith("txt/") and manifest['categories'][-1]['name'] in n)
+        assert archive.read(entry) == expected_txt, "zip의 txt 항목이 /api/keywords.txt 와 다름"
+        assert "keywords.parquet" in archive.namelist()
+        uncompressed = sum(info.file_size for info in archive.infolist())
+    body.close()
+    cold, warm = streams[0], streams[1:]
+    best = min(warm, key=lambda s: s['sec'])
+    warm_peak = max(s['serverPeakRssDeltaMB'] for s in warm)
+    # zip을 다 만든 뒤 보내면 첫 바이트가 거의 끝에 도착함 (메모리 상한은 카테고리 하나 + EXPORT_SPOOL_BYTES)
+    assert best['firstByteMs'] < best['sec'] * 1000 / 2, f"zip을 스트리밍하지 않음 (첫 바이트 {best['firstByteMs']}ms)"
+
+    return {
+        'categories': len(categories),
+        'rows': rows,
+        'files': files,
+        'api': {
+            'formats': formats,
+            'rows': manifest['rows'],
+            'uncompressedMB': round(uncompressed / 2**20, 2),
+            **best,
+            'serverPeakRssDeltaMB': warm_peak,
+            'coldServerPeakRssDeltaMB': cold['serverPeakRssDeltaMB'],
+        },
+    }
+
+
+RUNNERS: Dict[str, Callable] = {
+    'categories': bench_categories,
+    'keyword_pages': bench_keyword_pages,
+    'connection_pool': bench_connection_pool,
+    'pacing': bench_pacing,
+    'categories_under_load': bench_categories_under_load,
+    'api_text': bench_api_text,
+    'formatters': bench_formatters,
+    'instrumentation': bench_instrumentation,
+    'shared_workers': bench_shared_workers,
+    'partitioned': bench_partitioned,
+    'checkpoint_resume': bench_checkpoint_resume,
+    'graphql_payload': bench_graphql_payload,
+    'keywords_overlap': bench_keywords_overlap,
+    'search_index': bench_search_index,
+    'response_bodies': bench_response_bodies,
+    'prewarm': bench_prewarm,
+    'resilience': bench_resilience,
+    'admission': bench_admission,
+    'trends': bench_trends,
+    'export': bench_export,
+}
+
+
+def flatten(value, prefix: str = "") -> Dict[str, float]:
+    """중첩된 결과를 'benchmark.metric' 형태의 숫자 지표로 평탄화"""
+    if isinstance(value, dict):
+        flat = {}
+        for key, item in value.items():
+            flat.update(flatten(item, f"{prefix}.{key}" if prefix else key))
+        return flat
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {prefix: value}
+    return {}
+
+
+def compare(current: Dict, baseline: Dict) -> None:
+    """두 결과의 공통 지표 비교 출력 (비율 = 현재 / 기준)"""
+    base_meta = baseline.get('meta', {})
+    print(f"\n기준: {(base_meta.get('commit') or '?')[:10]} ({base_meta.get('timestamp', '?')})")
+    now, base = flatten(current['results']), flatten(baseline.get('results', {}))
+    print(f"{'지표':<40}{'기준':>14}{'현재':>14}{'비율':>9}")
+    for key in sorted(now.keys() & base.keys()):
+        ratio = now[key] / base[key] if base[key] else float('nan')
+        print(f"{key:<40}{base[key]:>14,.3f}{now[key]:>14,.3f}{ratio:>8.2f}x")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크 모음 (가짜 네이버 서버 사용)")
+    parser.add_argument("--only", help=f"실행할 벤치마크 (쉼표 구분, 기본값: 전체 - {','.join(BENCHMARKS)})")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용, 기본값: 3)")
+    parser.add_argument("--category-sizes", default="200,2000,20000,100000",
+                        help="가짜 서버 카테고리별 키워드 수 (ID는 1000부터 차례대로)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="가짜 서버 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="가짜 서버 추가 지연 범위 (ms)")
+    parser.add_argument("--crawl-category", default="1002", help="keyword_pages 수집 카테고리 (기본값: 1002)")
+    parser.add_argument("--pool-category", default="1002", help="connection_pool 수집 카테고리 (기본값: 1002)")
+    parser.add_argument("--pool-pages", type=int, default=200,
+                        help="connection_pool 수집당 최대 페이지 수 (기본값: 200)")
+    parser.add_argument("--pool-latency-ms", type=float, default=2.0,
+                        help="connection_pool 가짜 서버 응답 지연 (ms, 기본값: 2)")
+    parser.add_argument("--pool-handshake-ms", type=float, default=20.0,
+                        help="connection_pool 새 연결의 첫 요청 추가 지연 - TLS 핸드셰이크 대역 (ms, 기본값: 20)")
+    parser.add_argument("--pacing-category", default="1003",
+                        help="pacing 수집 카테고리 (기본값: 1003)")
+    parser.add_argument("--pacing-rate-limit", type=float, default=1.5,
+                        help="pacing 가짜 서버 초당 요청 수 상한 (기본값: 1.5)")
+    parser.add_argument("--pacing-start-delay", type=float, default=0.5,
+                        help="pacing 시작 간격 = 적응형 최소 간격 = 고정 간격 (초, 기본값: 0.5 - PACER_MIN_DELAY)")
+    parser.add_argument("--pacing-duration", type=float, default=30.0,
+                        help="pacing 간격 조절기마다 수집할 시간 (초, 기본값: 30)")
+    parser.add_argument("--pacing-noise-sleep", type=float, default=0.0,
+                        help="pacing 지연 잡음 구간의 sleepSec (초, 기본값: 0)")
+    parser.add_argument("--pacing-noise-pages", type=int, default=300,
+                        help="pacing 지연 잡음 구간에서 수집할 페이지 수 (기본값: 300)")
+    parser.add_argument("--pacing-noise-latency-ms", type=float, default=20.0,
+                        help="pacing 지연 잡음 구간의 기본 응답 지연 (ms, jitter는 3배, 기본값: 20)")
+    parser.add_argument("--pacing-noise-slow-rate", type=float, default=0.05,
+                        help="pacing 지연 잡음 구간에서 느린 응답 비율 (기본값: 0.05)")
+    parser.add_argument("--pacing-noise-slow-ms", type=float, default=400.0,
+                        help="pacing 지연 잡음 구간의 느린 응답 추가 지연 (ms, 기본값: 400)")
+    parser.add_argument("--load-categories", default="1000,1001,1002",
+                        help="categories_under_load 동시에 수집할 카테고리 (쉼표 구분, 기본값: 1000,1001,1002)")
+    parser.add_argument("--load-latency-ms", type=float, default=5.0,
+                        help="categories_under_load 가짜 서버 응답 지연 (ms, 기본값: 5)")
+    parser.add_argument("--load-idle-sec", type=float, default=3.0,
+                        help="categories_under_load 유휴 상태 측정 시간 (초, 기본값: 3)")
+    parser.add_argument("--load-probe-interval", type=float, default=0.02,
+                        help="categories_under_load 카테고리 목록 요청 간격 (초, 기본값: 0.02)")
+    parser.add_argument("--load-slack-ms", type=float, default=50.0,
+                        help="categories_under_load 유휴 p95 대비 허용 증가량 (ms, 기본값: 50)")
+    parser.add_argument("--api-category", default="1002", help="api_text 카테고리 (기본값: 1002)")
+    parser.add_argument("--api-format", choices=["txt", "tsv", "csv"], default="tsv")
+    parser.add_argument("--clients", type=int, default=8, help="api_text 동시 클라이언트 수 (기본값: 8)")
+    parser.add_argument("--requests", type=int, default=25, help="api_text 클라이언트당 요청 수 (기본값: 25)")
+    parser.add_argument("--workers", type=int, default=4, help="shared_workers API 워커 수 (기본값: 4)")
+    parser.add_argument("--shared-timeout", type=float, default=30.0,
+                        help="shared_workers 요청 하나의 최대 대기 시간 (초, 기본값: 30)")
+    parser.add_argument("--shared-categories", default="1000,1001",
+                        help="shared_workers 동시 요청 카테고리 (쉼표 구분, 기본값: 1000,1001)")
+    parser.add_argument("--partition-latency-ms", type=float, default=20.0,
+                        help="partitioned 측정 중 가짜 서버 응답 지연 (ms, 기본값: 20)")
+    parser.add_argument("--partition-concurrency", type=lambda v: [int(c) for c in v.split(",")], default=[2, 4, 8],
+                        help="partitioned 동시 검색어 수 (쉼표 구분, 기본값: 2,4,8)")
+    parser.add_argument("--partition-rate", type=float, default=0,
+                        help="partitioned 전체 요청 속도 상한 (초당, 0이면 제한 없음)")
+    parser.add_argument("--resume-category", default="1002",
+                        help="checkpoint_resume 수집 카테고리 (기본값: 1002)")
+    parser.add_argument("--resume-latency-ms", type=float, default=5.0,
+                        help="checkpoint_resume 가짜 서버 응답 지연 (ms, 기본값: 5)")
+    parser.add_argument("--resume-kill-fraction", type=float, default=0.5,
+                        help="checkpoint_resume 전체 페이지 중 이만큼 받은 뒤 강제 종료 (기본값: 0.5)")
+    parser.add_argument("--payload-pages", type=int, default=50,
+                        help="graphql_payload 바이트 측정 페이지 수 (기본값: 50)")
+    parser.add_argument("--harvest-categories", type=int, default=120,
+                        help="graphql_payload 일괄 수집 카테고리 수 (기본값: 120)")
+    parser.add_argument("--harvest-keywords", type=int, default=40,
+                        help="graphql_payload 일괄 수집 카테고리당 키워드 수 (기본값: 40)")
+    parser.add_argument("--overlap-category", default="1000",
+                        help="keywords_overlap 카테고리 (기본값: 1000)")
+    parser.add_argument("--overlap-latency-ms", type=float, default=30.0,
+                        help="keywords_overlap 가짜 서버 응답 지연 (ms, 기본값: 30)")
+    parser.add_argument("--overlap-recommend-delay-ms", type=float, default=3000.0,
+                        help="keywords_overlap 느린 추천 키워드 추가 지연 (ms, 기본값: 3000)")
+    parser.add_argument("--overlap-recommend-timeout", type=float, default=0.5,
+                        help="keywords_overlap 추천 키워드 제한 시간 (초, 기본값: 0.5)")
+    parser.add_argument("--search-categories", type=int, default=40,
+                        help="search_index 색인할 카테고리 수 (기본값: 40)")
+    parser.add_argument("--search-keywords", type=int, default=5000,
+                        help="search_index 카테고리당 키워드 수 (기본값: 5,000)")
+    parser.add_argument("--search-queries", default="캠,캠핑,추천,인테리어,브이로그,ㅋㅍ,ㅂㅇㄹㄱ,xyz",
+                        help="search_index 검색어 (쉼표 구분)")
+    parser.add_argument("--prewarm-categories", default="1000,1001",
+                        help="prewarm 인기 카테고리 (쉼표 구분, 기본값: 1000,1001)")
+    parser.add_argument("--prewarm-cold-category", default="1002",
+                        help="prewarm 한 번만 요청할 카테고리 (기본값: 1002)")
+    parser.add_argument("--prewarm-ttl", type=float, default=4.0, help="prewarm 결과 TTL (초, 기본값: 4)")
+    parser.add_argument("--prewarm-lead", type=float, default=2.0, help="prewarm 만료 전 갱신 시점 (초, 기본값: 2)")
+    parser.add_argument("--prewarm-interval", type=float, default=0.2, help="prewarm 확인 간격 (초, 기본값: 0.2)")
+    parser.add_argument("--prewarm-latency-ms", type=float, default=5.0,
+                        help="prewarm 가짜 서버 응답 지연 (ms, 기본값: 5)")
+    parser.add_argument("--prewarm-duration", type=float, default=20.0,
+                        help="prewarm 사용자 요청 시간 (초, 기본값: 20)")
+    parser.add_argument("--resilience-category", default="1001",
+                        help="resilience 수집 카테고리 (기본값: 1001)")
+    parser.add_argument("--resilience-stale-category", default="1000",
+                        help="resilience 장애 전에 받아 둘 카테고리 (기본값: 1000)")
+    parser.add_argument("--resilience-latency-ms", type=float, default=5.0,
+                        help="resilience 가짜 서버 응답 지연 (ms, 기본값: 5, 같은 범위의 jitter 추가)")
+    parser.add_argument("--resilience-slow-rate", type=float, default=0.02,
+                        help="resilience 느린 페이지 비율 (기본값: 0.02)")
+    parser.add_argument("--resilience-slow-ms", type=float, default=500.0,
+                        help="resilience 느린 페이지 추가 지연 (ms, 기본값: 500)")
+    parser.add_argument("--resilience-error-rate", type=float, default=0.1,
+                        help="resilience 재시도 확인용 500 응답 비율 (기본값: 0.1)")
+    parser.add_argument("--resilience-outage-sec", type=float, default=8.0,
+                        help="resilience 장애 중 요청 시간 (초, 기본값: 8)")
+    parser.add_argument("--resilience-breaker-reset", type=float, default=2.0,
+                        help="resilience 차단 후 시험 요청까지 시간 (초, 기본값: 2)")
+    parser.add_argument("--admission-clients", type=int, default=24,
+                        help="admission 동시 클라이언트 수 (기본값: 24)")
+    parser.add_argument("--admission-max-crawls", type=int, default=4,
+                        help="admission 동시 수집 제한 (기본값: 4)")
+    parser.add_argument("--admission-categories", type=int, default=600,
+                        help="admission 가짜 서버 카테고리 수 (기본값: 600)")
+    parser.add_argument("--admission-category-size", type=int, default=400,
+                        help="admission 카테고리별 키워드 수 (기본값: 400)")
+    parser.add_argument("--admission-latency-ms", type=float, default=20.0,
+                        help="admission 가짜 서버 응답 지연 (ms, 기본값: 20)")
+    parser.add_argument("--admission-duration", type=float, default=10.0,
+                        help="admission 측정 시간 (초, 기본값: 10)")
+    parser.add_argument("--admission-retry-cap", type=float, default=1.0,
+                        help="admission 429 후 다시 시도까지 최대 대기 (초, 기본값: 1)")
+    parser.add_argument("--trends-keywords", type=int, default=100_000,
+                        help="trends 카테고리 키워드 수 (기본값: 100,000)")
+    parser.add_argument("--trends-snapshots", type=int, default=300,
+                        help="trends 합성 스냅샷 수 (기본값: 300)")
+    parser.add_argument("--export-categories", type=int, default=20,
+                        help="export 카테고리 수 (기본값: 20)")
+    parser.add_argument("--export-keywords", type=int, default=20_000,
+                        help="export 카테고리당 키워드 수 (기본값: 20,000)")
+    parser.add_argument("--format-rows", type=int, default=100_000, help="formatters 행 수 (기본값: 100,000)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    return parser.parse_args(argv)
+
+
+async def run_all(fake: FakeNaverServer, names: List[str], args: argparse.Namespace) -> Dict:
+    results = {}
+    for name in names:
+        print(f"[{name}] 실행 중...", file=sys.stderr)
+        results[name] = await RUNNERS[name](fake, args)
+        print(json.dumps({name: results[name]}, ensure_ascii=False))
+    return results
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    names = args.only.split(",") if args.only else BENCHMARKS
+    unknown = set(names) - set(RUNNERS)
+    if unknown:
+        raise SystemExit(f"알 수 없는 벤치마크: {', '.join(sorted(unknown))}")
+
+    sizes = [int(s) for s in args.category_sizes.split(",")]
+    with FakeNaverServer(sizes, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms) as fake, \
+            tempfile.TemporaryDirectory(prefix="naver_infl_bench_") as data_dir:
+        # backend.config 는 가져올 때 주소를 읽으므로 backend 를 가져오기 전에 설정
+        # (체크포인트 등 로컬 데이터는 실행마다 비어 있는 임시 디렉토리에,
+        #  upstream 요청 수를 세는 벤치마크가 흔들리지 않도록 hedged request는 resilience 에서만 켬)
+        os.environ.update(local_env(
+            NAVER_INFL_BASE_URL=fake.base_url, NAVER_INFL_DATA_DIR=data_dir, NAVER_INFL_HEDGE="0",
+        ))
+        results = asyncio.run(run_all(fake, names, args))
+
+    report = {
+        'meta': {
+            **git_revision(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'args': vars(args),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}", file=sys.stderr)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
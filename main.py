@@ -2,11 +2,47 @@
 네이버 인플루언서 키워드 수집 CLI 스크립트
 
 기존 동작을 100% 유지하면서 backend 모듈을 활용합니다.
+
+사용법:
+    python main.py            # 대화형 모드 (카테고리 하나 선택)
+    python main.py harvest    # 전체 카테고리 일괄 수집
+    python main.py export     # 전체 카테고리를 여러 포맷(txt/tsv/csv/parquet 등)으로 한 번에 수집/저장
+    python main.py sync       # 키워드 저장소와 비교해 변경분만 수집 (증분 동기화)
+    python main.py partition  # 큰 카테고리 하나를 검색어별로 나눠 동시에 수집
+    python main.py search 캠핑  # 수집해 둔 키워드 검색 (네이버에 요청하지 않음)
+    python main.py trends 1    # 카테고리 참여자수 추이 (최근 수집들 사이에 많이 늘어난 키워드)
+    python main.py prewarm    # 인기 카테고리를 만료 전에 미리 갱신 (API 서버와 별도 프로세스)
 """
 
-from backend.scraper import fetch_categories, get_all_keywords
-from backend.utils import save_keywords
-from backend.config import DEFAULT_SLEEP_SEC_CLI
+import argparse
+
+from backend.scraper import fetch_categories, fetch_recommend_keywords, get_all_keywords
+from backend.harvest import harvest_all
+from backend.partition import fetch_partitioned_keywords
+from backend.delta import delta_sync
+from backend.search_index import get_default_search_index
+from backend.trends import TrendsUnavailable, record_snapshot, get_default_trend_store
+from backend.prewarm import run_worker, parse_quiet_hours
+from backend.export import ExportPipeline, ExportUnavailable, parse_formats
+from backend.utils import save_keywords, save_delta
+from backend.config import (
+    DEFAULT_SLEEP_SEC_CLI,
+    DEFAULT_FORMAT,
+    SUPPORTED_FORMATS,
+    HARVEST_CONCURRENCY,
+    HARVEST_RATE_PER_SEC,
+    HARVEST_OUTPUT_DIR,
+    PARTITION_CONCURRENCY,
+    PARTITION_RATE_PER_SEC,
+    SEARCH_DEFAULT_LIMIT,
+    TRENDS_DEFAULT_WINDOW,
+    TRENDS_DEFAULT_K,
+    EXPORT_COMPRESSIONS,
+    EXPORT_OUTPUT_DIR,
+    PREWARM_INTERVAL,
+    PREWARM_BUDGET,
+    PREWARM_QUIET_HOURS,
+)
 
 
 def get_user_choice(menu):
@@ -98,9 +134,15 @@ def main():
                 
                 print(f"\n✅ 키워드 수집 완료!")
                 print(f"   - 추천 키워드: {recomm_count}개")
+                if 'recommError' in keywords:
+                    print(f"     ⚠️  추천 키워드 조회 실패: {keywords['recommError']}")
                 print(f"   - 일반 키워드: {normal_count}개")
                 print(f"   - 총 {total_count}개")
                 
+                # 검색 색인 / 참여자수 추이에 반영 (python main.py search, trends 로 조회)
+                get_default_search_index().update(category_id, keywords['normal'], category_name)
+                record_snapshot(category_id, keywords['normal'])
+                
                 # 파일 저장 (기본 포맷: txt, 키워드명만)
                 filepath = save_keywords(
                     category_name, 
@@ -131,5 +173,394 @@ def main():
             print("   메뉴로 돌아갑니다.")
 
 
+def harvest(args):
+    """
+    전체 카테고리 일괄 수집
+    
+    Args:
+        args: argparse 결과 (concurrency, rate, format, include_recomm, output_dir)
+    """
+    print("=" * 60)
+    print("네이버 인플루언서 키워드 일괄 수집")
+    print("=" * 60)
+    print(f"   동시 수집: {args.concurrency}개 카테고리")
+    print(f"   요청 속도 상한: 초당 {args.rate}회")
+    print(f"   저장 위치: {args.output_dir} ({args.format})")
+    
+    search_index = get_default_search_index()
+    
+    def on_result(result, keywords):
+        if result.error:
+            print(f"❌ {result.category_name}: {result.error}")
+        else:
+            search_index.update(result.category_id, keywords['normal'], result.category_name)
+            record_snapshot(result.category_id, keywords['normal'])
+            print(f"✅ {result.category_name}: {result.keyword_count}개 "
+                  f"({result.pages}페이지, {result.elapsed:.1f}초) -> {result.filepath}")
+    
+    try:
+        report = harvest_all(
+            concurrency=args.concurrency,
+            rate=args.rate,
+            format=args.format,
+            include_recomm=args.include_recomm,
+            output_dir=args.output_dir,
+            on_result=on_result,
+        )
+    except KeyboardInterrupt:
+        print("\n\n프로그램을 종료합니다. 👋")
+        return
+    except Exception as e:
+        print(f"❌ 카테고리 조회 실패: {str(e)}")
+        print("네트워크 연결을 확인하거나 나중에 다시 시도하세요.")
+        return
+    
+    print("\n" + "=" * 60)
+    print(f"✅ 일괄 수집 완료: {len(report.results)}개 카테고리 (실패 {report.failed}개)")
+    print(f"   - 키워드: {report.keywords}개, 페이지: {report.pages}개, 요청: {report.requests}회")
+    print(f"   - 소요 시간: {report.elapsed:.1f}초")
+    print(f"   - 처리량: {report.pages_per_sec:.2f} pages/sec, {report.keywords_per_sec:.1f} keywords/sec")
+
+
+def export(args):
+    """
+    카테고리 일괄 수집 후 여러 포맷으로 한 번에 저장 (키워드를 한 번만 읽어 모든 포맷에 씀)
+    
+    Args:
+        args: argparse 결과 (category, format, compression, include_recomm, output_dir, concurrency, rate)
+    """
+    try:
+        pipeline = ExportPipeline(args.output_dir, parse_formats(args.format), args.compression, args.include_recomm)
+    except (ValueError, ExportUnavailable) as e:
+        print(f"❌ {str(e)}")
+        return
+    
+    print("=" * 60)
+    print("네이버 인플루언서 키워드 내보내기")
+    print("=" * 60)
+    print(f"   포맷: {args.format} (압축: {args.compression})")
+    print(f"   저장 위치: {args.output_dir}")
+    
+    search_index = get_default_search_index()
+    
+    def on_result(result, keywords):
+        if result.error:
+            print(f"❌ {result.category_name}: {result.error}")
+        else:
+            search_index.update(result.category_id, keywords['normal'], result.category_name)
+            record_snapshot(result.category_id, keywords['normal'])
+            print(f"✅ {result.category_name}: {result.keyword_count}개 ({result.elapsed:.1f}초)")
+    
+    try:
+        categories = None
+        if args.category:
+            categories = [c for c in fetch_categories() if str(c['id']) in args.category]
+        with pipeline:
+            report = harvest_all(
+                categories=categories,
+                concurrency=args.concurrency,
+                rate=args.rate,
+                on_result=on_result,
+                exporter=pipeline,
+            )
+    except KeyboardInterrupt:
+        print("\n\n프로그램을 종료합니다. 👋")
+        return
+    except Exception as e:
+        print(f"❌ 내보내기 실패: {str(e)}")
+        return
+    
+    summary = pipeline.summary()
+    print("\n" + "=" * 60)
+    print(f"✅ 내보내기 완료: {summary['categories']}개 카테고리 (실패 {report.failed}개), {summary['rows']}행")
+    for format, size in summary['bytes'].items():
+        print(f"   - {format}: {size / 1024 / 1024:.2f}MB")
+    print(f"   - 소요 시간: {report.elapsed:.1f}초")
+
+
+def sync(args):
+    """
+    카테고리 증분 동기화
+    
+    Args:
+        args: argparse 결과 (category, full, output_dir)
+    """
+    print("=" * 60)
+    print("네이버 인플루언서 키워드 증분 동기화")
+    print("=" * 60)
+    
+    try:
+        categories = fetch_categories()
+    except KeyboardInterrupt:
+        print("\n\n프로그램을 종료합니다. 👋")
+        return
+    except Exception as e:
+        print(f"❌ 카테고리 조회 실패: {str(e)}")
+        print("네트워크 연결을 확인하거나 나중에 다시 시도하세요.")
+        return
+    
+    if args.category:
+        categories = [c for c in categories if c['id'] in args.category]
+        if not categories:
+            print(f"❌ 카테고리를 찾을 수 없습니다: {', '.join(args.category)}")
+            return
+    
+    options = {'early_stop_pages': 0} if args.full else {}
+    for category in categories:
+        try:
+            result = delta_sync(category['id'], sleep_sec=DEFAULT_SLEEP_SEC_CLI, **options)
+        except KeyboardInterrupt:
+            print("\n\n프로그램을 종료합니다. 👋")
+            return
+        except Exception as e:
+            print(f"❌ {category['name']}: {str(e)}")
+            continue
+        
+        filepath = save_delta(category['name'], result.iter_changes(), args.output_dir)
+        status = "조기 중단" if result.early_stopped else ("전체" if result.complete else "일부")
+        print(f"✅ {category['name']}: 추가 {len(result.added)}, 삭제 {len(result.removed)}, "
+              f"변경 {len(result.changed)} ({result.pages}페이지 {status}, {result.elapsed:.1f}초) -> {filepath}")
+
+
+def partition(args):
+    """
+    카테고리 하나를 검색어(키워드명 첫 글자)별로 나눠 동시에 수집
+    
+    Args:
+        args: argparse 결과 (category, concurrency, rate, format, include_recomm, output_dir)
+    """
+    print("=" * 60)
+    print("네이버 인플루언서 키워드 분할 수집")
+    print("=" * 60)
+    
+    try:
+        categories = {c['id']: c for c in fetch_categories()}
+    except KeyboardInterrupt:
+        print("\n\n프로그램을 종료합니다. 👋")
+        return
+    except Exception as e:
+        print(f"❌ 카테고리 조회 실패: {str(e)}")
+        print("네트워크 연결을 확인하거나 나중에 다시 시도하세요.")
+        return
+    
+    category = categories.get(args.category)
+    if category is None:
+        print(f"❌ 카테고리를 찾을 수 없습니다: {args.category}")
+        return
+    
+    print(f"   카테고리: {category['name']} (키워드 수: {category['keywordCount']}개)")
+    print(f"   동시 수집: 검색어 {args.concurrency}개 + 전체 목록")
+    print("   요청 속도 상한: " + (f"초당 {args.rate}회" if args.rate > 0 else "제한 없음"))
+    
+    try:
+        result = fetch_partitioned_keywords(args.category, concurrency=args.concurrency, rate=args.rate)
+        recomm = fetch_recommend_keywords(args.category) if args.include_recomm else []
+    except KeyboardInterrupt:
+        print("\n\n프로그램을 종료합니다. 👋")
+        return
+    except Exception as e:
+        print(f"❌ 키워드 수집 실패: {str(e)}")
+        print("네트워크 연결을 확인하거나 나중에 다시 시도하세요.")
+        return
+    
+    filepath = save_keywords(
+        category['name'],
+        {'recomm': recomm, 'normal': result.keywords},
+        format=args.format,
+        include_recomm=args.include_recomm,
+        output_dir=args.output_dir,
+    )
+    get_default_search_index().update(args.category, result.keywords, category['name'])
+    record_snapshot(args.category, result.keywords)
+    mode = "검색어 분할로 완료" if result.covered_by_partitions else "전체 목록 수집으로 완료"
+    print(f"\n✅ {len(result.keywords)}개 / 전체 {result.total}개 ({mode})")
+    print(f"   - 페이지: {result.pages}개 (전체 목록 {result.serial_pages}개, 검색어 {len(result.terms)}개)")
+    print(f"   - 소요 시간: {result.elapsed:.1f}초")
+    if result.failed_terms:
+        print(f"   - 실패한 검색어: {', '.join(result.failed_terms)}")
+    print(f"\n💾 파일 저장 완료: {filepath}")
+
+
+def search(args):
+    """
+    수집해 둔 키워드 검색 (로컬 검색 색인)
+    
+    Args:
+        args: argparse 결과 (query, category, sort, limit)
+    """
+    try:
+        result = get_default_search_index().search(args.query, args.category, args.sort, args.limit)
+    except ValueError as e:
+        print(f"❌ {str(e)}")
+        return
+    
+    kind = "초성 " if result.initials else ""
+    print(f"🔍 '{args.query}' {kind}검색: {result.total}개 ({len(result.categories)}개 카테고리, "
+          f"{result.elapsed * 1000:.1f}ms)")
+    for category in result.categories[:10]:
+        print(f"   - {category['name'] or category['categoryId']}: {category['matches']}개")
+    print()
+    for hit in result.items:
+        count = "-" if hit.participant_count is None else f"{hit.participant_count:,}"
+        print(f"{hit.name}\t{count}\t{hit.category_id}")
+
+
+def trends(args):
+    """
+    카테고리 참여자수 추이 (로컬에 쌓인 수집 스냅샷 기준)
+    
+    Args:
+        args: argparse 결과 (category, window, k, by)
+    """
+    try:
+        result = get_default_trend_store().trends(args.category, args.window, args.k, args.by)
+    except (TrendsUnavailable, ValueError) as e:
+        print(f"❌ {str(e)}")
+        return
+    if result is None:
+        print(f"❌ 카테고리 {args.category}의 스냅샷이 2개 미만입니다 (수집을 마칠 때마다 쌓입니다)")
+        return
+    
+    days = (result['to'] - result['from']) / 86400
+    print(f"📈 카테고리 {args.category}: 최근 {result['window']}개 스냅샷 ({days:.1f}일, 전체 {result['snapshots']}개)")
+    print(f"   - 키워드 {result['keywords']}개 (새로 나옴 {result['new']}개, 사라짐 {result['removed']}개)")
+    for title, items in (("늘어난 키워드", result['gainers']), ("줄어든 키워드", result['losers'])):
+        print(f"\n{title}")
+        for item in items:
+            print(f"{item['name']}\t{item['previous']:,} -> {item['participantCount']:,}\t"
+                  f"{item['change']:+,}\t{item['growthRate'] * 100:+.1f}%")
+
+
+def prewarm(args):
+    """
+    인기 카테고리 미리 갱신 (API 서버가 기록한 요청 빈도 기준)
+    
+    Args:
+        args: argparse 결과 (once, interval, budget, quiet_hours)
+    """
+    try:
+        parse_quiet_hours(args.quiet_hours)
+    except ValueError as e:
+        print(f"❌ {str(e)}")
+        return
+    
+    options = {'budget': args.budget, 'quiet_hours': args.quiet_hours}
+    if args.once:
+        try:
+            refreshed = run_worker(once=True, **options)
+        except KeyboardInterrupt:
+            print("\n\n프로그램을 종료합니다. 👋")
+            return
+        print(f"✅ 미리 갱신: {len(refreshed)}개 카테고리" + (f" ({', '.join(refreshed)})" if refreshed else ""))
+        return
+    
+    print(f"🔥 인기 카테고리 미리 갱신 중 ({args.interval}초마다 확인, Ctrl+C로 종료)")
+    try:
+        run_worker(interval=args.interval, **options)
+    except KeyboardInterrupt:
+        print("\n\n프로그램을 종료합니다. 👋")
+
+
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="네이버 인플루언서 키워드 수집 프로그램")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    harvest_parser = subparsers.add_parser("harvest", help="전체 카테고리 일괄 수집")
+    harvest_parser.add_argument("--concurrency", type=int, default=HARVEST_CONCURRENCY,
+                                help=f"동시에 수집할 카테고리 수 (기본값: {HARVEST_CONCURRENCY})")
+    harvest_parser.add_argument("--rate", type=float, default=HARVEST_RATE_PER_SEC,
+                                help=f"전체 요청 속도 상한, 초당 요청 수 (기본값: {HARVEST_RATE_PER_SEC})")
+    harvest_parser.add_argument("--format", choices=SUPPORTED_FORMATS, default=DEFAULT_FORMAT,
+                                help=f"저장 포맷 (기본값: {DEFAULT_FORMAT})")
+    harvest_parser.add_argument("--include-recomm", action="store_true",
+                                help="추천 키워드 포함")
+    harvest_parser.add_argument("--output-dir", default=HARVEST_OUTPUT_DIR,
+                                help=f"저장 디렉토리 (기본값: {HARVEST_OUTPUT_DIR})")
+    
+    export_parser = subparsers.add_parser("export", help="카테고리를 수집해 여러 포맷으로 한 번에 저장")
+    export_parser.add_argument("--category", action="append",
+                               help="내보낼 카테고리 ID (여러 번 지정 가능, 기본값: 전체)")
+    export_parser.add_argument("--format", default="txt,tsv,csv",
+                               help="저장 포맷, 쉼표 구분 (txt, tsv, csv, ndjson, parquet, arrow / 기본값: txt,tsv,csv)")
+    export_parser.add_argument("--compression", choices=EXPORT_COMPRESSIONS, default="none",
+                               help="텍스트 포맷 압축 (zstd는 zstandard 필요, 기본값: none)")
+    export_parser.add_argument("--include-recomm", action="store_true",
+                               help="추천 키워드 포함 (parquet / arrow는 recommended 컬럼)")
+    export_parser.add_argument("--output-dir", default=EXPORT_OUTPUT_DIR,
+                               help=f"저장 디렉토리 (기본값: {EXPORT_OUTPUT_DIR})")
+    export_parser.add_argument("--concurrency", type=int, default=HARVEST_CONCURRENCY,
+                               help=f"동시에 수집할 카테고리 수 (기본값: {HARVEST_CONCURRENCY})")
+    export_parser.add_argument("--rate", type=float, default=HARVEST_RATE_PER_SEC,
+                               help=f"전체 요청 속도 상한, 초당 요청 수 (기본값: {HARVEST_RATE_PER_SEC})")
+    
+    sync_parser = subparsers.add_parser("sync", help="키워드 저장소와 비교해 변경분만 수집")
+    sync_parser.add_argument("--category", action="append",
+                             help="동기화할 카테고리 ID (여러 번 지정 가능, 기본값: 전체)")
+    sync_parser.add_argument("--full", action="store_true",
+                             help="조기 중단 없이 끝까지 수집 (삭제된 키워드까지 반영)")
+    sync_parser.add_argument("--output-dir", default=HARVEST_OUTPUT_DIR,
+                             help=f"변경분 저장 디렉토리 (기본값: {HARVEST_OUTPUT_DIR})")
+    
+    partition_parser = subparsers.add_parser("partition", help="카테고리 하나를 검색어별로 나눠 동시에 수집")
+    partition_parser.add_argument("--category", required=True, help="수집할 카테고리 ID")
+    partition_parser.add_argument("--concurrency", type=int, default=PARTITION_CONCURRENCY,
+                                  help=f"동시에 진행할 검색어 수 (기본값: {PARTITION_CONCURRENCY})")
+    partition_parser.add_argument("--rate", type=float, default=PARTITION_RATE_PER_SEC,
+                                  help=f"전체 요청 속도 상한, 초당 요청 수, 0이면 제한 없음 (기본값: {PARTITION_RATE_PER_SEC})")
+    partition_parser.add_argument("--format", choices=SUPPORTED_FORMATS, default=DEFAULT_FORMAT,
+                                  help=f"저장 포맷 (기본값: {DEFAULT_FORMAT})")
+    partition_parser.add_argument("--include-recomm", action="store_true",
+                                  help="추천 키워드 포함")
+    partition_parser.add_argument("--output-dir", default=HARVEST_OUTPUT_DIR,
+                                  help=f"저장 디렉토리 (기본값: {HARVEST_OUTPUT_DIR})")
+    
+    search_parser = subparsers.add_parser("search", help="수집해 둔 키워드 검색 (네이버에 요청하지 않음)")
+    search_parser.add_argument("query", help="검색어 (초성만 입력하면 초성 검색)")
+    search_parser.add_argument("--category", action="append",
+                               help="검색할 카테고리 ID (여러 번 지정 가능, 기본값: 전체)")
+    search_parser.add_argument("--sort", choices=("participants", "name"), default="participants",
+                               help="정렬 (participants=참여자수 내림차순, name=키워드명 순)")
+    search_parser.add_argument("--limit", type=int, default=SEARCH_DEFAULT_LIMIT,
+                               help=f"최대 결과 수 (기본값: {SEARCH_DEFAULT_LIMIT})")
+    
+    trends_parser = subparsers.add_parser("trends", help="카테고리 참여자수 추이 (네이버에 요청하지 않음)")
+    trends_parser.add_argument("category", help="카테고리 ID")
+    trends_parser.add_argument("--window", type=int, default=TRENDS_DEFAULT_WINDOW,
+                               help=f"비교할 최근 스냅샷 수 (기본값: {TRENDS_DEFAULT_WINDOW})")
+    trends_parser.add_argument("-k", type=int, default=TRENDS_DEFAULT_K,
+                               help=f"늘어난 / 줄어든 키워드 각각 최대 개수 (기본값: {TRENDS_DEFAULT_K})")
+    trends_parser.add_argument("--by", choices=("change", "rate"), default="change",
+                               help="순위 기준 (change=참여자수 변화량, rate=증가율)")
+    
+    prewarm_parser = subparsers.add_parser("prewarm", help="인기 카테고리를 만료 전에 미리 갱신")
+    prewarm_parser.add_argument("--once", action="store_true",
+                                help="한 번만 확인하고 종료 (cron 등에서 실행)")
+    prewarm_parser.add_argument("--interval", type=float, default=PREWARM_INTERVAL,
+                                help=f"확인 간격, 초 (기본값: {PREWARM_INTERVAL})")
+    prewarm_parser.add_argument("--budget", type=int, default=PREWARM_BUDGET,
+                                help=f"예산 기간 동안 쓸 수 있는 최대 요청 수 (기본값: {PREWARM_BUDGET})")
+    prewarm_parser.add_argument("--quiet-hours", default=PREWARM_QUIET_HOURS,
+                                help=f"수집하지 않을 시간대 HH-HH, 빈 값이면 없음 (기본값: {PREWARM_QUIET_HOURS})")
+    
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = parse_args()
+    if args.command == "harvest":
+        harvest(args)
+    elif args.command == "export":
+        export(args)
+    elif args.command == "sync":
+        sync(args)
+    elif args.command == "partition":
+        partition(args)
+    elif args.command == "search":
+        search(args)
+    elif args.command == "trends":
+        trends(args)
+    elif args.command == "prewarm":
+        prewarm(args)
+    else:
+        main()
\ No newline at end of file